@@ -0,0 +1,154 @@
+"""
+Benchmark for BambuParser G-code parsing.
+
+Compares the previous whole-file path (``f.read()`` followed by regex scans
+over the full content) with the streaming header/footer scan used by
+``BambuParser._parse_gcode_file``. Each run happens in a fresh subprocess so
+peak RSS is measured per implementation.
+
+Usage (from the printernizer directory):
+    python -m benchmarks.gcode_parser_benchmark --size-mb 200
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from src.services.bambu_parser import BambuParser
+
+CONFIG_LINES = [
+    "; layer_height = 0.2",
+    "; first_layer_height = 0.2",
+    "; nozzle_temperature_initial_layer = 220",
+    "; bed_temperature_initial_layer = 55",
+    "; total layer count = 250",
+    "; filament used [g] = 12.5,3.1",
+    "; filament_type = PLA;PETG",
+    "; model_width = 120.5",
+    "; model_depth = 80.0",
+    "; model_height = 50.0",
+    "; nozzle_diameter = 0.4",
+    "; wall_loops = 3",
+    "; sparse_infill_density = 15%",
+    "; compatible_printers = \"Bambu Lab X1 Carbon\";\"Bambu Lab P1S\"",
+]
+
+
+def write_sample(path: Path, size_mb: int) -> None:
+    """Write a synthetic Bambu-style G-code file of roughly ``size_mb`` MB."""
+    thumbnail = base64.b64encode(os.urandom(48 * 1024)).decode('ascii')
+    thumbnail_lines = [thumbnail[i:i + 78] for i in range(0, len(thumbnail), 78)]
+    move_block = "".join(
+        f"G1 X{100 + i % 50:.3f} Y{80 + i % 30:.3f} E{i * 0.01:.5f}\n" for i in range(1000)
+    )
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("; HEADER_BLOCK_START\n; generated by BambuStudio 01.09.00.70\n")
+        f.write("; estimated printing time (normal mode) = 2h 15m 30s\n; HEADER_BLOCK_END\n")
+        f.write(f"; thumbnail begin 300x300 {len(thumbnail)}\n")
+        f.writelines(f"; {line}\n" for line in thumbnail_lines)
+        f.write("; thumbnail end\n")
+        target = size_mb * 1024 * 1024
+        while f.tell() < target:
+            f.write(move_block)
+        f.write("; CONFIG_BLOCK_START\n")
+        f.writelines(f"{line}\n" for line in CONFIG_LINES)
+        f.write("; CONFIG_BLOCK_END\n")
+
+
+def parse_whole_file(parser: BambuParser, path: Path) -> Dict[str, Any]:
+    """Previous implementation: load the file and regex-scan the full content."""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+
+    thumbnails = []
+    begins = list(parser.THUMBNAIL_PATTERN.finditer(content))
+    ends = list(parser.THUMBNAIL_END_PATTERN.finditer(content))
+    if len(begins) == len(ends):
+        for begin, end in zip(begins, ends):
+            data = ''.join(
+                line.strip()[1:].strip()
+                for line in content[begin.end():end.start()].split('\n')
+                if line.strip().startswith(';') and len(line.strip()) > 2
+            )
+            thumbnail = parser._build_gcode_thumbnail(
+                {'width': begin.group(1), 'height': begin.group(2), 'data_size': begin.group(3)},
+                data
+            )
+            if thumbnail:
+                thumbnails.append(thumbnail)
+
+    raw_values = {}
+    for key, pattern in parser._GCODE_LINE_PATTERNS.items():
+        match = pattern.search(content)
+        if match:
+            raw_values[key] = match.group(1).strip()
+
+    return {'thumbnails': thumbnails, 'metadata': parser._build_gcode_metadata(raw_values)}
+
+
+def run_single(mode: str, path: Path) -> None:
+    """Parse once and print timing, peak RSS and a result fingerprint as JSON."""
+    parser = BambuParser()
+    start = time.perf_counter()
+    if mode == 'whole':
+        result = parse_whole_file(parser, path)
+    else:
+        result = asyncio.run(parser._parse_gcode_file(path))
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    print(json.dumps({
+        'mode': mode,
+        'seconds': round(elapsed, 3),
+        'peak_rss_mb': round(peak_mb, 1),
+        'thumbnails': len(result['thumbnails']),
+        'metadata': result['metadata'],
+    }, default=str))
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--size-mb', type=int, default=200, help="Size of the generated G-code file")
+    arg_parser.add_argument('--file', type=Path, help="Benchmark an existing G-code file instead")
+    arg_parser.add_argument('--run', choices=['whole', 'streaming'], help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.run:
+        run_single(args.run, args.file)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = Path(tmp) / 'benchmark.gcode'
+            write_sample(path, args.size_mb)
+        print(f"File: {path} ({path.stat().st_size / (1024 * 1024):.1f} MB)")
+
+        results = {}
+        for mode in ('whole', 'streaming'):
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.gcode_parser_benchmark', '--run', mode, '--file', str(path)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:>10}: {results[mode]['seconds']:8.3f} s  "
+                  f"peak RSS {results[mode]['peak_rss_mb']:8.1f} MB  "
+                  f"thumbnails {results[mode]['thumbnails']}")
+
+        if results['whole']['metadata'] != results['streaming']['metadata']:
+            print("WARNING: metadata differs between implementations")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+Benchmark for reading multi-plate Bambu 3MF project files.
+
+Compares the previous path, where the ThreeMFAnalyzer, BambuParser and the
+mesh loader each opened the archive (the parser building a full element tree
+of the model, the mesh loader going through ``trimesh.load``), with one
+``read_3mf`` pass feeding all three. Each run happens in a fresh subprocess
+so peak RSS is measured per implementation.
+
+Usage (from the printernizer directory):
+    python -m benchmarks.threemf_reader_benchmark --plates 8 --faces 200000
+"""
+import argparse
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+from typing import Any, Dict
+
+from src.services.threemf_reader import read_3mf
+
+CORE_NS = 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02'
+
+
+def _sphere_mesh_xml(faces: int, radius: float, center: tuple) -> str:
+    """<mesh> of a UV sphere with roughly ``faces`` triangles."""
+    rings = max(3, int(math.sqrt(faces / 2)))
+    segments = max(3, faces // (2 * rings))
+    cx, cy, cz = center
+    vertices = []
+    for ring in range(rings + 1):
+        phi = math.pi * ring / rings
+        for segment in range(segments):
+            theta = 2 * math.pi * segment / segments
+            vertices.append(
+                f'<vertex x="{cx + radius * math.sin(phi) * math.cos(theta):.6f}" '
+                f'y="{cy + radius * math.sin(phi) * math.sin(theta):.6f}" '
+                f'z="{cz + radius * math.cos(phi):.6f}"/>'
+            )
+    triangles = []
+    for ring in range(rings):
+        for segment in range(segments):
+            a = ring * segments + segment
+            b = ring * segments + (segment + 1) % segments
+            c, d = a + segments, b + segments
+            triangles.append(f'<triangle v1="{a}" v2="{c}" v3="{b}"/>')
+            triangles.append(f'<triangle v1="{b}" v2="{c}" v3="{d}"/>')
+    return (f'<mesh><vertices>{"".join(vertices)}</vertices>'
+            f'<triangles>{"".join(triangles)}</triangles></mesh>')
+
+
+def write_sample(path: Path, plates: int, faces: int) -> None:
+    """Write a synthetic Bambu Studio project: one object per plate, meshes in 3D/Objects/."""
+    faces_per_object = max(100, faces // plates)
+    objects, items = [], []
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('[Content_Types].xml', '<?xml version="1.0" encoding="UTF-8"?><Types/>')
+        for plate in range(1, plates + 1):
+            object_part = f'3D/Objects/object_{plate}.model'
+            zip_file.writestr(object_part, (
+                f'<?xml version="1.0" encoding="UTF-8"?><model unit="millimeter" xmlns="{CORE_NS}">'
+                f'<resources><object id="1" type="model">'
+                f'{_sphere_mesh_xml(faces_per_object, 20.0, (0.0, 0.0, 20.0))}'
+                f'</object></resources><build/></model>'
+            ))
+            objects.append(
+                f'<object id="{plate}" type="model"><components>'
+                f'<component p:path="/{object_part}" objectid="1" transform="1 0 0 0 1 0 0 0 1 0 0 0"/>'
+                f'</components></object>'
+            )
+            items.append(f'<item objectid="{plate}" transform="1 0 0 0 1 0 0 0 1 {plate * 60} 0 0"/>')
+
+            zip_file.writestr(f'Metadata/plate_{plate}.json', json.dumps({
+                'bbox_all': [plate * 60 - 20, -20, plate * 60 + 20, 20],
+                'bbox_objects': [{'name': f'object_{plate}', 'area': 1256.6, 'layer_height': 0.2}],
+                'filament_colors': ['#FFFFFF', '#000000'],
+                'filament_ids': ['GFA00', 'GFA01'],
+                'nozzle_diameter': 0.4,
+            }))
+            zip_file.writestr(f'Metadata/plate_{plate}.png', os.urandom(64 * 1024))
+            zip_file.writestr(f'Metadata/plate_{plate}_small.png', os.urandom(8 * 1024))
+            zip_file.writestr(f'Metadata/process_settings_{plate}.config', json.dumps({
+                'layer_height': '0.2', 'initial_layer_print_height': '0.2', 'wall_loops': '3',
+                'sparse_infill_density': '15%', 'nozzle_temperature': ['220'],
+                'compatible_printers': ['Bambu Lab X1 Carbon 0.4 nozzle'],
+            }))
+
+        zip_file.writestr('3D/3dmodel.model', (
+            f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<model unit="millimeter" xmlns="{CORE_NS}" '
+            f'xmlns:p="http://schemas.microsoft.com/3dmanufacturing/production/2015/06">'
+            f'<metadata name="Application">BambuStudio-01.09.00.70</metadata>'
+            f'<metadata name="Title">Benchmark project</metadata>'
+            f'<resources>{"".join(objects)}</resources><build>{"".join(items)}</build></model>'
+        ))
+        plate_info = ''.join(
+            f'<plate><metadata key="index" value="{plate}"/>'
+            f'<metadata key="prediction" value="3600"/><metadata key="weight" value="12.5"/>'
+            f'<filament id="1" type="PLA" color="#FFFFFF" used_m="4.2" used_g="12.5"/></plate>'
+            for plate in range(1, plates + 1)
+        )
+        zip_file.writestr('Metadata/slice_info.config', f'<?xml version="1.0"?><config>{plate_info}</config>')
+
+
+def read_separately(path: Path) -> Dict[str, Any]:
+    """Previous path: analyzer, parser and mesh loader each open the archive."""
+    # ThreeMFAnalyzer: plate 1 JSON, process settings and slice info
+    with zipfile.ZipFile(path, 'r') as zip_file:
+        names = zip_file.namelist()
+        if 'Metadata/plate_1.json' in names:
+            json.loads(zip_file.read('Metadata/plate_1.json').decode('utf-8'))
+        if 'Metadata/process_settings_1.config' in names:
+            json.loads(zip_file.read('Metadata/process_settings_1.config').decode('utf-8'))
+        if 'Metadata/slice_info.config' in names:
+            ET.fromstring(zip_file.read('Metadata/slice_info.config').decode('utf-8')).find('plate')
+
+    # BambuParser: thumbnails plus a full element tree of the root model
+    with zipfile.ZipFile(path, 'r') as zip_file:
+        thumbnails = [zip_file.read(name) for name in zip_file.namelist()
+                      if name.startswith('Metadata/') and name.endswith('.png')]
+        root = ET.fromstring(zip_file.read('3D/3dmodel.model').decode('utf-8'))
+        [elem for elem in root.iter() if 'metadata' in elem.tag.lower()]
+        [elem for elem in root.findall('.//*') if elem.tag.endswith('vertex')]
+
+    # Mesh loader: trimesh scene, concatenated. trimesh's 3MF loader needs
+    # lxml; without it, build full element trees of the object parts the way
+    # that loader does, which is the dominant cost either way.
+    try:
+        import trimesh
+        scene = trimesh.load(str(path))
+        if isinstance(scene, trimesh.Scene):
+            geometries = [geom for geom in scene.geometry.values() if isinstance(geom, trimesh.Trimesh)]
+            scene = trimesh.util.concatenate(geometries) if geometries else trimesh.Trimesh()
+        faces = len(scene.faces)
+    except Exception:
+        faces = 0
+        with zipfile.ZipFile(path, 'r') as zip_file:
+            for name in zip_file.namelist():
+                if not (name.startswith('3D/') and name.endswith('.model')):
+                    continue
+                tree = ET.fromstring(zip_file.read(name))
+                [[float(v.get(axis)) for axis in 'xyz'] for v in tree.iter(f'{{{CORE_NS}}}vertex')]
+                faces += len([[int(t.get(key)) for key in ('v1', 'v2', 'v3')]
+                              for t in tree.iter(f'{{{CORE_NS}}}triangle')])
+    return {'thumbnails': len(thumbnails), 'faces': faces}
+
+
+def read_once(path: Path) -> Dict[str, Any]:
+    """One ``read_3mf`` pass serving all three consumers."""
+    package = read_3mf(path)
+    triangles = package.triangles
+    package.vertices
+    package.bounds()
+    return {'thumbnails': len(package.thumbnails), 'faces': len(triangles)}
+
+
+def run_single(mode: str, path: Path) -> None:
+    """Read once and print timing, peak RSS and a result fingerprint as JSON."""
+    start = time.perf_counter()
+    result = read_separately(path) if mode == 'separate' else read_once(path)
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    print(json.dumps({'mode': mode, 'seconds': round(elapsed, 3), 'peak_rss_mb': round(peak_mb, 1), **result}))
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--plates', type=int, default=8, help="Plates (one object each) in the generated project")
+    arg_parser.add_argument('--faces', type=int, default=200000, help="Total triangles over all objects")
+    arg_parser.add_argument('--file', type=Path, help="Benchmark an existing 3MF file instead")
+    arg_parser.add_argument('--run', choices=['separate', 'once'], help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.run:
+        run_single(args.run, args.file)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = Path(tmp) / 'benchmark.3mf'
+            write_sample(path, args.plates, args.faces)
+        print(f"File: {path} ({path.stat().st_size / (1024 * 1024):.1f} MB)")
+
+        for mode in ('separate', 'once'):
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.threemf_reader_benchmark', '--run', mode, '--file', str(path)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:>10}: {result['seconds']:8.3f} s  "
+                  f"peak RSS {result['peak_rss_mb']:8.1f} MB  "
+                  f"thumbnails {result['thumbnails']}  faces {result['faces']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark for rendering animated turntable previews.
+
+Compares the previous path, where every frame was a separate matplotlib
+figure (mesh copied and normalized, ``plot_trisurf``, PNG round trip) before
+the frames were quantized into a GIF, with the TurntableRenderer, which
+prepares the mesh once and rotates it per frame. Each run happens in a fresh
+subprocess so peak RSS is measured per implementation.
+
+Usage (from the printernizer directory):
+    python -m benchmarks.turntable_benchmark --faces 50000 --frames 4
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.services.mesh_cache import decimate_mesh, load_mesh_arrays
+from src.services.turntable_renderer import TurntableRenderer
+
+SIZE = (512, 512)
+ELEVATION = 45
+
+
+def write_sample(path: Path, faces: int) -> None:
+    """Write a binary STL of a torus with roughly ``faces`` triangles."""
+    rings = max(3, int(np.sqrt(faces / 4)))
+    segments = max(3, faces // (2 * rings))
+    u, v = np.meshgrid(np.linspace(0, 2 * np.pi, rings, endpoint=False),
+                       np.linspace(0, 2 * np.pi, segments, endpoint=False), indexing='ij')
+    vertices = np.stack([(30 + 10 * np.cos(v)) * np.cos(u),
+                         (30 + 10 * np.cos(v)) * np.sin(u),
+                         10 * np.sin(v) + 10], axis=-1).reshape(-1, 3).astype(np.float32)
+    ring, segment = np.meshgrid(np.arange(rings), np.arange(segments), indexing='ij')
+    a = ring * segments + segment
+    b = ring * segments + (segment + 1) % segments
+    c = ((ring + 1) % rings) * segments + segment
+    d = ((ring + 1) % rings) * segments + (segment + 1) % segments
+    triangles = np.concatenate([np.stack([a, c, b], -1).reshape(-1, 3),
+                                np.stack([b, c, d], -1).reshape(-1, 3)])
+
+    record = np.dtype([('normal', '<f4', 3), ('corners', '<f4', (3, 3)), ('attribute', '<u2')])
+    data = np.zeros(len(triangles), dtype=record)
+    data['corners'] = vertices[triangles]
+    with open(path, 'wb') as f:
+        f.write(b'\0' * 80)
+        f.write(np.uint32(len(triangles)).tobytes())
+        f.write(data.tobytes())
+
+
+def render_per_frame(vertices: np.ndarray, faces: np.ndarray, angles: List[float]) -> bytes:
+    """Previous path: one matplotlib figure per angle, frames decoded from PNG."""
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib import pyplot as plt
+    from PIL import Image
+
+    frames = []
+    for azimuth in angles:
+        frame_vertices = vertices - vertices.mean(axis=0)
+        frame_vertices = frame_vertices / max(frame_vertices.max(axis=0) - frame_vertices.min(axis=0))
+        fig = plt.figure(figsize=(SIZE[0] / 100, SIZE[1] / 100), dpi=100)
+        ax = fig.add_subplot(111, projection='3d')
+        ax.plot_trisurf(frame_vertices[:, 0], frame_vertices[:, 1], frame_vertices[:, 2], triangles=faces,
+                        color='#6c757d', edgecolor='none', linewidth=0, alpha=0.9, shade=True)
+        ax.view_init(elev=ELEVATION, azim=azimuth)
+        ax.set_axis_off()
+        for limit in (ax.set_xlim, ax.set_ylim, ax.set_zlim):
+            limit([-0.5, 0.5])
+        buf = BytesIO()
+        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight', pad_inches=0.1, facecolor='#ffffff')
+        plt.close(fig)
+        buf.seek(0)
+        frames.append(Image.open(buf))
+
+    gif_buffer = BytesIO()
+    frames[0].save(gif_buffer, format='GIF', save_all=True, append_images=frames[1:],
+                   duration=500, loop=0, optimize=False)
+    return gif_buffer.getvalue()
+
+
+def render_turntable(vertices: np.ndarray, faces: np.ndarray, angles: List[float]) -> bytes:
+    """Mesh prepared once, rotated per frame, frames encoded in one pass."""
+    renderer = TurntableRenderer(vertices, faces, SIZE, elevation=ELEVATION)
+    return renderer.render_gif(angles, frame_duration=500)
+
+
+def run_single(mode: str, path: Path, frames: int, max_faces: int) -> None:
+    """Render once and print timing, peak RSS and the GIF size as JSON."""
+    mesh = load_mesh_arrays(path)
+    vertices, faces = decimate_mesh(mesh.vertices, mesh.faces, max_faces)
+    angles = [360.0 * index / frames for index in range(frames)]
+
+    start = time.perf_counter()
+    render = render_per_frame if mode == 'per-frame' else render_turntable
+    gif = render(vertices, faces, angles)
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    result: Dict[str, Any] = {'mode': mode, 'seconds': round(elapsed, 3), 'peak_rss_mb': round(peak_mb, 1),
+                              'faces': len(faces), 'gif_kb': round(len(gif) / 1024, 1)}
+    print(json.dumps(result))
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--faces', type=int, default=50000, help="Triangles of the generated mesh")
+    arg_parser.add_argument('--frames', type=int, default=4, help="Turntable frames (evenly spaced azimuths)")
+    arg_parser.add_argument('--max-faces', type=int, default=50000,
+                            help="Decimation limit, as mesh_preview_max_faces")
+    arg_parser.add_argument('--file', type=Path, help="Benchmark an existing STL or 3MF file instead")
+    arg_parser.add_argument('--run', choices=['per-frame', 'turntable'], help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.run:
+        run_single(args.run, args.file, args.frames, args.max_faces)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = Path(tmp) / 'benchmark.stl'
+            write_sample(path, args.faces)
+        print(f"File: {path} ({path.stat().st_size / (1024 * 1024):.1f} MB), {args.frames} frames")
+
+        for mode in ('per-frame', 'turntable'):
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.turntable_benchmark', '--run', mode, '--file', str(path),
+                 '--frames', str(args.frames), '--max-faces', str(args.max_faces)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:>10}: {result['seconds']:8.3f} s  "
+                  f"peak RSS {result['peak_rss_mb']:8.1f} MB  "
+                  f"faces {result['faces']}  GIF {result['gif_kb']:.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,18 @@
+-- Migration: 038_search_filter_indexes.sql
+-- Description: Index the metadata fields used by search filters. The files table
+--              keeps physical properties, print time, weight and cost only in its
+--              metadata JSON, so these are expression indexes; the expressions must
+--              match Database._SEARCH_RANGE_FIELDS exactly to be usable.
+-- Date: 2026-10-16
+
+CREATE INDEX IF NOT EXISTS idx_files_meta_width ON files((CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.physical_properties.width') END));
+CREATE INDEX IF NOT EXISTS idx_files_meta_depth ON files((CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.physical_properties.depth') END));
+CREATE INDEX IF NOT EXISTS idx_files_meta_height ON files((CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.physical_properties.height') END));
+CREATE INDEX IF NOT EXISTS idx_files_meta_print_time ON files((CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.print_settings.estimated_time_minutes') END));
+CREATE INDEX IF NOT EXISTS idx_files_meta_weight ON files((CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.material_requirements.total_weight') END));
+CREATE INDEX IF NOT EXISTS idx_files_meta_cost ON files((CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.cost_breakdown.total_cost') END));
+
+-- library_files has typed columns; dimensions, cost and complexity are indexed by 017
+CREATE INDEX IF NOT EXISTS idx_library_filament_weight ON library_files(total_filament_weight);
+CREATE INDEX IF NOT EXISTS idx_library_depth ON library_files(model_depth);
+CREATE INDEX IF NOT EXISTS idx_library_height ON library_files(model_height);
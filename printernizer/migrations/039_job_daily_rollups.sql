@@ -0,0 +1,48 @@
+-- Migration: 039_job_daily_rollups.sql
+-- Description: Materialized job aggregates per day, printer and business flag for
+--              the dashboard and analytics. Maintained by JobService on job writes
+--              (see JobRollupRepository); this migration backfills existing jobs.
+-- Date: 2026-10-16
+
+CREATE TABLE IF NOT EXISTS job_daily_rollups (
+    day TEXT NOT NULL,
+    printer_id TEXT NOT NULL,
+    is_business INTEGER NOT NULL DEFAULT 0,
+    total_jobs INTEGER NOT NULL DEFAULT 0,
+    completed_jobs INTEGER NOT NULL DEFAULT 0,
+    failed_jobs INTEGER NOT NULL DEFAULT 0,
+    cancelled_jobs INTEGER NOT NULL DEFAULT 0,
+    total_runtime_seconds INTEGER NOT NULL DEFAULT 0,
+    completed_runtime_seconds INTEGER NOT NULL DEFAULT 0,
+    total_material_grams REAL NOT NULL DEFAULT 0,
+    completed_material_grams REAL NOT NULL DEFAULT 0,
+    total_cost_eur REAL NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (day, printer_id, is_business)
+);
+
+-- Bucket lookup for refreshing a single rollup row
+CREATE INDEX IF NOT EXISTS idx_jobs_rollup_bucket
+    ON jobs(printer_id, date(COALESCE(start_time, created_at)), COALESCE(is_business, 0));
+
+INSERT OR REPLACE INTO job_daily_rollups (
+    day, printer_id, is_business,
+    total_jobs, completed_jobs, failed_jobs, cancelled_jobs,
+    total_runtime_seconds, completed_runtime_seconds,
+    total_material_grams, completed_material_grams,
+    total_cost_eur
+)
+SELECT
+    date(COALESCE(start_time, created_at)), printer_id, COALESCE(is_business, 0),
+    COUNT(*),
+    COALESCE(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(actual_duration), 0),
+    COALESCE(SUM(CASE WHEN status = 'completed' THEN actual_duration END), 0),
+    COALESCE(SUM(material_used), 0),
+    COALESCE(SUM(CASE WHEN status = 'completed' THEN material_used END), 0),
+    COALESCE(SUM(COALESCE(material_cost, 0) + COALESCE(power_cost, 0)), 0)
+FROM jobs
+WHERE date(COALESCE(start_time, created_at)) IS NOT NULL
+GROUP BY 1, 2, 3;
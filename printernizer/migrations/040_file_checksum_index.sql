@@ -0,0 +1,16 @@
+-- Migration: 040_file_checksum_index.sql
+-- Description: Persistent checksum index keyed by file path and stat identity
+--              (size, mtime_ns, inode). Watch-folder rescans reuse the stored
+--              checksum for unchanged files instead of hashing them again
+--              (see ChecksumIndexRepository).
+-- Date: 2026-10-16
+
+CREATE TABLE IF NOT EXISTS file_checksum_index (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
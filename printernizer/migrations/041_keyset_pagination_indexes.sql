@@ -0,0 +1,23 @@
+-- Migration: 041_keyset_pagination_indexes.sql
+-- Description: Composite (sort column, id) indexes for keyset pagination of the
+--              jobs, files and library listings. A cursor page is a range seek on
+--              one of these indexes instead of an OFFSET scan (see
+--              src/database/pagination.py). Filtered variants cover the common
+--              printer/status filters of the jobs list and the source filter of
+--              the files list.
+-- Date: 2026-10-16
+
+CREATE INDEX IF NOT EXISTS idx_jobs_created_id ON jobs(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_updated_id ON jobs(updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_name_id ON jobs(job_name, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_printer_created_id ON jobs(printer_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created_id ON jobs(status, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_files_source_created_id ON files(source, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_files_source_filename_id ON files(source, filename, id);
+CREATE INDEX IF NOT EXISTS idx_files_source_size_id ON files(source, file_size, id);
+
+CREATE INDEX IF NOT EXISTS idx_library_added_id ON library_files(added_to_library, id);
+CREATE INDEX IF NOT EXISTS idx_library_filename_id ON library_files(filename, id);
+CREATE INDEX IF NOT EXISTS idx_library_size_id ON library_files(file_size, id);
+CREATE INDEX IF NOT EXISTS idx_library_modified_id ON library_files(last_modified, id);
@@ -0,0 +1,28 @@
+-- Migration: 042_printer_status_series.sql
+-- Description: Printer status history (bed/nozzle temperature, progress) as
+--              columnar chunks: one row per printer, tier and time span with
+--              delta-encoded, compressed value arrays (see
+--              src/database/timeseries.py). Tiers: raw samples (1h chunks,
+--              kept 24h), 1-minute averages (1d chunks, kept 30d) and
+--              15-minute averages (30d chunks, kept forever).
+-- Date: 2026-10-16
+
+CREATE TABLE IF NOT EXISTS printer_status_series (
+    printer_id TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    chunk_start INTEGER NOT NULL,
+    sample_count INTEGER NOT NULL,
+    first_ts INTEGER NOT NULL,
+    last_ts INTEGER NOT NULL,
+    timestamps BLOB NOT NULL,
+    temperature_bed BLOB NOT NULL,
+    temperature_nozzle BLOB NOT NULL,
+    progress BLOB NOT NULL,
+    sealed INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (printer_id, tier, chunk_start)
+);
+
+-- Retention pruning and recovery of unsealed raw chunks
+CREATE INDEX IF NOT EXISTS idx_status_series_tier_start
+    ON printer_status_series(tier, sealed, chunk_start);
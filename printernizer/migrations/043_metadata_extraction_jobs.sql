@@ -0,0 +1,25 @@
+-- Migration: 043_metadata_extraction_jobs.sql
+-- Description: Persistent queue for library metadata extraction. One row per
+--              library file waiting for, or running, extraction; workers
+--              claim rows by priority (user-opened file, upload, backfill)
+--              and due time. Failed attempts are rescheduled with backoff;
+--              rows left 'running' by a restart are reset to 'pending' (see
+--              MetadataExtractionQueue).
+-- Date: 2026-10-16
+
+CREATE TABLE IF NOT EXISTS metadata_extraction_jobs (
+    checksum TEXT PRIMARY KEY,
+    file_id TEXT,
+    priority INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending', -- pending, running, failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL, -- epoch seconds
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (checksum) REFERENCES library_files(checksum) ON DELETE CASCADE
+);
+
+-- Claiming the next due job
+CREATE INDEX IF NOT EXISTS idx_extraction_jobs_claim
+    ON metadata_extraction_jobs(status, priority, next_attempt_at);
@@ -0,0 +1,8 @@
+-- Migration: 044_extraction_job_requeue.sql
+-- Description: Remember that a file was enqueued again while its extraction
+--              was running (e.g. reprocess during an extraction). The job
+--              is then put back to 'pending' when the running attempt
+--              finishes instead of being deleted or failed.
+-- Date: 2026-10-16
+
+ALTER TABLE metadata_extraction_jobs ADD COLUMN requeue INTEGER NOT NULL DEFAULT 0;
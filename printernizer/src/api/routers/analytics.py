@@ -77,6 +77,14 @@ async def get_analytics_overview(
     return overview
 
 
+@router.post("/rollups/rebuild")
+async def rebuild_analytics_rollups(
+    analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """Recompute the materialized job aggregates (after backfills or manual edits)."""
+    return await analytics_service.rebuild_rollups()
+
+
 @router.get("/orders")
 async def get_order_analytics(
     analytics_service: AnalyticsService = Depends(get_analytics_service)
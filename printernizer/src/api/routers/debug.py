@@ -226,3 +226,28 @@ async def system_info():
         "slicer_service_url": __import__("os").getenv("SLICER_SERVICE_URL") or None,
         "libraries": libraries,
     }
+
+
+@router.get("/websocket", tags=["Debug"], summary="WebSocket client send-queue statistics")
+async def websocket_stats():
+    """Report per-client WebSocket queue depth and dropped/coalesced frame counters.
+
+    A client with a growing ``dropped`` count is too slow to keep up with the
+    broadcast rate and is receiving only the latest state per topic.
+    """
+    from src.api.routers.websocket import get_connection_manager
+
+    return get_connection_manager().get_stats()
+
+
+@router.get("/database", tags=["Debug"], summary="Database read pool and write queue metrics")
+async def database_stats(request: Request):
+    """Report read pool wait time/utilization and write-behind queue counters.
+
+    A high ``wait_ms_avg`` or a ``utilization`` near 1.0 means the read pool
+    is too small for the query load.
+    """
+    database = getattr(request.app.state, "database", None)
+    if database is None:
+        raise ServiceUnavailableError("database", "Database not available")
+    return database.get_pool_stats()
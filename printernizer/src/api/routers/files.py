@@ -3,18 +3,21 @@
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File as FastAPIFile, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File as FastAPIFile, Form, Request
 from fastapi.responses import Response, FileResponse as FastAPIFileResponse
 from pydantic import BaseModel
 import structlog
+import asyncio
 import base64
 
+from src.database.pagination import InvalidCursorError
 from src.models.file import File, FileStatus, FileSource, WatchFolderSettings, WatchFolderStatus, WatchFolderItem
 from src.services.file_service import FileService
 from src.services.config_service import ConfigService
 from src.services.printer_service import PrinterService
 from src.models.printer import PrinterType
 from src.utils.dependencies import get_file_service, get_config_service, get_printer_service
+from src.utils.http_cache import cache_validator_headers, content_etag, is_not_modified
 from src.utils.errors import (
     FileNotFoundError as PrinternizerFileNotFoundError,
     FileDownloadError,
@@ -96,6 +99,7 @@ class PaginationResponse(BaseModel):
     limit: int
     total_items: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 class FileListResponse(BaseModel):
@@ -116,24 +120,39 @@ async def list_files(
     order_by: Optional[str] = Query("created_at", description="Order by field"),
     order_dir: Optional[str] = Query("desc", description="Order direction (asc/desc)"),
     page: Optional[int] = Query(1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from pagination.next_cursor; continues "
+                                                    "after the previous page instead of using page"),
     file_service: FileService = Depends(get_file_service)
 ):
-    """List files from printers and local storage."""
+    """
+    List files from printers and local storage.
+
+    For deep listings pass ``cursor`` (the previous page's
+    ``pagination.next_cursor``) instead of increasing ``page``; cursors are
+    available when ordering by created_at, filename or file_size.
+    """
     logger.info("Listing files", printer_id=printer_id, status=status, source=source,
-               has_thumbnail=has_thumbnail, search=search, limit=limit, page=page)
-
-    # Get paginated files with total count (optimized to avoid fetching all records twice)
-    paginated_files, total_items = await file_service.get_files_with_count(
-        printer_id=printer_id,
-        status=status,
-        source=source,
-        has_thumbnail=has_thumbnail,
-        search=search,
-        limit=limit,
-        order_by=order_by,
-        order_dir=order_dir,
-        page=page
-    )
+               has_thumbnail=has_thumbnail, search=search, limit=limit, page=page,
+               cursor=bool(cursor))
+
+    try:
+        result = await file_service.get_files_page(
+            printer_id=printer_id,
+            status=status,
+            source=source,
+            has_thumbnail=has_thumbnail,
+            search=search,
+            limit=limit,
+            order_by=order_by,
+            order_dir=order_dir,
+            page=page,
+            cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise PrinternizerValidationError(field="cursor", error=str(e))
+    except ValueError as e:
+        raise PrinternizerValidationError(field="order_by", error=str(e))
+    paginated_files, total_items = result.items, result.total
     total_pages = max(1, (total_items + limit - 1) // limit) if limit else 1
 
     logger.info("Got files from service", total=total_items, page_count=len(paginated_files))
@@ -155,17 +174,17 @@ async def list_files(
                         file_id=file_data.get('id'),
                         file_type=file_data['file_type'])
 
-    file_list = [FileResponse.model_validate(file) for file in paginated_files]
-
-    logger.info("Validated files", count=len(file_list))
+    # Rows are validated once, by response_model; building FileResponse
+    # objects here would validate and dump every row a second time
+    file_list = paginated_files
 
     # Log sample for verification (only in debug mode)
     if file_list:
         sample = file_list[0]
         logger.debug("Sample file response",
-                    file_id=sample.id,
-                    file_type=sample.file_type,
-                    filename=sample.filename)
+                    file_id=sample.get('id'),
+                    file_type=sample.get('file_type'),
+                    filename=sample.get('filename'))
 
     return {
         "files": file_list,
@@ -174,7 +193,8 @@ async def list_files(
             "page": page,
             "limit": limit,
             "total_items": total_items,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": result.next_cursor
         }
     }
 
@@ -428,9 +448,10 @@ async def upload_files(
 @router.get("/{file_id}/thumbnail")
 async def get_file_thumbnail(
     file_id: str,
+    request: Request,
     file_service: FileService = Depends(get_file_service)
 ):
-    """Get thumbnail image for a file."""
+    """Get thumbnail image for a file (ETag validated, 304 if the client's copy is current)."""
     file_data = await file_service.get_file_by_id(file_id)
 
     if not file_data:
@@ -439,6 +460,14 @@ async def get_file_thumbnail(
     if not file_data.get('has_thumbnail') or not file_data.get('thumbnail_data'):
         raise PrinternizerFileNotFoundError(file_id, details={"reason": "no_thumbnail"})
 
+    # Validate against the stored data before decoding it
+    etag = content_etag(file_data['thumbnail_data'])
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={
+            "Cache-Control": "public, max-age=86400",
+            **cache_validator_headers(etag)
+        })
+
     # Decode base64 thumbnail data
     try:
         thumbnail_data = base64.b64decode(file_data['thumbnail_data'])
@@ -460,7 +489,8 @@ async def get_file_thumbnail(
         media_type=content_type,
         headers={
             "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
-            "Content-Disposition": f"inline; filename=thumbnail_{file_id}.{thumbnail_format}"
+            "Content-Disposition": f"inline; filename=thumbnail_{file_id}.{thumbnail_format}",
+            **cache_validator_headers(etag)
         }
     )
 
@@ -468,9 +498,10 @@ async def get_file_thumbnail(
 @router.get("/{file_id}/thumbnail/animated")
 async def get_file_animated_thumbnail(
     file_id: str,
+    request: Request,
     file_service: FileService = Depends(get_file_service)
 ):
-    """Get animated GIF thumbnail for a file (multi-angle preview)."""
+    """Get animated GIF thumbnail for a file (multi-angle preview, 304 if the client's copy is current)."""
     file_data = await file_service.get_file_by_id(file_id)
 
     if not file_data:
@@ -491,12 +522,22 @@ async def get_file_animated_thumbnail(
             reason=f"Animated thumbnails not supported for {file_type} files"
         )
 
+    # Remove leading dot from file_type for preview service
+    file_type_clean = file_type.lstrip('.')
+    preview_service = file_service.thumbnail.preview_render_service
+
+    # Answer revalidations from the preview cache index without reading the GIF
+    entry = await asyncio.to_thread(preview_service.get_cached_preview, file_path, file_type_clean,
+                                    size=(200, 200), animated=True)
+    if entry is not None and is_not_modified(request, entry.etag, entry.created_at):
+        return Response(status_code=304, headers={
+            "Cache-Control": "public, max-age=86400",
+            **cache_validator_headers(entry.etag, entry.created_at)
+        })
+
     try:
         # Get or generate animated preview using file service's thumbnail service
-        # Remove leading dot from file_type for preview service
-        file_type_clean = file_type.lstrip('.')
-        
-        gif_bytes = await file_service.thumbnail.preview_render_service.get_or_generate_animated_preview(
+        gif_bytes = await preview_service.get_or_generate_animated_preview(
             file_path,
             file_type_clean,
             size=(200, 200)
@@ -509,13 +550,19 @@ async def get_file_animated_thumbnail(
                 reason="Failed to generate animated preview"
             )
 
+        entry = await asyncio.to_thread(preview_service.get_cached_preview, file_path, file_type_clean,
+                                        size=(200, 200), animated=True)
+        validators = (cache_validator_headers(entry.etag, entry.created_at) if entry
+                      else cache_validator_headers(content_etag(gif_bytes)))
+
         # Return GIF response
         return Response(
             content=gif_bytes,
             media_type="image/gif",
             headers={
                 "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
-                "Content-Disposition": f"inline; filename=thumbnail_animated_{file_id}.gif"
+                "Content-Disposition": f"inline; filename=thumbnail_animated_{file_id}.gif",
+                **validators
             }
         )
 
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, Field
 import structlog
 
+from src.database.pagination import InvalidCursorError
 from src.models.job import Job, JobStatus, JobCreate, JobUpdateRequest, JobStatusUpdateRequest, JobStatusUpdateResponse
 from src.services.job_service import JobService
 from src.services.printer_service import PrinterService
@@ -30,6 +31,7 @@ class PaginationResponse(BaseModel):
     limit: int
     total_items: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 class JobResponse(BaseModel):
@@ -74,10 +76,14 @@ class JobListResponse(BaseModel):
     pagination: PaginationResponse
 
 
-def _transform_job_to_response(job_data: dict) -> dict:
-    """Transform job data to response format."""
+def _transform_job_to_response(job_data: dict, copy: bool = True) -> dict:
+    """Transform job data to response format.
+
+    Pass ``copy=False`` for dicts the caller owns (e.g. fresh from
+    JobService) to fill in the response fields in place.
+    """
     # Create a copy to avoid modifying the original
-    response_data = job_data.copy()
+    response_data = job_data.copy() if copy else job_data
 
     # Extract customer_name from customer_info JSON
     customer_info = response_data.get('customer_info')
@@ -117,36 +123,52 @@ async def list_jobs(
     job_status: Optional[str] = Query(None, description="Filter by job status"),
     is_business: Optional[bool] = Query(None, description="Filter business/private jobs"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of jobs to return"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given)"),
+    cursor: Optional[str] = Query(None, description="Cursor from pagination.next_cursor of the previous page"),
+    sort_by: str = Query('created_at', description="Sort by field (created_at, updated_at, job_name)"),
+    sort_order: str = Query('desc', description="Sort order (asc, desc)"),
     job_service: JobService = Depends(get_job_service)
 ):
-    """List jobs with optional filtering and pagination."""
+    """List jobs with optional filtering and pagination.
+
+    Infinite scroll should follow ``pagination.next_cursor``: cursor pages
+    cost the same however deep they are, and their ``total_items`` may be
+    up to a few seconds old. ``page`` remains for numbered pagination.
+    """
     # Calculate offset for database-level pagination
     offset = (page - 1) * limit
 
-    # Get paginated jobs with total count (optimized with separate COUNT query)
-    paginated_jobs, total_items = await job_service.list_jobs_with_count(
-        printer_id=printer_id,
-        status=job_status,
-        is_business=is_business,
-        limit=limit,
-        offset=offset
-    )
-    total_pages = max(1, (total_items + limit - 1) // limit)
-
-    # Transform jobs to response format
-    job_responses = [JobResponse.model_validate(_transform_job_to_response(job)) for job in paginated_jobs]
-
-    return JobListResponse(
-        jobs=job_responses,
-        total_count=total_items,
-        pagination=PaginationResponse(
-            page=page,
+    try:
+        paginated_jobs, total_items, next_cursor = await job_service.list_jobs_page(
+            printer_id=printer_id,
+            status=job_status,
+            is_business=is_business,
             limit=limit,
-            total_items=total_items,
-            total_pages=total_pages
+            offset=offset,
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_order=sort_order
         )
-    )
+    except InvalidCursorError as e:
+        raise PrinternizerValidationError(field="cursor", error=str(e))
+    except ValueError as e:
+        raise PrinternizerValidationError(field="sort_by", error=str(e))
+    total_pages = max(1, (total_items + limit - 1) // limit)
+
+    # Transform jobs to response format; response_model validates them once
+    job_responses = [_transform_job_to_response(job, copy=False) for job in paginated_jobs]
+
+    return {
+        'jobs': job_responses,
+        'total_count': total_items,
+        'pagination': {
+            'page': page,
+            'limit': limit,
+            'total_items': total_items,
+            'total_pages': total_pages,
+            'next_cursor': next_cursor
+        }
+    }
 
 
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
@@ -216,7 +238,7 @@ async def export_jobs(
     writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
     writer.writeheader()
     for job in jobs:
-        row = _transform_job_to_response(job)
+        row = _transform_job_to_response(job, copy=False)
         for key, value in row.items():
             if isinstance(value, datetime):
                 row[key] = value.isoformat()
@@ -5,13 +5,16 @@ Provides REST API for library operations (list, get, reprocess, delete).
 
 from typing import Optional, Dict, Any, List
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, Query, Path as PathParam, Depends
+from fastapi import APIRouter, HTTPException, Query, Path as PathParam, Depends, Request
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 import structlog
 import asyncio
 
+from src.constants import LibraryConstants
+from src.database.pagination import InvalidCursorError
 from src.utils.dependencies import get_printer_service
+from src.utils.http_cache import cache_validator_headers, content_etag, is_not_modified
 
 from src.utils.errors import (
     LibraryItemNotFoundError,
@@ -108,6 +111,7 @@ class LibraryStatsResponse(BaseModel):
     unique_file_types: int = 0
     avg_file_size: float = 0
     total_material_cost: float = 0
+    extraction_queue: Dict[str, Any] = {}
 
 
 class ReprocessResponse(BaseModel):
@@ -177,6 +181,7 @@ async def list_library_files(
     only_duplicates: Optional[bool] = Query(False, description="Show only duplicate files (default: false)"),
     sort_by: Optional[str] = Query('created_at', description="Sort by field (created_at, filename, file_size, last_modified)"),
     sort_order: Optional[str] = Query('desc', description="Sort order (asc, desc)"),
+    cursor: Optional[str] = Query(None, description="Cursor from pagination.next_cursor of the previous page"),
     library_service = Depends(get_library_service)
 ):
     """
@@ -196,6 +201,9 @@ async def list_library_files(
     **Pagination:**
     - `page`: Page number (starts at 1)
     - `limit`: Items per page (default 50, max 200)
+    - `cursor`: Continue after the previous page (`pagination.next_cursor`);
+      constant cost per page for infinite scroll, `page` is then ignored and
+      `total_items` may be a few seconds old
 
     **Sorting:**
     - `sort_by`: Sort by field (created_at, filename, file_size, last_modified) - default: created_at
@@ -236,7 +244,10 @@ async def list_library_files(
         filters['sort_order'] = sort_order
 
     # Get files from library service
-    files, pagination = await library_service.list_files(filters, page, limit)
+    try:
+        files, pagination = await library_service.list_files(filters, page, limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise PrinternizerValidationError(field="cursor", error=str(e))
 
     return {
         'files': files,
@@ -269,6 +280,10 @@ async def get_library_file(
     if not file_record:
         raise LibraryItemNotFoundError(checksum)
 
+    # The user is looking at it: extract it next if it is still queued
+    if file_record.get('last_analyzed') is None:
+        await library_service.prioritize_extraction(checksum)
+
     return file_record
 
 
@@ -355,8 +370,8 @@ async def reprocess_library_file(
     - `checksum`: File SHA-256 checksum
 
     **Process:**
-    1. File status set to 'processing'
-    2. Metadata extraction scheduled asynchronously
+    1. File queued for metadata extraction (ahead of background work)
+    2. File status set to 'processing' when a worker picks it up
     3. Thumbnails regenerated
     4. Status updated to 'ready' or 'error'
 
@@ -480,7 +495,8 @@ async def get_library_statistics(
         error_files=stats.get('error_files', 0),
         unique_file_types=stats.get('unique_file_types', 0),
         avg_file_size=stats.get('avg_file_size', 0),
-        total_material_cost=stats.get('total_material_cost', 0)
+        total_material_cost=stats.get('total_material_cost', 0),
+        extraction_queue=stats.get('extraction_queue', {})
     )
 
 
@@ -732,6 +748,7 @@ async def get_library_file_metadata(
 
 @router.get("/files/{checksum}/thumbnail/animated")
 async def get_library_file_animated_thumbnail(
+    request: Request,
     checksum: str = PathParam(..., description="File checksum (SHA-256)"),
     library_service = Depends(get_library_service)
 ):
@@ -747,9 +764,11 @@ async def get_library_file_animated_thumbnail(
     **Returns:**
     - GIF image data (binary)
     - Content-Type: image/gif
+    - `ETag` / `Last-Modified` of the cached preview
 
     **Status Codes:**
     - `200`: Animated thumbnail returned successfully
+    - `304`: The client's copy (`If-None-Match` / `If-Modified-Since`) is current
     - `404`: File not found
     - `400`: File type not supported for animation
     - `500`: Error generating animated thumbnail
@@ -781,15 +800,26 @@ async def get_library_file_animated_thumbnail(
             reason=f"Animated thumbnails not supported for {file_type} files"
         )
 
+    # Remove leading dot from file_type for preview service
+    file_type_clean = file_type.lstrip('.')
+    preview_service = library_service.preview_service
+
+    # Answer revalidations from the preview cache index without reading the GIF
+    entry = await asyncio.to_thread(preview_service.get_cached_preview, str(file_path), file_type_clean,
+                                    size=(200, 200), checksum=checksum, animated=True)
+    if entry is not None and is_not_modified(request, entry.etag, entry.created_at):
+        return Response(status_code=304, headers={
+            "Cache-Control": "public, max-age=86400",
+            **cache_validator_headers(entry.etag, entry.created_at)
+        })
+
     try:
         # Get or generate animated preview using library service's preview service
-        # Remove leading dot from file_type for preview service
-        file_type_clean = file_type.lstrip('.')
-        
-        gif_bytes = await library_service.preview_service.get_or_generate_animated_preview(
+        gif_bytes = await preview_service.get_or_generate_animated_preview(
             str(file_path),
             file_type_clean,
-            size=(200, 200)
+            size=(200, 200),
+            checksum=checksum
         )
 
         if not gif_bytes:
@@ -799,13 +829,19 @@ async def get_library_file_animated_thumbnail(
                 reason="Failed to generate animated preview"
             )
 
+        entry = await asyncio.to_thread(preview_service.get_cached_preview, str(file_path), file_type_clean,
+                                        size=(200, 200), checksum=checksum, animated=True)
+        validators = (cache_validator_headers(entry.etag, entry.created_at) if entry
+                      else cache_validator_headers(content_etag(gif_bytes)))
+
         # Return GIF response
         return Response(
             content=gif_bytes,
             media_type="image/gif",
             headers={
                 "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
-                "Content-Disposition": f"inline; filename=thumbnail_animated_{checksum[:16]}.gif"
+                "Content-Disposition": f"inline; filename=thumbnail_animated_{checksum[:16]}.gif",
+                **validators
             }
         )
 
@@ -823,6 +859,7 @@ async def get_library_file_animated_thumbnail(
 
 @router.get("/files/{checksum}/thumbnail")
 async def get_library_file_thumbnail(
+    request: Request,
     checksum: str = PathParam(..., description="File checksum (SHA-256)"),
     library_service = Depends(get_library_service)
 ):
@@ -837,9 +874,11 @@ async def get_library_file_thumbnail(
     **Returns:**
     - PNG image data (binary)
     - Content-Type: image/png
+    - `ETag` of the thumbnail data
 
     **Status Codes:**
     - `200`: Thumbnail returned successfully
+    - `304`: The client's copy (`If-None-Match`) is current
     - `404`: File not found or no thumbnail available
     - `500`: Error retrieving thumbnail
     """
@@ -855,6 +894,14 @@ async def get_library_file_thumbnail(
     if not file_record.get('has_thumbnail') or not file_record.get('thumbnail_data'):
         raise LibraryItemNotFoundError(checksum, details={"reason": "no_thumbnail"})
 
+    # Validate against the stored data before decoding it
+    etag = content_etag(file_record['thumbnail_data'])
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={
+            "Cache-Control": "public, max-age=3600",
+            **cache_validator_headers(etag)
+        })
+
     # Decode base64 thumbnail data
     try:
         thumbnail_base64 = file_record['thumbnail_data']
@@ -869,7 +916,8 @@ async def get_library_file_thumbnail(
             media_type="image/png",
             headers={
                 "Cache-Control": "public, max-age=3600",
-                "Content-Disposition": f"inline; filename=\"{checksum[:16]}_thumbnail.png\""
+                "Content-Disposition": f"inline; filename=\"{checksum[:16]}_thumbnail.png\"",
+                **cache_validator_headers(etag)
             }
         )
     except Exception as e:
@@ -906,7 +954,8 @@ async def bulk_reanalyze_library(
 
     **Note:**
     - This operation runs asynchronously in the background
-    - Files are processed one at a time to avoid overloading the system
+    - Files are queued at backfill priority and extracted by a fixed number of
+      workers, so files a user opens or uploads are extracted first
     - Check individual file status to see when extraction completes
 
     **Returns:**
@@ -963,7 +1012,8 @@ async def bulk_reanalyze_library(
     for file in files_to_process:
         try:
             # Create task without awaiting to schedule all files quickly
-            task = library_service.reprocess_file(file['checksum'])
+            task = library_service.reprocess_file(
+                file['checksum'], priority=LibraryConstants.EXTRACTION_PRIORITY_BACKFILL)
             tasks.append(task)
         except Exception as e:
             logger.warning("Failed to create reprocessing task",
@@ -2,7 +2,7 @@
 
 import os
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Query
 from fastapi.responses import RedirectResponse
@@ -13,7 +13,11 @@ import structlog
 
 from src.models.printer import Printer, PrinterType, PrinterStatus
 from src.services.printer_service import PrinterService
-from src.utils.dependencies import get_printer_service, get_database, get_job_repository, get_file_service
+from src.services.status_history_service import StatusHistoryService, RESOLUTIONS
+from src.utils.dependencies import (
+    get_printer_service, get_database, get_job_repository, get_file_service,
+    get_status_history_service
+)
 from src.database.repositories import JobRepository
 from src.database.database import Database
 from src.utils.errors import (
@@ -585,6 +589,44 @@ async def get_printer_status(
     return response
 
 
+@router.get("/{printer_id}/history")
+async def get_printer_history(
+    printer_id: str,
+    start: Optional[datetime] = Query(None, description="Range start (default: 6 hours before end)"),
+    end: Optional[datetime] = Query(None, description="Range end (default: now)"),
+    resolution: str = Query("auto", description=f"One of {', '.join(RESOLUTIONS)}"),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of "
+                                                    "temperature_bed,temperature_nozzle,progress"),
+    printer_service: PrinterService = Depends(get_printer_service),
+    status_history_service: StatusHistoryService = Depends(get_status_history_service)
+):
+    """
+    Get temperature and progress history for charts.
+
+    Returns parallel arrays: ``timestamps`` (epoch seconds) and one value
+    list per field. Raw samples are kept 24 hours, 1-minute averages 30 days
+    and 15-minute averages forever; ``auto`` picks the finest resolution
+    that suits the range.
+    """
+    printer = await printer_service.get_printer(printer_id)
+    if not printer:
+        raise PrinterNotFoundError(printer_id)
+
+    end = end or datetime.now(start.tzinfo if start else None)
+    start = start or end - timedelta(hours=6)
+    if start > end:
+        raise PrinternizerValidationError(field="start", error="start must not be after end")
+
+    try:
+        return await status_history_service.get_series(
+            printer_id, start, end, resolution=resolution,
+            fields=[field.strip() for field in fields.split(",") if field.strip()] if fields else None
+        )
+    except ValueError as e:
+        raise PrinternizerValidationError(field="resolution" if "resolution" in str(e) else "fields",
+                                          error=str(e))
+
+
 @router.get("/{printer_id}/details")
 async def get_printer_details(
     printer_id: str,
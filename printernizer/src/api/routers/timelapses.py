@@ -133,6 +133,27 @@ async def trigger_processing(
     return timelapse
 
 
+@router.post("/{timelapse_id}/cancel", response_model=dict)
+async def cancel_processing(
+    timelapse_id: str,
+    timelapse_service: TimelapseService = Depends(get_timelapse_service)
+):
+    """
+    Cancel a pending or running render.
+
+    A running render process is stopped; the timelapse is marked failed and
+    can be triggered again.
+
+    - **timelapse_id**: Unique timelapse identifier
+    """
+    timelapse = await timelapse_service.cancel_processing(timelapse_id)
+
+    if not timelapse:
+        raise NotFoundError(resource_type="timelapse", resource_id=timelapse_id)
+
+    return timelapse
+
+
 @router.delete("/{timelapse_id}", status_code=204)
 async def delete_timelapse(
     timelapse_id: str,
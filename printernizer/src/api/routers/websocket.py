@@ -1,36 +1,288 @@
-"""WebSocket endpoints for real-time updates."""
+"""WebSocket endpoints for real-time updates.
 
-from typing import Dict, Set
+Two protocol modes are available for printer status:
+
+* ``full`` (default): every ``printer_status`` frame carries the complete
+  status dict of one printer.
+* ``delta`` (opt-in via ``/ws?protocol=delta`` or a
+  ``{"type": "set_protocol", "mode": "delta"}`` message): subscribing sends
+  one ``printer_snapshot`` frame with the full state of the subscribed
+  printers, followed by ``printer_patch`` frames holding JSON-patch style
+  ``ops`` (``add``/``replace``/``remove``) per printer. Every delta frame
+  carries a per-connection ``seq``; a client that misses a frame or gets
+  confused sends ``{"type": "resync"}`` and receives a fresh snapshot.
+
+Subscribing to printer ``"*"`` receives status for all printers.
+"""
+
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Union
+import itertools
 import json
 import asyncio
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from prometheus_client import Counter, Gauge
 import structlog
 
+from src.constants import WebSocketConstants
 from src.services.event_service import EventService
 
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+PROTOCOL_FULL = "full"
+PROTOCOL_DELTA = "delta"
+ALL_PRINTERS = "*"
+
+# A queued frame is either pre-serialized text or a producer that renders the
+# frame when it is actually sent (returns None to skip it)
+Frame = Union[str, Callable[[], Optional[str]]]
+
+
+def _escape_pointer(key: str) -> str:
+    """Escape a key for use as a JSON pointer segment (RFC 6901)."""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def diff_status(old: Dict[str, Any], new: Dict[str, Any], path: str = "") -> List[Dict[str, Any]]:
+    """Compute JSON-patch style operations turning ``old`` into ``new``.
+
+    Nested dicts are diffed recursively; any other value (including lists)
+    is replaced as a whole.
+    """
+    ops: List[Dict[str, Any]] = []
+    for key, value in new.items():
+        pointer = f"{path}/{_escape_pointer(key)}"
+        if key not in old:
+            ops.append({"op": "add", "path": pointer, "value": value})
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            ops.extend(diff_status(old[key], value, pointer))
+        elif old[key] != value:
+            ops.append({"op": "replace", "path": pointer, "value": value})
+    for key in old:
+        if key not in new:
+            ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+    return ops
+
+
+# Per-client broadcaster metrics - initialized once
+try:
+    WS_QUEUE_DEPTH = Gauge(
+        'printernizer_websocket_queue_depth',
+        'Frames waiting in a WebSocket client send queue', ['client']
+    )
+    WS_DROPPED_FRAMES = Counter(
+        'printernizer_websocket_dropped_frames_total',
+        'Frames discarded for a WebSocket client (overflow or superseded)', ['client', 'reason']
+    )
+except ValueError:
+    # Metrics already registered (happens during reload)
+    from prometheus_client import REGISTRY
+    WS_QUEUE_DEPTH = REGISTRY._names_to_collectors['printernizer_websocket_queue_depth']
+    WS_DROPPED_FRAMES = REGISTRY._names_to_collectors['printernizer_websocket_dropped_frames_total']
+
+
+class ClientConnection:
+    """A connected WebSocket client with its own bounded send queue.
+
+    Frames are pre-serialized strings. A frame may carry a coalesce key
+    (e.g. ``printer_status:<printer_id>``); a newer frame with the same key
+    replaces the pending one in place, so a slow client only ever receives
+    the latest state per topic. When the queue is full the oldest frame is
+    dropped. A dedicated writer task drains the queue, so one stalled
+    client never delays the others.
+    """
+
+    def __init__(self, websocket: WebSocket, manager: "ConnectionManager",
+                 max_queue: int = WebSocketConstants.CLIENT_QUEUE_SIZE):
+        self.websocket = websocket
+        self.manager = manager
+        self.client_id = uuid4().hex[:8]
+        self.max_queue = max(1, max_queue)
+        self._queue: "OrderedDict[Hashable, Frame]" = OrderedDict()
+        self._seq = itertools.count()
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        # Delta protocol state: latest known and last-sent status per printer
+        self.protocol = PROTOCOL_FULL
+        self.seq = 0
+        self._latest_state: Dict[str, Dict[str, Any]] = {}
+        self._sent_state: Dict[str, Dict[str, Any]] = {}
+
+    def start(self) -> None:
+        """Start the writer task."""
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def stop(self) -> None:
+        """Stop the writer task and discard pending frames."""
+        self._queue.clear()
+        if self._writer and not self._writer.done() and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        for metric, labels in ((WS_QUEUE_DEPTH, (self.client_id,)),
+                               (WS_DROPPED_FRAMES, (self.client_id, 'overflow')),
+                               (WS_DROPPED_FRAMES, (self.client_id, 'superseded'))):
+            try:
+                metric.remove(*labels)
+            except KeyError:
+                pass
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._queue)
+
+    def enqueue(self, text: Frame, coalesce_key: Optional[str] = None) -> None:
+        """Queue a serialized frame (or frame producer) without blocking the caller."""
+        if coalesce_key is not None and coalesce_key in self._queue:
+            self._queue[coalesce_key] = text
+            self.coalesced += 1
+            WS_DROPPED_FRAMES.labels(self.client_id, 'superseded').inc()
+            return
+
+        if len(self._queue) >= self.max_queue:
+            self._queue.popitem(last=False)
+            self.dropped += 1
+            WS_DROPPED_FRAMES.labels(self.client_id, 'overflow').inc()
+
+        key = coalesce_key if coalesce_key is not None else ('_', next(self._seq))
+        self._queue[key] = text
+        WS_QUEUE_DEPTH.labels(self.client_id).set(len(self._queue))
+        self._ready.set()
+
+    async def _write_loop(self) -> None:
+        """Drain the send queue to the socket."""
+        try:
+            while True:
+                while not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                _, frame = self._queue.popitem(last=False)
+                WS_QUEUE_DEPTH.labels(self.client_id).set(len(self._queue))
+                text = frame() if callable(frame) else frame
+                if text is None:
+                    continue
+                await asyncio.wait_for(
+                    self.websocket.send_text(text),
+                    timeout=WebSocketConstants.SEND_TIMEOUT_SECONDS
+                )
+                self.sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.info("WebSocket client send failed, disconnecting",
+                        client=self.client_id, error=str(e) or type(e).__name__)
+            self.manager.disconnect(self.websocket)
+            # Close the socket too, so the client notices and reconnects (and
+            # resyncs) instead of staying connected without frames.
+            # 1013 "try again later" for a stalled client, 1011 otherwise.
+            code = 1013 if isinstance(e, asyncio.TimeoutError) else 1011
+            try:
+                await asyncio.wait_for(self.websocket.close(code=code),
+                                       timeout=WebSocketConstants.SEND_TIMEOUT_SECONDS)
+            except Exception:
+                pass
+
+    def set_protocol(self, mode: str) -> None:
+        """Switch protocol mode; resets delta state."""
+        self.protocol = mode
+        self._latest_state.clear()
+        self._sent_state.clear()
+
+    def queue_printer_state(self, printer_id: str, state: Dict[str, Any]) -> None:
+        """Record a printer's latest state and queue a patch for it (delta mode).
+
+        The patch is computed when the frame is sent, against what this
+        client last received, so coalesced or dropped frames never leave the
+        client with a gap - the next patch simply carries all changes.
+        """
+        self._latest_state[printer_id] = state
+        self.enqueue(lambda: self._render_patch(printer_id),
+                     coalesce_key=f"printer_status:{printer_id}")
+
+    def queue_snapshot(self, states: Dict[str, Dict[str, Any]]) -> None:
+        """Queue a full snapshot of ``states`` (delta mode, subscribe/resync)."""
+        for printer_id, state in states.items():
+            self._latest_state.setdefault(printer_id, state)
+        printer_ids = list(states)
+        self.enqueue(lambda: self._render_snapshot(printer_ids),
+                     coalesce_key=f"printer_snapshot:{','.join(sorted(printer_ids))}")
+
+    def _render_patch(self, printer_id: str) -> Optional[str]:
+        latest = self._latest_state.get(printer_id)
+        if latest is None:
+            return None
+        ops = diff_status(self._sent_state.get(printer_id, {}), latest)
+        if not ops:
+            return None
+        self.seq += 1
+        self._sent_state[printer_id] = deepcopy(latest)
+        return json.dumps({
+            "type": "printer_patch",
+            "printer_id": printer_id,
+            "seq": self.seq,
+            "ops": ops
+        })
+
+    def _render_snapshot(self, printer_ids: List[str]) -> str:
+        printers = {
+            printer_id: self._latest_state[printer_id]
+            for printer_id in printer_ids if printer_id in self._latest_state
+        }
+        for printer_id, state in printers.items():
+            self._sent_state[printer_id] = deepcopy(state)
+        self.seq += 1
+        return json.dumps({
+            "type": "printer_snapshot",
+            "seq": self.seq,
+            "printers": printers
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get send counters for this client."""
+        return {
+            "client": self.client_id,
+            "protocol": self.protocol,
+            "queue_depth": self.queue_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
 
 class ConnectionManager:
-    """WebSocket connection manager."""
+    """WebSocket connection manager.
+
+    Messages are serialized once per broadcast and fanned out to each
+    client's send queue (see ``ClientConnection``).
+    """
     
     def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
+        self.active_connections: Dict[WebSocket, ClientConnection] = {}
         self.printer_subscriptions: Dict[str, Set[WebSocket]] = {}
+        # Last broadcast status per printer, used for delta-mode snapshots
+        self.printer_states: Dict[str, Dict[str, Any]] = {}
         
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, protocol: str = PROTOCOL_FULL):
         """Accept and register a new WebSocket connection.
 
         Args:
             websocket: WebSocket connection to accept and register.
+            protocol: Printer status protocol mode (``full`` or ``delta``).
         """
         await websocket.accept()
-        self.active_connections.add(websocket)
-        logger.info("WebSocket client connected", total_connections=len(self.active_connections))
+        client = ClientConnection(websocket, self)
+        client.set_protocol(protocol)
+        client.start()
+        self.active_connections[websocket] = client
+        logger.info("WebSocket client connected", client=client.client_id,
+                    total_connections=len(self.active_connections))
         
     def disconnect(self, websocket: WebSocket):
         """Unregister a WebSocket connection and clean up subscriptions.
@@ -38,48 +290,102 @@ class ConnectionManager:
         Args:
             websocket: WebSocket connection to disconnect and remove from all subscriptions.
         """
-        self.active_connections.discard(websocket)
+        client = self.active_connections.pop(websocket, None)
+        if client is None:
+            return
+        client.stop()
         # Remove from printer subscriptions
         for printer_id, connections in self.printer_subscriptions.items():
             connections.discard(websocket)
-        logger.info("WebSocket client disconnected", total_connections=len(self.active_connections))
+        logger.info("WebSocket client disconnected", client=client.client_id,
+                    total_connections=len(self.active_connections))
+
+    def _fan_out(self, websockets, message: dict, coalesce_key: Optional[str] = None) -> None:
+        """Serialize ``message`` once and queue it for each connection."""
+        message_str = json.dumps(message)
+        for websocket in websockets:
+            client = self.active_connections.get(websocket)
+            if client is not None:
+                client.enqueue(message_str, coalesce_key)
         
-    async def broadcast(self, message: dict):
+    async def broadcast(self, message: dict, coalesce_key: Optional[str] = None):
         """Broadcast message to all connected clients."""
         if not self.active_connections:
             return
+        self._fan_out(list(self.active_connections), message, coalesce_key)
             
-        message_str = json.dumps(message)
-        disconnected = set()
-        
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_str)
-            except:
-                disconnected.add(connection)
-                
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
-            
-    async def send_to_printer_subscribers(self, printer_id: str, message: dict):
+    async def send_to_printer_subscribers(self, printer_id: str, message: dict,
+                                          coalesce_key: Optional[str] = None):
         """Send message to clients subscribed to specific printer."""
         connections = self.printer_subscriptions.get(printer_id, set())
         if not connections:
             return
-            
-        message_str = json.dumps(message)
-        disconnected = set()
-        
-        for connection in connections:
-            try:
-                await connection.send_text(message_str)
-            except:
-                disconnected.add(connection)
-                
-        # Clean up disconnected clients
-        for connection in disconnected:
-            connections.discard(connection)
+        self._fan_out(list(connections), message, coalesce_key)
+
+    async def publish_printer_status(self, printer_id: str, message: dict):
+        """Send a printer status frame to its subscribers in their protocol mode.
+
+        Full-mode clients receive ``message`` (serialized once); delta-mode
+        clients receive a patch against what they were last sent.
+        """
+        status_data = message.get("data") or {}
+        self.printer_states[printer_id] = status_data
+
+        connections = (self.printer_subscriptions.get(printer_id, set())
+                       | self.printer_subscriptions.get(ALL_PRINTERS, set()))
+        if not connections:
+            return
+
+        full_clients = []
+        for websocket in connections:
+            client = self.active_connections.get(websocket)
+            if client is None:
+                continue
+            if client.protocol == PROTOCOL_DELTA:
+                client.queue_printer_state(printer_id, status_data)
+            else:
+                full_clients.append(websocket)
+        if full_clients:
+            self._fan_out(full_clients, message, coalesce_key=f"printer_status:{printer_id}")
+
+    def subscribed_printers(self, websocket: WebSocket, known_printers: Iterable[str] = ()) -> List[str]:
+        """List printer IDs a connection is subscribed to.
+
+        A ``*`` subscription expands to every printer broadcast so far plus
+        ``known_printers``.
+        """
+        if websocket in self.printer_subscriptions.get(ALL_PRINTERS, set()):
+            return list(dict.fromkeys([*self.printer_states, *known_printers]))
+        return [
+            printer_id for printer_id, connections in self.printer_subscriptions.items()
+            if printer_id != ALL_PRINTERS and websocket in connections
+        ]
+
+    def send_snapshot(self, websocket: WebSocket, printer_ids: List[str],
+                      fallback: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None):
+        """Queue a delta-protocol snapshot for ``printer_ids``.
+
+        Args:
+            websocket: Target connection (must be in delta mode).
+            printer_ids: Printers to include.
+            fallback: Optional lookup for printers that have not been
+                broadcast since startup (e.g. the event service status bus).
+        """
+        client = self.active_connections.get(websocket)
+        if client is None:
+            return
+        states = {}
+        for printer_id in printer_ids:
+            state = self.printer_states.get(printer_id)
+            if state is None and fallback is not None:
+                state = fallback(printer_id)
+            if state is not None:
+                states[printer_id] = state
+        client.queue_snapshot(states)
+
+    async def send_personal(self, websocket: WebSocket, message: dict):
+        """Queue a message for a single connection (replies to client requests)."""
+        self._fan_out((websocket,), message)
             
     def subscribe_to_printer(self, websocket: WebSocket, printer_id: str):
         """Subscribe websocket to printer updates."""
@@ -92,17 +398,32 @@ class ConnectionManager:
         if printer_id in self.printer_subscriptions:
             self.printer_subscriptions[printer_id].discard(websocket)
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-client queue depth and drop counters."""
+        clients = [client.get_stats() for client in self.active_connections.values()]
+        return {
+            "total_connections": len(clients),
+            "total_queue_depth": sum(c["queue_depth"] for c in clients),
+            "total_dropped": sum(c["dropped"] for c in clients),
+            "total_coalesced": sum(c["coalesced"] for c in clients),
+            "clients": clients,
+        }
+
 
 manager = ConnectionManager()
 
 
 @router.websocket("")
-async def websocket_endpoint(websocket: WebSocket):
-    """Main WebSocket endpoint for real-time updates."""
+async def websocket_endpoint(websocket: WebSocket, protocol: str = PROTOCOL_FULL):
+    """Main WebSocket endpoint for real-time updates.
+
+    Pass ``?protocol=delta`` to opt in to snapshot + patch printer status frames.
+    """
     event_service = websocket.app.state.event_service
-    await _handle_websocket_connection(websocket, event_service)
+    await _handle_websocket_connection(websocket, event_service, protocol)
 
-async def _handle_websocket_connection(websocket: WebSocket, event_service: EventService):
+async def _handle_websocket_connection(websocket: WebSocket, event_service: EventService,
+                                       protocol: str = PROTOCOL_FULL):
     """Handle WebSocket connection lifecycle and message processing.
 
     Manages the full lifecycle of a WebSocket connection including accepting the connection,
@@ -111,11 +432,14 @@ async def _handle_websocket_connection(websocket: WebSocket, event_service: Even
     Args:
         websocket: WebSocket connection to handle.
         event_service: Event service for publishing real-time updates.
+        protocol: Initial printer status protocol mode.
 
     Raises:
         WebSocketDisconnect: When the client disconnects.
     """
-    await manager.connect(websocket)
+    if protocol not in (PROTOCOL_FULL, PROTOCOL_DELTA):
+        protocol = PROTOCOL_FULL
+    await manager.connect(websocket, protocol)
     
     try:
         while True:
@@ -123,59 +447,109 @@ async def _handle_websocket_connection(websocket: WebSocket, event_service: Even
             data = await websocket.receive_text()
             try:
                 message = json.loads(data)
-                await handle_client_message(websocket, message)
+                await handle_client_message(websocket, message, event_service)
             except json.JSONDecodeError:
-                await websocket.send_text(json.dumps({
+                await manager.send_personal(websocket, {
                     "type": "error",
                     "message": "Invalid JSON format"
-                }))
+                })
             except Exception as e:
                 logger.error("Error handling WebSocket message", error=str(e))
-                await websocket.send_text(json.dumps({
+                await manager.send_personal(websocket, {
                     "type": "error", 
                     "message": "Internal server error"
-                }))
+                })
                 
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 
-async def handle_client_message(websocket: WebSocket, message: dict):
+def _status_fallback(event_service: Optional[EventService]) -> Optional[Callable[[str], Optional[Dict[str, Any]]]]:
+    """Status lookup for printers not broadcast since startup."""
+    status_bus = getattr(event_service, "status_bus", None)
+    if status_bus is None:
+        return None
+    return status_bus.get_snapshot
+
+
+def _send_delta_snapshot(websocket: WebSocket, event_service: Optional[EventService],
+                         printer_ids: Optional[List[str]] = None) -> None:
+    """Queue a snapshot of ``printer_ids`` (default: all subscribed printers)."""
+    if printer_ids is None:
+        status_bus = getattr(event_service, "status_bus", None)
+        known = status_bus.printer_ids() if status_bus is not None else ()
+        printer_ids = manager.subscribed_printers(websocket, known)
+    manager.send_snapshot(websocket, printer_ids, _status_fallback(event_service))
+
+
+async def handle_client_message(websocket: WebSocket, message: dict,
+                                event_service: Optional[EventService] = None):
     """Handle incoming client messages."""
     message_type = message.get("type")
+    client = manager.active_connections.get(websocket)
+    delta_mode = client is not None and client.protocol == PROTOCOL_DELTA
     
     if message_type == "subscribe_printer":
         printer_id = message.get("printer_id")
         if printer_id:
             manager.subscribe_to_printer(websocket, printer_id)
-            await websocket.send_text(json.dumps({
+            await manager.send_personal(websocket, {
                 "type": "subscribed",
                 "printer_id": printer_id
-            }))
+            })
+            if delta_mode:
+                _send_delta_snapshot(websocket, event_service,
+                                     None if printer_id == ALL_PRINTERS else [printer_id])
+
+    elif message_type == "set_protocol":
+        mode = message.get("mode")
+        if client is not None and mode in (PROTOCOL_FULL, PROTOCOL_DELTA):
+            client.set_protocol(mode)
+            await manager.send_personal(websocket, {"type": "protocol", "mode": mode})
+            if mode == PROTOCOL_DELTA:
+                _send_delta_snapshot(websocket, event_service)
+        else:
+            await manager.send_personal(websocket, {
+                "type": "error",
+                "message": f"Unknown protocol mode: {mode}"
+            })
+
+    elif message_type == "resync":
+        if delta_mode:
+            # The snapshot resets what the client is assumed to hold when sent
+            _send_delta_snapshot(websocket, event_service)
+        else:
+            await manager.send_personal(websocket, {
+                "type": "error",
+                "message": "resync requires the delta protocol"
+            })
             
     elif message_type == "unsubscribe_printer":
         printer_id = message.get("printer_id")
         if printer_id:
             manager.unsubscribe_from_printer(websocket, printer_id)
-            await websocket.send_text(json.dumps({
+            await manager.send_personal(websocket, {
                 "type": "unsubscribed", 
                 "printer_id": printer_id
-            }))
+            })
             
     elif message_type == "ping":
-        await websocket.send_text(json.dumps({"type": "pong"}))
+        await manager.send_personal(websocket, {"type": "pong"})
         
     else:
-        await websocket.send_text(json.dumps({
+        await manager.send_personal(websocket, {
             "type": "error",
             "message": f"Unknown message type: {message_type}"
-        }))
+        })
 
 
 # Event handlers for broadcasting updates
 async def broadcast_printer_status(printer_id: UUID, status_data: dict):
     """Broadcast printer status update."""
-    await manager.send_to_printer_subscribers(str(printer_id), {
+    # Coalesced per printer: a slow client only gets the latest status
+    await manager.publish_printer_status(str(printer_id), {
         "type": "printer_status",
         "printer_id": str(printer_id),
         "data": status_data
@@ -188,16 +562,24 @@ async def broadcast_job_update(job_id: UUID, job_data: dict):
         "type": "job_update",
         "job_id": str(job_id),
         "data": job_data
-    })
+    }, coalesce_key=f"job_update:{job_id}")
+
 
+async def broadcast_system_event(event_type: str, event_data: dict,
+                                 coalesce_key: Optional[str] = None):
+    """Broadcast system event.
 
-async def broadcast_system_event(event_type: str, event_data: dict):
-    """Broadcast system event."""
+    Args:
+        event_type: System event type.
+        event_data: Event payload.
+        coalesce_key: Optional key; a pending frame with the same key is
+            replaced instead of queued again (e.g. progress updates).
+    """
     await manager.broadcast({
         "type": "system_event",
         "event_type": event_type,
         "data": event_data
-    })
+    }, coalesce_key=coalesce_key)
 
 
 # Make connection manager available for other modules
@@ -168,6 +168,36 @@ class FileConstants:
     BAMBU_FILE_CACHE_VALIDITY_SECONDS: int = 30
     """Cached file list validity duration"""
 
+    HASH_CHUNK_BYTES: int = 1_048_576
+    """Read buffer for full file hashes (reused for the whole file)"""
+
+    HASH_SAMPLE_BYTES: int = 65_536
+    """Bytes sampled from head and tail for the duplicate pre-screen fingerprint"""
+
+    HASH_LOG_MIN_BYTES: int = 10_485_760
+    """Log hashing throughput for files of at least this size"""
+
+    SCAN_STAT_WORKERS: int = 4
+    """Default concurrent stat workers in the watch-folder scan pipeline (setting: watch_scan_stat_workers)"""
+
+    SCAN_HASH_WORKERS: int = 4
+    """Default concurrent hash workers (checksum index lookup + hashing) per folder scan (setting: watch_scan_hash_workers)"""
+
+    SCAN_REGISTER_WORKERS: int = 2
+    """Default concurrent library registrations per folder scan (setting: watch_scan_register_workers)"""
+
+    SCAN_WALK_BATCH_SIZE: int = 256
+    """Paths handed from the directory walk thread to the stat stage per batch"""
+
+    SCAN_QUEUE_SIZE: int = 1024
+    """Bound of each queue between scan pipeline stages (back-pressure)"""
+
+    SCAN_INDEX_BATCH_SIZE: int = 200
+    """Checksum index rows written per transaction during a scan"""
+
+    SCAN_PROGRESS_INTERVAL_SECONDS: float = 1.0
+    """Interval between watch_folder_scan_progress events"""
+
 
 class MonitoringConstants:
     """
@@ -191,10 +221,85 @@ class MonitoringConstants:
     MONITOR_JITTER_MAX: float = 0.1
     """Maximum jitter for monitoring interval randomization"""
 
+    STATUS_PUSH_MIN_INTERVAL_SECONDS: float = 2.0
+    """Minimum spacing between push-driven status publishes per printer"""
+
+    STATUS_POLL_TIMEOUT_SECONDS: float = 10.0
+    """Per-printer timeout for the fallback status poll"""
+
+    LAST_SEEN_REFRESH_SECONDS: int = 300
+    """Refresh printers.last_seen at least this often even without status changes"""
+
     FILENAME_PREFIX_MATCH_LENGTH: int = 20
     """Prefix length for truncated filename matching"""
 
 
+class DatabaseConstants:
+    """
+    SQLite connection constants.
+
+    Controls the write-behind queue that group-commits high-frequency writes
+    and the read-only connection pool.
+    """
+
+    WRITE_QUEUE_MAX_DELAY_SECONDS: float = 0.05
+    """Longest a queued write waits for others to join its transaction"""
+
+    WRITE_QUEUE_MAX_STATEMENTS: int = 500
+    """Pending statements that trigger an immediate group commit"""
+
+    WRITE_QUEUE_BUSY_TIMEOUT_MS: int = 5000
+    """SQLite busy timeout of the writer connection (shared with the write-behind queue)"""
+
+    READ_POOL_MMAP_SIZE_BYTES: int = 67_108_864
+    """PRAGMA mmap_size of each read pool connection (64 MiB)"""
+
+    READ_POOL_CACHE_SIZE_KIB: int = 8192
+    """Page cache of each read pool connection in KiB"""
+
+
+class StatusHistoryConstants:
+    """
+    Printer status history (time-series) configuration constants.
+
+    Controls sampling, flushing and the retention tiers of the status
+    history store: raw samples, 1-minute and 15-minute averages.
+    """
+
+    SAMPLE_MIN_INTERVAL_SECONDS: int = 5
+    """Minimum spacing between stored raw samples per printer"""
+
+    FLUSH_INTERVAL_SECONDS: float = 60.0
+    """How often open (current hour) chunks are written to the database"""
+
+    MAINTENANCE_INTERVAL_SECONDS: float = 3600.0
+    """How often unsealed chunks are recovered and expired chunks pruned"""
+
+    RAW_CHUNK_SECONDS: int = 3600
+    """Time span of one raw chunk (one row per printer per hour)"""
+
+    RAW_RETENTION_SECONDS: int = 86400
+    """How long raw samples are kept (24 hours)"""
+
+    MINUTE_CHUNK_SECONDS: int = 86400
+    """Time span of one 1-minute chunk (one row per printer per day)"""
+
+    MINUTE_RETENTION_SECONDS: int = 2_592_000
+    """How long 1-minute averages are kept (30 days)"""
+
+    QUARTER_HOUR_CHUNK_SECONDS: int = 2_592_000
+    """Time span of one 15-minute chunk (kept forever)"""
+
+    VALUE_SCALE: int = 10
+    """Fixed-point scale of stored values (10 = 0.1 precision)"""
+
+    AUTO_RAW_MAX_SPAN_SECONDS: int = 21600
+    """Longest range (6 hours) answered with raw samples when resolution is auto"""
+
+    AUTO_MINUTE_MAX_SPAN_SECONDS: int = 604800
+    """Longest range (7 days) answered with 1-minute averages when resolution is auto"""
+
+
 class TemperatureConstants:
     """
     Temperature threshold constants for printer state detection.
@@ -236,6 +341,9 @@ class PaginationConstants:
     DEFAULT_PAGE_NUMBER: int = 1
     """Default starting page number"""
 
+    COUNT_CACHE_TTL_SECONDS: float = 30.0
+    """How long cursor pages reuse a listing's total count before recounting"""
+
 
 class SearchConstants:
     """
@@ -245,6 +353,12 @@ class SearchConstants:
     LIBRARY_SEARCH_MIN_LENGTH: int = 3
     """Minimum search query length"""
 
+    RESULTS_CACHE_TTL_SECONDS: int = 300
+    """Lifetime of a cached search result page"""
+
+    RESULTS_CACHE_MAX_ENTRIES: int = 256
+    """Maximum cached search result pages before least-recently-used eviction"""
+
 
 class SecurityConstants:
     """
@@ -290,9 +404,25 @@ class TimelapseConstants:
     TIMELAPSE_FOLDER_SCAN_INTERVAL_SECONDS: int = 30
     """Interval for scanning source folders for new timelapses"""
 
+    TIMELAPSE_EVENT_DEBOUNCE_SECONDS: float = 2.0
+    """Delay after a file system event before changed folders are rescanned"""
+
+    TIMELAPSE_MTIME_SETTLE_SECONDS: float = 2.0
+    """Folders modified more recently than this are recounted on the next scan
+    (coarse file system timestamps may hide a change within the same tick)"""
+
     TIMELAPSE_CLEANUP_AGE_DAYS: int = 30
     """Age threshold for cleanup recommendations"""
 
+    RENDER_READ_CHUNK_BYTES: int = 4096
+    """Read size when streaming render subprocess output"""
+
+    RENDER_OUTPUT_TAIL_LINES: int = 50
+    """Lines of render output kept per stream for error messages"""
+
+    RENDER_PROGRESS_EVENT_INTERVAL_SECONDS: float = 2.0
+    """Minimum interval between render progress events of one timelapse"""
+
 
 class ThumbnailConstants:
     """
@@ -316,6 +446,48 @@ class ThumbnailConstants:
     BACKGROUND_COLOR_RGB: tuple = (255, 255, 255)
     """White background for transparent images"""
 
+    RENDER_PRIORITY_INTERACTIVE: int = 0
+    """Preview render priority for requests a user is waiting on (rendered first)"""
+
+    RENDER_PRIORITY_BACKGROUND: int = 10
+    """Preview render priority for pre-generation (library processing, animated previews)"""
+
+    RENDER_METRICS_KEPT: int = 20
+    """Most recent animated renders whose time and memory get_statistics reports"""
+
+
+class LibraryConstants:
+    """
+    Library metadata extraction queue constants.
+
+    Priorities, retry backoff and limits of the persistent extraction queue
+    (lower priority values are extracted first).
+    """
+
+    EXTRACTION_PRIORITY_USER: int = 0
+    """A user opened or reprocessed the file"""
+
+    EXTRACTION_PRIORITY_UPLOAD: int = 1
+    """File was uploaded by a user"""
+
+    EXTRACTION_PRIORITY_BACKFILL: int = 2
+    """Watch-folder and printer imports, bulk re-analysis and startup backfills"""
+
+    EXTRACTION_MAX_ATTEMPTS: int = 3
+    """Attempts before a job is marked failed"""
+
+    EXTRACTION_RETRY_BASE_SECONDS: float = 30.0
+    """Delay before the first retry; doubles with each further attempt"""
+
+    EXTRACTION_RETRY_MAX_SECONDS: float = 1800.0
+    """Upper bound of the retry delay"""
+
+    EXTRACTION_TIMEOUT_SECONDS: float = 600.0
+    """Time a parser may run in a worker process before the attempt fails"""
+
+    EXTRACTION_IDLE_POLL_SECONDS: float = 60.0
+    """Longest time an idle worker waits before checking the queue again"""
+
 
 class GCodeConstants:
     """
@@ -328,6 +500,15 @@ class GCodeConstants:
     GCODE_RENDER_MAX_LINES: int = 10000
     """Maximum lines to render in G-code preview"""
 
+    HEADER_SCAN_BYTES: int = 1024 * 1024
+    """Bytes of G-code header scanned for thumbnails and metadata comments (1 MB)"""
+
+    FOOTER_SCAN_BYTES: int = 1024 * 1024
+    """Bytes at the end of G-code scanned for the slicer config block (1 MB)"""
+
+    TOOLPATH_PIXELS_PER_POINT: int = 4
+    """Image pixels per plotted toolpath point; toolpaths are decimated per layer to fit"""
+
 
 class MQTTTopicConstants:
     """
@@ -515,6 +696,20 @@ class OctoPrintConstants:
     """Exponential backoff multiplier for retries"""
 
 
+class WebSocketConstants:
+    """
+    WebSocket broadcaster configuration constants.
+
+    Controls per-client send queues and slow-client handling.
+    """
+
+    CLIENT_QUEUE_SIZE: int = 256
+    """Maximum pending frames per client before the oldest is dropped"""
+
+    SEND_TIMEOUT_SECONDS: float = 10.0
+    """A single send taking longer than this disconnects the client"""
+
+
 class FileExtensionConstants:
     """
     Common file extension constants.
@@ -565,4 +760,5 @@ ALL_CONSTANT_CLASSES = [
     CameraConstants,
     OctoPrintConstants,
     FileExtensionConstants,
+    WebSocketConstants,
 ]
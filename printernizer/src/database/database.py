@@ -38,49 +38,57 @@ Example migration:
     printer = await db.get_printer(printer_id)
 
     # New way (preferred)
-    printer_repo = PrinterRepository(db.get_connection())
+    printer_repo = PrinterRepository.from_database(db)
     printer = await printer_repo.get(printer_id)
 
 See docs/technical-debt/progress-tracker.md for migration status.
 
 CONNECTION POOLING (Phase 3):
 -----------------------------
-The Database class now supports connection pooling for improved concurrency.
+Reads and writes use separate connections:
+
+    - Reads (``_fetch_one``/``_fetch_all``, ``fetch_one``/``fetch_all`` and
+      repository reads) go through ``read_pool``, a pool of read-only WAL
+      connections, so concurrent queries no longer serialize on one
+      aiosqlite worker thread.
+    - Writes go to the single writer connection (``get_connection()``),
+      either directly or through ``write_queue``, which group-commits
+      high-frequency writes on that same connection.
 
 Usage examples:
-    # Using pooled connections (recommended for concurrent operations)
+    # Read connection from the pool (query_only; writes raise)
     async with db.pooled_connection() as conn:
         async with conn.execute("SELECT * FROM jobs") as cursor:
             rows = await cursor.fetchall()
 
-    # Or manually acquire/release
-    conn = await db.acquire_connection()
-    try:
-        # Use connection
-        pass
-    finally:
-        await db.release_connection(conn)
+    # Repositories bound to the writer connection, read pool and write queue
+    job_repo = JobRepository.from_database(db)
 
-    # Legacy usage (backward compatible)
+    # Legacy usage (backward compatible): the writer connection
     conn = db.get_connection()
-    # Use connection directly
 
 Configuration:
-    - Default pool size: 5 connections
+    - Default pool size: 5 read connections
     - Customize: Database(db_path, pool_size=10)
-    - Uses WAL mode for optimal read concurrency
+    - Pool wait time and utilization: db.get_pool_stats()
 """
 import asyncio
 import aiosqlite
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import structlog
 from contextlib import asynccontextmanager
 import time
 import sqlite3
 
+from src.database.read_pool import ReadPool
+from src.database.repositories.file_repository import FILE_DECODERS, FILE_LIST_COLUMNS
+from src.database.row_mapping import LazyRow, map_rows, select_statement
+from src.database.write_queue import WriteBehindQueue, Statement
+from src.constants import DatabaseConstants
+
 logger = structlog.get_logger()
 
 
@@ -101,25 +109,31 @@ class Database:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Connection pooling
+        # Read-only connection pool (started in initialize, after migrations)
         self._pool_size = pool_size
-        self._connection_pool: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue(maxsize=pool_size)
-        self._pool_semaphore = asyncio.Semaphore(pool_size)
-        self._pool_initialized = False
+        self.read_pool = ReadPool(self.db_path, size=pool_size)
 
-        # Backward compatibility: maintain single connection reference for old code
+        # Writer connection; also kept as the legacy single connection for old code
         self._connection: Optional[aiosqlite.Connection] = None
+
+        # Group-committing writer for high-frequency writes (started in
+        # initialize, on the writer connection)
+        self.write_queue = WriteBehindQueue()
         
     async def initialize(self):
         """Initialize database, connection pool, and create tables."""
         logger.info("Initializing database with connection pool", path=str(self.db_path), pool_size=self._pool_size)
 
-        # Create main connection for backward compatibility and initial setup
+        # Create the writer connection (also used for setup and legacy code)
         self._connection = await aiosqlite.connect(str(self.db_path))
         self._connection.row_factory = aiosqlite.Row
 
         # Enable foreign key constraints
         await self._connection.execute("PRAGMA foreign_keys = ON")
+        # WAL lets the read pool query while the writer commits
+        await self._connection.execute("PRAGMA journal_mode = WAL")
+        await self._connection.execute("PRAGMA synchronous = NORMAL")
+        await self._connection.execute(f"PRAGMA busy_timeout = {DatabaseConstants.WRITE_QUEUE_BUSY_TIMEOUT_MS}")
 
         # Create tables
         await self._create_tables()
@@ -130,6 +144,10 @@ class Database:
         # Initialize connection pool
         await self._initialize_pool()
 
+        # Start write-behind queue (after migrations); it commits on the writer
+        # connection, so there is only one SQLite writer
+        await self.write_queue.start(self._connection)
+
         logger.info("Database initialized successfully", pool_size=self._pool_size)
         
     async def _create_tables(self):
@@ -515,13 +533,47 @@ class Database:
                 logger.error("db.write.exception", error=str(e))
                 return False
 
+    def write_behind(self, sql: str, params: Optional[tuple] = None,
+                     *, key: Optional[Any] = None) -> asyncio.Future:
+        """Queue a single write statement for the next group commit.
+
+        See ``write_behind_many``.
+        """
+        return self.write_behind_many([(sql, params)], key=key)
+
+    def write_behind_many(self, statements: List[Statement],
+                          *, key: Optional[Any] = None) -> asyncio.Future:
+        """Queue write statements for the next group commit.
+
+        The statements are applied atomically and in order. With a ``key``,
+        a still-pending write with the same key is dropped in favor of this
+        one (last write wins). Callers that need read-after-write await the
+        returned future or ``flush_writes()``.
+
+        Args:
+            statements: (sql, params) tuples
+            key: Supersession key, e.g. ("printer_status", printer_id)
+        Returns:
+            Future resolved once the statements are committed
+        Raises:
+            RuntimeError: If the database is not initialized
+        """
+        if not self.write_queue.is_running:
+            raise RuntimeError("Database not initialized")
+        return self.write_queue.enqueue(statements, key=key)
+
+    async def flush_writes(self) -> None:
+        """Wait until all queued write-behind statements are committed."""
+        await self.write_queue.flush()
+
     async def _fetch_one(self, sql: str, params: Optional[List[Any]] = None):
         if not self._connection:
             raise RuntimeError("Database not initialized")
         start = time.perf_counter()
         try:
-            async with self._connection.execute(sql, params or []) as cursor:
-                row = await cursor.fetchone()
+            async with self.pooled_connection() as conn:
+                async with conn.execute(sql, params or []) as cursor:
+                    row = await cursor.fetchone()
             duration_ms = (time.perf_counter() - start) * 1000
             logger.debug("db.select.one", sql=sql.split('\n')[0][:100], hit=bool(row), duration_ms=round(duration_ms, 2))
             return row
@@ -534,8 +586,9 @@ class Database:
             raise RuntimeError("Database not initialized")
         start = time.perf_counter()
         try:
-            async with self._connection.execute(sql, params or []) as cursor:
-                rows = await cursor.fetchall()
+            async with self.pooled_connection() as conn:
+                async with conn.execute(sql, params or []) as cursor:
+                    rows = await cursor.fetchall()
             duration_ms = (time.perf_counter() - start) * 1000
             logger.debug("db.select", sql=sql.split('\n')[0][:100], rows=len(rows), duration_ms=round(duration_ms, 2))
             return rows
@@ -588,79 +641,23 @@ class Database:
         Returns:
             True if successful, False otherwise
         """
-        # Convert tuple to list for internal method
-        param_list = list(params) if params else None
-        return await self._write(sql, param_list)
+        return await self._execute_write(sql, tuple(params) if params else None)
 
     # ============================================================================
     # Connection Pool Management
     # ============================================================================
 
     async def _initialize_pool(self):
-        """Initialize the connection pool with configured number of connections."""
-        if self._pool_initialized:
-            logger.warning("Connection pool already initialized")
-            return
-
-        logger.info("Initializing connection pool", size=self._pool_size)
-
-        for i in range(self._pool_size):
-            conn = await aiosqlite.connect(str(self.db_path))
-            conn.row_factory = aiosqlite.Row
-            await conn.execute("PRAGMA foreign_keys = ON")
-            # Optimize for concurrent reads
-            await conn.execute("PRAGMA journal_mode = WAL")
-            await conn.execute("PRAGMA synchronous = NORMAL")
-            await self._connection_pool.put(conn)
-
-        self._pool_initialized = True
-        logger.info("Connection pool initialized", connections=self._pool_size)
-
-    async def acquire_connection(self) -> aiosqlite.Connection:
-        """
-        Acquire a connection from the pool.
-
-        Returns:
-            aiosqlite.Connection: Database connection from pool
-
-        Raises:
-            RuntimeError: If pool not initialized
-        """
-        if not self._pool_initialized:
-            # Fallback to main connection if pool not initialized
-            logger.warning("Pool not initialized, using main connection")
-            return self._connection
-
-        # Acquire semaphore slot
-        await self._pool_semaphore.acquire()
-
-        # Get connection from pool
-        conn = await self._connection_pool.get()
-        logger.debug("Connection acquired from pool", pool_size=self._connection_pool.qsize())
-        return conn
-
-    async def release_connection(self, conn: aiosqlite.Connection):
-        """
-        Release a connection back to the pool.
-
-        Args:
-            conn: Connection to release back to pool
-        """
-        if not self._pool_initialized:
-            # Nothing to release if pool not used
-            return
-
-        # Return connection to pool
-        await self._connection_pool.put(conn)
-
-        # Release semaphore slot
-        self._pool_semaphore.release()
-        logger.debug("Connection released to pool", pool_size=self._connection_pool.qsize())
+        """Open the read-only connection pool."""
+        await self.read_pool.start()
 
     @asynccontextmanager
     async def pooled_connection(self):
         """
-        Get a database connection from pool as async context manager.
+        Get a read-only connection from the pool as async context manager.
+
+        Falls back to the writer connection while the pool is not started
+        (during migrations).
 
         Usage:
             async with db.pooled_connection() as conn:
@@ -668,30 +665,30 @@ class Database:
                     rows = await cursor.fetchall()
 
         Yields:
-            aiosqlite.Connection: Database connection from pool
+            aiosqlite.Connection: Read-only database connection
         """
-        conn = await self.acquire_connection()
-        try:
+        if not self.read_pool.is_running:
+            yield self._connection
+            return
+        async with self.read_pool.acquire() as conn:
             yield conn
-        finally:
-            await self.release_connection(conn)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get read pool wait/utilization metrics and write queue counters."""
+        return {
+            'read_pool': self.read_pool.get_stats(),
+            'write_queue': self.write_queue.get_stats(),
+        }
 
     async def close(self):
         """Close all database connections including pool."""
         logger.info("Closing database connections")
 
-        # Close pool connections
-        if self._pool_initialized:
-            closed_count = 0
-            while not self._connection_pool.empty():
-                try:
-                    conn = await asyncio.wait_for(self._connection_pool.get(), timeout=1.0)
-                    await conn.close()
-                    closed_count += 1
-                except asyncio.TimeoutError:
-                    break
-            logger.info("Closed pool connections", count=closed_count)
-            self._pool_initialized = False
+        # Commit queued writes before the connections go away
+        await self.write_queue.stop()
+
+        # Close read pool connections
+        await self.read_pool.close()
 
         # Close main connection
         if self._connection:
@@ -774,10 +771,14 @@ class Database:
         try:
             if last_seen is None:
                 last_seen = datetime.now()
-            return await self._execute_write(
+            # Group-committed; a newer status for the same printer supersedes
+            # one that is still pending
+            self.write_behind(
                 "UPDATE printers SET status = ?, last_seen = ? WHERE id = ?",
-                (status, last_seen.isoformat(), printer_id)
+                (status, last_seen.isoformat(), printer_id),
+                key=("printer_status", printer_id)
             )
+            return True
         except Exception as e:  # pragma: no cover
             logger.error("Failed to update printer status", printer_id=printer_id, error=str(e))
             return False
@@ -895,7 +896,7 @@ class Database:
     async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job by ID."""
         try:
-            async with self._connection.execute(
+            async with self.pooled_connection() as conn, conn.execute(
                 "SELECT * FROM jobs WHERE id = ?", (job_id,)
             ) as cursor:
                 row = await cursor.fetchone()
@@ -936,7 +937,7 @@ class Database:
                     query += " OFFSET ?"
                     params.append(offset)
             
-            async with self._connection.execute(query, params) as cursor:
+            async with self.pooled_connection() as conn, conn.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
         except Exception as e:
@@ -956,7 +957,7 @@ class Database:
             
             query += " ORDER BY created_at DESC"
             
-            async with self._connection.execute(query, params) as cursor:
+            async with self.pooled_connection() as conn, conn.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
         except Exception as e:
@@ -969,7 +970,7 @@ class Database:
             stats = {}
             
             # Total job counts by status
-            async with self._connection.execute("""
+            async with self.pooled_connection() as conn, conn.execute("""
                 SELECT status, COUNT(*) as count 
                 FROM jobs 
                 GROUP BY status
@@ -979,7 +980,7 @@ class Database:
                     stats[f"{row['status']}_jobs"] = row['count']
             
             # Business vs Private job counts
-            async with self._connection.execute("""
+            async with self.pooled_connection() as conn, conn.execute("""
                 SELECT is_business, COUNT(*) as count 
                 FROM jobs 
                 GROUP BY is_business
@@ -990,7 +991,7 @@ class Database:
                     stats[key] = row['count']
             
             # Material and cost statistics
-            async with self._connection.execute("""
+            async with self.pooled_connection() as conn, conn.execute("""
                 SELECT 
                     SUM(material_used) as total_material,
                     AVG(material_used) as avg_material,
@@ -1017,7 +1018,7 @@ class Database:
                     })
             
             # Total jobs count
-            async with self._connection.execute("SELECT COUNT(*) as total FROM jobs") as cursor:
+            async with self.pooled_connection() as conn, conn.execute("SELECT COUNT(*) as total FROM jobs") as cursor:
                 total_row = await cursor.fetchone()
                 stats['total_jobs'] = total_row['total'] if total_row else 0
             
@@ -1122,42 +1123,30 @@ class Database:
             return False
     
     async def list_files(self, printer_id: Optional[str] = None, status: Optional[str] = None,
-                        source: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List files with optional filtering."""
+                        source: Optional[str] = None) -> List[LazyRow]:
+        """
+        List files with optional filtering.
+
+        Rows leave out thumbnail_data and decode the JSON metadata column
+        only when it is read.
+        """
         try:
-            query = "SELECT * FROM files"
+            filters = []
             params = []
-            conditions = []
 
             if printer_id:
-                conditions.append("printer_id = ?")
+                filters.append('printer_id')
                 params.append(printer_id)
             if status:
-                conditions.append("status = ?")
+                filters.append('status')
                 params.append(status)
             if source:
-                conditions.append("source = ?")
+                filters.append('source')
                 params.append(source)
 
-            if conditions:
-                query += " WHERE " + " AND ".join(conditions)
-
-            query += " ORDER BY created_at DESC"
-
-            async with self._connection.execute(query, params) as cursor:
-                rows = await cursor.fetchall()
-                files = []
-                for row in rows:
-                    file_data = dict(row)
-                    # Deserialize JSON metadata back to dict
-                    if file_data.get('metadata') and isinstance(file_data['metadata'], str):
-                        try:
-                            file_data['metadata'] = json.loads(file_data['metadata'])
-                        except (json.JSONDecodeError, TypeError):
-                            # If deserialization fails, set to empty dict
-                            file_data['metadata'] = {}
-                    files.append(file_data)
-                return files
+            query = select_statement('files', FILE_LIST_COLUMNS, tuple(filters), 'created_at DESC')
+            async with self.pooled_connection() as conn, conn.execute(query, params) as cursor:
+                return map_rows(cursor.description, await cursor.fetchall(), FILE_DECODERS)
         except Exception as e:
             logger.error("Failed to list files", error=str(e))
             return []
@@ -1273,7 +1262,7 @@ class Database:
             
             query += " ORDER BY modified_time DESC"
             
-            async with self._connection.execute(query, params) as cursor:
+            async with self.pooled_connection() as conn, conn.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
         except Exception as e:
@@ -1294,21 +1283,21 @@ class Database:
             stats = {}
             
             # Total counts
-            async with self._connection.execute("SELECT COUNT(*), source FROM files GROUP BY source") as cursor:
+            async with self.pooled_connection() as conn, conn.execute("SELECT COUNT(*), source FROM files GROUP BY source") as cursor:
                 rows = await cursor.fetchall()
                 for row in rows:
                     source = row[1] or 'unknown'
                     stats[f"{source}_count"] = row[0]
             
             # Total size by source
-            async with self._connection.execute("SELECT SUM(file_size), source FROM files GROUP BY source") as cursor:
+            async with self.pooled_connection() as conn, conn.execute("SELECT SUM(file_size), source FROM files GROUP BY source") as cursor:
                 rows = await cursor.fetchall()
                 for row in rows:
                     source = row[1] or 'unknown'
                     stats[f"{source}_size"] = row[0] or 0
             
             # Status counts
-            async with self._connection.execute("SELECT COUNT(*), status FROM files GROUP BY status") as cursor:
+            async with self.pooled_connection() as conn, conn.execute("SELECT COUNT(*), status FROM files GROUP BY status") as cursor:
                 rows = await cursor.fetchall()
                 for row in rows:
                     status = row[1] or 'unknown'
@@ -2345,6 +2334,8 @@ class Database:
         Returns:
             List of file IDs that match the search query
         """
+        # Index updates are group-committed; make pending ones visible
+        await self.flush_writes()
         try:
             sql = """
                 SELECT file_id, rank
@@ -2370,6 +2361,8 @@ class Database:
         Returns:
             List of idea IDs that match the search query
         """
+        # Index updates are group-committed; make pending ones visible
+        await self.flush_writes()
         try:
             sql = """
                 SELECT idea_id, rank
@@ -2384,69 +2377,361 @@ class Database:
             logger.error("FTS search failed for ideas", error=str(e), query=query)
             return []
 
-    async def update_file_fts(self, file_id: str, file_data: Dict[str, Any]) -> bool:
-        """Update FTS index for a file."""
+    async def search_files_fts_hydrated(self, query: str, limit: int = 50, offset: int = 0,
+                                        filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Full-text search on files returning hydrated rows in rank order.
+
+        Joins the FTS hits against ``files`` and ``library_files`` in a single
+        query (printer/watch-folder files win over library entries with the
+        same ID). Only the columns needed for search results are selected, so
+        thumbnail BLOBs are never loaded. Hits whose file no longer exists are
+        skipped.
+
+        Filters are applied in SQL through an uncorrelated ID subquery over
+        ``files`` and ``library_files``, so the filter predicates can use the
+        indexes on those tables (see ``_build_file_search_filters``).
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results
+            offset: Number of ranked hits to skip
+            filters: Search filters (``SearchFilters.dict(exclude_none=True)``)
+
+        Returns:
+            List of file dicts with an additional ``rank`` and ``origin``
+            (``'files'`` or ``'library'``) key
+        """
+        # Index updates are group-committed; make pending ones visible
+        await self.flush_writes()
+        try:
+            from_sql, params = self._file_search_from(query, filters)
+            sql = f"""
+                SELECT
+                    fts_files.file_id AS id,
+                    COALESCE(f.filename, l.filename) AS filename,
+                    COALESCE(f.display_name, l.display_name) AS display_name,
+                    f.file_path AS file_path,
+                    COALESCE(f.file_size, l.file_size) AS file_size,
+                    COALESCE(f.file_type, l.file_type) AS file_type,
+                    COALESCE(f.metadata, l.metadata) AS metadata,
+                    COALESCE(f.created_at, l.created_at) AS created_at,
+                    COALESCE(f.modified_time, l.last_modified) AS modified_time,
+                    CASE WHEN f.id IS NOT NULL THEN 'files' ELSE 'library' END AS origin,
+                    fts_files.rank AS rank
+                {from_sql}
+                ORDER BY fts_files.rank
+                LIMIT ? OFFSET ?
+            """
+            rows = await self._fetch_all(sql, [*params, limit, offset])
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error("Hydrated FTS search failed for files", error=str(e), query=query)
+            return []
+
+    async def count_files_fts_hydrated(self, query: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count the hits ``search_files_fts_hydrated`` pages through.
+
+        Args:
+            query: Search query string
+            filters: Search filters (``SearchFilters.dict(exclude_none=True)``)
+
+        Returns:
+            Number of matching files (0 if the query fails)
+        """
+        await self.flush_writes()
+        try:
+            from_sql, params = self._file_search_from(query, filters)
+            row = await self._fetch_one(f"SELECT COUNT(*) AS total {from_sql}", params)
+            return row['total'] if row else 0
+        except Exception as e:
+            logger.error("FTS count failed for files", error=str(e), query=query)
+            return 0
+
+    def _file_search_from(self, query: str, filters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        """FROM/WHERE clause and parameters shared by the hydrated file search and its count."""
+        filter_sql, filter_params = self._build_file_search_filters(filters or {})
+        sql = f"""
+                FROM fts_files
+                LEFT JOIN files f ON f.id = fts_files.file_id
+                LEFT JOIN library_files l ON l.id = fts_files.file_id AND f.id IS NULL
+                WHERE fts_files MATCH ?
+                  AND (f.id IS NOT NULL OR l.id IS NOT NULL)
+                  {filter_sql}"""
+        return sql, [query, *filter_params]
+
+    async def search_ideas_fts_hydrated(self, query: str, limit: int = 50, offset: int = 0,
+                                        filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Full-text search on ideas returning full idea rows in rank order.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results
+            offset: Number of ranked hits to skip
+            filters: Search filters (``SearchFilters.dict(exclude_none=True)``)
+
+        Returns:
+            List of idea dicts with the indexed ``tags`` and an additional
+            ``rank`` key
+        """
+        # Index updates are group-committed; make pending ones visible
+        await self.flush_writes()
         try:
-            # Delete existing entry
-            await self._execute_write(
-                "DELETE FROM fts_files WHERE file_id = ?",
-                (file_id,)
+            from_sql, params = self._idea_search_from(query, filters)
+            sql = f"""
+                SELECT i.*, fts_ideas.tags AS tags, fts_ideas.rank AS rank
+                {from_sql}
+                ORDER BY fts_ideas.rank
+                LIMIT ? OFFSET ?
+            """
+            rows = await self._fetch_all(sql, [*params, limit, offset])
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error("Hydrated FTS search failed for ideas", error=str(e), query=query)
+            return []
+
+    async def count_ideas_fts_hydrated(self, query: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count the hits ``search_ideas_fts_hydrated`` pages through.
+
+        Args:
+            query: Search query string
+            filters: Search filters (``SearchFilters.dict(exclude_none=True)``)
+
+        Returns:
+            Number of matching ideas (0 if the query fails)
+        """
+        await self.flush_writes()
+        try:
+            from_sql, params = self._idea_search_from(query, filters)
+            row = await self._fetch_one(f"SELECT COUNT(*) AS total {from_sql}", params)
+            return row['total'] if row else 0
+        except Exception as e:
+            logger.error("FTS count failed for ideas", error=str(e), query=query)
+            return 0
+
+    def _idea_search_from(self, query: str, filters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        """FROM/WHERE clause and parameters shared by the hydrated idea search and its count."""
+        where_clauses, filter_params = self._build_idea_search_filters(filters or {})
+        filter_sql = "".join(f" AND {clause}" for clause in where_clauses)
+        sql = f"""
+                FROM fts_ideas
+                JOIN ideas i ON i.id = fts_ideas.idea_id
+                WHERE fts_ideas MATCH ?{filter_sql}"""
+        return sql, [query, *filter_params]
+
+    # Numeric search filters: SearchFilters field suffix -> (files expression,
+    # library_files expression). The files table keeps these values only in its
+    # metadata JSON; migration 038 indexes exactly these expressions.
+    _SEARCH_RANGE_FIELDS: Dict[str, Tuple[str, str]] = {
+        'width': (
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.physical_properties.width') END",
+            "model_width"),
+        'depth': (
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.physical_properties.depth') END",
+            "model_depth"),
+        'height': (
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.physical_properties.height') END",
+            "model_height"),
+        'print_time': (
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.print_settings.estimated_time_minutes') END",
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.print_settings.estimated_time_minutes') END"),
+        'material_weight': (
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.material_requirements.total_weight') END",
+            "total_filament_weight"),
+        'cost': (
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.cost_breakdown.total_cost') END",
+            "total_cost"),
+        'complexity_score': (
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.quality_metrics.complexity_score') END",
+            "complexity_score"),
+        'success_probability': (
+            "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.quality_metrics.success_probability') END",
+            "success_probability"),
+    }
+
+    # Filters that only apply to files; an idea search using any of them
+    # cannot match anything
+    _FILE_ONLY_SEARCH_FILTERS = (
+        'file_types', 'material_types', 'difficulty_levels',
+        'min_width', 'max_width', 'min_depth', 'max_depth', 'min_height', 'max_height',
+        'min_print_time', 'max_print_time', 'min_material_weight', 'max_material_weight',
+        'min_cost', 'max_cost', 'min_complexity_score', 'min_success_probability',
+    )
+
+    def _build_file_search_filters(self, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """
+        Translate search filters into SQL for the hydrated file search.
+
+        Args:
+            filters: Search filters (``SearchFilters.dict(exclude_none=True)``)
+
+        Returns:
+            Tuple of an ``AND ...`` fragment restricting ``fts_files.file_id``
+            (empty when no filter applies) and its parameters
+        """
+        files_where: List[str] = []
+        files_params: List[Any] = []
+        library_where: List[str] = []
+        library_params: List[Any] = []
+
+        def add(files_clause: str, library_clause: str, params: List[Any]) -> None:
+            files_where.append(files_clause)
+            files_params.extend(params)
+            library_where.append(library_clause)
+            library_params.extend(params)
+
+        if filters.get('idea_status'):
+            # Idea workflow status never matches a file
+            return "AND 0", []
+
+        if filters.get('file_types'):
+            file_types = [t.lower().lstrip('.') for t in filters['file_types']]
+            placeholders = ",".join("?" * len(file_types))
+            clause = f"LOWER(LTRIM(file_type, '.')) IN ({placeholders})"
+            add(clause, clause, file_types)
+
+        for field, (files_expr, library_expr) in self._SEARCH_RANGE_FIELDS.items():
+            for bound, operator in (('min', '>='), ('max', '<=')):
+                value = filters.get(f"{bound}_{field}")
+                if value is not None:
+                    add(f"{files_expr} {operator} ?", f"{library_expr} {operator} ?", [value])
+
+        if filters.get('material_types'):
+            materials = list(filters['material_types'])
+            placeholders = ",".join("?" * len(materials))
+            add(
+                "EXISTS (SELECT 1 FROM json_each(CASE WHEN json_valid(metadata) "
+                "AND json_type(metadata, '$.material_requirements.material_types') = 'array' "
+                "THEN json_extract(metadata, '$.material_requirements.material_types') END) "
+                f"WHERE value IN ({placeholders}))",
+                "EXISTS (SELECT 1 FROM json_each(CASE WHEN json_valid(material_types) "
+                f"THEN material_types END) WHERE value IN ({placeholders}))",
+                materials
             )
-            # Insert updated entry
+
+        if filters.get('difficulty_levels'):
+            levels = list(filters['difficulty_levels'])
+            placeholders = ",".join("?" * len(levels))
+            add(
+                "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.quality_metrics.difficulty_level') END"
+                f" IN ({placeholders})",
+                f"difficulty_level IN ({placeholders})",
+                levels
+            )
+
+        if filters.get('is_business') is not None:
+            clause = "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.is_business') END = ?"
+            add(clause, clause, [1 if filters['is_business'] else 0])
+
+        for key, operator in (('created_after', '>='), ('created_before', '<=')):
+            value = filters.get(key)
+            if value is not None:
+                value = value.isoformat() if isinstance(value, datetime) else value
+                clause = f"datetime(created_at) {operator} datetime(?)"
+                add(clause, clause, [value])
+
+        if not files_where:
+            return "", []
+
+        sql = f"""
+            AND fts_files.file_id IN (
+                SELECT id FROM files WHERE {" AND ".join(files_where)}
+                UNION ALL
+                SELECT id FROM library_files WHERE {" AND ".join(library_where)}
+                    AND NOT EXISTS (SELECT 1 FROM files WHERE files.id = library_files.id)
+            )
+        """
+        return sql, files_params + library_params
+
+    def _build_idea_search_filters(self, filters: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+        """
+        Translate search filters into WHERE clauses on ``ideas i``.
+
+        Args:
+            filters: Search filters (``SearchFilters.dict(exclude_none=True)``)
+
+        Returns:
+            Tuple of WHERE clauses and their parameters
+        """
+        if any(filters.get(key) not in (None, []) for key in self._FILE_ONLY_SEARCH_FILTERS):
+            return ["0"], []
+
+        where_clauses: List[str] = []
+        params: List[Any] = []
+
+        if filters.get('is_business') is not None:
+            where_clauses.append("i.is_business = ?")
+            params.append(1 if filters['is_business'] else 0)
+
+        if filters.get('idea_status'):
+            placeholders = ",".join("?" * len(filters['idea_status']))
+            where_clauses.append(f"i.status IN ({placeholders})")
+            params.extend(filters['idea_status'])
+
+        for key, operator in (('created_after', '>='), ('created_before', '<=')):
+            value = filters.get(key)
+            if value is not None:
+                value = value.isoformat() if isinstance(value, datetime) else value
+                where_clauses.append(f"datetime(i.created_at) {operator} datetime(?)")
+                params.append(value)
+
+        return where_clauses, params
+
+    async def update_file_fts(self, file_id: str, file_data: Dict[str, Any]) -> bool:
+        """Update FTS index for a file (group-committed)."""
+        try:
             metadata_str = file_data.get('metadata', '')
             if isinstance(metadata_str, dict):
                 metadata_str = json.dumps(metadata_str)
 
-            await self._execute_write(
-                """INSERT INTO fts_files(file_id, filename, display_name, file_type, metadata)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (file_id, file_data.get('filename', ''), file_data.get('display_name', ''),
-                 file_data.get('file_type', ''), metadata_str)
-            )
+            # Replace the existing entry; supersedes a pending update/delete
+            self.write_behind_many([
+                ("DELETE FROM fts_files WHERE file_id = ?", (file_id,)),
+                ("""INSERT INTO fts_files(file_id, filename, display_name, file_type, metadata)
+                    VALUES (?, ?, ?, ?, ?)""",
+                 (file_id, file_data.get('filename', ''), file_data.get('display_name', ''),
+                  file_data.get('file_type', ''), metadata_str)),
+            ], key=("fts_files", file_id))
             return True
         except Exception as e:
             logger.error("Failed to update file FTS index", error=str(e), file_id=file_id)
             return False
 
     async def update_idea_fts(self, idea_id: str, idea_data: Dict[str, Any]) -> bool:
-        """Update FTS index for an idea."""
+        """Update FTS index for an idea (group-committed)."""
         try:
-            # Delete existing entry
-            await self._execute_write(
-                "DELETE FROM fts_ideas WHERE idea_id = ?",
-                (idea_id,)
-            )
-            # Insert updated entry
             tags_str = ', '.join(idea_data.get('tags', []))
-            await self._execute_write(
-                """INSERT INTO fts_ideas(idea_id, title, description, tags, category)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (idea_id, idea_data.get('title', ''), idea_data.get('description', ''),
-                 tags_str, idea_data.get('category', ''))
-            )
+            self.write_behind_many([
+                ("DELETE FROM fts_ideas WHERE idea_id = ?", (idea_id,)),
+                ("""INSERT INTO fts_ideas(idea_id, title, description, tags, category)
+                    VALUES (?, ?, ?, ?, ?)""",
+                 (idea_id, idea_data.get('title', ''), idea_data.get('description', ''),
+                  tags_str, idea_data.get('category', ''))),
+            ], key=("fts_ideas", idea_id))
             return True
         except Exception as e:
             logger.error("Failed to update idea FTS index", error=str(e), idea_id=idea_id)
             return False
 
     async def delete_file_fts(self, file_id: str) -> bool:
-        """Delete file from FTS index."""
+        """Delete file from FTS index (group-committed)."""
         try:
-            return await self._execute_write(
-                "DELETE FROM fts_files WHERE file_id = ?",
-                (file_id,)
-            )
+            self.write_behind("DELETE FROM fts_files WHERE file_id = ?", (file_id,),
+                              key=("fts_files", file_id))
+            return True
         except Exception as e:
             logger.error("Failed to delete file from FTS index", error=str(e), file_id=file_id)
             return False
 
     async def delete_idea_fts(self, idea_id: str) -> bool:
-        """Delete idea from FTS index."""
+        """Delete idea from FTS index (group-committed)."""
         try:
-            return await self._execute_write(
-                "DELETE FROM fts_ideas WHERE idea_id = ?",
-                (idea_id,)
-            )
+            self.write_behind("DELETE FROM fts_ideas WHERE idea_id = ?", (idea_id,),
+                              key=("fts_ideas", idea_id))
+            return True
         except Exception as e:
             logger.error("Failed to delete idea from FTS index", error=str(e), idea_id=idea_id)
             return False
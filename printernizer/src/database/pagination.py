@@ -0,0 +1,160 @@
+"""
+Keyset (cursor) pagination helpers.
+
+OFFSET pagination makes SQLite step over every skipped row, so a deep page
+of a 50k-row listing costs as much as reading all rows before it. Keyset
+pagination continues after the last row of the previous page instead:
+
+    WHERE (sort_column, id) < (?, ?) ORDER BY sort_column DESC, id DESC
+
+is a range seek on a ``(sort_column, id)`` index (migration 041), so every
+page costs the same no matter how deep it is.
+
+Cursors handed to API clients are opaque: base64url JSON holding the last
+row's sort value and ID plus a signature of the query shape (sort column,
+direction, filters). A cursor reused with different parameters is rejected
+with ``InvalidCursorError`` rather than silently returning a wrong page.
+
+SQLite sorts NULLs first ascending and last descending. Row-value
+comparisons never match NULL, so nullable sort columns are scanned in two
+segments (non-NULL values, then NULLs, or the reverse) in that same order.
+
+Usage:
+    ```python
+    signature = query_signature('jobs', 'created_at', 'desc', printer_id)
+    segments = keyset_segments('created_at', 'id', descending=True, nullable=True,
+                               after=decode_cursor(cursor, signature))
+    ```
+"""
+import base64
+import binascii
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+# Condition SQL plus its parameters
+Segment = Tuple[str, List[Any]]
+
+
+class InvalidCursorError(ValueError):
+    """A pagination cursor is malformed or belongs to a different query."""
+
+
+class Page(NamedTuple):
+    """One page of a listing."""
+    items: List[Any]
+    total: int
+    next_cursor: Optional[str]
+
+
+def query_signature(*parts: Any) -> str:
+    """Short, stable fingerprint of a query shape (sort, direction, filters)."""
+    encoded = json.dumps(parts, default=str, separators=(',', ':'))
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:12]
+
+
+def encode_cursor(signature: str, sort_value: Any, row_id: Any) -> str:
+    """Encode the position after a row as an opaque cursor."""
+    payload = json.dumps([signature, sort_value, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, signature: str) -> Tuple[Any, Any]:
+    """
+    Decode a cursor into ``(sort_value, row_id)``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different query shape
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_signature, sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+    if cursor_signature != signature:
+        raise InvalidCursorError("Pagination cursor does not match the sort order or filters")
+    return sort_value, row_id
+
+
+def keyset_segments(sort_column: str, id_column: str, descending: bool, nullable: bool,
+                    after: Optional[Tuple[Any, Any]] = None) -> List[Segment]:
+    """
+    Build the WHERE conditions that continue a listing after a row.
+
+    Segments are scanned in order until the page is full; each one is an
+    index range on ``(sort_column, id_column)``.
+
+    Args:
+        sort_column: SQL expression of the sort column
+        id_column: SQL expression of the unique tie-breaker column
+        descending: Sort direction
+        nullable: Whether the sort column may be NULL
+        after: ``(sort_value, row_id)`` of the last row already returned,
+            None for the first page
+
+    Returns:
+        List of (condition SQL, parameters)
+    """
+    compare = '<' if descending else '>'
+    if not nullable:
+        if after is None:
+            return [('1=1', [])]
+        return [(f"({sort_column}, {id_column}) {compare} (?, ?)", list(after))]
+
+    values = f"{sort_column} IS NOT NULL"
+    nulls = f"{sort_column} IS NULL"
+    if after is None:
+        return [(values, []), (nulls, [])] if descending else [(nulls, []), (values, [])]
+
+    sort_value, row_id = after
+    if sort_value is None:
+        rest_of_nulls = (f"{nulls} AND {id_column} {compare} ?", [row_id])
+        # Descending: NULLs come last, nothing follows them
+        return [rest_of_nulls] if descending else [rest_of_nulls, (values, [])]
+
+    rest_of_values = (f"({sort_column}, {id_column}) {compare} (?, ?)", [sort_value, row_id])
+    return [rest_of_values, (nulls, [])] if descending else [rest_of_values]
+
+
+def sort_key(value: Any, row_id: Any) -> Tuple[bool, Any, Any]:
+    """
+    Python sort key matching SQLite's ascending order with NULLs first.
+
+    Use it for in-memory rows that are merged with keyset-paged SQL rows;
+    sort with ``reverse=True`` for descending order.
+    """
+    return (value is not None, value if value is not None else '', row_id)
+
+
+class CountCache:
+    """
+    Short-lived cache of COUNT(*) results per filter combination.
+
+    Cursor pages reuse the total of the first page instead of counting the
+    whole table again; totals may lag behind writes by up to ``ttl``
+    seconds unless the owner calls ``invalidate()`` after a write.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+
+    async def get(self, key: Hashable, count: Callable[[], Awaitable[int]]) -> int:
+        """Return the cached count for ``key``, calling ``count()`` when stale."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+        total = await count()
+        self.put(key, total)
+        return total
+
+    def put(self, key: Hashable, total: int) -> None:
+        """Store a freshly computed count."""
+        self._entries[key] = (time.monotonic(), total)
+
+    def invalidate(self) -> None:
+        """Drop all cached counts (call after inserts and deletes)."""
+        self._entries.clear()
@@ -0,0 +1,162 @@
+"""
+Read-only connection pool for SQLite.
+
+Each aiosqlite connection runs its statements on its own worker thread, so
+queries sharing one connection are serialized. The read pool keeps several
+WAL-mode connections with ``query_only`` set, letting SELECTs run in parallel
+with each other and with the writer connection. Readers see everything the
+writer has committed; they never see uncommitted writes.
+
+Pool wait time and utilization are tracked so undersized pools show up in
+``get_stats()`` (exposed at ``/api/v1/debug/database``).
+
+Usage:
+    ```python
+    pool = ReadPool(db_path, size=5)
+    await pool.start()
+
+    async with pool.acquire() as conn:
+        async with conn.execute("SELECT * FROM jobs") as cursor:
+            rows = await cursor.fetchall()
+
+    await pool.close()
+    ```
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Union
+
+import aiosqlite
+import structlog
+
+from src.constants import DatabaseConstants
+
+logger = structlog.get_logger()
+
+
+class ReadPool:
+    """
+    Fixed-size pool of read-only aiosqlite connections.
+
+    Metrics:
+        - acquisitions / waits: total checkouts and those that had to wait
+        - wait time: total, average and maximum time spent waiting
+        - utilization: share of connection-time spent checked out since start
+    """
+
+    def __init__(self, db_path: Union[str, Path], size: int = 5,
+                 mmap_size: int = DatabaseConstants.READ_POOL_MMAP_SIZE_BYTES,
+                 cache_size_kib: int = DatabaseConstants.READ_POOL_CACHE_SIZE_KIB):
+        """
+        Initialize the pool (connections are opened by ``start``).
+
+        Args:
+            db_path: SQLite database file
+            size: Number of read connections
+            mmap_size: PRAGMA mmap_size per connection in bytes
+            cache_size_kib: Page cache per connection in KiB
+        """
+        self.db_path = str(db_path)
+        self.size = max(1, size)
+        self.mmap_size = mmap_size
+        self.cache_size_kib = cache_size_kib
+
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._connections: List[aiosqlite.Connection] = []
+        self._started_at = 0.0
+        self._in_use = 0
+        self._waiting = 0
+        self._busy_seconds = 0.0
+        self.stats = {
+            'acquisitions': 0,
+            'waits': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """True once the connections are open."""
+        return bool(self._connections)
+
+    async def start(self) -> None:
+        """Open the read connections."""
+        if self.is_running:
+            logger.warning("Read pool already started")
+            return
+        for _ in range(self.size):
+            conn = await aiosqlite.connect(self.db_path)
+            conn.row_factory = aiosqlite.Row
+            await conn.execute("PRAGMA query_only = ON")
+            await conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+            # Negative cache_size is in KiB rather than pages
+            await conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kib)}")
+            await conn.execute("PRAGMA temp_store = MEMORY")
+            self._connections.append(conn)
+            self._idle.put_nowait(conn)
+        self._started_at = time.monotonic()
+        logger.info("Read pool started", size=self.size,
+                    mmap_size=self.mmap_size, cache_size_kib=self.cache_size_kib)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Check out a read connection for the duration of the block.
+
+        Raises:
+            RuntimeError: If the pool is not started
+        """
+        if not self.is_running:
+            raise RuntimeError("Read pool not started")
+
+        start = time.monotonic()
+        if self._idle.empty():
+            self.stats['waits'] += 1
+        self._waiting += 1
+        try:
+            conn = await self._idle.get()
+        finally:
+            self._waiting -= 1
+        checked_out = time.monotonic()
+        waited = checked_out - start
+        self.stats['acquisitions'] += 1
+        self.stats['wait_seconds_total'] += waited
+        self.stats['wait_seconds_max'] = max(self.stats['wait_seconds_max'], waited)
+        self._in_use += 1
+        try:
+            yield conn
+        finally:
+            self._in_use -= 1
+            self._busy_seconds += time.monotonic() - checked_out
+            self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close all read connections."""
+        connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning("Failed to close read connection", error=str(e))
+        self._idle = asyncio.Queue()
+        if connections:
+            logger.info("Read pool closed", connections=len(connections))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool metrics."""
+        acquisitions = self.stats['acquisitions']
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        capacity = uptime * self.size
+        return {
+            'size': self.size,
+            'running': self.is_running,
+            'in_use': self._in_use,
+            'waiting': self._waiting,
+            'acquisitions': acquisitions,
+            'waits': self.stats['waits'],
+            'wait_ms_avg': round(self.stats['wait_seconds_total'] * 1000 / acquisitions, 3) if acquisitions else 0.0,
+            'wait_ms_max': round(self.stats['wait_seconds_max'] * 1000, 3),
+            'utilization': round(self._busy_seconds / capacity, 4) if capacity else 0.0,
+        }
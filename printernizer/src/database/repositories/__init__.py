@@ -7,6 +7,7 @@ database operations for specific domain entities.
 from .base_repository import BaseRepository
 from .printer_repository import PrinterRepository
 from .job_repository import JobRepository
+from .job_rollup_repository import JobRollupRepository
 from .file_repository import FileRepository
 from .idea_repository import IdeaRepository
 from .library_repository import LibraryRepository
@@ -17,11 +18,15 @@ from .notification_repository import NotificationRepository
 from .customer_repository import CustomerRepository
 from .order_repository import OrderRepository
 from .generator_repository import GeneratorRepository
+from .checksum_index_repository import ChecksumIndexRepository
+from .status_series_repository import StatusSeriesRepository
+from .extraction_job_repository import ExtractionJobRepository
 
 __all__ = [
     'BaseRepository',
     'PrinterRepository',
     'JobRepository',
+    'JobRollupRepository',
     'FileRepository',
     'IdeaRepository',
     'LibraryRepository',
@@ -32,4 +37,7 @@ __all__ = [
     'CustomerRepository',
     'OrderRepository',
     'GeneratorRepository',
+    'ChecksumIndexRepository',
+    'StatusSeriesRepository',
+    'ExtractionJobRepository',
 ]
@@ -54,10 +54,18 @@ See Also:
     - docs/technical-debt/COMPLETION-REPORT.md - Phase 1 repository extraction
     - src/services/ - Services that use these repositories
 """
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Mapping, Sequence, Tuple, AsyncIterator, TYPE_CHECKING
 import aiosqlite
 import structlog
 
+from src.database.pagination import decode_cursor, encode_cursor, keyset_segments
+from src.database.row_mapping import Decoder, LazyRow, column_index, map_rows
+
+if TYPE_CHECKING:
+    from src.database.read_pool import ReadPool
+    from src.database.write_queue import WriteBehindQueue
+
 logger = structlog.get_logger()
 
 
@@ -87,17 +95,24 @@ class BaseRepository:
 
     Thread Safety:
         While individual operations are atomic, the repository itself is not
-        thread-safe. Use connection pooling (Database.pooled_connection()) for
-        concurrent access.
+        thread-safe. Repositories created with ``from_database()`` run reads
+        on the read-only pool, so concurrent queries do not serialize on the
+        writer connection.
     """
 
-    def __init__(self, connection: aiosqlite.Connection):
+    def __init__(self, connection: aiosqlite.Connection,
+                 write_queue: Optional['WriteBehindQueue'] = None,
+                 read_pool: Optional['ReadPool'] = None):
         """
         Initialize the repository with a database connection.
 
         Args:
-            connection: Active aiosqlite database connection. This should be
-                obtained from Database.connection or Database.pooled_connection().
+            connection: Active aiosqlite database connection used for writes
+                (Database.get_connection(), the writer connection).
+            write_queue: Optional Database.write_queue; writes issued through
+                ``_write_behind`` are then group-committed
+            read_pool: Optional Database.read_pool; ``_fetch_one`` and
+                ``_fetch_all`` then run on pooled read-only connections
 
         Example:
             ```python
@@ -107,6 +122,55 @@ class BaseRepository:
             ```
         """
         self.connection = connection
+        self.write_queue = write_queue
+        self.read_pool = read_pool
+
+    @classmethod
+    def from_database(cls, database) -> 'BaseRepository':
+        """
+        Create a repository bound to a Database's writer connection, read
+        pool and write queue.
+
+        Example:
+            ```python
+            job_repo = JobRepository.from_database(database)
+            ```
+        """
+        return cls(database._connection,
+                   write_queue=getattr(database, 'write_queue', None),
+                   read_pool=getattr(database, 'read_pool', None))
+
+    @asynccontextmanager
+    async def _read_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield a pooled read connection, or the writer connection without a pool."""
+        if self.read_pool is not None and self.read_pool.is_running:
+            async with self.read_pool.acquire() as conn:
+                yield conn
+        else:
+            yield self.connection
+
+    async def _write_behind(self, sql: str, params: Optional[tuple] = None,
+                            key: Optional[Any] = None) -> None:
+        """
+        Queue a write for the next group commit, or write directly.
+
+        Falls back to ``_execute_write`` when the repository has no running
+        write queue. Reads that must see these writes call ``_flush_writes``.
+
+        Args:
+            sql: SQL statement
+            params: Query parameters
+            key: Supersession key (last write wins), see WriteBehindQueue
+        """
+        if self.write_queue is not None and self.write_queue.is_running:
+            self.write_queue.enqueue([(sql, params)], key=key)
+        else:
+            await self._execute_write(sql, params)
+
+    async def _flush_writes(self) -> None:
+        """Wait for writes queued through ``_write_behind`` to be committed."""
+        if self.write_queue is not None:
+            await self.write_queue.flush()
 
     async def _execute_write(self, sql: str, params: Optional[tuple] = None,
                              retry_count: int = 3) -> Optional[int]:
@@ -168,6 +232,43 @@ class BaseRepository:
 
         return None
 
+    async def _execute_many(self, sql: str, params_seq: Sequence[tuple],
+                            retry_count: int = 3) -> None:
+        """
+        Execute one write statement for many parameter sets in a single commit.
+
+        Same retry behavior as ``_execute_write``; use it for bulk upserts
+        where committing per row would dominate the cost.
+
+        Args:
+            sql: SQL statement to execute for every parameter set
+            params_seq: Parameter tuples, one per row
+            retry_count: Number of retries for locked database (default: 3)
+
+        Raises:
+            aiosqlite.OperationalError: If database is locked after all retries
+            Exception: For any other database errors
+        """
+        if not params_seq:
+            return
+        for attempt in range(retry_count):
+            try:
+                await self.connection.executemany(sql, params_seq)
+                await self.connection.commit()
+                return
+            except aiosqlite.OperationalError as e:
+                if "locked" in str(e).lower() and attempt < retry_count - 1:
+                    logger.warning(f"Database locked, retrying... (attempt {attempt + 1}/{retry_count})")
+                    continue
+                else:
+                    logger.error("Database batch write failed",
+                               sql=sql[:100], rows=len(params_seq), error=str(e), exc_info=True)
+                    raise
+            except Exception as e:
+                logger.error("Unexpected error in database batch write",
+                           sql=sql[:100], rows=len(params_seq), error=str(e), exc_info=True)
+                raise
+
     async def _fetch_one(self, sql: str, params: Optional[List[Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Fetch a single row from the database.
@@ -209,8 +310,9 @@ class BaseRepository:
             easier access and JSON serialization.
         """
         try:
-            cursor = await self.connection.execute(sql, params or [])
-            row = await cursor.fetchone()
+            async with self._read_connection() as conn:
+                cursor = await conn.execute(sql, params or [])
+                row = await cursor.fetchone()
 
             if row is None:
                 return None
@@ -277,8 +379,9 @@ class BaseRepository:
             to avoid loading all rows into memory at once.
         """
         try:
-            cursor = await self.connection.execute(sql, params or [])
-            rows = await cursor.fetchall()
+            async with self._read_connection() as conn:
+                cursor = await conn.execute(sql, params or [])
+                rows = await cursor.fetchall()
 
             if not rows:
                 return []
@@ -291,3 +394,118 @@ class BaseRepository:
             logger.error("Error fetching multiple rows",
                         sql=sql[:100], error=str(e), exc_info=True)
             raise
+
+    async def _fetch_rows(self, sql: str, params: Optional[Sequence[Any]] = None,
+                          decoders: Optional[Mapping[str, Decoder]] = None) -> List[LazyRow]:
+        """
+        Fetch all rows as LazyRows (listing fast path).
+
+        Unlike ``_fetch_all`` no dict is built per row: the column index is
+        built once per result shape and columns in ``decoders`` (JSON,
+        timestamps) are decoded only when first read. Use it for list
+        queries whose callers read a subset of the columns.
+
+        Args:
+            sql: SQL SELECT query to execute
+            params: Query parameters
+            decoders: Column name -> decoder applied on first access
+                (not called for NULL values)
+
+        Returns:
+            List of LazyRow mappings, empty if no rows found
+
+        Raises:
+            Exception: For any database errors (logged automatically)
+        """
+        try:
+            async with self._read_connection() as conn:
+                cursor = await conn.execute(sql, params or [])
+                rows = await cursor.fetchall()
+            return map_rows(cursor.description, rows, decoders)
+
+        except Exception as e:
+            logger.error("Error fetching mapped rows",
+                        sql=sql[:100], error=str(e), exc_info=True)
+            raise
+
+    async def _fetch_row(self, sql: str, params: Optional[Sequence[Any]] = None,
+                         decoders: Optional[Mapping[str, Decoder]] = None) -> Optional[LazyRow]:
+        """Fetch the first row as a LazyRow, or None. See ``_fetch_rows``."""
+        try:
+            async with self._read_connection() as conn:
+                cursor = await conn.execute(sql, params or [])
+                row = await cursor.fetchone()
+            if row is None:
+                return None
+            return LazyRow(row, column_index(cursor.description), decoders)
+
+        except Exception as e:
+            logger.error("Error fetching mapped row",
+                        sql=sql[:100], error=str(e), exc_info=True)
+            raise
+
+    async def _fetch_keyset_page(self, select_sql: str, conditions: Sequence[str],
+                                 params: Sequence[Any], sort_column: str, id_column: str,
+                                 descending: bool, nullable: bool, limit: int,
+                                 signature: str, cursor: Optional[str] = None,
+                                 offset: int = 0,
+                                 decoders: Optional[Mapping[str, Decoder]] = None
+                                 ) -> Tuple[List[LazyRow], Optional[str]]:
+        """
+        Fetch one page ordered by ``(sort_column, id_column)``.
+
+        With a ``cursor`` the page continues after the cursor's row using
+        keyset conditions (constant cost per page, needs a composite index
+        on the two columns); without one ``offset`` is used. Either way one
+        extra row is read to tell whether a next page exists, and the
+        returned cursor points after the last row of this page.
+
+        Args:
+            select_sql: ``SELECT <columns> FROM <table> [JOIN ...]``
+            conditions: Filter conditions, joined with AND
+            params: Parameters of ``conditions``
+            sort_column: SQL expression of the sort column
+            id_column: SQL expression of the unique tie-breaker
+            descending: Sort direction
+            nullable: Whether the sort column may be NULL
+            limit: Page size
+            signature: ``query_signature`` of sort and filters; cursors
+                issued for another signature are rejected
+            cursor: Cursor from a previous page
+            offset: Rows to skip when no cursor is given
+            decoders: Column decoders, see ``_fetch_rows``
+
+        Returns:
+            Tuple of (rows, next cursor or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or foreign
+        """
+        direction = 'DESC' if descending else 'ASC'
+        order_by = f" ORDER BY {sort_column} {direction}, {id_column} {direction} LIMIT ?"
+        wanted = limit + 1
+
+        if cursor:
+            after = decode_cursor(cursor, signature)
+            segments = keyset_segments(sort_column, id_column, descending, nullable, after)
+        else:
+            segments = [('1=1', [])]
+            order_by += " OFFSET ?"
+
+        rows: List[LazyRow] = []
+        for condition, segment_params in segments:
+            sql = f"{select_sql} WHERE {' AND '.join([*conditions, condition])}{order_by}"
+            page_params = [*params, *segment_params, wanted - len(rows)]
+            if not cursor:
+                page_params.append(offset)
+            rows.extend(await self._fetch_rows(sql, page_params, decoders))
+            if len(rows) >= wanted:
+                break
+
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        sort_key = sort_column.rsplit('.', 1)[-1]
+        id_key = id_column.rsplit('.', 1)[-1]
+        return rows, encode_cursor(signature, last.raw(sort_key), last.raw(id_key))
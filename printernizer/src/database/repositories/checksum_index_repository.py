@@ -0,0 +1,162 @@
+"""
+Checksum index repository for stat-keyed file checksums.
+
+Hashing every watch-folder file on each startup is slow on large folders and
+network mounts. The file_checksum_index table remembers the checksum of each
+file together with the stat identity it was computed for; as long as path,
+size, mtime_ns and inode are unchanged, the stored checksum is reused and the
+file is not read again.
+
+Database Schema:
+    The file_checksum_index table (migration 040):
+    - path (TEXT): Absolute file path, primary key
+    - size (INTEGER): st_size when the checksum was computed
+    - mtime_ns (INTEGER): st_mtime_ns when the checksum was computed
+    - inode (INTEGER): st_ino when the checksum was computed
+    - algorithm (TEXT): Hash algorithm (sha256, md5)
+    - checksum (TEXT): Hex digest
+    - updated_at (TIMESTAMP): Last time the entry was written
+
+Usage Examples:
+    ```python
+    from src.database.repositories import ChecksumIndexRepository
+
+    index = ChecksumIndexRepository(db.connection)
+
+    stat = path.stat()
+    checksum = await index.lookup(str(path), stat, 'sha256')
+    if checksum is None:
+        checksum = hash_file(path)
+        await index.store(str(path), stat, 'sha256', checksum)
+    ```
+"""
+import os
+from typing import Optional, List, Iterable, Tuple
+import structlog
+
+from .base_repository import BaseRepository
+
+logger = structlog.get_logger()
+
+UPSERT_SQL = """
+    INSERT INTO file_checksum_index (path, size, mtime_ns, inode, algorithm, checksum)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        size = excluded.size,
+        mtime_ns = excluded.mtime_ns,
+        inode = excluded.inode,
+        algorithm = excluded.algorithm,
+        checksum = excluded.checksum,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+class ChecksumIndexRepository(BaseRepository):
+    """
+    Repository for the file_checksum_index table.
+
+    Key Features:
+        - Lookup only hits when size, mtime_ns, inode and algorithm all match
+        - Upsert per path, or batched in one transaction
+        - Pruning of entries for files that disappeared from a folder
+    """
+
+    async def lookup(self, path: str, stat: os.stat_result, algorithm: str) -> Optional[str]:
+        """
+        Get the stored checksum for a file if it is unchanged.
+
+        Args:
+            path: Absolute file path
+            stat: Current stat result of the file
+            algorithm: Hash algorithm the checksum must have been computed with
+
+        Returns:
+            Stored checksum, or None if there is no entry or the file changed
+        """
+        row = await self._fetch_one(
+            """SELECT checksum FROM file_checksum_index
+               WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ? AND algorithm = ?""",
+            [path, stat.st_size, stat.st_mtime_ns, stat.st_ino, algorithm]
+        )
+        return row['checksum'] if row else None
+
+    async def store(self, path: str, stat: os.stat_result, algorithm: str, checksum: str) -> None:
+        """
+        Store the checksum computed for a file's current stat identity.
+
+        Args:
+            path: Absolute file path
+            stat: Stat result taken before the file was hashed
+            algorithm: Hash algorithm
+            checksum: Hex digest
+        """
+        await self._execute_write(
+            UPSERT_SQL,
+            (path, stat.st_size, stat.st_mtime_ns, stat.st_ino, algorithm, checksum)
+        )
+
+    async def store_many(self, entries: Iterable[Tuple[str, os.stat_result, str]],
+                         algorithm: str) -> int:
+        """
+        Store many checksums in one transaction.
+
+        Args:
+            entries: (path, stat, checksum) tuples, stat taken before hashing
+            algorithm: Hash algorithm of all checksums
+
+        Returns:
+            Number of entries written
+        """
+        rows = [
+            (path, stat.st_size, stat.st_mtime_ns, stat.st_ino, algorithm, checksum)
+            for path, stat, checksum in entries
+        ]
+        await self._execute_many(UPSERT_SQL, rows)
+        return len(rows)
+
+    async def delete(self, path: str) -> None:
+        """Remove the entry for a path (e.g. after the file was deleted)."""
+        await self._execute_write("DELETE FROM file_checksum_index WHERE path = ?", (path,))
+
+    async def list_paths(self, folder: str) -> List[str]:
+        """
+        List indexed paths inside a folder.
+
+        Args:
+            folder: Absolute folder path
+
+        Returns:
+            Paths of all entries below ``folder``
+        """
+        prefix = folder.rstrip(os.sep) + os.sep
+        # Escape LIKE wildcards that can occur in folder names
+        escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        rows = await self._fetch_all(
+            "SELECT path FROM file_checksum_index WHERE path LIKE ? ESCAPE '\\'",
+            [escaped + '%']
+        )
+        return [row['path'] for row in rows]
+
+    async def prune(self, folder: str, existing_paths: Iterable[str], recursive: bool = True) -> int:
+        """
+        Remove entries below a folder whose files no longer exist.
+
+        Args:
+            folder: Absolute folder path that was fully scanned
+            existing_paths: Paths found by the scan
+            recursive: Whether the scan covered subdirectories; if not, only
+                direct children of ``folder`` are considered
+
+        Returns:
+            Number of entries removed
+        """
+        existing = set(existing_paths)
+        folder = folder.rstrip(os.sep) or os.sep
+        stale = [path for path in await self.list_paths(folder)
+                 if path not in existing and (recursive or os.path.dirname(path) == folder)]
+        # One transaction however many files vanished (e.g. a moved folder)
+        await self._execute_many("DELETE FROM file_checksum_index WHERE path = ?",
+                                 [(path,) for path in stale])
+        if stale:
+            logger.info("Pruned checksum index", folder=folder, removed=len(stale))
+        return len(stale)
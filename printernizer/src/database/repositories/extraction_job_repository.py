@@ -0,0 +1,267 @@
+"""
+Extraction job repository for the library metadata extraction queue.
+
+Every library file waiting for metadata extraction has one row here. Workers
+claim the most urgent due row, delete it on success and reschedule it with
+backoff on failure, so queued work survives restarts.
+
+Database Schema:
+    The metadata_extraction_jobs table (migration 043):
+    - checksum (TEXT): Library file checksum, primary key (one job per file)
+    - file_id (TEXT): Library file ID
+    - priority (INTEGER): Lower runs first (see LibraryConstants)
+    - status (TEXT): 'pending', 'running' or 'failed'
+    - attempts (INTEGER): Attempts started so far
+    - next_attempt_at (REAL): Epoch seconds the job is due
+    - last_error (TEXT): Error of the last failed attempt
+    - requeue (INTEGER): 1 if the file was enqueued again while running
+      (migration 044); the job returns to 'pending' when the attempt ends
+    - created_at / updated_at (TIMESTAMP)
+
+Usage Examples:
+    ```python
+    from src.database.repositories import ExtractionJobRepository
+
+    jobs = ExtractionJobRepository.from_database(database)
+
+    await jobs.enqueue(checksum, file_id, LibraryConstants.EXTRACTION_PRIORITY_UPLOAD)
+    job = await jobs.claim_next(time.time())
+    if job:
+        await jobs.complete(job['checksum'])
+    ```
+"""
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import structlog
+
+from .base_repository import BaseRepository
+
+logger = structlog.get_logger()
+
+# A pending job submitted again keeps its row: it moves up if the new priority
+# is more urgent (and becomes due now), a failed one starts over, and a
+# running one is marked to run again once the current attempt ends.
+ENQUEUE_SQL = """
+    INSERT INTO metadata_extraction_jobs (checksum, file_id, priority, status, next_attempt_at)
+    VALUES (?, ?, ?, 'pending', ?)
+    ON CONFLICT(checksum) DO UPDATE SET
+        file_id = COALESCE(excluded.file_id, file_id),
+        next_attempt_at = CASE
+            WHEN status = 'failed' OR excluded.priority < priority
+            THEN MIN(next_attempt_at, excluded.next_attempt_at)
+            ELSE next_attempt_at END,
+        attempts = CASE WHEN status = 'failed' THEN 0 ELSE attempts END,
+        requeue = CASE WHEN status = 'running' THEN 1 ELSE requeue END,
+        status = CASE WHEN status = 'failed' THEN 'pending' ELSE status END,
+        priority = MIN(priority, excluded.priority),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+CLAIM_SQL = """
+    UPDATE metadata_extraction_jobs
+    SET status = 'running', attempts = attempts + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE checksum = (
+        SELECT checksum FROM metadata_extraction_jobs
+        WHERE status = 'pending' AND next_attempt_at <= ?
+        ORDER BY priority, next_attempt_at
+        LIMIT 1
+    )
+    RETURNING checksum, file_id, priority, attempts
+"""
+
+
+class ExtractionJobRepository(BaseRepository):
+    """
+    Repository for the metadata_extraction_jobs table.
+
+    Key Features:
+        - One job per file; enqueueing again only raises its priority
+        - Atomic claim of the most urgent due job (UPDATE ... RETURNING)
+        - Retry scheduling and reset of jobs interrupted by a restart
+    """
+
+    async def _write_counted(self, sql: str, params: Sequence[Any]) -> int:
+        """Execute a write on the writer connection and return the affected row count."""
+        cursor = await self.connection.execute(sql, tuple(params))
+        await self.connection.commit()
+        return cursor.rowcount
+
+    async def enqueue(self, checksum: str, file_id: Optional[str], priority: int) -> None:
+        """
+        Queue extraction of a file, or move its queued job up.
+
+        Args:
+            checksum: Library file checksum
+            file_id: Library file ID
+            priority: Queue priority (lower runs first)
+        """
+        await self._execute_write(ENQUEUE_SQL, (checksum, file_id, priority, time.time()))
+
+    async def enqueue_many(self, entries: Iterable[Tuple[str, Optional[str]]], priority: int) -> int:
+        """
+        Queue extraction of many files in one transaction.
+
+        Args:
+            entries: (checksum, file_id) tuples
+            priority: Queue priority of all of them
+
+        Returns:
+            Number of files submitted
+        """
+        now = time.time()
+        rows = [(checksum, file_id, priority, now) for checksum, file_id in entries]
+        if rows:
+            await self._execute_many(ENQUEUE_SQL, rows)
+        return len(rows)
+
+    async def enqueue_orphaned(self, statuses: Sequence[str], priority: int) -> int:
+        """
+        Queue library files left in one of ``statuses`` without a job (e.g.
+        'processing' rows from before the queue existed).
+
+        Returns:
+            Number of files queued
+        """
+        placeholders = ', '.join('?' for _ in statuses)
+        return await self._write_counted(
+            f"""INSERT INTO metadata_extraction_jobs (checksum, file_id, priority, status, next_attempt_at)
+                SELECT lf.checksum, lf.id, ?, 'pending', ? FROM library_files lf
+                WHERE lf.status IN ({placeholders})
+                  AND NOT EXISTS (SELECT 1 FROM metadata_extraction_jobs j WHERE j.checksum = lf.checksum)""",
+            [priority, time.time(), *statuses]
+        )
+
+    async def escalate(self, checksum: str, priority: int) -> bool:
+        """
+        Move a pending job up to ``priority`` and make it due now.
+
+        Returns:
+            True if a less urgent pending job was moved up
+        """
+        return await self._write_counted(
+            """UPDATE metadata_extraction_jobs
+               SET priority = ?, next_attempt_at = MIN(next_attempt_at, ?), updated_at = CURRENT_TIMESTAMP
+               WHERE checksum = ? AND status = 'pending' AND priority > ?""",
+            [priority, time.time(), checksum, priority]
+        ) > 0
+
+    async def claim_next(self, now: float) -> Optional[Dict[str, Any]]:
+        """
+        Mark the most urgent due job as running and return it.
+
+        Args:
+            now: Current epoch seconds
+
+        Returns:
+            Dict with checksum, file_id, priority and attempts (including this
+            one), or None if no job is due
+        """
+        async with self.connection.execute(CLAIM_SQL, (now,)) as cursor:
+            row = await cursor.fetchone()
+        await self.connection.commit()
+        if row is None:
+            return None
+        return {'checksum': row[0], 'file_id': row[1], 'priority': row[2], 'attempts': row[3]}
+
+    async def next_due_at(self) -> Optional[float]:
+        """Epoch seconds the earliest pending job is due, or None if there is none."""
+        row = await self._fetch_one(
+            "SELECT MIN(next_attempt_at) AS due FROM metadata_extraction_jobs WHERE status = 'pending'"
+        )
+        return row['due'] if row else None
+
+    async def _requeue_requested(self, checksum: str, error: Optional[str] = None) -> bool:
+        """Start a running job over, due now, if it was enqueued again meanwhile."""
+        return await self._write_counted(
+            """UPDATE metadata_extraction_jobs
+               SET status = 'pending', requeue = 0, attempts = 0, next_attempt_at = ?, last_error = ?,
+                   updated_at = CURRENT_TIMESTAMP
+               WHERE checksum = ? AND status = 'running' AND requeue = 1""",
+            [time.time(), error, checksum]
+        ) > 0
+
+    async def complete(self, checksum: str) -> bool:
+        """
+        Remove a finished job, or requeue it if it was enqueued again while running.
+
+        Returns:
+            True if the job was requeued
+        """
+        deleted = await self._write_counted(
+            "DELETE FROM metadata_extraction_jobs WHERE checksum = ? AND status = 'running' AND requeue = 0",
+            [checksum]
+        )
+        return not deleted and await self._requeue_requested(checksum)
+
+    async def retry(self, checksum: str, next_attempt_at: float, error: str) -> None:
+        """
+        Put a failed attempt back in the queue, due at ``next_attempt_at``
+        (due now with attempts reset if it was enqueued again while running).
+        """
+        if await self._requeue_requested(checksum, error):
+            return
+        await self._execute_write(
+            """UPDATE metadata_extraction_jobs
+               SET status = 'pending', next_attempt_at = ?, last_error = ?, updated_at = CURRENT_TIMESTAMP
+               WHERE checksum = ?""",
+            (next_attempt_at, error, checksum)
+        )
+
+    async def release(self, checksum: str) -> None:
+        """Put a running job back in the queue, due now, without counting the attempt."""
+        await self._execute_write(
+            """UPDATE metadata_extraction_jobs
+               SET status = 'pending', attempts = MAX(attempts - 1, 0), next_attempt_at = ?, requeue = 0,
+                   updated_at = CURRENT_TIMESTAMP
+               WHERE checksum = ? AND status = 'running'""",
+            (time.time(), checksum)
+        )
+
+    async def fail(self, checksum: str, error: str) -> bool:
+        """
+        Mark a job failed after its last attempt (kept until enqueued again).
+
+        Returns:
+            False if it was enqueued again while running and requeued instead
+        """
+        if await self._requeue_requested(checksum, error):
+            return False
+        await self._execute_write(
+            """UPDATE metadata_extraction_jobs
+               SET status = 'failed', last_error = ?, updated_at = CURRENT_TIMESTAMP
+               WHERE checksum = ?""",
+            (error, checksum)
+        )
+        return True
+
+    async def reset_running(self) -> int:
+        """
+        Put jobs left running (by a restart or shutdown) back in the queue.
+
+        The interrupted attempt is not counted.
+
+        Returns:
+            Number of jobs reset
+        """
+        return await self._write_counted(
+            """UPDATE metadata_extraction_jobs
+               SET status = 'pending', attempts = MAX(attempts - 1, 0), requeue = 0,
+                   updated_at = CURRENT_TIMESTAMP
+               WHERE status = 'running'""",
+            []
+        )
+
+    async def get_counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        rows = await self._fetch_all(
+            "SELECT status, COUNT(*) AS count FROM metadata_extraction_jobs GROUP BY status"
+        )
+        return {row['status']: row['count'] for row in rows}
+
+    async def get_failed(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recently failed jobs with their last error."""
+        return await self._fetch_all(
+            """SELECT checksum, attempts, last_error, updated_at FROM metadata_extraction_jobs
+               WHERE status = 'failed' ORDER BY updated_at DESC LIMIT ?""",
+            [limit]
+        )
@@ -146,14 +146,45 @@ See Also:
 import json
 import sqlite3
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import structlog
 
+from src.database.row_mapping import LazyRow
 from .base_repository import BaseRepository
 
 
 logger = structlog.get_logger(__name__)
 
+# Columns for file listings: everything except the thumbnail_data BLOB,
+# which only the single-file and thumbnail endpoints need
+FILE_LIST_COLUMNS = (
+    'id', 'printer_id', 'filename', 'display_name', 'file_path', 'file_size',
+    'file_type', 'status', 'source', 'download_progress', 'downloaded_at',
+    'metadata', 'watch_folder_path', 'relative_path', 'modified_time',
+    'has_thumbnail', 'thumbnail_width', 'thumbnail_height', 'thumbnail_format',
+    'thumbnail_source', 'created_at',
+)
+
+
+def decode_file_metadata(value: Any) -> Any:
+    """Decoder for the JSON metadata column; malformed JSON becomes {}."""
+    if not value or not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+
+
+FILE_DECODERS = {'metadata': decode_file_metadata}
+
+# Columns files can be keyset-paged by: column -> nullable
+FILE_SORT_COLUMNS = {
+    'created_at': True,
+    'filename': False,
+    'file_size': True,
+}
+
 
 class FileRepository(BaseRepository):
     """
@@ -375,14 +406,81 @@ class FileRepository(BaseRepository):
             logger.error("Failed to list files", error=str(e), exc_info=True)
             return []
 
+    @staticmethod
+    def _filter_conditions(printer_id: Optional[str] = None, status: Optional[str] = None,
+                           source: Optional[str] = None, has_thumbnail: Optional[bool] = None,
+                           search: Optional[str] = None) -> Tuple[List[str], List[Any]]:
+        """Build WHERE conditions and parameters for the listing filters."""
+        conditions: List[str] = []
+        params: List[Any] = []
+        if printer_id:
+            conditions.append("printer_id = ?")
+            params.append(printer_id)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if has_thumbnail is not None:
+            conditions.append("COALESCE(has_thumbnail, 0) = ?")
+            params.append(1 if has_thumbnail else 0)
+        if search:
+            # Case-insensitive substring match without LIKE wildcards
+            conditions.append("instr(lower(filename), ?) > 0")
+            params.append(search.lower())
+        return conditions, params
+
+    async def list_page(self, signature: str, printer_id: Optional[str] = None,
+                        status: Optional[str] = None, source: Optional[str] = None,
+                        has_thumbnail: Optional[bool] = None, search: Optional[str] = None,
+                        limit: int = 50, cursor: Optional[str] = None,
+                        sort_by: str = 'created_at',
+                        descending: bool = True) -> Tuple[List[LazyRow], Optional[str]]:
+        """List one keyset page of files (listing columns, metadata decoded lazily).
+
+        Args:
+            signature: query_signature of the caller's sort and filters; the
+                cursor must have been issued for the same signature
+            printer_id: Filter by printer ID
+            status: Filter by file status
+            source: Filter by file source
+            has_thumbnail: Filter by thumbnail availability
+            search: Case-insensitive substring of the filename
+            limit: Page size
+            cursor: Cursor of the previous page (None for the first page)
+            sort_by: One of FILE_SORT_COLUMNS
+            descending: Sort direction
+
+        Returns:
+            Tuple of (file rows, cursor after the last row or None)
+
+        Raises:
+            ValueError: If sort_by is not sortable
+            InvalidCursorError: If the cursor does not match the signature
+        """
+        if sort_by not in FILE_SORT_COLUMNS:
+            raise ValueError(f"Cannot page files by {sort_by!r}; use one of {', '.join(FILE_SORT_COLUMNS)}")
+        conditions, params = self._filter_conditions(printer_id, status, source,
+                                                     has_thumbnail, search)
+        return await self._fetch_keyset_page(
+            f"SELECT {', '.join(FILE_LIST_COLUMNS)} FROM files", conditions, params,
+            sort_column=sort_by, id_column='id', descending=descending,
+            nullable=FILE_SORT_COLUMNS[sort_by], limit=limit,
+            signature=signature, cursor=cursor, decoders=FILE_DECODERS,
+        )
+
     async def count(self, printer_id: Optional[str] = None, status: Optional[str] = None,
-                   source: Optional[str] = None) -> int:
+                   source: Optional[str] = None, has_thumbnail: Optional[bool] = None,
+                   search: Optional[str] = None) -> int:
         """Count files with optional filtering (efficient COUNT query).
 
         Args:
             printer_id: Filter by printer ID
             status: Filter by file status
             source: Filter by file source
+            has_thumbnail: Filter by thumbnail availability
+            search: Case-insensitive substring of the filename
 
         Returns:
             Total count of files matching filters
@@ -393,18 +491,8 @@ class FileRepository(BaseRepository):
         """
         try:
             query = "SELECT COUNT(*) as count FROM files"
-            params = []
-            conditions = []
-
-            if printer_id:
-                conditions.append("printer_id = ?")
-                params.append(printer_id)
-            if status:
-                conditions.append("status = ?")
-                params.append(status)
-            if source:
-                conditions.append("source = ?")
-                params.append(source)
+            conditions, params = self._filter_conditions(printer_id, status, source,
+                                                         has_thumbnail, search)
 
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
@@ -83,14 +83,33 @@ See Also:
     - src/api/routers/jobs.py - API endpoints
     - docs/technical-debt/COMPLETION-REPORT.md - Phase 1 repository extraction
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+import json
 import sqlite3
 import structlog
 
+from src.database.pagination import query_signature
+from src.database.row_mapping import LazyRow, decode_datetime, select_statement
 from .base_repository import BaseRepository
 
 logger = structlog.get_logger()
 
+# Serialized job columns, decoded lazily by get() and list()
+JOB_DECODERS = {
+    'customer_info': json.loads,
+    'start_time': decode_datetime,
+    'end_time': decode_datetime,
+    'created_at': decode_datetime,
+    'updated_at': decode_datetime,
+}
+
+# Sortable job columns for list_page: column -> nullable
+JOB_SORT_COLUMNS = {
+    'created_at': True,
+    'updated_at': True,
+    'job_name': False,
+}
+
 
 class JobRepository(BaseRepository):
     """
@@ -196,7 +215,7 @@ class JobRepository(BaseRepository):
                         exc_info=True)
             return False
 
-    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+    async def get(self, job_id: str) -> Optional[LazyRow]:
         """
         Get a job by ID.
 
@@ -204,11 +223,12 @@ class JobRepository(BaseRepository):
             job_id: Unique job identifier
 
         Returns:
-            Job data dictionary or None if not found
+            Job row (customer_info and timestamps decoded on access) or None
+            if not found
         """
         try:
-            row = await self._fetch_one("SELECT * FROM jobs WHERE id = ?", [job_id])
-            return row
+            return await self._fetch_row(select_statement('jobs', filters=('id',)),
+                                         [job_id], JOB_DECODERS)
 
         except Exception as e:
             logger.error("Failed to get job",
@@ -221,7 +241,7 @@ class JobRepository(BaseRepository):
                   status: Optional[str] = None,
                   is_business: Optional[bool] = None,
                   limit: Optional[int] = None,
-                  offset: int = 0) -> List[Dict[str, Any]]:
+                  offset: int = 0) -> List[LazyRow]:
         """
         List jobs with optional filtering.
 
@@ -233,32 +253,30 @@ class JobRepository(BaseRepository):
             offset: Number of jobs to skip
 
         Returns:
-            List of job dictionaries
+            List of job rows (customer_info and timestamps decoded on access)
         """
         try:
-            query = "SELECT * FROM jobs WHERE 1=1"
+            filters: List[str] = []
             params: List[Any] = []
 
             if printer_id:
-                query += " AND printer_id = ?"
+                filters.append('printer_id')
                 params.append(printer_id)
 
             if status:
-                query += " AND status = ?"
+                filters.append('status')
                 params.append(status)
 
             if is_business is not None:
-                query += " AND is_business = ?"
+                filters.append('is_business')
                 params.append(1 if is_business else 0)
 
-            query += " ORDER BY created_at DESC"
-
             if limit:
-                query += " LIMIT ? OFFSET ?"
                 params.extend([limit, offset])
 
-            rows = await self._fetch_all(query, params)
-            return rows
+            query = select_statement('jobs', filters=tuple(filters),
+                                     order_by='created_at DESC', paginate=bool(limit))
+            return await self._fetch_rows(query, params, JOB_DECODERS)
 
         except Exception as e:
             logger.error("Failed to list jobs",
@@ -269,6 +287,59 @@ class JobRepository(BaseRepository):
                         exc_info=True)
             return []
 
+    async def list_page(self, printer_id: Optional[str] = None,
+                        status: Optional[str] = None,
+                        is_business: Optional[bool] = None,
+                        limit: int = 50,
+                        cursor: Optional[str] = None,
+                        offset: int = 0,
+                        sort_by: str = 'created_at',
+                        descending: bool = True) -> Tuple[List[LazyRow], Optional[str]]:
+        """
+        List one page of jobs with keyset (cursor) or offset pagination.
+
+        Args:
+            printer_id: Filter by printer ID
+            status: Filter by job status
+            is_business: Filter by business flag (True/False/None for all)
+            limit: Page size
+            cursor: Cursor returned with the previous page; takes precedence
+                over ``offset``
+            offset: Number of jobs to skip when no cursor is given
+            sort_by: One of JOB_SORT_COLUMNS
+            descending: Sort direction
+
+        Returns:
+            Tuple of (job rows, cursor of the next page or None)
+
+        Raises:
+            ValueError: If sort_by is not sortable
+            InvalidCursorError: If the cursor is malformed or was issued for
+                other filters or another sort order
+        """
+        if sort_by not in JOB_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort jobs by {sort_by!r}; use one of {', '.join(JOB_SORT_COLUMNS)}")
+
+        conditions: List[str] = []
+        params: List[Any] = []
+        if printer_id:
+            conditions.append('printer_id = ?')
+            params.append(printer_id)
+        if status:
+            conditions.append('status = ?')
+            params.append(status)
+        if is_business is not None:
+            conditions.append('is_business = ?')
+            params.append(1 if is_business else 0)
+
+        return await self._fetch_keyset_page(
+            'SELECT * FROM jobs', conditions, params,
+            sort_column=sort_by, id_column='id', descending=descending,
+            nullable=JOB_SORT_COLUMNS[sort_by], limit=limit,
+            signature=query_signature('jobs', sort_by, descending, printer_id, status, is_business),
+            cursor=cursor, offset=offset, decoders=JOB_DECODERS,
+        )
+
     async def count(self, printer_id: Optional[str] = None,
                    status: Optional[str] = None,
                    is_business: Optional[bool] = None) -> int:
@@ -0,0 +1,226 @@
+"""
+Job rollup repository for materialized dashboard aggregates.
+
+The job_daily_rollups table holds one row per (day, printer, business flag)
+bucket with job counts, runtime, material and cost totals. Analytics read
+these rows instead of loading every job, so dashboard queries scale with the
+number of buckets rather than the number of jobs.
+
+Database Schema:
+    The job_daily_rollups table (migration 039):
+    - day (TEXT): Bucket day, date(COALESCE(start_time, created_at)) of the job
+    - printer_id (TEXT): Printer the jobs ran on
+    - is_business (INTEGER): 1 for business jobs, 0 for private jobs
+    - total_jobs / completed_jobs / failed_jobs / cancelled_jobs (INTEGER)
+    - total_runtime_seconds / completed_runtime_seconds (INTEGER): SUM(actual_duration)
+    - total_material_grams / completed_material_grams (REAL): SUM(material_used)
+    - total_cost_eur (REAL): SUM(material_cost + power_cost)
+    - updated_at (TIMESTAMP): Last refresh of the bucket
+
+Maintenance:
+    Buckets are recomputed from the jobs table rather than adjusted by
+    deltas, so a refresh is idempotent and repairs any drift in the bucket.
+    JobService refreshes the old and new bucket of a job on every write;
+    rebuild() recomputes everything (backfills, manual SQL edits).
+
+Usage Examples:
+    ```python
+    from src.database.repositories import JobRollupRepository
+
+    rollup_repo = JobRollupRepository(db.connection)
+
+    # Before and after changing a job
+    old_bucket = await rollup_repo.get_job_bucket(job_id)
+    ...
+    await rollup_repo.refresh_job(job_id, old_bucket)
+
+    # Totals for January, per printer
+    rows = await rollup_repo.get_totals('2025-01-01', '2025-01-31', group_by_printer=True)
+    ```
+"""
+from typing import Optional, List, Dict, Any, Tuple
+import structlog
+
+from .base_repository import BaseRepository
+
+logger = structlog.get_logger()
+
+# (day, printer_id, is_business)
+RollupBucket = Tuple[str, str, int]
+
+# Bucket key expressions over the jobs table; must match the expression index
+# created by migration 039
+BUCKET_DAY_SQL = "date(COALESCE(start_time, created_at))"
+BUCKET_BUSINESS_SQL = "COALESCE(is_business, 0)"
+
+ROLLUP_AGGREGATES_SQL = """
+    COUNT(*),
+    COALESCE(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(actual_duration), 0),
+    COALESCE(SUM(CASE WHEN status = 'completed' THEN actual_duration END), 0),
+    COALESCE(SUM(material_used), 0),
+    COALESCE(SUM(CASE WHEN status = 'completed' THEN material_used END), 0),
+    COALESCE(SUM(COALESCE(material_cost, 0) + COALESCE(power_cost, 0)), 0)
+"""
+
+ROLLUP_COLUMNS_SQL = """
+    day, printer_id, is_business,
+    total_jobs, completed_jobs, failed_jobs, cancelled_jobs,
+    total_runtime_seconds, completed_runtime_seconds,
+    total_material_grams, completed_material_grams,
+    total_cost_eur
+"""
+
+SUM_COLUMNS = (
+    'total_jobs', 'completed_jobs', 'failed_jobs', 'cancelled_jobs',
+    'total_runtime_seconds', 'completed_runtime_seconds',
+    'total_material_grams', 'completed_material_grams',
+    'total_cost_eur',
+)
+
+
+class JobRollupRepository(BaseRepository):
+    """
+    Repository for the job_daily_rollups materialized aggregates.
+
+    Key Features:
+        - Bucket refresh as a single upsert (atomic, idempotent)
+        - Full rebuild for backfills
+        - Range/printer/business totals read from rollup rows only
+    """
+
+    async def get_job_bucket(self, job_id: str) -> Optional[RollupBucket]:
+        """
+        Get the rollup bucket a job currently belongs to.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            (day, printer_id, is_business) tuple, or None if the job does not
+            exist or has no timestamp
+        """
+        row = await self._fetch_one(
+            f"""SELECT {BUCKET_DAY_SQL} AS day, printer_id, {BUCKET_BUSINESS_SQL} AS is_business
+                FROM jobs WHERE id = ?""",
+            [job_id]
+        )
+        if not row or not row['day']:
+            return None
+        return (row['day'], row['printer_id'], int(row['is_business']))
+
+    async def refresh_bucket(self, bucket: RollupBucket) -> None:
+        """
+        Recompute one rollup bucket from the jobs table.
+
+        The aggregate always yields exactly one row, so a bucket whose last
+        job moved away or was deleted is reset to zeros.
+
+        Args:
+            bucket: (day, printer_id, is_business) tuple
+        """
+        day, printer_id, is_business = bucket
+        await self._execute_write(
+            f"""INSERT INTO job_daily_rollups ({ROLLUP_COLUMNS_SQL})
+                SELECT ?, ?, ?, {ROLLUP_AGGREGATES_SQL}
+                FROM jobs
+                WHERE printer_id = ? AND {BUCKET_DAY_SQL} = ? AND {BUCKET_BUSINESS_SQL} = ?
+                ON CONFLICT(day, printer_id, is_business) DO UPDATE SET
+                    total_jobs = excluded.total_jobs,
+                    completed_jobs = excluded.completed_jobs,
+                    failed_jobs = excluded.failed_jobs,
+                    cancelled_jobs = excluded.cancelled_jobs,
+                    total_runtime_seconds = excluded.total_runtime_seconds,
+                    completed_runtime_seconds = excluded.completed_runtime_seconds,
+                    total_material_grams = excluded.total_material_grams,
+                    completed_material_grams = excluded.completed_material_grams,
+                    total_cost_eur = excluded.total_cost_eur,
+                    updated_at = CURRENT_TIMESTAMP""",
+            (day, printer_id, is_business, printer_id, day, is_business)
+        )
+
+    async def refresh_job(self, job_id: str, previous_bucket: Optional[RollupBucket] = None) -> None:
+        """
+        Refresh the buckets affected by a job write.
+
+        Args:
+            job_id: Job identifier
+            previous_bucket: Bucket of the job before the write (if it may
+                have moved, e.g. start_time or is_business changed, or the
+                job was deleted)
+        """
+        buckets = {previous_bucket, await self.get_job_bucket(job_id)}
+        for bucket in buckets:
+            if bucket is not None:
+                await self.refresh_bucket(bucket)
+
+    async def rebuild(self) -> int:
+        """
+        Recompute all rollups from the jobs table.
+
+        Returns:
+            Number of rollup rows written
+        """
+        await self.connection.execute("DELETE FROM job_daily_rollups")
+        await self.connection.execute(
+            f"""INSERT INTO job_daily_rollups ({ROLLUP_COLUMNS_SQL})
+                SELECT {BUCKET_DAY_SQL}, printer_id, {BUCKET_BUSINESS_SQL}, {ROLLUP_AGGREGATES_SQL}
+                FROM jobs
+                WHERE {BUCKET_DAY_SQL} IS NOT NULL
+                GROUP BY 1, 2, 3"""
+        )
+        await self.connection.commit()
+
+        row = await self._fetch_one("SELECT COUNT(*) AS count FROM job_daily_rollups")
+        count = row['count'] if row else 0
+        logger.info("Job rollups rebuilt", buckets=count)
+        return count
+
+    async def get_totals(self, start_day: Optional[str] = None, end_day: Optional[str] = None,
+                         printer_id: Optional[str] = None, is_business: Optional[bool] = None,
+                         group_by_printer: bool = False) -> List[Dict[str, Any]]:
+        """
+        Sum rollup rows over an optional day range.
+
+        Args:
+            start_day: First day to include (YYYY-MM-DD), inclusive
+            end_day: Last day to include (YYYY-MM-DD), inclusive
+            printer_id: Only include this printer
+            is_business: Only include business (True) or private (False) jobs
+            group_by_printer: Return one row per printer instead of one total
+
+        Returns:
+            List of dicts with the summed rollup columns (plus printer_id and
+            business_jobs when grouped); a single row when not grouped
+        """
+        where_clauses = []
+        params: List[Any] = []
+
+        if start_day:
+            where_clauses.append("day >= ?")
+            params.append(start_day)
+        if end_day:
+            where_clauses.append("day <= ?")
+            params.append(end_day)
+        if printer_id:
+            where_clauses.append("printer_id = ?")
+            params.append(printer_id)
+        if is_business is not None:
+            where_clauses.append("is_business = ?")
+            params.append(1 if is_business else 0)
+
+        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+        sums = ", ".join(f"COALESCE(SUM({column}), 0) AS {column}" for column in SUM_COLUMNS)
+        business_jobs = "COALESCE(SUM(CASE WHEN is_business = 1 THEN total_jobs ELSE 0 END), 0) AS business_jobs"
+
+        if group_by_printer:
+            sql = f"""SELECT printer_id, {sums}, {business_jobs}
+                      FROM job_daily_rollups WHERE {where_clause}
+                      GROUP BY printer_id"""
+        else:
+            sql = f"""SELECT {sums}, {business_jobs}
+                      FROM job_daily_rollups WHERE {where_clause}"""
+
+        return await self._fetch_all(sql, params)
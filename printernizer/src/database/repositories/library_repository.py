@@ -151,11 +151,33 @@ import sqlite3
 from typing import Any, Dict, List, Optional, Tuple
 import structlog
 
+from src.database.pagination import CountCache, InvalidCursorError, query_signature
+from src.database.row_mapping import LazyRow
 from .base_repository import BaseRepository
 
 
 logger = structlog.get_logger(__name__)
 
+# Columns for library listings: everything except the thumbnail_data BLOB
+# and the search_index text, which listings filter on but never return
+LIBRARY_LIST_COLUMNS = (
+    'id', 'checksum', 'filename', 'display_name', 'library_path', 'file_size',
+    'file_type', 'sources', 'status', 'added_to_library', 'last_modified',
+    'last_analyzed', 'is_duplicate', 'duplicate_of_checksum', 'duplicate_count',
+    'has_thumbnail', 'thumbnail_width', 'thumbnail_height', 'thumbnail_format',
+    'thumbnail_source', 'metadata', 'created_at', 'model_width', 'model_depth',
+    'model_height', 'model_volume', 'surface_area', 'object_count', 'layer_height',
+    'first_layer_height', 'nozzle_diameter', 'wall_count', 'wall_thickness',
+    'infill_density', 'infill_pattern', 'support_used', 'nozzle_temperature',
+    'bed_temperature', 'print_speed', 'total_layer_count', 'total_filament_weight',
+    'filament_length', 'filament_colors', 'material_types', 'multi_material',
+    'material_cost', 'energy_cost', 'total_cost', 'complexity_score',
+    'difficulty_level', 'success_probability', 'overhang_percentage',
+    'compatible_printers', 'slicer_name', 'slicer_version', 'profile_name',
+    'bed_type', 'error_message', 'role', 'parent_checksum', 'analysis_error',
+)
+_LIBRARY_LIST_SELECT = ', '.join(f'lf.{column}' for column in LIBRARY_LIST_COLUMNS)
+
 
 class LibraryRepository(BaseRepository):
     """
@@ -340,7 +362,8 @@ class LibraryRepository(BaseRepository):
             return False
 
     async def list_files(self, filters: Optional[Dict[str, Any]] = None,
-                        page: int = 1, limit: int = 50) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+                        page: int = 1, limit: int = 50, cursor: Optional[str] = None,
+                        count_cache: Optional[CountCache] = None) -> Tuple[List[LazyRow], Dict[str, Any]]:
         """List library files with filters and pagination.
 
         Args:
@@ -357,13 +380,22 @@ class LibraryRepository(BaseRepository):
                 - only_duplicates: If True, show only duplicates
                 - sort_by: Field to sort by ('created_at', 'filename', 'file_size', 'last_modified')
                 - sort_order: Sort direction ('asc' or 'desc', default: 'desc')
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when a cursor is given
             limit: Items per page
+            cursor: pagination['next_cursor'] of the previous page; the page
+                is then read by keyset instead of OFFSET
+            count_cache: Optional CountCache; cursor pages take their total
+                from it instead of counting again
 
         Returns:
             Tuple of (files_list, pagination_info)
-            - files_list: List of library file dictionaries
-            - pagination_info: Dictionary with pagination metadata
+            - files_list: List of library file rows (without thumbnail_data and search_index)
+            - pagination_info: Dictionary with pagination metadata, including
+              next_cursor (None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued for
+                other filters or another sort order
 
         Notes:
             - Automatically JOINs library_file_sources when filtering by manufacturer/printer_model
@@ -445,14 +477,29 @@ class LibraryRepository(BaseRepository):
                     INNER JOIN library_file_sources lfs ON lf.checksum = lfs.file_checksum
                     WHERE {where_clause}
                 """
-                count_params = params.copy()
+                # DISTINCT to avoid duplicates
+                select_sql = f"""
+                    SELECT DISTINCT {_LIBRARY_LIST_SELECT} FROM library_files lf
+                    INNER JOIN library_file_sources lfs ON lf.checksum = lfs.file_checksum
+                """
             else:
                 # Simple query without JOIN
                 count_query = f"SELECT COUNT(*) as total FROM library_files lf WHERE {where_clause}"
-                count_params = params.copy()
+                select_sql = f"SELECT {_LIBRARY_LIST_SELECT} FROM library_files lf"
+
+            async def count() -> int:
+                count_row = await self._fetch_one(count_query, tuple(params))
+                return count_row['total'] if count_row else 0
 
-            count_row = await self._fetch_one(count_query, tuple(count_params))
-            total_items = count_row['total'] if count_row else 0
+            # Cursor pages reuse the total counted for the first page
+            count_key = tuple(sorted((k, str(v)) for k, v in filters.items()
+                                     if k not in ('sort_by', 'sort_order')))
+            if cursor and count_cache is not None:
+                total_items = await count_cache.get(count_key, count)
+            else:
+                total_items = await count()
+                if count_cache is not None:
+                    count_cache.put(count_key, total_items)
 
             # Calculate pagination
             offset = (page - 1) * limit
@@ -477,29 +524,17 @@ class LibraryRepository(BaseRepository):
             if sort_order not in ['ASC', 'DESC']:
                 sort_order = 'DESC'
 
-            order_by = f"{db_field} {sort_order}"
-
-            if needs_join:
-                # Query with JOIN (distinct to avoid duplicates)
-                query = f"""
-                    SELECT DISTINCT lf.* FROM library_files lf
-                    INNER JOIN library_file_sources lfs ON lf.checksum = lfs.file_checksum
-                    WHERE {where_clause}
-                    ORDER BY {order_by}
-                    LIMIT ? OFFSET ?
-                """
-            else:
-                # Simple query without JOIN
-                query = f"""
-                    SELECT lf.* FROM library_files lf
-                    WHERE {where_clause}
-                    ORDER BY {order_by}
-                    LIMIT ? OFFSET ?
-                """
-
-            params.extend([limit, offset])
-
-            rows = await self._fetch_all(query, tuple(params))
+            # ORDER BY <sort field>, lf.id; cursor pages seek on the
+            # (sort field, id) indexes of migration 041
+            rows, next_cursor = await self._fetch_keyset_page(
+                select_sql, where_clauses, params,
+                sort_column=db_field, id_column='lf.id',
+                descending=sort_order == 'DESC',
+                nullable=db_field != 'lf.filename',
+                limit=limit,
+                signature=query_signature('library_files', db_field, sort_order, count_key),
+                cursor=cursor, offset=offset,
+            )
 
             # CRITICAL FIX: Remove leading dot from file_type for frontend compatibility
             for row in rows:
@@ -513,12 +548,15 @@ class LibraryRepository(BaseRepository):
                 'total_pages': total_pages,
                 'page_size': limit,
                 'current_page': page,
-                'has_previous': page > 1,
-                'has_next': page < total_pages
+                'has_previous': bool(cursor) or page > 1,
+                'has_next': next_cursor is not None,
+                'next_cursor': next_cursor
             }
 
             return rows, pagination
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error("Failed to list library files", error=str(e), exc_info=True)
             return [], {'page': page, 'limit': limit, 'total_items': 0, 'total_pages': 0,
@@ -0,0 +1,183 @@
+"""
+Status series repository for printer status history chunks.
+
+Printer temperatures and progress are stored as columnar chunks, one row per
+printer, tier and time span, instead of one row per sample (see
+src/database/timeseries.py for the encoding and tiers).
+
+Database Schema:
+    The printer_status_series table (migration 042):
+    - printer_id (TEXT): Printer the samples belong to
+    - tier (TEXT): 'raw', '1m' or '15m'
+    - chunk_start (INTEGER): Epoch seconds, aligned to the tier's chunk span
+    - sample_count (INTEGER): Number of points in the chunk
+    - first_ts / last_ts (INTEGER): Epoch seconds of the first and last point
+    - timestamps, temperature_bed, temperature_nozzle, progress (BLOB):
+      Delta-encoded, compressed columns
+    - sealed (INTEGER): 1 once a raw chunk is complete and downsampled
+    - updated_at (TIMESTAMP): Last write of the chunk
+
+Usage Examples:
+    ```python
+    from src.database.repositories import StatusSeriesRepository
+
+    series_repo = StatusSeriesRepository.from_database(database)
+
+    await series_repo.save_chunk(chunk)                 # write-behind upsert
+    chunks = await series_repo.get_chunks('bambu_001', MINUTE_TIER, start, end)
+    await series_repo.prune(RAW_TIER, before=now - RAW_TIER.retention_seconds)
+    ```
+"""
+from typing import List, Optional
+import structlog
+
+from .base_repository import BaseRepository
+from src.database.timeseries import (
+    SERIES_FIELDS, SeriesChunk, SeriesTier, TIERS,
+    decode_ints, decode_values, encode_ints, encode_values,
+)
+
+logger = structlog.get_logger()
+
+CHUNK_COLUMNS_SQL = f"printer_id, tier, chunk_start, sealed, timestamps, {', '.join(SERIES_FIELDS)}"
+
+UPSERT_SQL = f"""
+    INSERT INTO printer_status_series (
+        printer_id, tier, chunk_start, sample_count, first_ts, last_ts,
+        timestamps, {', '.join(SERIES_FIELDS)}, sealed
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, {', '.join('?' for _ in SERIES_FIELDS)}, ?)
+    ON CONFLICT(printer_id, tier, chunk_start) DO UPDATE SET
+        sample_count = excluded.sample_count,
+        first_ts = excluded.first_ts,
+        last_ts = excluded.last_ts,
+        timestamps = excluded.timestamps,
+        {', '.join(f'{field} = excluded.{field}' for field in SERIES_FIELDS)},
+        sealed = excluded.sealed,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def _chunk_from_row(row) -> SeriesChunk:
+    """Decode a row selected with CHUNK_COLUMNS_SQL."""
+    printer_id, tier, chunk_start, sealed, timestamps = row[:5]
+    return SeriesChunk(
+        printer_id, TIERS[tier], chunk_start, decode_ints(timestamps),
+        [decode_values(blob) for blob in row[5:]], sealed=bool(sealed),
+    )
+
+
+class StatusSeriesRepository(BaseRepository):
+    """
+    Repository for the printer_status_series chunks.
+
+    Key Features:
+        - Chunk upserts through the write-behind queue (last write per chunk wins)
+        - Range reads that decode chunk columns straight from cursor rows
+        - Retention pruning per tier
+    """
+
+    async def save_chunk(self, chunk: SeriesChunk) -> None:
+        """
+        Upsert a chunk through the write-behind queue.
+
+        Later saves of the same chunk supersede pending ones. Empty chunks
+        are not stored. Clears ``chunk.dirty``.
+        """
+        if not chunk.timestamps:
+            return
+        params = (
+            chunk.printer_id, chunk.tier.name, chunk.chunk_start, len(chunk.timestamps),
+            chunk.timestamps[0], chunk.timestamps[-1], encode_ints(chunk.timestamps),
+            *(encode_values(column) for column in chunk.columns), int(chunk.sealed),
+        )
+        chunk.dirty = False
+        await self._write_behind(
+            UPSERT_SQL, params,
+            key=('status_series', chunk.printer_id, chunk.tier.name, chunk.chunk_start)
+        )
+
+    async def flush(self) -> None:
+        """Wait until queued chunk writes are committed."""
+        await self._flush_writes()
+
+    async def get_chunk(self, printer_id: str, tier: SeriesTier, chunk_start: int) -> Optional[SeriesChunk]:
+        """
+        Get one chunk (pending writes are committed first).
+
+        Args:
+            printer_id: Printer identifier
+            tier: Series tier
+            chunk_start: Aligned chunk start (epoch seconds)
+
+        Returns:
+            Decoded chunk, or None if it does not exist
+        """
+        await self.flush()
+        async with self._read_connection() as conn:
+            async with conn.execute(
+                f"""SELECT {CHUNK_COLUMNS_SQL} FROM printer_status_series
+                    WHERE printer_id = ? AND tier = ? AND chunk_start = ?""",
+                (printer_id, tier.name, chunk_start)
+            ) as cursor:
+                row = await cursor.fetchone()
+        return _chunk_from_row(row) if row else None
+
+    async def get_chunks(self, printer_id: str, tier: SeriesTier, start: int, end: int) -> List[SeriesChunk]:
+        """
+        Get the chunks of a printer and tier that overlap ``[start, end]``.
+
+        Args:
+            printer_id: Printer identifier
+            tier: Series tier
+            start: Range start (epoch seconds)
+            end: Range end (epoch seconds)
+
+        Returns:
+            Decoded chunks ordered by chunk_start
+        """
+        async with self._read_connection() as conn:
+            async with conn.execute(
+                f"""SELECT {CHUNK_COLUMNS_SQL} FROM printer_status_series
+                    WHERE printer_id = ? AND tier = ? AND chunk_start BETWEEN ? AND ?
+                      AND last_ts >= ?
+                    ORDER BY chunk_start""",
+                (printer_id, tier.name, tier.chunk_start(start), end, start)
+            ) as cursor:
+                rows = await cursor.fetchall()
+        return [_chunk_from_row(row) for row in rows]
+
+    async def get_unsealed_raw_chunks(self, before: int) -> List[SeriesChunk]:
+        """
+        Get raw chunks that ended before ``before`` but were never sealed
+        (e.g. the application stopped during that hour).
+        """
+        async with self._read_connection() as conn:
+            async with conn.execute(
+                f"""SELECT {CHUNK_COLUMNS_SQL} FROM printer_status_series
+                    WHERE tier = 'raw' AND sealed = 0 AND chunk_start <= ?""",
+                (before - TIERS['raw'].chunk_seconds,)
+            ) as cursor:
+                rows = await cursor.fetchall()
+        return [_chunk_from_row(row) for row in rows]
+
+    async def prune(self, tier: SeriesTier, before: int) -> int:
+        """
+        Delete chunks of a tier that ended before ``before``.
+
+        Returns:
+            Number of deleted chunks
+        """
+        await self.flush()
+        params = (tier.name, before - tier.chunk_seconds)
+        row = await self._fetch_one(
+            "SELECT COUNT(*) AS count FROM printer_status_series WHERE tier = ? AND chunk_start <= ?",
+            list(params)
+        )
+        deleted = row['count'] if row else 0
+        if deleted:
+            await self._execute_write(
+                "DELETE FROM printer_status_series WHERE tier = ? AND chunk_start <= ?", params
+            )
+            logger.info("Pruned status history chunks", tier=tier.name, chunks=deleted)
+        return deleted
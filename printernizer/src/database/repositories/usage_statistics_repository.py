@@ -113,7 +113,8 @@ class UsageStatisticsRepository(BaseRepository):
             # Serialize metadata to JSON
             metadata_json = json.dumps(event.metadata) if event.metadata else None
 
-            await self._execute_write(
+            # Group-committed when a write queue is configured
+            await self._write_behind(
                 """INSERT INTO usage_events (id, event_type, timestamp, metadata, submitted, created_at)
                    VALUES (?, ?, ?, ?, ?, ?)""",
                 (
@@ -169,6 +170,7 @@ class UsageStatisticsRepository(BaseRepository):
             )
             ```
         """
+        await self._flush_writes()
         try:
             # Build query dynamically based on filters
             query = "SELECT * FROM usage_events WHERE 1=1"
@@ -237,6 +239,7 @@ class UsageStatisticsRepository(BaseRepository):
             # Returns: {"job_completed": 23, "file_downloaded": 18, ...}
             ```
         """
+        await self._flush_writes()
         try:
             query = """
                 SELECT event_type, COUNT(*) as count
@@ -288,6 +291,7 @@ class UsageStatisticsRepository(BaseRepository):
             await repo.mark_events_submitted(period_start, period_end)
             ```
         """
+        await self._flush_writes()
         try:
             await self._execute_write(
                 """UPDATE usage_events
@@ -423,6 +427,7 @@ class UsageStatisticsRepository(BaseRepository):
             This method only deletes local data. If data was previously
             submitted, the user must contact us to delete remote data.
         """
+        await self._flush_writes()
         try:
             await self._execute_write("DELETE FROM usage_events")
             logger.info("All usage events deleted")
@@ -445,6 +450,7 @@ class UsageStatisticsRepository(BaseRepository):
             print(f"Total events recorded: {total}")
             ```
         """
+        await self._flush_writes()
         try:
             row = await self._fetch_one("SELECT COUNT(*) as count FROM usage_events")
             return row['count'] if row else 0
@@ -469,6 +475,7 @@ class UsageStatisticsRepository(BaseRepository):
                 print(f"Statistics collection started: {first_seen}")
             ```
         """
+        await self._flush_writes()
         try:
             row = await self._fetch_one(
                 "SELECT MIN(timestamp) as first_timestamp FROM usage_events"
@@ -507,18 +514,19 @@ class UsageStatisticsRepository(BaseRepository):
             This is optional and not part of the MVP. Consider adding as a
             background task if database size becomes an issue.
         """
+        await self._flush_writes()
         try:
             from datetime import timedelta
             cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-            cursor = await self._execute_write(
+            # Run on the writer connection and take the count from its cursor;
+            # changes() on a read-pool connection would always report 0
+            cursor = await self.connection.execute(
                 "DELETE FROM usage_events WHERE timestamp < ?",
                 (cutoff_date.isoformat(),)
             )
-
-            # Get number of deleted rows (SQLite doesn't return this from cursor)
-            row = await self._fetch_one("SELECT changes() as deleted_count")
-            deleted_count = row['deleted_count'] if row else 0
+            await self.connection.commit()
+            deleted_count = max(cursor.rowcount, 0)
 
             logger.info("Cleaned up old usage events",
                        days=days,
@@ -0,0 +1,176 @@
+"""
+Row mapping fast path for listing queries.
+
+``_fetch_all`` turns every row into a dict; listing code then copies that
+dict again and runs ``json.loads`` / ``fromisoformat`` on every serialized
+column, including columns the response model drops. For list endpoints this
+module provides a cheaper path:
+
+    column_index      column name -> position map, built once per result
+                      shape instead of once per row
+    LazyRow           row mapping over the raw cursor row; a column with a
+                      decoder is decoded on first access and cached
+    select_statement  SQL text cached per (table, columns, filters, order)
+                      shape, so filtered listings stop re-concatenating SQL
+
+A LazyRow reads like a dict (``row['x']``, ``.get``, ``in``, ``**row``,
+pydantic ``model_validate``) and accepts assignment, so existing
+post-processing keeps working. Where a real dict is required (``json.dumps``,
+caching) use ``row.to_dict()``, which decodes every column.
+
+Usage:
+    ```python
+    async with conn.execute(select_statement('files', FILE_LIST_COLUMNS,
+                                             ('status',), 'created_at DESC'),
+                            ['available']) as cursor:
+        rows = map_rows(cursor.description, await cursor.fetchall(),
+                        {'metadata': json.loads})
+    rows[0]['filename']   # no decoding
+    rows[0]['metadata']   # json.loads runs now, once
+    ```
+"""
+import functools
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+Decoder = Callable[[Any], Any]
+
+_UNSET = object()
+_DELETED = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _index_for(names: Tuple[str, ...]) -> Dict[str, int]:
+    return {name: position for position, name in enumerate(names)}
+
+
+def column_index(description: Sequence[Sequence[Any]]) -> Dict[str, int]:
+    """
+    Map column names to positions for a cursor description.
+
+    Maps are cached per column-name tuple and shared by every row of that
+    shape; treat the result as read-only.
+    """
+    return _index_for(tuple(column[0] for column in description))
+
+
+class LazyRow(MutableMapping):
+    """
+    Dict-like view of one result row with decode-on-first-access columns.
+
+    Decoded values, assignments and added keys live in a small overlay dict;
+    the raw row is never modified.
+    """
+
+    __slots__ = ('_values', '_index', '_decoders', '_overlay')
+
+    def __init__(self, values: Sequence[Any], index: Mapping[str, int],
+                 decoders: Optional[Mapping[str, Decoder]] = None):
+        self._values = values
+        self._index = index
+        self._decoders = decoders or {}
+        self._overlay: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._overlay.get(key, _UNSET)
+        if value is not _UNSET:
+            if value is _DELETED:
+                raise KeyError(key)
+            return value
+        value = self._values[self._index[key]]
+        decoder = self._decoders.get(key)
+        if decoder is not None and value is not None:
+            value = decoder(value)
+            self._overlay[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._overlay[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if key in self._index:
+            self._overlay[key] = _DELETED
+        else:
+            del self._overlay[key]
+
+    def __contains__(self, key: object) -> bool:
+        value = self._overlay.get(key, _UNSET)
+        if value is not _UNSET:
+            return value is not _DELETED
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        overlay = self._overlay
+        for key in self._index:
+            if overlay.get(key) is not _DELETED:
+                yield key
+        for key, value in overlay.items():
+            if key not in self._index and value is not _DELETED:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"LazyRow({self.to_dict()!r})"
+
+    def raw(self, key: str) -> Any:
+        """Column value as stored, without decoding or assignments."""
+        return self._values[self._index[key]]
+
+    def copy(self) -> 'LazyRow':
+        """Shallow copy sharing the raw row; decoded values are not re-decoded."""
+        row = LazyRow(self._values, self._index, self._decoders)
+        row._overlay = dict(self._overlay)
+        return row
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize a plain dict (decodes every column)."""
+        return {key: self[key] for key in self}
+
+
+def map_rows(description: Sequence[Sequence[Any]], rows: Sequence[Sequence[Any]],
+             decoders: Optional[Mapping[str, Decoder]] = None) -> List[LazyRow]:
+    """Wrap fetched rows in LazyRows sharing one column index."""
+    if not rows:
+        return []
+    index = column_index(description)
+    return [LazyRow(row, index, decoders) for row in rows]
+
+
+@functools.lru_cache(maxsize=512)
+def select_statement(table: str, columns: Tuple[str, ...] = ('*',),
+                     filters: Tuple[str, ...] = (), order_by: Optional[str] = None,
+                     paginate: bool = False) -> str:
+    """
+    Build (and cache) a SELECT for one query shape.
+
+    Only pass identifiers from code, never user input; values always go
+    through ``?`` parameters in the order of ``filters``, then LIMIT/OFFSET.
+
+    Args:
+        table: Table name
+        columns: Selected columns
+        filters: Columns compared with ``= ?``, joined with AND
+        order_by: ORDER BY clause body, e.g. ``"created_at DESC"``
+        paginate: Append ``LIMIT ? OFFSET ?``
+
+    Returns:
+        SQL text
+    """
+    sql = f"SELECT {', '.join(columns)} FROM {table}"
+    if filters:
+        sql += " WHERE " + " AND ".join(f"{column} = ?" for column in filters)
+    if order_by:
+        sql += f" ORDER BY {order_by}"
+    if paginate:
+        sql += " LIMIT ? OFFSET ?"
+    return sql
+
+
+def decode_datetime(value: Any) -> Any:
+    """Decoder for ISO timestamp columns; empty strings pass through."""
+    return datetime.fromisoformat(value) if isinstance(value, str) and value else value
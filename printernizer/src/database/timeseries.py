@@ -0,0 +1,201 @@
+"""
+Columnar, delta-encoded storage of printer status samples.
+
+Status history is stored as chunks rather than one row per sample: one row
+holds every sample of one printer for one time span (an hour of raw samples,
+a day of 1-minute averages, 30 days of 15-minute averages). Each column
+(timestamps, bed and nozzle temperature, progress) is a BLOB:
+
+    values -> fixed-point ints (x VALUE_SCALE, missing -> MISSING)
+           -> deltas to the previous value (int64 array)
+           -> zlib
+
+Temperatures and timestamps change slowly, so the deltas are small and
+repetitive and an hour of 5-second samples compresses to a few hundred
+bytes per column. Range queries decode a handful of chunk BLOBs into flat
+lists; samples never become per-row dicts.
+
+Tiers:
+    raw   every sample (SAMPLE_MIN_INTERVAL_SECONDS apart), kept 24 hours
+    1m    1-minute averages, kept 30 days
+    15m   15-minute averages, kept forever
+
+Usage:
+    ```python
+    chunk = SeriesChunk.empty('bambu_001', RAW_TIER, RAW_TIER.chunk_start(ts))
+    chunk.append(ts, (60.2, 219.8, 12))
+    minutes = chunk.downsample(MINUTE_TIER)
+    blob = encode_values(chunk.columns[0])
+    ```
+"""
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.constants import StatusHistoryConstants
+
+SERIES_FIELDS: Tuple[str, ...] = ('temperature_bed', 'temperature_nozzle', 'progress')
+"""Sampled status fields, in column order"""
+
+MISSING = -(1 << 62)
+"""Fixed-point marker for a missing value (fits int64 deltas either way)"""
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+class SeriesTier(NamedTuple):
+    """One retention tier of the status history."""
+    name: str
+    resolution_seconds: int
+    """Bucket width of averaged tiers, 0 for raw samples"""
+    chunk_seconds: int
+    retention_seconds: Optional[int]
+    """None keeps chunks forever"""
+
+    def chunk_start(self, ts: int) -> int:
+        """Start of the chunk containing ``ts`` (epoch seconds)."""
+        return ts - ts % self.chunk_seconds
+
+
+RAW_TIER = SeriesTier('raw', 0, StatusHistoryConstants.RAW_CHUNK_SECONDS,
+                      StatusHistoryConstants.RAW_RETENTION_SECONDS)
+MINUTE_TIER = SeriesTier('1m', 60, StatusHistoryConstants.MINUTE_CHUNK_SECONDS,
+                         StatusHistoryConstants.MINUTE_RETENTION_SECONDS)
+QUARTER_HOUR_TIER = SeriesTier('15m', 900, StatusHistoryConstants.QUARTER_HOUR_CHUNK_SECONDS, None)
+
+TIERS: Dict[str, SeriesTier] = {tier.name: tier for tier in (RAW_TIER, MINUTE_TIER, QUARTER_HOUR_TIER)}
+DOWNSAMPLED_TIERS: Tuple[SeriesTier, ...] = (MINUTE_TIER, QUARTER_HOUR_TIER)
+
+
+def encode_ints(values: Sequence[int]) -> bytes:
+    """Delta-encode and compress a sequence of ints."""
+    deltas = array('q', (b - a for a, b in zip([0, *values], values)))
+    if _BIG_ENDIAN:
+        deltas.byteswap()
+    return zlib.compress(deltas.tobytes())
+
+
+def decode_ints(blob: bytes) -> List[int]:
+    """Inverse of ``encode_ints``."""
+    deltas = array('q')
+    deltas.frombytes(zlib.decompress(blob))
+    if _BIG_ENDIAN:
+        deltas.byteswap()
+    return list(accumulate(deltas))
+
+
+def encode_values(values: Sequence[Optional[float]],
+                  scale: int = StatusHistoryConstants.VALUE_SCALE) -> bytes:
+    """Encode optional floats as fixed-point deltas."""
+    return encode_ints([MISSING if value is None else round(value * scale) for value in values])
+
+
+def decode_values(blob: bytes, scale: int = StatusHistoryConstants.VALUE_SCALE) -> List[Optional[float]]:
+    """Inverse of ``encode_values`` (precision is 1/scale)."""
+    return [None if value == MISSING else value / scale for value in decode_ints(blob)]
+
+
+class SeriesChunk:
+    """
+    Columnar samples of one printer, tier and chunk span.
+
+    ``timestamps`` are ascending epoch seconds; ``columns`` holds one list
+    per entry of SERIES_FIELDS, aligned with ``timestamps``.
+    """
+
+    __slots__ = ('printer_id', 'tier', 'chunk_start', 'timestamps', 'columns',
+                 'sealed', 'dirty')
+
+    def __init__(self, printer_id: str, tier: SeriesTier, chunk_start: int,
+                 timestamps: List[int], columns: List[List[Optional[float]]],
+                 sealed: bool = False):
+        self.printer_id = printer_id
+        self.tier = tier
+        self.chunk_start = chunk_start
+        self.timestamps = timestamps
+        self.columns = columns
+        self.sealed = sealed
+        self.dirty = False
+
+    @classmethod
+    def empty(cls, printer_id: str, tier: SeriesTier, chunk_start: int) -> 'SeriesChunk':
+        """New chunk without samples."""
+        return cls(printer_id, tier, chunk_start, [], [[] for _ in SERIES_FIELDS])
+
+    @property
+    def chunk_end(self) -> int:
+        """First second after the chunk span."""
+        return self.chunk_start + self.tier.chunk_seconds
+
+    def append(self, ts: int, values: Sequence[Optional[float]]) -> bool:
+        """
+        Append one sample; samples not newer than the last one are ignored.
+
+        Returns:
+            True if the sample was added
+        """
+        if self.timestamps and ts <= self.timestamps[-1]:
+            return False
+        self.timestamps.append(ts)
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        self.sealed = False
+        self.dirty = True
+        return True
+
+    def merge(self, timestamps: Sequence[int], columns: Sequence[Sequence[Optional[float]]]) -> None:
+        """Insert points, replacing existing points with the same timestamp."""
+        if not timestamps:
+            return
+        if not self.timestamps or timestamps[0] > self.timestamps[-1]:
+            self.timestamps.extend(timestamps)
+            for own, new in zip(self.columns, columns):
+                own.extend(new)
+        else:
+            points = {ts: [column[i] for column in self.columns] for i, ts in enumerate(self.timestamps)}
+            for i, ts in enumerate(timestamps):
+                points[ts] = [column[i] for column in columns]
+            self.timestamps = sorted(points)
+            self.columns = [[points[ts][c] for ts in self.timestamps] for c in range(len(SERIES_FIELDS))]
+        self.dirty = True
+
+    def slice(self, start: int, end: int, fields: Sequence[int]) -> Tuple[List[int], List[List[Optional[float]]]]:
+        """Timestamps and the selected columns within ``[start, end]``."""
+        lo = bisect_left(self.timestamps, start)
+        hi = bisect_right(self.timestamps, end)
+        return self.timestamps[lo:hi], [self.columns[f][lo:hi] for f in fields]
+
+    def downsample(self, tier: SeriesTier) -> Tuple[List[int], List[List[Optional[float]]]]:
+        """
+        Average samples into ``tier.resolution_seconds`` buckets.
+
+        Each bucket is stamped with its start; missing values are ignored and
+        a bucket without any value for a column stores None.
+        """
+        resolution = tier.resolution_seconds
+        bucket_ts: List[int] = []
+        sums: List[List[float]] = []
+        counts: List[List[int]] = []
+        width = len(self.columns)
+        for i, ts in enumerate(self.timestamps):
+            bucket = ts - ts % resolution
+            if not bucket_ts or bucket_ts[-1] != bucket:
+                bucket_ts.append(bucket)
+                sums.append([0.0] * width)
+                counts.append([0] * width)
+            bucket_sums, bucket_counts = sums[-1], counts[-1]
+            for c in range(width):
+                value = self.columns[c][i]
+                if value is not None:
+                    bucket_sums[c] += value
+                    bucket_counts[c] += 1
+        scale = StatusHistoryConstants.VALUE_SCALE
+        columns = [
+            [round(sums[b][c] / counts[b][c] * scale) / scale if counts[b][c] else None
+             for b in range(len(bucket_ts))]
+            for c in range(width)
+        ]
+        return bucket_ts, columns
@@ -0,0 +1,275 @@
+"""
+Write-behind queue for high-frequency SQLite writes.
+
+Every ``_execute_write`` on the main connection is its own transaction and
+pays a full WAL commit. Writers that fire often and can tolerate a few
+milliseconds of delay (printer status, FTS index maintenance, usage events)
+enqueue their statements here instead. A single writer task groups them
+into one transaction per time/size budget.
+
+The queue commits on the database's one writer connection, the same one
+``_execute_write`` and the repositories use, so writes never compete for
+SQLite's write lock. Each batch runs as a single call on that connection's
+worker thread: no other statement on the connection can interleave with a
+batch, and a write of another caller whose transaction is still open is
+committed together with it.
+
+Statements enqueued with a ``key`` supersede any still-pending write with the
+same key (last write wins), so a printer flapping between states costs one
+UPDATE per commit, not one per change. Every enqueue returns a future that
+resolves once the write (or the write that superseded it) is committed;
+``flush()`` waits for everything enqueued so far.
+
+Usage:
+    ```python
+    queue = WriteBehindQueue()
+    await queue.start(database.get_connection())
+
+    queue.enqueue([("UPDATE printers SET status = ? WHERE id = ?", ("online", "p1"))],
+                  key=("printer_status", "p1"))
+
+    await queue.flush()  # read-after-write from another connection
+    await queue.stop()
+    ```
+"""
+import asyncio
+import sqlite3
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import aiosqlite
+import structlog
+
+from src.constants import DatabaseConstants
+
+logger = structlog.get_logger()
+
+Statement = Tuple[str, Optional[Sequence[Any]]]
+
+
+class _PendingWrite:
+    """Statements of one enqueue call plus the futures waiting on them."""
+
+    __slots__ = ('statements', 'futures')
+
+    def __init__(self, statements: List[Statement], futures: List[asyncio.Future]):
+        self.statements = statements
+        self.futures = futures
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    """Mark a failed write's exception as retrieved; it was already logged."""
+    if not future.cancelled():
+        future.exception()
+
+
+def _apply_batch(conn: sqlite3.Connection, batch: List[_PendingWrite]) -> List[Optional[Exception]]:
+    """
+    Apply pending writes in one transaction (runs on the connection's thread).
+
+    Returns:
+        Per write, None if applied or the error that rolled it back
+    """
+    errors: List[Optional[Exception]] = [None] * len(batch)
+    try:
+        # Join a transaction another caller left open (its commit is pending)
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        for i, write in enumerate(batch):
+            conn.execute("SAVEPOINT write_behind")
+            try:
+                for sql, params in write.statements:
+                    conn.execute(sql, params or ())
+            except sqlite3.Error as e:
+                conn.execute("ROLLBACK TO write_behind")
+                errors[i] = e
+            conn.execute("RELEASE write_behind")
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        raise
+    return errors
+
+
+class WriteBehindQueue:
+    """
+    Group-committing writer on the database's writer connection.
+
+    Writes that share a key are superseded in place; writes of one enqueue
+    call are applied atomically (savepoint per write), so a failing statement
+    only fails its own future and never the rest of the batch.
+    """
+
+    def __init__(self,
+                 max_delay: float = DatabaseConstants.WRITE_QUEUE_MAX_DELAY_SECONDS,
+                 max_batch: int = DatabaseConstants.WRITE_QUEUE_MAX_STATEMENTS):
+        """
+        Initialize the queue (the connection is passed to ``start``).
+
+        Args:
+            max_delay: Seconds a write may wait for more writes to join its
+                transaction
+            max_batch: Pending statements that trigger an immediate commit
+        """
+        self.max_delay = max_delay
+        self.max_batch = max(1, max_batch)
+
+        self._connection: Optional[aiosqlite.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Dict[Hashable, _PendingWrite] = {}
+        self._pending_statements = 0
+        self._inflight: List[asyncio.Future] = []
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self.stats = {
+            'writes': 0,
+            'superseded': 0,
+            'statements': 0,
+            'transactions': 0,
+            'failed': 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """True while the writer task accepts writes."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self, connection: aiosqlite.Connection) -> None:
+        """
+        Start the writer task.
+
+        Args:
+            connection: The database's writer connection; it stays owned
+                (and is closed) by the caller
+        """
+        if self.is_running:
+            return
+        self._connection = connection
+        self._task = asyncio.create_task(self._run())
+        logger.info("Write-behind queue started",
+                    max_delay_ms=round(self.max_delay * 1000), max_batch=self.max_batch)
+
+    async def stop(self) -> None:
+        """Commit everything pending, then stop the writer."""
+        if self._task is None:
+            return
+        if self.is_running:
+            await self.flush()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._connection = None
+        logger.info("Write-behind queue stopped", **self.stats)
+
+    def enqueue(self, statements: Sequence[Statement], key: Optional[Hashable] = None) -> asyncio.Future:
+        """
+        Queue statements for the next group commit.
+
+        Args:
+            statements: (sql, params) tuples applied atomically, in order
+            key: Supersede a pending write with the same key (last write wins).
+                Only use keys for self-contained upserts whose earlier values
+                nobody else depends on.
+
+        Returns:
+            Future resolved with None once committed, or with the error that
+            made this write fail
+
+        Raises:
+            RuntimeError: If the queue is not running
+        """
+        if not self.is_running:
+            raise RuntimeError("Write-behind queue not running")
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        futures = [future]
+
+        if key is None:
+            key = object()
+        else:
+            superseded = self._pending.pop(key, None)
+            if superseded is not None:
+                # Waiters of the old write are satisfied by the newer one
+                futures = superseded.futures + futures
+                self._pending_statements -= len(superseded.statements)
+                self.stats['superseded'] += 1
+
+        statements = list(statements)
+        self._pending[key] = _PendingWrite(statements, futures)
+        self._pending_statements += len(statements)
+        self.stats['writes'] += 1
+
+        self._wakeup.set()
+        if self._pending_statements >= self.max_batch:
+            self._full.set()
+        return future
+
+    async def flush(self) -> None:
+        """Wait until every write enqueued so far is committed (or failed)."""
+        futures = list(self._inflight)
+        for write in self._pending.values():
+            futures.extend(write.futures)
+        if not futures:
+            return
+        if self._pending:
+            self._full.set()
+        await asyncio.gather(*futures, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue counters for debugging."""
+        return {**self.stats, 'pending': len(self._pending), 'running': self.is_running}
+
+    async def _run(self) -> None:
+        """Writer task: wait for a write, let the batch fill, commit."""
+        while True:
+            await self._wakeup.wait()
+            if not self._full.is_set():
+                try:
+                    await asyncio.wait_for(self._full.wait(), timeout=self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+            await self._commit_pending()
+
+    async def _commit_pending(self) -> None:
+        """Apply all pending writes in one transaction."""
+        self._wakeup.clear()
+        self._full.clear()
+        batch = list(self._pending.values())
+        self._pending = {}
+        self._pending_statements = 0
+        if not batch:
+            return
+
+        self._inflight = [f for write in batch for f in write.futures]
+        try:
+            # One call on the connection's worker thread: nothing else runs on
+            # the writer connection until the batch is committed
+            errors = await self._connection._execute(_apply_batch, self._connection._conn, batch)
+            self.stats['transactions'] += 1
+            for write, error in zip(batch, errors):
+                if error is None:
+                    self.stats['statements'] += len(write.statements)
+                else:
+                    logger.error("Write-behind statement failed",
+                                 sql=write.statements[0][0].split('\n')[0][:100], error=str(error))
+        except Exception as e:
+            logger.error("Write-behind commit failed", writes=len(batch), error=str(e))
+            errors = [e] * len(batch)
+
+        for write, error in zip(batch, errors):
+            if error is not None:
+                self.stats['failed'] += 1
+            for future in write.futures:
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+        self._inflight = []
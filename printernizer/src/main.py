@@ -42,7 +42,7 @@ from src.api.routers import (
     errors_router,
     camera_router
 )
-from src.api.routers.websocket import broadcast_printer_status
+from src.api.routers.websocket import broadcast_printer_status, broadcast_system_event
 from src.api.routers.ideas import router as ideas_router
 from src.api.routers.idea_url import router as idea_url_router
 # from src.api.routers.trending import router as trending_router  # DISABLED
@@ -77,6 +77,7 @@ from src.services.thumbnail_service import ThumbnailService
 from src.services.url_parser_service import UrlParserService
 from src.services.timelapse_service import TimelapseService
 from src.services.notification_service import NotificationService
+from src.services.preview_render_service import shutdown_render_pool
 from src.utils.logging_config import setup_logging
 from src.utils.errors import (
     PrinternizerError,
@@ -202,6 +203,8 @@ async def lifespan(app: FastAPI):
 
     job_service = JobService(database, event_service, usage_statistics_service)
     printer_service = PrinterService(database, event_service, config_service, usage_stats_service=usage_statistics_service)
+    # Printer status fallback polling and status persistence in the event service
+    event_service.set_services(printer_service=printer_service, database=database)
 
     # Inject PrinterService into UsageStatisticsService for fleet stats
     # (done after initialization to avoid circular dependencies)
@@ -285,6 +288,12 @@ async def lifespan(app: FastAPI):
     printer_service.monitoring.set_job_service(job_service)
     printer_service.monitoring.set_config_service(config_service)
 
+    # Temperature/progress history recorded from status updates
+    from src.services.status_history_service import StatusHistoryService
+    status_history_service = StatusHistoryService(database)
+    await status_history_service.start()
+    printer_service.monitoring.set_status_history_service(status_history_service)
+
     # Initialize TrendingService - DISABLED
     # timer.start("Trending service initialization")
     # logger.info("Initializing trending service...")
@@ -344,10 +353,21 @@ async def lifespan(app: FastAPI):
     app.state.usage_statistics_service = usage_statistics_service
     app.state.usage_statistics_scheduler = usage_statistics_scheduler
     app.state.camera_snapshot_service = camera_snapshot_service
+    app.state.status_history_service = status_history_service
     app.state.slicer_service = slicer_service
     app.state.slicing_queue = slicing_queue
     app.state.generator_service = generator_service
 
+    from src.services.search_service import SearchService
+    from src.services.idea_service import IdeaService
+
+    # Search service is shared so its result cache survives across requests
+    # and is invalidated by file/library/idea write events
+    app.state.search_service = SearchService(
+        database, file_service, IdeaService(database, event_service=event_service),
+        event_service=event_service
+    )
+
     # Initialize notification service
     notification_service = NotificationService(database, event_service)
     await notification_service.initialize()
@@ -378,6 +398,21 @@ async def lifespan(app: FastAPI):
 
     event_service.subscribe("printer_status_update", _on_printer_status_update)
 
+    # Forward watch-folder scan progress to the UI (latest frame per folder wins)
+    def _forward_scan_event(event_type):
+        async def _on_scan_event(data):
+            try:
+                await broadcast_system_event(
+                    event_type, data,
+                    coalesce_key=f"{event_type}:{data.get('folder')}"
+                )
+            except Exception as e:
+                logger.warning("Failed to broadcast scan event", event_type=event_type, error=str(e))
+        return _on_scan_event
+
+    for scan_event in ("watch_folder_scan_progress", "watch_folder_scan_completed"):
+        event_service.subscribe(scan_event, _forward_scan_event(scan_event))
+
     # Initialize Ideas-related services
     # logger.info("Starting trending service...")  # DISABLED
     # await trending_service.initialize()  # DISABLED
@@ -571,6 +606,26 @@ async def lifespan(app: FastAPI):
             )
         )
 
+    # File service background tasks
+    if hasattr(app.state, 'file_service') and app.state.file_service:
+        shutdown_tasks.append(
+            shutdown_with_timeout(
+                app.state.file_service.shutdown(),
+                "File service",
+                timeout=TimeoutConstants.SERVICE_SHUTDOWN_TIMEOUT_SECONDS
+            )
+        )
+
+    # Library metadata extraction workers (interrupted jobs resume on next start)
+    if hasattr(app.state, 'library_service') and app.state.library_service:
+        shutdown_tasks.append(
+            shutdown_with_timeout(
+                app.state.library_service.shutdown(),
+                "Library service",
+                timeout=TimeoutConstants.SERVICE_SHUTDOWN_TIMEOUT_SECONDS
+            )
+        )
+
     # Camera snapshot service
     if hasattr(app.state, 'camera_snapshot_service') and app.state.camera_snapshot_service:
         shutdown_tasks.append(
@@ -581,6 +636,16 @@ async def lifespan(app: FastAPI):
             )
         )
 
+    # Status history (writes the open hour of samples)
+    if hasattr(app.state, 'status_history_service') and app.state.status_history_service:
+        shutdown_tasks.append(
+            shutdown_with_timeout(
+                app.state.status_history_service.shutdown(),
+                "Status history service",
+                timeout=TimeoutConstants.SERVICE_SHUTDOWN_TIMEOUT_SECONDS
+            )
+        )
+
     # Slicing queue
     if hasattr(app.state, 'slicing_queue') and app.state.slicing_queue:
         shutdown_tasks.append(
@@ -601,6 +666,15 @@ async def lifespan(app: FastAPI):
             )
         )
 
+    # Preview render worker processes
+    shutdown_tasks.append(
+        shutdown_with_timeout(
+            shutdown_render_pool(),
+            "Preview render pool",
+            timeout=TimeoutConstants.SERVICE_SHUTDOWN_TIMEOUT_SECONDS
+        )
+    )
+
     # Execute all service shutdowns in parallel
     if shutdown_tasks:
         await asyncio.gather(*shutdown_tasks, return_exceptions=True)
@@ -3,7 +3,7 @@ Timelapse models for Printernizer.
 Pydantic models for timelapse video data validation and serialization.
 """
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field, computed_field
 from pathlib import Path
@@ -115,6 +115,10 @@ class TimelapseStats(BaseModel):
     completed_count: int = Field(0, description="Number of completed timelapses")
     failed_count: int = Field(0, description="Number of failed timelapses")
     cleanup_candidates_count: int = Field(0, description="Number of videos recommended for cleanup")
+    render_pool: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Render queue depth, running renders with progress, and encode throughput"
+    )
 
     @computed_field
     @property
@@ -159,6 +159,8 @@ class BambuLabPrinter(BasePrinter):
             payload = json.loads(msg.payload.decode())
             self.latest_data = payload
             logger.debug("Received MQTT data", printer_id=self.printer_id, topic=msg.topic)
+            # Runs on the paho network thread - hand off to the event loop
+            self.request_status_push()
         except Exception as e:
             logger.warning("Failed to parse MQTT message", printer_id=self.printer_id, error=str(e))
 
@@ -522,6 +524,7 @@ class BambuLabPrinter(BasePrinter):
         """Handle status updates from bambulabs_api."""
         self.latest_status = status
         logger.debug("Received status update from bambulabs_api", printer_id=self.printer_id)
+        self.request_status_push()
 
     async def _on_bambu_file_list_update(self, file_list_data: Dict[str, Any]):
         """Handle file list updates from bambulabs_api."""
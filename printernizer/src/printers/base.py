@@ -220,6 +220,12 @@ class BasePrinter(PrinterInterface):
         self._monitor_last_error: Optional[str] = None
         self._monitor_last_error_at: Optional[datetime] = None
         self._monitor_last_success_at: Optional[datetime] = None
+        # Push path: drivers with their own real-time channel (MQTT, SockJS)
+        # request an out-of-band status publish instead of waiting for the poll.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._push_task: Optional[asyncio.Task] = None
+        self._last_push_at: float = 0.0
+        self._push_min_interval = MonitoringConstants.STATUS_PUSH_MIN_INTERVAL_SECONDS
         
     async def start_monitoring(self, interval: int = 30) -> None:
         """Start periodic status monitoring."""
@@ -236,6 +242,7 @@ class BasePrinter(PrinterInterface):
         self._monitor_last_error = None
         self._monitor_last_error_at = None
         self._monitor_last_success_at = None
+        self._loop = asyncio.get_running_loop()
         self._monitoring_task = asyncio.create_task(self._monitor_loop(self._monitor_interval))
         
     async def stop_monitoring(self) -> None:
@@ -255,6 +262,10 @@ class BasePrinter(PrinterInterface):
             pass
             
         self._monitoring_task = None
+
+        if self._push_task and not self._push_task.done():
+            self._push_task.cancel()
+        self._push_task = None
         
     async def _monitor_loop(self, interval: int) -> None:
         """Internal monitoring loop with exponential backoff on failures."""
@@ -271,14 +282,7 @@ class BasePrinter(PrinterInterface):
                     logger.info("monitoring.backoff.reset", printer_id=self.printer_id)
                 self._monitor_current_interval = self._monitor_interval
                 
-                for callback in self.status_callbacks:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(status)
-                        else:
-                            callback(status)
-                    except Exception as e:
-                        logger.error("Error in status callback", printer_id=self.printer_id, error=str(e))
+                await self._notify_status_callbacks(status)
             except Exception as e:
                 self._monitor_total_failures += 1
                 self._monitor_consecutive_failures += 1
@@ -297,6 +301,66 @@ class BasePrinter(PrinterInterface):
             except asyncio.TimeoutError:
                 continue
                 
+    async def _notify_status_callbacks(self, status: PrinterStatusUpdate) -> None:
+        """Deliver a status update to all registered callbacks."""
+        for callback in self.status_callbacks:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(status)
+                else:
+                    callback(status)
+            except Exception as e:
+                logger.error("Error in status callback", printer_id=self.printer_id, error=str(e))
+
+    def request_status_push(self) -> None:
+        """Request an immediate status publish from a driver push channel.
+
+        Safe to call from any thread (e.g. the paho-mqtt network thread).
+        Requests are coalesced: at most one push is in flight per printer
+        and pushes are rate limited to ``STATUS_PUSH_MIN_INTERVAL_SECONDS``,
+        so chatty channels (Bambu MQTT reports every second) don't flood
+        the status callbacks.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed() or not self.status_callbacks:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._schedule_status_push()
+        else:
+            loop.call_soon_threadsafe(self._schedule_status_push)
+
+    def _schedule_status_push(self) -> None:
+        """Start the push task unless one is already pending (event loop only)."""
+        if self._push_task is not None and not self._push_task.done():
+            return
+        delay = max(0.0, self._last_push_at + self._push_min_interval - time.monotonic())
+        self._push_task = asyncio.create_task(self._push_status(delay))
+
+    async def _push_status(self, delay: float) -> None:
+        """Publish current status after the rate-limit delay has elapsed."""
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            if not self.is_connected:
+                return
+            self._last_push_at = time.monotonic()
+            await self.refresh_status()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("Status push failed", printer_id=self.printer_id, error=str(e))
+
+    async def refresh_status(self) -> PrinterStatusUpdate:
+        """Read current status and publish it to the status callbacks."""
+        status = await self.get_status()
+        self.last_status = status
+        await self._notify_status_callbacks(status)
+        return status
+
     def add_status_callback(self, callback: Callable[[PrinterStatusUpdate], None]) -> None:
         """Add a status update callback."""
         self.status_callbacks.append(callback)
@@ -216,8 +216,10 @@ class OctoPrintPrinter(BasePrinter):
     async def _on_sockjs_status_update(self, current: Dict[str, Any]) -> None:
         """Handle status update from SockJS."""
         # This is called by the SockJS client when it receives a 'current' message
-        # The data is cached in the SockJS client, we can use it in get_status()
+        # The data is cached in the SockJS client, so get_status() in the push
+        # task reads it without another HTTP round trip
         logger.debug("SockJS status update received", printer_id=self.printer_id)
+        self.request_status_push()
 
     async def _on_sockjs_event(self, event_type: str, payload: Dict[str, Any]) -> None:
         """Handle event from SockJS."""
@@ -91,9 +91,11 @@ Cost Estimation:
     material costs and electricity rates.
 
 Performance Considerations:
-    - Dashboard stats: Loads all jobs into memory (consider caching)
-    - Printer usage: Filtered by date range for efficiency
-    - Material consumption: Only processes completed jobs
+    - Dashboard stats, printer usage, material consumption and summary read
+      the job_daily_rollups table (one row per day/printer/business flag),
+      which JobService keeps up to date on every job write
+    - Rollups can be recomputed with AnalyticsService.rebuild_rollups() or
+      POST /api/v1/analytics/rollups/rebuild after backfills
     - Export operations: Streams data for large datasets
 
 Error Handling:
@@ -114,7 +116,7 @@ from pathlib import Path
 import csv
 import structlog
 from src.database.database import Database
-from src.database.repositories import PrinterRepository, JobRepository, FileRepository
+from src.database.repositories import PrinterRepository, JobRepository, FileRepository, JobRollupRepository
 
 logger = structlog.get_logger()
 
@@ -171,9 +173,23 @@ class AnalyticsService:
         """
         self.database = database
         # Use provided repositories or create new ones from database connection
-        self.printer_repo = printer_repository or PrinterRepository(database._connection)
-        self.job_repo = job_repository or JobRepository(database._connection)
-        self.file_repo = file_repository or FileRepository(database._connection)
+        self.printer_repo = printer_repository or PrinterRepository.from_database(database)
+        self.job_repo = job_repository or JobRepository.from_database(database)
+        self.file_repo = file_repository or FileRepository.from_database(database)
+        self.rollup_repo = JobRollupRepository.from_database(database)
+
+    @staticmethod
+    def _day(value) -> str:
+        """Format a date/datetime as a rollup bucket day (YYYY-MM-DD)."""
+        return value.strftime('%Y-%m-%d')
+
+    async def _get_rollup_totals(self, start_date=None, end_date=None) -> Dict[str, Any]:
+        """Sum the job rollups for an optional date range."""
+        rows = await self.rollup_repo.get_totals(
+            start_day=self._day(start_date) if start_date else None,
+            end_day=self._day(end_date) if end_date else None
+        )
+        return rows[0] if rows else {}
         
     async def get_dashboard_stats(self) -> Dict[str, Any]:
         """
@@ -199,8 +215,8 @@ class AnalyticsService:
             On error, returns all values as 0 to prevent frontend crashes.
 
         Performance:
-            Loads all jobs into memory. For large datasets (>10,000 jobs),
-            consider implementing caching or pagination.
+            Reads the job_daily_rollups aggregates, so the cost does not grow
+            with the number of jobs.
 
         Example:
             ```python
@@ -219,24 +235,23 @@ class AnalyticsService:
             - get_material_consumption(): For detailed material breakdown
         """
         try:
-            # Get all jobs
-            all_jobs = await self.job_repo.list()
+            # All-time job totals from the rollups
+            totals = await self._get_rollup_totals()
 
             # Count jobs by type
-            total_jobs = len(all_jobs)
-            business_jobs = len([j for j in all_jobs if j.get('is_business', False)])
+            total_jobs = totals.get('total_jobs', 0)
+            business_jobs = totals.get('business_jobs', 0)
             private_jobs = total_jobs - business_jobs
 
             # Get active printers
             printers = await self.printer_repo.list()
             active_printers = len([p for p in printers if p.get('status') in ('online', 'printing', 'paused')])
 
-            # Calculate total runtime from completed jobs
-            completed_jobs = [j for j in all_jobs if j.get('status') == 'completed']
-            total_runtime_minutes = sum(j.get('elapsed_time_minutes', 0) for j in completed_jobs)
+            # Total runtime of completed jobs (actual_duration is in seconds)
+            total_runtime_minutes = int(totals.get('completed_runtime_seconds', 0)) // 60
 
-            # Calculate material used from completed jobs (in grams)
-            material_used_grams = sum(j.get('material_used_grams', 0.0) for j in completed_jobs)
+            # Material used by completed jobs (in grams)
+            material_used_grams = totals.get('completed_material_grams', 0.0)
 
             # Estimate costs (material + power)
             # Material cost: ~€0.025 per gram average for PLA/PETG
@@ -274,6 +289,18 @@ class AnalyticsService:
                 "private_jobs": 0
             }
         
+    async def rebuild_rollups(self) -> Dict[str, Any]:
+        """
+        Recompute the job_daily_rollups aggregates from the jobs table.
+
+        Use after backfilling or editing jobs outside JobService.
+
+        Returns:
+            Dictionary with the number of rollup buckets written
+        """
+        buckets = await self.rollup_repo.rebuild()
+        return {"buckets": buckets}
+
     async def get_printer_usage(self, days: int = 30) -> List[Dict[str, Any]]:
         """Get printer usage statistics for the last N days."""
         try:
@@ -284,29 +311,28 @@ class AnalyticsService:
             # Get all printers
             printers = await self.printer_repo.list()
 
-            # Get jobs within the time period
-            jobs = await self.job_repo.get_by_date_range(
-                start_date.isoformat(),
-                end_date.isoformat()
+            # Per-printer rollup totals within the time period
+            rows = await self.rollup_repo.get_totals(
+                start_day=self._day(start_date),
+                end_day=self._day(end_date),
+                group_by_printer=True
             )
+            totals_by_printer = {row['printer_id']: row for row in rows}
 
             # Calculate usage per printer
             usage_stats = []
             for printer in printers:
                 printer_id = printer.get('id')
                 printer_name = printer.get('name', 'Unknown')
-
-                # Filter jobs for this printer
-                printer_jobs = [j for j in jobs if j.get('printer_id') == printer_id]
-                completed_jobs = [j for j in printer_jobs if j.get('status') == 'completed']
+                totals = totals_by_printer.get(printer_id, {})
 
                 # Calculate statistics
-                total_jobs = len(printer_jobs)
-                completed_count = len(completed_jobs)
-                failed_count = len([j for j in printer_jobs if j.get('status') in ('failed', 'cancelled')])
+                total_jobs = totals.get('total_jobs', 0)
+                completed_count = totals.get('completed_jobs', 0)
+                failed_count = totals.get('failed_jobs', 0) + totals.get('cancelled_jobs', 0)
 
-                total_runtime_minutes = sum(j.get('elapsed_time_minutes', 0) for j in completed_jobs)
-                total_material_grams = sum(j.get('material_used_grams', 0.0) for j in completed_jobs)
+                total_runtime_minutes = totals.get('completed_runtime_seconds', 0) / 60
+                total_material_grams = totals.get('completed_material_grams', 0.0)
 
                 # Calculate utilization (assuming 24/7 availability)
                 available_minutes = days * 24 * 60
@@ -399,32 +425,23 @@ class AnalyticsService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
 
-            # Get jobs within the time period
-            jobs = await self.job_repo.get_by_date_range(
-                start_date.isoformat(),
-                end_date.isoformat()
-            )
-
-            # Only consider completed jobs for accurate material tracking
-            completed_jobs = [j for j in jobs if j.get('status') == 'completed']
+            # Rollup totals within the time period; only completed jobs
+            # count for accurate material tracking
+            totals = await self._get_rollup_totals(start_date, end_date)
+            completed_count = totals.get('completed_jobs', 0)
 
             # Calculate total consumption
-            total_consumption_grams = sum(j.get('material_used_grams', 0.0) for j in completed_jobs)
+            total_consumption_grams = totals.get('completed_material_grams', 0.0)
 
             # Group by material type
-            # Note: Most jobs don't track material type yet, so we'll use a default
+            # Note: Jobs don't track material type yet, so everything is
+            # attributed to the default material
             material_breakdown = {}
             cost_breakdown = {}
 
-            for job in completed_jobs:
-                material_type = job.get('material_type', 'PLA')  # Default to PLA
-                material_used = job.get('material_used_grams', 0.0)
-
-                if material_type not in material_breakdown:
-                    material_breakdown[material_type] = 0.0
-                    cost_breakdown[material_type] = 0.0
-
-                material_breakdown[material_type] += material_used
+            if completed_count:
+                material_type = 'PLA'  # Default to PLA
+                material_breakdown[material_type] = total_consumption_grams
 
                 # Estimate costs per material type (€/kg)
                 material_costs_per_kg = {
@@ -437,7 +454,7 @@ class AnalyticsService:
                 }
 
                 cost_per_gram = material_costs_per_kg.get(material_type, 25.0) / 1000
-                cost_breakdown[material_type] += material_used * cost_per_gram
+                cost_breakdown[material_type] = total_consumption_grams * cost_per_gram
 
             # Convert to kg and round
             material_breakdown_kg = {
@@ -460,7 +477,7 @@ class AnalyticsService:
                 "cost_breakdown": cost_breakdown_eur,
                 "total_cost": round(total_cost_eur, 2),
                 "period_days": days,
-                "job_count": len(completed_jobs)
+                "job_count": completed_count
             }
 
         except Exception as e:
@@ -685,19 +702,17 @@ class AnalyticsService:
             if not start_date:
                 start_date = end_date - timedelta(days=30)
             
-            # Get jobs within the period
-            jobs = await self.job_repo.get_by_date_range(
-                start_date.isoformat(), end_date.isoformat()
-            )
-            
+            # Rollup totals within the period
+            totals = await self._get_rollup_totals(start_date, end_date)
+
             # Calculate statistics
-            total_jobs = len(jobs)
-            completed_jobs = len([j for j in jobs if j.get('status') == 'completed'])
-            failed_jobs = len([j for j in jobs if j.get('status') == 'failed'])
-            
-            total_print_time_hours = sum(j.get('elapsed_time_minutes', 0) for j in jobs) / 60.0
-            total_material_used_kg = sum(j.get('material_used_grams', 0.0) for j in jobs) / 1000.0
-            total_cost_eur = sum(j.get('cost_eur', 0.0) for j in jobs)
+            total_jobs = totals.get('total_jobs', 0)
+            completed_jobs = totals.get('completed_jobs', 0)
+            failed_jobs = totals.get('failed_jobs', 0)
+
+            total_print_time_hours = totals.get('total_runtime_seconds', 0) / 3600.0
+            total_material_used_kg = totals.get('total_material_grams', 0.0) / 1000.0
+            total_cost_eur = totals.get('total_cost_eur', 0.0)
             
             average_job_duration_hours = total_print_time_hours / total_jobs if total_jobs > 0 else 0.0
             success_rate_percent = (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0.0
@@ -2,16 +2,21 @@
 Bambu G-code and 3MF file parser for extracting thumbnails and metadata.
 Supports parsing Bambu Lab slicer generated files for thumbnails and print information.
 """
+import os
 import re
+import asyncio
 import base64
 import binascii
-import zipfile
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator
 from pathlib import Path
 from io import BytesIO
 import structlog
 
+from src.constants import GCodeConstants
+from src.services.mesh_cache import get_mesh_cache
+from src.services.threemf_reader import ThreeMFPackage, read_3mf
+
 logger = structlog.get_logger()
 
 
@@ -79,17 +84,22 @@ class BambuParser:
         'total_filament_weight': re.compile(r'; total filament weight \[g\] : ([\d.,]+)', re.IGNORECASE),
         'total_filament_length': re.compile(r'; total filament used \[mm\] : ([\d.,]+)', re.IGNORECASE),
     }
+
+    # All comment-line patterns, matched line by line while streaming G-code
+    _GCODE_LINE_PATTERNS = {**METADATA_PATTERNS, **FILAMENT_PATTERNS, **ADVANCED_METADATA_PATTERNS}
     
     def __init__(self):
         """Initialize the Bambu parser."""
         pass
     
-    async def parse_file(self, file_path: str) -> Dict[str, Any]:
+    async def parse_file(self, file_path: str, checksum: Optional[str] = None) -> Dict[str, Any]:
         """
         Parse a Bambu G-code or 3MF file and extract thumbnails and metadata.
 
         Args:
             file_path: Path to the file to parse
+            checksum: Library checksum; 3MF meshes are stored in the shared
+                mesh cache under it
 
         Returns:
             Dictionary containing parsed data with keys:
@@ -113,7 +123,7 @@ class BambuParser:
 
             # Determine file type and parse accordingly
             if file_path.suffix.lower() == '.3mf':
-                return await self._parse_3mf_file(file_path)
+                return await self._parse_3mf_file(file_path, checksum)
             elif file_path.suffix.lower() in ['.gcode', '.g']:
                 return await self._parse_gcode_file(file_path)
             elif file_path.suffix.lower() == '.bgcode':
@@ -140,17 +150,20 @@ class BambuParser:
             }
     
     async def _parse_gcode_file(self, file_path: Path) -> Dict[str, Any]:
-        """Parse G-code file for thumbnails and metadata."""
+        """
+        Parse G-code file for thumbnails and metadata.
+
+        Streams the header and footer comment regions in a single pass instead
+        of loading the file, so memory stays bounded for multi-hundred MB
+        G-code.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Extract thumbnails
-            thumbnails = self._extract_gcode_thumbnails(content)
-            
-            # Extract metadata
-            metadata = self._extract_gcode_metadata(content)
-            
+            thumbnails, raw_values = self._scan_gcode_comments(
+                self._iter_gcode_comment_lines(file_path)
+            )
+
+            metadata = self._build_gcode_metadata(raw_values)
+
             logger.info("Successfully parsed G-code file",
                        file_path=str(file_path),
                        thumbnail_count=len(thumbnails),
@@ -174,62 +187,51 @@ class BambuParser:
                 'needs_generation': False
             }
     
-    async def _parse_3mf_file(self, file_path: Path) -> Dict[str, Any]:
-        """Parse 3MF file for thumbnails and metadata."""
+    async def _parse_3mf_file(self, file_path: Path, checksum: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse 3MF file for thumbnails and metadata.
+
+        The archive is read once by the shared 3MF reader (in a thread); its
+        mesh goes to the mesh cache so preview rendering does not parse the
+        file again.
+        """
         try:
             thumbnails = []
             metadata = {}
-            
-            with zipfile.ZipFile(file_path, 'r') as zip_file:
-                # Look for thumbnail images in 3MF package
-                thumbnail_files = [f for f in zip_file.namelist() 
-                                 if f.startswith('Metadata/') and f.endswith('.png')]
-                
-                # Extract thumbnails
-                for thumb_file in thumbnail_files:
-                    try:
-                        with zip_file.open(thumb_file) as thumb:
-                            thumb_data = thumb.read()
-                            thumb_base64 = base64.b64encode(thumb_data).decode('utf-8')
-                            
-                            # Try to get dimensions from filename or default
-                            width, height = self._parse_thumbnail_dimensions(thumb_file)
-                            
-                            thumbnails.append({
-                                'data': thumb_base64,
-                                'width': width,
-                                'height': height,
-                                'format': 'png',
-                                'source_file': thumb_file
-                            })
-                            
-                    except Exception as e:
-                        logger.warning("Failed to extract thumbnail from 3MF", 
-                                     file=thumb_file, error=str(e))
-                        continue
-                
-                # Parse 3MF model file for metadata
+
+            package = await asyncio.to_thread(self._read_3mf_package, file_path, checksum)
+
+            # Thumbnail images in the 3MF package
+            for thumb_file, thumb_data in package.thumbnails:
+                thumb_base64 = base64.b64encode(thumb_data).decode('utf-8')
+
+                # Try to get dimensions from filename or default
+                width, height = self._parse_thumbnail_dimensions(thumb_file)
+
+                thumbnails.append({
+                    'data': thumb_base64,
+                    'width': width,
+                    'height': height,
+                    'format': 'png',
+                    'source_file': thumb_file
+                })
+
+            # Model metadata and dimensions from the mesh bounding box
+            if package.model_parsed:
+                metadata.update(self._convert_3mf_metadata(package.model_metadata))
+            bounds = package.bounds()
+            if bounds:
+                metadata.update(self._dimensions_from_bounds(*bounds, vertex_count=package.vertex_count))
+
+            # Other metadata files
+            for meta_file, meta_content in package.metadata_xml.items():
                 try:
-                    with zip_file.open('3D/3dmodel.model') as model_file:
-                        model_content = model_file.read().decode('utf-8')
-                        metadata.update(self._extract_3mf_metadata(model_content))
+                    metadata.update(self._extract_3mf_metadata(meta_content))
                 except Exception as e:
-                    logger.warning("Could not parse 3MF model metadata", error=str(e))
-                
-                # Look for other metadata files
-                metadata_files = [f for f in zip_file.namelist() 
-                                if f.startswith('Metadata/') and f.endswith('.xml')]
-                
-                for meta_file in metadata_files:
-                    try:
-                        with zip_file.open(meta_file) as meta:
-                            meta_content = meta.read().decode('utf-8')
-                            metadata.update(self._extract_3mf_metadata(meta_content))
-                    except Exception as e:
-                        logger.warning("Failed to parse 3MF metadata file", 
-                                     file=meta_file, error=str(e))
-                        continue
-            
+                    logger.warning("Failed to parse 3MF metadata file",
+                                 file=meta_file, error=str(e))
+                    continue
+
             logger.info("Successfully parsed 3MF file",
                        file_path=str(file_path),
                        thumbnail_count=len(thumbnails),
@@ -253,74 +255,150 @@ class BambuParser:
                 'needs_generation': False
             }
     
-    def _extract_gcode_thumbnails(self, content: str) -> List[Dict[str, Any]]:
-        """Extract thumbnails from G-code comments."""
+    def _iter_gcode_comment_lines(self, file_path: Path) -> Iterator[str]:
+        """
+        Yield the comment lines of a G-code file's header and footer regions.
+
+        Slicers write thumbnails and settings as comment blocks at the start
+        and/or end of the file, with the toolpath in between. The header is
+        read up to ``GCodeConstants.HEADER_SCAN_BYTES`` (extended until an open
+        thumbnail block is closed), then the reader jumps to the last
+        ``GCodeConstants.FOOTER_SCAN_BYTES``. Files smaller than both regions
+        are read once from start to end; no byte is read twice.
+        """
+        header_limit = GCodeConstants.HEADER_SCAN_BYTES
+        footer_size = GCodeConstants.FOOTER_SCAN_BYTES
+
+        with open(file_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            position = 0
+            in_thumbnail = False
+
+            for line in f:
+                position += len(line)
+                stripped = line.lstrip()
+                if stripped.startswith(b';'):
+                    text = stripped.decode('utf-8', errors='ignore')
+                    # Thumbnail blocks must be read to the end even past the limit
+                    if self.THUMBNAIL_PATTERN.search(text):
+                        in_thumbnail = True
+                    elif in_thumbnail and self.THUMBNAIL_END_PATTERN.search(text):
+                        in_thumbnail = False
+                    yield text
+                if position >= header_limit and not in_thumbnail:
+                    break
+
+            footer_start = file_size - footer_size
+            if footer_start > position:
+                f.seek(footer_start)
+                f.readline()  # Skip the partial line at the seek position
+
+            for line in f:
+                stripped = line.lstrip()
+                if stripped.startswith(b';'):
+                    yield stripped.decode('utf-8', errors='ignore')
+
+    def _scan_gcode_comments(
+        self, lines: Iterable[str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """
+        Collect thumbnails and raw metadata values from G-code comment lines.
+
+        Args:
+            lines: Comment lines in file order
+
+        Returns:
+            Tuple of (thumbnails, raw metadata values keyed by pattern name).
+            The first match of each pattern wins.
+        """
         thumbnails = []
-        
-        # Find all thumbnail sections
-        thumbnail_matches = list(self.THUMBNAIL_PATTERN.finditer(content))
-        thumbnail_end_matches = list(self.THUMBNAIL_END_PATTERN.finditer(content))
-        
-        if len(thumbnail_matches) != len(thumbnail_end_matches):
-            logger.warning("Mismatched thumbnail begin/end markers", 
-                          begin_count=len(thumbnail_matches),
-                          end_count=len(thumbnail_end_matches))
-            return thumbnails
-        
-        for i, begin_match in enumerate(thumbnail_matches):
-            try:
-                width = int(begin_match.group(1))
-                height = int(begin_match.group(2))
-                data_size = int(begin_match.group(3))
-                
-                if i < len(thumbnail_end_matches):
-                    end_match = thumbnail_end_matches[i]
-                    
-                    # Extract the base64 data between begin and end
-                    start_pos = begin_match.end()
-                    end_pos = end_match.start()
-                    thumbnail_section = content[start_pos:end_pos]
-                    
-                    # Clean up the data - remove comment markers and whitespace
-                    thumbnail_data = ''
-                    for line in thumbnail_section.split('\n'):
-                        line = line.strip()
-                        if line.startswith(';') and len(line) > 2:
-                            # Remove comment marker and spaces
-                            clean_line = line[1:].strip()
-                            thumbnail_data += clean_line
-                    
-                    # Validate base64 data
-                    if thumbnail_data and self._is_valid_base64(thumbnail_data):
-                        thumbnails.append({
-                            'data': thumbnail_data,
-                            'width': width,
-                            'height': height,
-                            'format': 'png',
-                            'data_size': data_size,
-                            'source': 'gcode_comment'
-                        })
-                        
-                        logger.debug("Extracted thumbnail from G-code", 
-                                   width=width, height=height, data_size=data_size)
-                    else:
-                        logger.warning("Invalid base64 thumbnail data found")
-                        
-            except (ValueError, IndexError) as e:
-                logger.warning("Failed to parse thumbnail", error=str(e))
+        raw_values: Dict[str, str] = {}
+        pending = dict(self._GCODE_LINE_PATTERNS)
+
+        begin_count = 0
+        end_count = 0
+        current: Optional[Dict[str, Any]] = None
+        chunks: List[str] = []
+
+        for line in lines:
+            line = line.strip()
+
+            begin_match = self.THUMBNAIL_PATTERN.search(line)
+            if begin_match:
+                begin_count += 1
+                current = {
+                    'width': begin_match.group(1),
+                    'height': begin_match.group(2),
+                    'data_size': begin_match.group(3),
+                }
+                chunks = []
                 continue
-        
-        return thumbnails
+
+            if self.THUMBNAIL_END_PATTERN.search(line):
+                end_count += 1
+                if current is not None:
+                    thumbnail = self._build_gcode_thumbnail(current, ''.join(chunks))
+                    if thumbnail:
+                        thumbnails.append(thumbnail)
+                current = None
+                chunks = []
+                continue
+
+            if current is not None:
+                if line.startswith(';') and len(line) > 2:
+                    # Remove comment marker and spaces
+                    chunks.append(line[1:].strip())
+                continue
+
+            if pending:
+                for key, pattern in list(pending.items()):
+                    match = pattern.search(line)
+                    if match:
+                        raw_values[key] = match.group(1).strip()
+                        del pending[key]
+
+        if begin_count != end_count:
+            logger.warning("Mismatched thumbnail begin/end markers",
+                          begin_count=begin_count,
+                          end_count=end_count)
+            thumbnails = []
+
+        return thumbnails, raw_values
+
+    def _build_gcode_thumbnail(self, header: Dict[str, Any], thumbnail_data: str) -> Optional[Dict[str, Any]]:
+        """Build a thumbnail entry from a G-code thumbnail block."""
+        try:
+            width = int(header['width'])
+            height = int(header['height'])
+            data_size = int(header['data_size'])
+        except (ValueError, KeyError) as e:
+            logger.warning("Failed to parse thumbnail", error=str(e))
+            return None
+
+        # Validate base64 data
+        if not thumbnail_data or not self._is_valid_base64(thumbnail_data):
+            logger.warning("Invalid base64 thumbnail data found")
+            return None
+
+        logger.debug("Extracted thumbnail from G-code",
+                   width=width, height=height, data_size=data_size)
+        return {
+            'data': thumbnail_data,
+            'width': width,
+            'height': height,
+            'format': 'png',
+            'data_size': data_size,
+            'source': 'gcode_comment'
+        }
     
-    def _extract_gcode_metadata(self, content: str) -> Dict[str, Any]:
-        """Extract metadata from G-code comments."""
+    def _build_gcode_metadata(self, raw_values: Dict[str, str]) -> Dict[str, Any]:
+        """Convert raw G-code comment values into typed metadata."""
         metadata = {}
         
         # Extract standard metadata
-        for key, pattern in self.METADATA_PATTERNS.items():
-            match = pattern.search(content)
-            if match:
-                value = match.group(1).strip()
+        for key in self.METADATA_PATTERNS:
+            if key in raw_values:
+                value = raw_values[key]
                 
                 # Convert to appropriate type
                 if key in ['layer_height', 'first_layer_height', 'infill_density', 'print_speed']:
@@ -341,10 +419,9 @@ class BambuParser:
                     metadata[key] = value
         
         # Extract filament information
-        for key, pattern in self.FILAMENT_PATTERNS.items():
-            match = pattern.search(content)
-            if match:
-                value = match.group(1).strip()
+        for key in self.FILAMENT_PATTERNS:
+            if key in raw_values:
+                value = raw_values[key]
                 
                 if key == 'filament_used':
                     # Parse comma-separated list of filament usage per extruder
@@ -366,25 +443,15 @@ class BambuParser:
                     metadata[key] = value
         
         # Extract advanced metadata patterns
-        metadata.update(self._extract_advanced_metadata(content))
+        for key in self.ADVANCED_METADATA_PATTERNS:
+            if key in raw_values:
+                metadata[key] = self._convert_metadata_value(key, raw_values[key])
         
         # Calculate derived metrics
         metadata.update(self._calculate_derived_metrics(metadata))
         
         return metadata
     
-    def _extract_advanced_metadata(self, content: str) -> Dict[str, Any]:
-        """Extract advanced metadata from G-code content."""
-        advanced_metadata = {}
-        
-        for key, pattern in self.ADVANCED_METADATA_PATTERNS.items():
-            match = pattern.search(content)
-            if match:
-                value = match.group(1).strip()
-                advanced_metadata[key] = self._convert_metadata_value(key, value)
-        
-        return advanced_metadata
-    
     def _convert_metadata_value(self, key: str, value: str) -> Any:
         """Convert string values to appropriate types based on key."""
         # Numeric fields (float)
@@ -580,24 +647,10 @@ class BambuParser:
             root = ET.fromstring(xml_content)
 
             # Look for metadata elements
-            for elem in root.iter():
-                if 'metadata' in elem.tag.lower():
-                    name = elem.get('name', '')
-                    value = elem.text or elem.get('value', '')
-
-                    if name and value:
-                        # Convert known numeric fields
-                        if name.lower() in ['layer_height', 'layer_count', 'print_time',
-                                          'nozzle_temperature', 'bed_temperature']:
-                            try:
-                                if '.' in value:
-                                    metadata[name.lower()] = float(value)
-                                else:
-                                    metadata[name.lower()] = int(value)
-                            except ValueError:
-                                metadata[name.lower()] = value
-                        else:
-                            metadata[name.lower()] = value
+            metadata.update(self._convert_3mf_metadata(
+                (elem.get('name', ''), elem.text or elem.get('value', ''))
+                for elem in root.iter() if 'metadata' in elem.tag.lower()
+            ))
 
             # Extract model dimensions from vertices (bounding box calculation)
             # 3MF files contain vertices in the <mesh> elements
@@ -613,21 +666,40 @@ class BambuParser:
 
         return metadata
 
-    def _extract_3mf_dimensions(self, root_element) -> Dict[str, Any]:
-        """Extract physical dimensions from 3MF model by calculating bounding box."""
-        dimensions = {}
+    def _convert_3mf_metadata(self, entries: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+        """Convert (name, value) 3MF metadata entries, typing known numeric fields."""
+        metadata = {}
+        for name, value in entries:
+            if not (name and value):
+                continue
+            # Convert known numeric fields
+            if name.lower() in ['layer_height', 'layer_count', 'print_time',
+                              'nozzle_temperature', 'bed_temperature']:
+                try:
+                    if '.' in value:
+                        metadata[name.lower()] = float(value)
+                    else:
+                        metadata[name.lower()] = int(value)
+                except ValueError:
+                    metadata[name.lower()] = value
+            else:
+                metadata[name.lower()] = value
+        return metadata
 
-        # Find all vertices in the model
-        # 3MF uses namespace, need to handle it
-        namespaces = {
-            '3mf': 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02',
-            'model': 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02'
-        }
+    def _read_3mf_package(self, file_path: Path, checksum: Optional[str]) -> ThreeMFPackage:
+        """Read a 3MF package and hand its mesh to the mesh cache (runs in a thread)."""
+        package = read_3mf(file_path)
+        if package.vertex_count:
+            try:
+                get_mesh_cache().put(file_path, package.vertices, package.triangles, checksum=checksum)
+            except Exception as e:
+                logger.debug("Could not cache 3MF mesh", file_path=str(file_path), error=str(e))
+        return package
 
-        # Try to find vertices without namespace first (some slicers don't use it)
+    def _extract_3mf_dimensions(self, root_element) -> Dict[str, Any]:
+        """Extract physical dimensions from 3MF model by calculating bounding box."""
+        # Search for <vertex> elements (with or without the 3MF namespace)
         vertices = []
-
-        # Search for <vertex> elements
         for vertex in root_element.findall('.//*'):
             if vertex.tag.endswith('vertex'):
                 try:
@@ -638,39 +710,44 @@ class BambuParser:
                 except (ValueError, TypeError):
                     continue
 
-        # Calculate bounding box if we found vertices
-        if vertices:
-            min_x = min(v[0] for v in vertices)
-            max_x = max(v[0] for v in vertices)
-            min_y = min(v[1] for v in vertices)
-            max_y = max(v[1] for v in vertices)
-            min_z = min(v[2] for v in vertices)
-            max_z = max(v[2] for v in vertices)
-
-            # Calculate dimensions in mm
-            dimensions['model_width'] = round(max_x - min_x, 2)
-            dimensions['model_depth'] = round(max_y - min_y, 2)
-            dimensions['model_height'] = round(max_z - min_z, 2)
-
-            # Calculate volume (simple bounding box volume, not actual mesh volume)
-            volume_mm3 = (max_x - min_x) * (max_y - min_y) * (max_z - min_z)
-            dimensions['model_volume'] = round(volume_mm3 / 1000, 2)  # Convert to cm³
-
-            # Calculate approximate surface area (bounding box surface area)
-            width = max_x - min_x
-            depth = max_y - min_y
-            height = max_z - min_z
-            surface_area_mm2 = 2 * (width * depth + width * height + depth * height)
-            dimensions['surface_area'] = round(surface_area_mm2 / 100, 2)  # Convert to cm²
-
-            logger.debug("Extracted 3MF dimensions",
-                        width=dimensions['model_width'],
-                        depth=dimensions['model_depth'],
-                        height=dimensions['model_height'],
-                        vertices=len(vertices))
+        if not vertices:
+            return {}
+
+        lower = tuple(min(v[axis] for v in vertices) for axis in range(3))
+        upper = tuple(max(v[axis] for v in vertices) for axis in range(3))
+        return self._dimensions_from_bounds(lower, upper, vertex_count=len(vertices))
+
+    def _dimensions_from_bounds(self, lower: Tuple[float, float, float], upper: Tuple[float, float, float],
+                                vertex_count: int) -> Dict[str, Any]:
+        """Model dimensions from the bounding box of its vertices."""
+        dimensions = {}
+        min_x, min_y, min_z = lower
+        max_x, max_y, max_z = upper
+
+        # Calculate dimensions in mm
+        dimensions['model_width'] = round(max_x - min_x, 2)
+        dimensions['model_depth'] = round(max_y - min_y, 2)
+        dimensions['model_height'] = round(max_z - min_z, 2)
+
+        # Calculate volume (simple bounding box volume, not actual mesh volume)
+        volume_mm3 = (max_x - min_x) * (max_y - min_y) * (max_z - min_z)
+        dimensions['model_volume'] = round(volume_mm3 / 1000, 2)  # Convert to cm³
+
+        # Calculate approximate surface area (bounding box surface area)
+        width = max_x - min_x
+        depth = max_y - min_y
+        height = max_z - min_z
+        surface_area_mm2 = 2 * (width * depth + width * height + depth * height)
+        dimensions['surface_area'] = round(surface_area_mm2 / 100, 2)  # Convert to cm²
+
+        logger.debug("Extracted 3MF dimensions",
+                    width=dimensions['model_width'],
+                    depth=dimensions['model_depth'],
+                    height=dimensions['model_height'],
+                    vertices=vertex_count)
 
         return dimensions
-    
+
     async def _parse_bgcode_file(self, file_path: Path) -> Dict[str, Any]:
         """Parse Binary G-code file for thumbnails and metadata.
         
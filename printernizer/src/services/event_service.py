@@ -8,6 +8,8 @@ from datetime import datetime
 import structlog
 
 from src.config.constants import PollingIntervals
+from src.constants import MonitoringConstants
+from src.services.printer_status_bus import PrinterStatusBus
 
 logger = structlog.get_logger()
 
@@ -28,6 +30,10 @@ class EventService:
         self.database = database
         
         # Monitoring state
+        self.status_bus = PrinterStatusBus()
+        self._pending_printer_changes: Dict[str, Dict[str, Any]] = {}
+        self._pending_status_changes: List[Dict[str, Any]] = []
+        self.poll_timeouts = 0
         self.last_printer_status = {}
         self.last_job_status = {}
         self.last_file_discovery = datetime.now()
@@ -110,108 +116,148 @@ class EventService:
                 logger.error("Error in event handler", 
                            event_type=event_type, error=str(e))
                 
+    async def record_printer_status(self, printer_id: str, snapshot: Dict[str, Any],
+                                    name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Feed a printer status snapshot into the status bus.
+
+        Called for every status a printer driver pushes (and for fallback
+        poll results). Connection events are emitted and the database is
+        written only when something actually changed.
+
+        Args:
+            printer_id: Printer identifier
+            snapshot: Status snapshot dict (``printer_status_update`` shape)
+            name: Optional printer name for emitted events
+
+        Returns:
+            Dict of changed fields (empty if the status is unchanged)
+        """
+        previous = self.status_bus.get_snapshot(printer_id) or {}
+        changes = self.status_bus.publish(printer_id, snapshot)
+
+        if changes:
+            self.last_printer_status[printer_id] = self.status_bus.get_snapshot(printer_id)
+            self._pending_printer_changes[printer_id] = changes
+
+        if 'status' in changes:
+            old_status = previous.get('status', 'unknown')
+            new_status = changes['status'] or 'unknown'
+            self._pending_status_changes.append({
+                'printer_id': printer_id,
+                'old_status': old_status,
+                'new_status': new_status,
+                'timestamp': datetime.now().isoformat()
+            })
+
+            # Emit specific connection/disconnection events
+            if new_status == 'online' and old_status != 'online':
+                await self.emit_event('printer_connected', {
+                    'printer_id': printer_id,
+                    'name': name,
+                    'timestamp': datetime.now().isoformat()
+                })
+                self.event_counts['printer_connected'] += 1
+            elif new_status != 'online' and old_status == 'online':
+                await self.emit_event('printer_disconnected', {
+                    'printer_id': printer_id,
+                    'name': name,
+                    'timestamp': datetime.now().isoformat()
+                })
+                self.event_counts['printer_disconnected'] += 1
+
+        status_value = (snapshot.get('status') or 'unknown').lower()
+        if self.database and self.status_bus.should_persist(printer_id, status_value):
+            try:
+                await self.database.update_printer_status(printer_id, status_value, datetime.now())
+                self.status_bus.mark_persisted(printer_id, status_value)
+            except Exception as e:
+                logger.warning("Failed to persist printer status", printer_id=printer_id, error=str(e))
+
+        return changes
+
+    async def _poll_printer_status(self, printer_id: str, instance) -> None:
+        """Fallback poll for a single printer, bounded by a per-printer timeout."""
+        try:
+            # refresh_status() publishes through the driver's status callbacks,
+            # so the result lands in the status bus like any pushed update
+            await asyncio.wait_for(
+                instance.refresh_status(),
+                timeout=MonitoringConstants.STATUS_POLL_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            self.poll_timeouts += 1
+            logger.warning("Printer status poll timed out", printer_id=printer_id,
+                           timeout=MonitoringConstants.STATUS_POLL_TIMEOUT_SECONDS)
+            await self.record_printer_status(printer_id, {
+                'status': 'offline',
+                'message': 'Status poll timed out'
+            }, name=getattr(instance, 'name', None))
+        except Exception as e:
+            logger.warning("Failed to get printer status", printer_id=printer_id, error=str(e))
+            # Mark printer as offline if we can't connect
+            await self.record_printer_status(printer_id, {
+                'status': 'offline',
+                'message': str(e)
+            }, name=getattr(instance, 'name', None))
+
     async def _printer_monitoring_task(self):
-        """Background task for monitoring printer status."""
+        """Background task for printer status fallback polling.
+
+        Printer drivers push status through their callbacks into the status
+        bus. This task only polls printers that have not reported within two
+        polling intervals, concurrently and with a per-printer timeout, so one
+        slow printer cannot hold up the others.
+        """
         logger.info("Starting printer monitoring task")
         
         while self._running:
             try:
                 if not self.printer_service:
+                    self._pending_printer_changes.clear()
+                    self._pending_status_changes.clear()
                     await asyncio.sleep(PollingIntervals.PRINTER_STATUS_CHECK)
                     continue
                 
-                # Get current printer status from all printers
-                printer_statuses = []
-                status_changes = []
-                
                 try:
-                    # Get list of active printers
-                    printers = await self.printer_service.list_printers()
-                    
-                    for printer in printers:
-                        printer_id = printer['id']
-                        
-                        try:
-                            # Get current status from printer
-                            current_status = await self.printer_service.get_printer_status(printer_id)
-                            
-                            if current_status:
-                                printer_statuses.append({
-                                    'printer_id': printer_id,
-                                    'name': printer['name'],
-                                    'type': printer['type'],
-                                    'status': current_status.get('status', 'unknown'),
-                                    'temperature': current_status.get('temperature', {}),
-                                    'progress': current_status.get('progress', 0),
-                                    'current_job': current_status.get('current_job'),
-                                    'last_seen': datetime.now().isoformat()
-                                })
-                                
-                                # Check for status changes
-                                last_status = self.last_printer_status.get(printer_id, {})
-                                if last_status.get('status') != current_status.get('status'):
-                                    status_changes.append({
-                                        'printer_id': printer_id,
-                                        'old_status': last_status.get('status', 'unknown'),
-                                        'new_status': current_status.get('status', 'unknown'),
-                                        'timestamp': datetime.now().isoformat()
-                                    })
-                                    
-                                    # Emit specific connection/disconnection events
-                                    if current_status.get('status') == 'online' and last_status.get('status') != 'online':
-                                        await self.emit_event('printer_connected', {
-                                            'printer_id': printer_id,
-                                            'name': printer['name'],
-                                            'timestamp': datetime.now().isoformat()
-                                        })
-                                        self.event_counts['printer_connected'] += 1
-                                    elif current_status.get('status') != 'online' and last_status.get('status') == 'online':
-                                        await self.emit_event('printer_disconnected', {
-                                            'printer_id': printer_id,
-                                            'name': printer['name'],
-                                            'timestamp': datetime.now().isoformat()
-                                        })
-                                        self.event_counts['printer_disconnected'] += 1
-                                
-                                # Update last known status
-                                self.last_printer_status[printer_id] = current_status
-                                
-                                # Update database status if needed
-                                if self.database:
-                                    await self.database.update_printer_status(
-                                        printer_id, 
-                                        current_status.get('status', 'unknown'),
-                                        datetime.now()
-                                    )
-                            
-                        except Exception as e:
-                            logger.warning("Failed to get printer status", printer_id=printer_id, error=str(e))
-                            # Mark printer as offline if we can't connect
-                            printer_statuses.append({
-                                'printer_id': printer_id,
-                                'name': printer['name'],
-                                'type': printer['type'],
-                                'status': 'offline',
-                                'error': str(e),
-                                'last_seen': datetime.now().isoformat()
-                            })
-                    
-                    # Emit general printer status event
-                    await self.emit_event("printer_status", {
-                        "timestamp": datetime.now().isoformat(),
-                        "printers": printer_statuses,
-                        "status_changes": status_changes
-                    })
-                    self.event_counts['printer_status'] += 1
+                    instances = dict(self.printer_service.printer_instances)
+                    max_age = PollingIntervals.PRINTER_STATUS_CHECK * 2
+                    stale = {
+                        printer_id: instance
+                        for printer_id, instance in instances.items()
+                        if not self.status_bus.is_fresh(printer_id, max_age)
+                    }
+
+                    if stale:
+                        await asyncio.gather(*(
+                            self._poll_printer_status(printer_id, instance)
+                            for printer_id, instance in stale.items()
+                        ))
+
+                    # Emit aggregated changes collected since the last sweep
+                    if self._pending_printer_changes:
+                        printer_changes = self._pending_printer_changes
+                        status_changes = self._pending_status_changes
+                        self._pending_printer_changes = {}
+                        self._pending_status_changes = []
+                        await self.emit_event("printer_status", {
+                            "timestamp": datetime.now().isoformat(),
+                            "printers": [
+                                {'printer_id': printer_id, **changes}
+                                for printer_id, changes in printer_changes.items()
+                            ],
+                            "status_changes": status_changes
+                        })
+                        self.event_counts['printer_status'] += 1
                     
                     logger.debug("Printer monitoring complete", 
-                               printer_count=len(printer_statuses),
-                               status_changes=len(status_changes))
+                               printer_count=len(instances),
+                               polled=len(stale))
                     
                 except Exception as e:
                     logger.error("Error getting printer list", error=str(e))
 
-                await asyncio.sleep(PollingIntervals.PRINTER_STATUS_CHECK)  # 30-second polling interval
+                await asyncio.sleep(PollingIntervals.PRINTER_STATUS_CHECK)  # 30-second fallback sweep
                 
             except asyncio.CancelledError:
                 break
@@ -467,6 +513,7 @@ class EventService:
                 "last_file_discovery": self.last_file_discovery.isoformat() if self.last_file_discovery else None
             },
             "event_counts": self.event_counts.copy(),
+            "status_bus": {**self.status_bus.get_stats(), "poll_timeouts": self.poll_timeouts},
             "service_dependencies": {
                 "printer_service": self.printer_service is not None,
                 "job_service": self.job_service is not None,
@@ -546,6 +593,9 @@ class EventService:
         """Reset all monitoring state - useful for testing or after configuration changes."""
         logger.info("Resetting event service monitoring state")
         self.last_printer_status.clear()
+        self.status_bus.clear()
+        self._pending_printer_changes.clear()
+        self._pending_status_changes.clear()
         self.last_job_status.clear()
         self.last_file_discovery = datetime.now()
         
@@ -55,7 +55,7 @@ class FileDiscoveryService:
                            Can be None if using event-driven communication
         """
         self.database = database
-        self.file_repo = FileRepository(database._connection)
+        self.file_repo = FileRepository.from_database(database)
         self.event_service = event_service
         self.printer_service = printer_service
 
@@ -64,7 +64,7 @@ class FileDownloadService:
             usage_stats_service: Optional usage statistics service for telemetry
         """
         self.database = database
-        self.file_repo = FileRepository(database._connection)
+        self.file_repo = FileRepository.from_database(database)
         self.event_service = event_service
         self.printer_service = printer_service
         self.config_service = config_service
@@ -615,7 +615,7 @@ class FileDownloadService:
                 "status": self.download_status.get(file_id, "unknown"),
                 "bytes_downloaded": self.download_bytes.get(file_id, 0),
                 "total_bytes": self.download_total_bytes.get(file_id, 0)
-            })
+            }, coalesce_key=f"download_progress:{file_id}")
         except Exception as e:
             # Don't fail the download if broadcast fails
             logger.warning("Failed to broadcast download progress",
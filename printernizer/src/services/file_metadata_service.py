@@ -61,7 +61,7 @@ class FileMetadataService:
             event_service: Event service for emitting metadata events
         """
         self.database = database
-        self.file_repo = FileRepository(database._connection)
+        self.file_repo = FileRepository.from_database(database)
         self.event_service = event_service
         self.bambu_parser = BambuParser()
 
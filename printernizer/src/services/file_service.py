@@ -19,7 +19,8 @@ from pathlib import Path
 from datetime import datetime
 
 from src.database.database import Database
-from src.database.repositories.file_repository import FileRepository
+from src.database.pagination import CountCache, Page, decode_cursor, encode_cursor, query_signature, sort_key
+from src.database.repositories.file_repository import FILE_SORT_COLUMNS, FileRepository
 from src.services.event_service import EventService
 from src.services.file_watcher_service import FileWatcherService
 from src.services.file_discovery_service import FileDiscoveryService
@@ -29,6 +30,7 @@ from src.services.file_metadata_service import FileMetadataService
 from src.services.file_upload_service import FileUploadService
 from src.utils.errors import NotFoundError
 from src.utils.config import get_settings
+from src.constants import PaginationConstants
 
 logger = structlog.get_logger()
 
@@ -109,7 +111,8 @@ class FileService:
         self.thumbnail = FileThumbnailService(
             database=database,
             event_service=event_service,
-            printer_service=printer_service
+            printer_service=printer_service,
+            preview_render_service=library_service.preview_service if library_service else None
         )
 
         self.metadata = FileMetadataService(
@@ -132,6 +135,9 @@ class FileService:
         # Background task tracking for graceful shutdown
         self._background_tasks: set = set()
 
+        # Totals reused by cursor pages of the files listing
+        self._count_cache = CountCache(PaginationConstants.COUNT_CACHE_TTL_SECONDS)
+
         logger.info("FileService initialized with specialized sub-services",
                    discovery=True,
                    downloader=True,
@@ -154,6 +160,87 @@ class FileService:
     # These methods stay in FileService as they coordinate data from multiple sources
     # ========================================================================
 
+    async def _enrich_printer_files(self, printer_files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add source and printer name/type to printer file rows (in place)."""
+        # Get printer information for enriching file data
+        printer_info_map = {}
+        if self.printer_service:
+            try:
+                printers = await self.printer_service.list_printers()
+                printer_info_map = {p.id: p for p in printers}
+            except Exception as e:
+                logger.warning(
+                    "Could not fetch printer information for file enrichment",
+                    error=str(e)
+                )
+
+        # The rows are ours, so fill them in place (copying would decode
+        # every column)
+        for file_dict in printer_files:
+            file_dict['source'] = 'printer'
+
+            # Add printer name and type information
+            printer_id_val = file_dict.get('printer_id')
+            if printer_id_val and printer_id_val in printer_info_map:
+                printer_info = printer_info_map[printer_id_val]
+                printer_name = printer_info.name
+                printer_type = printer_info.type.value if hasattr(printer_info.type, 'value') else str(printer_info.type)
+
+                file_dict['printer_name'] = printer_name
+                file_dict['printer_type'] = printer_type
+                file_dict['source_display'] = f"{printer_name} ({printer_type})"
+            else:
+                file_dict['printer_name'] = 'Unknown'
+                file_dict['printer_type'] = 'unknown'
+                file_dict['source_display'] = 'Unknown Printer'
+
+        return printer_files
+
+    def _get_local_files(self) -> List[Dict[str, Any]]:
+        """Get local watch-folder files with source display information."""
+        if not self.file_watcher:
+            return []
+        try:
+            local_files = self.file_watcher.get_local_files()
+
+            # Enrich local files with source display information
+            for local_file in local_files:
+                if local_file.get('source') == 'local_watch':
+                    local_file['source_display'] = 'Local Watch Folder'
+                    local_file['printer_name'] = None
+                    local_file['printer_type'] = None
+
+            logger.debug("Retrieved local files", count=len(local_files))
+            return local_files
+        except Exception as e:
+            logger.error("Error retrieving local files", error=str(e))
+            return []
+
+    @staticmethod
+    def _filter_files(files: List[Dict[str, Any]], printer_id: Optional[str] = None,
+                      status: Optional[str] = None, source: Optional[str] = None,
+                      has_thumbnail: Optional[bool] = None,
+                      search: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Apply the listing filters to in-memory file dicts."""
+        if printer_id and printer_id != 'local':
+            files = [f for f in files if f.get('printer_id') == printer_id or f.get('source') == 'local_watch']
+
+        if status:
+            files = [f for f in files if f.get('status') == status]
+
+        if source:
+            files = [f for f in files if f.get('source') == source]
+
+        if has_thumbnail is not None:
+            files = [f for f in files if bool(f.get('has_thumbnail', False)) == has_thumbnail]
+
+        # Apply search filter (case-insensitive partial match on filename)
+        if search:
+            search_lower = search.lower()
+            files = [f for f in files if search_lower in f.get('filename', '').lower()]
+
+        return files
+
     async def get_files(
         self,
         printer_id: Optional[str] = None,
@@ -204,91 +291,27 @@ class FileService:
                 printer_id=printer_id if printer_id != 'local' else None,
                 source='printer'
             )
-
-            # Get printer information for enriching file data
-            printer_info_map = {}
-            if self.printer_service:
-                try:
-                    printers = await self.printer_service.list_printers()
-                    printer_info_map = {p.id: p for p in printers}
-                except Exception as e:
-                    logger.warning(
-                        "Could not fetch printer information for file enrichment",
-                        error=str(e)
-                    )
-
-            # Convert database rows to file format and enrich with printer info
-            for file_data in printer_files:
-                file_dict = dict(file_data)
-                file_dict['source'] = 'printer'
-
-                # Add printer name and type information
-                printer_id_val = file_dict.get('printer_id')
-                if printer_id_val and printer_id_val in printer_info_map:
-                    printer_info = printer_info_map[printer_id_val]
-                    printer_name = printer_info.name
-                    printer_type = printer_info.type.value if hasattr(printer_info.type, 'value') else str(printer_info.type)
-
-                    file_dict['printer_name'] = printer_name
-                    file_dict['printer_type'] = printer_type
-                    file_dict['source_display'] = f"{printer_name} ({printer_type})"
-                else:
-                    file_dict['printer_name'] = 'Unknown'
-                    file_dict['printer_type'] = 'unknown'
-                    file_dict['source_display'] = 'Unknown Printer'
-
-                files.append(file_dict)
-
+            files.extend(await self._enrich_printer_files(printer_files))
             logger.debug("Retrieved printer files from database", count=len(printer_files))
 
         except Exception as e:
             logger.error("Error retrieving printer files from database", error=str(e))
 
         # Get local files from file watcher if enabled and available
-        if include_local and self.file_watcher:
-            try:
-                local_files = self.file_watcher.get_local_files()
-
-                # Enrich local files with source display information
-                for local_file in local_files:
-                    if local_file.get('source') == 'local_watch':
-                        local_file['source_display'] = 'Local Watch Folder'
-                        local_file['printer_name'] = None
-                        local_file['printer_type'] = None
-
-                files.extend(local_files)
-                logger.debug("Retrieved local files", count=len(local_files))
-            except Exception as e:
-                logger.error("Error retrieving local files", error=str(e))
+        if include_local:
+            files.extend(self._get_local_files())
 
         # Apply filters
-        if printer_id and printer_id != 'local':
-            files = [f for f in files if f.get('printer_id') == printer_id or f.get('source') == 'local_watch']
-
-        if status:
-            files = [f for f in files if f.get('status') == status]
-
-        if source:
-            files = [f for f in files if f.get('source') == source]
-
-        if has_thumbnail is not None:
-            files = [f for f in files if bool(f.get('has_thumbnail', False)) == has_thumbnail]
-
-        # Apply search filter (case-insensitive partial match on filename)
-        if search:
-            search_lower = search.lower()
-            files = [f for f in files if search_lower in f.get('filename', '').lower()]
+        files = self._filter_files(files, printer_id, status, source, has_thumbnail, search)
 
         # Sort files
         reverse_order = order_dir.lower() == 'desc'
         if order_by == 'downloaded_at':
             files = sorted(files, key=lambda x: x.get('downloaded_at') or x.get('created_at') or '', reverse=reverse_order)
-        elif order_by == 'created_at':
-            files = sorted(files, key=lambda x: x.get('created_at', ''), reverse=reverse_order)
-        elif order_by == 'filename':
-            files = sorted(files, key=lambda x: x.get('filename', ''), reverse=reverse_order)
-        elif order_by == 'file_size':
-            files = sorted(files, key=lambda x: x.get('file_size', 0), reverse=reverse_order)
+        elif order_by in FILE_SORT_COLUMNS:
+            # Same order (NULLs first ascending, ID tie-break) as keyset pages
+            files = sorted(files, key=lambda x: sort_key(x.get(order_by), x.get('id') or ''),
+                           reverse=reverse_order)
 
         # Apply pagination
         if limit:
@@ -371,6 +394,111 @@ class FileService:
 
         return paginated_files, total_count
 
+    async def get_files_page(
+        self,
+        printer_id: Optional[str] = None,
+        include_local: bool = True,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        has_thumbnail: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = 50,
+        order_by: Optional[str] = "created_at",
+        order_dir: Optional[str] = "desc",
+        page: Optional[int] = 1,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """
+        Get one page of files, by page number or by cursor.
+
+        Without a cursor this is ``get_files_with_count`` plus a cursor for
+        the next page. With a cursor, printer files are read with a keyset
+        query (see FileRepository.list_page) and local watch-folder files,
+        which only exist in memory, are merged in the same order; the total
+        comes from a short-lived count cache.
+
+        Args:
+            printer_id: Filter by specific printer ID
+            include_local: Include local watch folder files
+            status: Filter by file status
+            source: Filter by file source
+            has_thumbnail: Filter by thumbnail availability
+            search: Search term for filename filtering
+            limit: Page size (None returns all files and no cursor)
+            order_by: Field to sort by (cursors need one of FILE_SORT_COLUMNS)
+            order_dir: Sort direction ('asc' or 'desc')
+            page: Page number (1-indexed, ignored with a cursor)
+            cursor: next_cursor of the previous page
+
+        Returns:
+            Page of file dictionaries
+
+        Raises:
+            ValueError: If a cursor is given for an unsortable order_by
+            InvalidCursorError: If the cursor is malformed or belongs to
+                different filters or sort order
+        """
+        descending = (order_dir or 'desc').lower() == 'desc'
+        signature = query_signature('files', order_by, descending, printer_id, include_local,
+                                    status, source, has_thumbnail, search)
+
+        def next_cursor_after(items: List[Dict[str, Any]]) -> Optional[str]:
+            if order_by not in FILE_SORT_COLUMNS or not items:
+                return None
+            last = items[-1]
+            return encode_cursor(signature, last.get(order_by), last.get('id'))
+
+        if not cursor:
+            files, total = await self.get_files_with_count(
+                printer_id=printer_id, include_local=include_local, status=status,
+                source=source, has_thumbnail=has_thumbnail, search=search,
+                limit=limit, order_by=order_by, order_dir=order_dir, page=page
+            )
+            has_more = bool(limit) and (max(page or 1, 1) - 1) * limit + len(files) < total
+            return Page(files, total, next_cursor_after(files) if has_more else None)
+
+        if order_by not in FILE_SORT_COLUMNS:
+            raise ValueError(f"Cannot page files by {order_by!r}; use one of {', '.join(FILE_SORT_COLUMNS)}")
+        limit = limit or 50
+        after_value, after_id = decode_cursor(cursor, signature)
+        after_key = sort_key(after_value, after_id or '')
+
+        repository = FileRepository.from_database(self.database)
+        db_printer_id = printer_id if printer_id != 'local' else None
+        files: List[Dict[str, Any]] = []
+        printer_next = None
+        if source in (None, 'printer'):
+            printer_files, printer_next = await repository.list_page(
+                signature, printer_id=db_printer_id, status=status, source='printer',
+                has_thumbnail=has_thumbnail, search=search, limit=limit, cursor=cursor,
+                sort_by=order_by, descending=descending
+            )
+            files.extend(await self._enrich_printer_files(printer_files))
+
+        local_files: List[Dict[str, Any]] = []
+        if include_local and source in (None, 'local_watch'):
+            local_files = self._filter_files(self._get_local_files(), printer_id, status,
+                                             'local_watch', has_thumbnail, search)
+            for local_file in local_files:
+                key = sort_key(local_file.get(order_by), local_file.get('id') or '')
+                if (key < after_key) if descending else (key > after_key):
+                    files.append(local_file)
+
+        files.sort(key=lambda x: sort_key(x.get(order_by), x.get('id') or ''), reverse=descending)
+        has_more = len(files) > limit or printer_next is not None
+        files = files[:limit]
+
+        printer_total = 0
+        if source in (None, 'printer'):
+            printer_total = await self._count_cache.get(
+                ('files', db_printer_id, status, has_thumbnail, search),
+                lambda: repository.count(printer_id=db_printer_id, status=status, source='printer',
+                                         has_thumbnail=has_thumbnail, search=search)
+            )
+        total = printer_total + len(local_files)
+
+        return Page(files, total, next_cursor_after(files) if has_more else None)
+
     async def get_file_by_id(self, file_id: str) -> Optional[Dict[str, Any]]:
         """
         Get file information by ID.
@@ -387,11 +515,10 @@ class FileService:
             >>> file = await file_service.get_file_by_id("bambu_001_model.3mf")
         """
         try:
-            # Check printer files in database first
-            files = await self.database.list_files()
-            for file_data in files:
-                if file_data['id'] == file_id:
-                    return dict(file_data)
+            # Check printer files in database first (direct lookup by primary key)
+            file_data = await FileRepository.from_database(self.database).get(file_id)
+            if file_data:
+                return file_data
 
             # Check local files from file watcher if available
             if self.file_watcher:
@@ -528,6 +655,7 @@ class FileService:
 
             if success:
                 logger.info("File deleted successfully", file_id=file_id)
+                self._count_cache.invalidate()
 
                 # Emit file deleted event
                 await self.event_service.emit_event("file_deleted", {
@@ -778,6 +906,7 @@ class FileService:
         """Set library service dependency."""
         self.library_service = library_service
         self.downloader.set_library_service(library_service)
+        self.thumbnail.set_preview_render_service(library_service.preview_service)
         logger.debug("Library service set in FileService")
 
     # ========================================================================
@@ -841,7 +970,7 @@ class FileService:
         """
         try:
             # Get repository access via database connection
-            file_repo = FileRepository(self.database.get_connection())
+            file_repo = FileRepository.from_database(self.database)
 
             # Find old deleted files
             old_deleted = await file_repo.get_old_deleted_files(days=deleted_days)
@@ -931,6 +1060,8 @@ class FileService:
                 # Wait for cancellation to complete
                 await asyncio.gather(*self._background_tasks, return_exceptions=True)
 
+        self.thumbnail.close()
+
         logger.info("FileService shutdown complete")
 
 
@@ -19,6 +19,7 @@ from src.database.repositories import FileRepository
 from src.services.event_service import EventService
 from src.services.bambu_parser import BambuParser
 from src.services.preview_render_service import PreviewRenderService
+from src.constants import ThumbnailConstants
 
 logger = structlog.get_logger()
 
@@ -55,7 +56,8 @@ class FileThumbnailService:
         self,
         database: Database,
         event_service: EventService,
-        printer_service=None
+        printer_service=None,
+        preview_render_service: Optional[PreviewRenderService] = None
     ):
         """
         Initialize file thumbnail service.
@@ -64,13 +66,16 @@ class FileThumbnailService:
             database: Database instance for storing thumbnail data
             event_service: Event service for emitting processing events
             printer_service: Optional printer service for API thumbnail downloads
+            preview_render_service: Optional shared preview renderer (the
+                library's), so the app keeps a single preview cache and size budget
         """
         self.database = database
-        self.file_repo = FileRepository(database._connection)
+        self.file_repo = FileRepository.from_database(database)
         self.event_service = event_service
         self.printer_service = printer_service
         self.bambu_parser = BambuParser()
-        self.preview_render_service = PreviewRenderService()
+        self._owns_preview_render_service = preview_render_service is None
+        self.preview_render_service = preview_render_service or PreviewRenderService()
 
         # Thumbnail processing status tracking
         self.thumbnail_processing_log: List[Dict[str, Any]] = []
@@ -373,7 +378,8 @@ class FileThumbnailService:
                         self.preview_render_service.get_or_generate_animated_preview(
                             file_path,
                             file_type,
-                            size=(200, 200)
+                            size=(200, 200),
+                            priority=ThumbnailConstants.RENDER_PRIORITY_BACKGROUND
                         )
                     )
                     logger.debug("Started animated preview generation in background",
@@ -484,6 +490,25 @@ class FileThumbnailService:
         self.printer_service = printer_service
         logger.debug("Printer service set in FileThumbnailService")
 
+    def set_preview_render_service(self, preview_render_service: PreviewRenderService) -> None:
+        """
+        Share another service's preview renderer (and its cache).
+
+        Args:
+            preview_render_service: PreviewRenderService instance to use
+        """
+        if preview_render_service is self.preview_render_service:
+            return
+        self.close()
+        self.preview_render_service = preview_render_service
+        self._owns_preview_render_service = False
+        logger.debug("Preview render service set in FileThumbnailService")
+
+    def close(self) -> None:
+        """Persist the preview cache index if this service created the renderer."""
+        if self._owns_preview_render_service:
+            self.preview_render_service.close()
+
     async def subscribe_to_download_events(self):
         """
         Subscribe to file download events to automatically process thumbnails.
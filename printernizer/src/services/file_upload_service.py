@@ -70,7 +70,7 @@ class FileUploadService:
             usage_stats_service: Optional usage statistics service for telemetry
         """
         self.database = database
-        self.file_repo = FileRepository(database._connection)
+        self.file_repo = FileRepository.from_database(database)
         self.event_service = event_service
         self.thumbnail_service = thumbnail_service
         self.metadata_service = metadata_service
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
 
 from src.services.event_service import EventService
 from src.services.config_service import ConfigService
+from src.services.watch_folder_scanner import WatchFolderScanner
+from src.utils.config import get_settings
 
 logger = structlog.get_logger()
 
@@ -126,6 +128,7 @@ class FileWatcherService:
         self._observer = None
         self._watched_folders: Dict[str, Any] = {}  # folder_path -> watch descriptor
         self._local_files: Dict[str, LocalFile] = {}  # file_id -> LocalFile
+        self._scan_stats: Dict[str, Dict[str, Any]] = {}  # folder_path -> last scan stats
         self._is_running = False
         self._lock = threading.Lock()
 
@@ -288,23 +291,28 @@ class FileWatcherService:
         logger.info("Initial scan completed", discovered_files=len(self._local_files))
     
     async def _scan_folder(self, folder_path: Path, recursive: bool = True):
-        """Scan a folder for existing 3D print files."""
+        """Scan a folder for existing 3D print files through the scan pipeline."""
         try:
-            if recursive:
-                pattern = "**/*"
-            else:
-                pattern = "*"
-            
-            for file_path in folder_path.glob(pattern):
-                if file_path.is_file() and self._file_handler.should_process_file(str(file_path)):
-                    await self._process_discovered_file(str(file_path))
-                    
+            library_enabled = bool(self.library_service and self.library_service.enabled)
+            settings = get_settings()
+            scanner = WatchFolderScanner(
+                should_process=self._file_handler.should_process_file,
+                register=self._register_discovered_file,
+                event_service=self.event_service,
+                library_service=self.library_service if library_enabled else None,
+                stat_workers=settings.watch_scan_stat_workers,
+                hash_workers=settings.watch_scan_hash_workers,
+                register_workers=settings.watch_scan_register_workers
+            )
+            stats = await scanner.scan(str(folder_path), recursive)
+            self._scan_stats[str(folder_path)] = stats.to_dict()
+
         except Exception as e:
             logger.error("Error scanning folder", 
                        folder_path=str(folder_path), error=str(e))
     
     async def _process_discovered_file(self, file_path: str):
-        """Process a discovered file and add to local files and library."""
+        """Process a single discovered file (watchdog events)."""
         try:
             path = Path(file_path)
 
@@ -313,6 +321,29 @@ class FileWatcherService:
 
             stat = path.stat()
 
+            checksum = None
+            if self.library_service and self.library_service.enabled:
+                try:
+                    # Unchanged files are served from the checksum index
+                    # without being read
+                    checksum = await self.library_service.get_file_checksum(path)
+                except Exception as e:
+                    logger.warning("Failed to compute file checksum",
+                                  file_path=file_path,
+                                  error=str(e))
+
+            await self._register_discovered_file(file_path, stat, checksum)
+
+        except Exception as e:
+            logger.error("Error processing discovered file",
+                       file_path=file_path, error=str(e))
+
+    async def _register_discovered_file(self, file_path: str, stat: os.stat_result,
+                                        checksum: Optional[str] = None):
+        """Track a stat'ed file locally and add it to the library by checksum."""
+        try:
+            path = Path(file_path)
+
             # Find which watch folder this file belongs to
             watch_folder_path = self._find_watch_folder_for_file(file_path)
             if not watch_folder_path:
@@ -345,11 +376,8 @@ class FileWatcherService:
             self._local_files[file_id] = local_file
 
             # Add to library if library service is available and enabled
-            if self.library_service and self.library_service.enabled:
+            if checksum and self.library_service and self.library_service.enabled:
                 try:
-                    # Calculate checksum to check for duplicates
-                    checksum = await self.library_service.calculate_checksum(path)
-
                     # Check if file already exists in library (by checksum)
                     existing_file = await self.library_service.get_file_by_checksum(checksum)
 
@@ -386,7 +414,8 @@ class FileWatcherService:
                         await self.library_service.add_file_to_library(
                             source_path=path,
                             source_info=source_info,
-                            copy_file=True  # Copy, don't move (preserve original)
+                            copy_file=True,  # Copy, don't move (preserve original)
+                            checksum=checksum
                         )
 
                         logger.info("Added new watch folder file to library",
@@ -457,6 +486,13 @@ class FileWatcherService:
         for file_id, local_file in list(self._local_files.items()):
             if local_file.file_path == file_path:
                 del self._local_files[file_id]
+
+                if self.library_service and self.library_service.enabled:
+                    try:
+                        await self.library_service.forget_file_checksum(Path(file_path))
+                    except Exception as e:
+                        logger.debug("Failed to drop checksum index entry",
+                                    file_path=file_path, error=str(e))
                 
                 await self._emit_file_event('file_deleted', local_file)
                 
@@ -539,6 +575,7 @@ class FileWatcherService:
             'is_running': self._is_running,
             'watched_folders': list(self._watched_folders.keys()),
             'local_files_count': len(self._local_files),
+            'last_scans': dict(self._scan_stats),
             'supported_extensions': list(self._file_handler.SUPPORTED_EXTENSIONS)
         }
     
@@ -28,7 +28,7 @@ class GeneratorService:
         self.database = database
         self.event_service = event_service
         self.library_service = library_service
-        self.repo = GeneratorRepository(database._connection)
+        self.repo = GeneratorRepository.from_database(database)
 
         settings = get_settings()
         self.staging_dir = Path(settings.generator_output_dir) / "staging"
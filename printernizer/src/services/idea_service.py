@@ -19,11 +19,13 @@ class IdeaService:
     """Service for managing ideas and trending models."""
 
     def __init__(self, db: Database, idea_repository: Optional[IdeaRepository] = None,
-                 trending_repository: Optional[TrendingRepository] = None):
+                 trending_repository: Optional[TrendingRepository] = None,
+                 event_service=None):
         self.db = db
+        self.event_service = event_service
         # Use provided repositories or create new ones from database connection
-        self.idea_repo = idea_repository or IdeaRepository(db._connection)
-        self.trending_repo = trending_repository or TrendingRepository(db._connection)
+        self.idea_repo = idea_repository or IdeaRepository.from_database(db)
+        self.trending_repo = trending_repository or TrendingRepository.from_database(db)
         self.url_parser = UrlParserService()
 
     async def create_idea(self, idea_data: Dict[str, Any]) -> Optional[str]:
@@ -59,12 +61,18 @@ class IdeaService:
                 await self.idea_repo.add_tags(idea.id, idea_data['tags'])
 
             logger.info("Idea created", idea_id=idea.id, title=idea.title)
+            await self._emit("idea_created", idea.id)
             return idea.id
 
         except Exception as e:
             logger.error("Failed to create idea", error=str(e))
             return None
 
+    async def _emit(self, event_type: str, idea_id: str) -> None:
+        """Emit an idea write event if an event service is attached."""
+        if self.event_service:
+            await self.event_service.emit_event(event_type, {'idea_id': idea_id})
+
     async def get_idea(self, idea_id: str) -> Optional[Idea]:
         """Get idea by ID."""
         try:
@@ -161,6 +169,7 @@ class IdeaService:
                     await self.idea_repo.add_tags(idea_id, tags)
 
             logger.info("Idea updated", idea_id=idea_id)
+            await self._emit("idea_updated", idea_id)
             return True
 
         except Exception as e:
@@ -173,6 +182,7 @@ class IdeaService:
             success = await self.idea_repo.delete(idea_id)
             if success:
                 logger.info("Idea deleted", idea_id=idea_id)
+                await self._emit("idea_deleted", idea_id)
             return success
 
         except Exception as e:
@@ -185,6 +195,7 @@ class IdeaService:
             success = await self.idea_repo.update_status(idea_id, status)
             if success:
                 logger.info("Idea status updated", idea_id=idea_id, status=status)
+                await self._emit("idea_updated", idea_id)
             return success
 
         except Exception as e:
@@ -7,8 +7,10 @@ import json
 import uuid
 from datetime import datetime
 import structlog
+from src.constants import PaginationConstants
 from src.database.database import Database
-from src.database.repositories import JobRepository
+from src.database.pagination import CountCache, Page
+from src.database.repositories import JobRepository, JobRollupRepository
 from src.services.event_service import EventService
 from src.models.job import Job, JobStatus, JobCreate, JobUpdate, JobUpdateRequest, JobStatusUpdateRequest
 
@@ -21,10 +23,31 @@ class JobService:
     def __init__(self, database: Database, event_service: EventService, usage_stats_service=None):
         """Initialize job service."""
         # Use JobRepository for database operations
-        self.job_repo = JobRepository(database._connection)
+        self.job_repo = JobRepository.from_database(database)
+        # Materialized dashboard aggregates, refreshed on every job write
+        self.rollup_repo = JobRollupRepository.from_database(database)
         self.database = database
         self.event_service = event_service
         self.usage_stats_service = usage_stats_service
+        # Totals reused by cursor pages of list_jobs_page
+        self._count_cache = CountCache(PaginationConstants.COUNT_CACHE_TTL_SECONDS)
+
+    async def _get_rollup_bucket(self, job_id):
+        """Get a job's current rollup bucket (None if unavailable)."""
+        try:
+            return await self.rollup_repo.get_job_bucket(str(job_id))
+        except Exception as e:
+            logger.warning("Failed to read job rollup bucket", job_id=job_id, error=str(e))
+            return None
+
+    async def _refresh_rollups(self, job_id, previous_bucket=None) -> None:
+        """Keep the dashboard rollups in step with a job write."""
+        try:
+            await self.rollup_repo.refresh_job(str(job_id), previous_bucket)
+        except Exception as e:
+            # Rollups can be repaired with AnalyticsService.rebuild_rollups();
+            # never fail the job write
+            logger.warning("Failed to refresh job rollups", job_id=job_id, error=str(e))
 
     def _deserialize_job_data(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -54,34 +77,58 @@ class JobService:
 
         return job_data
 
+    def _rows_to_jobs(self, jobs_data, operation: str) -> List[Dict[str, Any]]:
+        """Validate repository rows as Job models, skipping invalid rows."""
+        jobs = []
+        skipped_count = 0
+        for job_data in jobs_data:
+            try:
+                # Validate job has ID - critical field
+                if not job_data.get('id'):
+                    logger.error("Job missing ID field, skipping",
+                               printer_id=job_data.get('printer_id'),
+                               job_name=job_data.get('job_name'))
+                    skipped_count += 1
+                    continue
+
+                # Repository rows decode customer_info/timestamps on access
+                job = Job.model_validate(job_data)
+                jobs.append(job.dict())
+            except Exception as e:
+                logger.error("Failed to parse job data, skipping",
+                           job_id=job_data.get('id'),
+                           error=str(e),
+                           error_type=type(e).__name__)
+                skipped_count += 1
+                continue
+
+        if skipped_count > 0:
+            logger.warning(f"Skipped jobs during {operation}",
+                         skipped_count=skipped_count,
+                         valid_count=len(jobs))
+        return jobs
+
     async def get_jobs(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """Get list of print jobs."""
         try:
-            jobs_data = await self.job_repo.list()
-
-            # Apply pagination
-            start = offset
-            end = offset + limit
-            paginated_jobs = jobs_data[start:end]
+            jobs_data = await self.job_repo.list(limit=limit, offset=offset)
 
             # Convert to Job models for validation and formatting
             jobs = []
             skipped_count = 0
-            for job_data in paginated_jobs:
+            for job_data in jobs_data:
                 try:
                     # Validate job has ID - critical field
                     if not job_data.get('id'):
                         logger.error("Job missing ID field, skipping",
                                    printer_id=job_data.get('printer_id'),
                                    job_name=job_data.get('job_name'),
-                                   job_data=job_data)
+                                   job_data=dict(job_data))
                         skipped_count += 1
                         continue
 
-                    # Deserialize job data from database format
-                    job_data = self._deserialize_job_data(job_data)
-
-                    job = Job(**job_data)
+                    # Repository rows decode customer_info/timestamps on access
+                    job = Job.model_validate(job_data)
                     jobs.append(job.dict())
                 except Exception as e:
                     logger.error("Failed to parse job data, skipping",
@@ -96,7 +143,7 @@ class JobService:
                              skipped_count=skipped_count,
                              valid_count=len(jobs))
 
-            logger.info("Retrieved jobs", count=len(jobs), total_available=len(jobs_data))
+            logger.info("Retrieved jobs", count=len(jobs), limit=limit, offset=offset)
             return jobs
 
         except Exception as e:
@@ -115,36 +162,7 @@ class JobService:
                 offset=offset
             )
 
-            # Convert to Job models
-            jobs = []
-            skipped_count = 0
-            for job_data in jobs_data:
-                try:
-                    # Validate job has ID - critical field
-                    if not job_data.get('id'):
-                        logger.error("Job missing ID field, skipping",
-                                   printer_id=job_data.get('printer_id'),
-                                   job_name=job_data.get('job_name'))
-                        skipped_count += 1
-                        continue
-
-                    # Deserialize job data from database format
-                    job_data = self._deserialize_job_data(job_data)
-
-                    job = Job(**job_data)
-                    jobs.append(job.dict())
-                except Exception as e:
-                    logger.error("Failed to parse job data, skipping",
-                               job_id=job_data.get('id'),
-                               error=str(e),
-                               error_type=type(e).__name__)
-                    skipped_count += 1
-                    continue
-
-            if skipped_count > 0:
-                logger.warning("Skipped jobs during list operation",
-                             skipped_count=skipped_count,
-                             valid_count=len(jobs))
+            jobs = self._rows_to_jobs(jobs_data, "list operation")
 
             logger.info("Listed jobs",
                        printer_id=printer_id,
@@ -210,6 +228,52 @@ class JobService:
             logger.error("Failed to list jobs with count", error=str(e))
             return [], 0
 
+    async def list_jobs_page(self, printer_id=None, status=None, is_business=None,
+                             limit: int = 50, offset: int = 0, cursor: Optional[str] = None,
+                             sort_by: str = 'created_at', sort_order: str = 'desc') -> Page:
+        """List one page of jobs with a next-page cursor.
+
+        Without ``cursor`` this is an offset page with an exact total. With
+        a cursor the page is read by keyset (constant cost however deep the
+        page is) and the total comes from a short-lived count cache.
+
+        Args:
+            printer_id: Filter by printer ID
+            status: Filter by job status
+            is_business: Filter by business flag
+            limit: Page size
+            offset: Jobs to skip when no cursor is given
+            cursor: Cursor returned with the previous page
+            sort_by: created_at, updated_at or job_name
+            sort_order: 'asc' or 'desc'
+
+        Returns:
+            Page of job dicts, total count and next cursor
+
+        Raises:
+            ValueError: For an unsupported sort field or an invalid cursor
+        """
+        rows, next_cursor = await self.job_repo.list_page(
+            printer_id=printer_id, status=status, is_business=is_business,
+            limit=limit, cursor=cursor, offset=offset,
+            sort_by=sort_by, descending=sort_order.lower() != 'asc'
+        )
+        jobs = self._rows_to_jobs(rows, "page listing")
+
+        count_key = (printer_id, status, is_business)
+
+        async def count() -> int:
+            return await self.job_repo.count(printer_id=printer_id, status=status,
+                                             is_business=is_business)
+
+        if cursor:
+            total = await self._count_cache.get(count_key, count)
+        else:
+            total = await count()
+            self._count_cache.put(count_key, total)
+
+        return Page(jobs, total, next_cursor)
+
     async def get_job(self, job_id) -> Optional[Dict[str, Any]]:
         """Get specific job by ID."""
         try:
@@ -217,11 +281,8 @@ class JobService:
             if not job_data:
                 return None
 
-            # Deserialize job data from database format
-            job_data = self._deserialize_job_data(job_data)
-            
-            # Validate with Job model
-            job = Job(**job_data)
+            # Validate with Job model (the row decodes JSON/timestamps itself)
+            job = Job.model_validate(job_data)
             logger.info("Retrieved job", job_id=job_id)
             return job.dict()
             
@@ -251,10 +312,13 @@ class JobService:
                 raise ValueError(error_msg)
 
             # Delete the job record from database
+            bucket = await self._get_rollup_bucket(job_id)
             success = await self.job_repo.delete(str(job_id))
 
             if success:
                 logger.info("Job deleted successfully", job_id=job_id)
+                await self._refresh_rollups(job_id, bucket)
+                self._count_cache.invalidate()
                 # Emit event for job deletion
                 await self.event_service.emit_event('job_deleted', {
                     'job_id': str(job_id),
@@ -285,10 +349,7 @@ class JobService:
             jobs = []
             for job_data in active_jobs:
                 try:
-                    # Deserialize job data from database format
-                    job_data = self._deserialize_job_data(job_data)
-
-                    job = Job(**job_data)
+                    job = Job.model_validate(job_data)
                     jobs.append(job.dict())
                 except Exception as e:
                     logger.warning("Failed to parse active job data", job_id=job_data.get('id'), error=str(e))
@@ -378,6 +439,8 @@ class JobService:
             success = await self.job_repo.create(db_job_data)
 
             if success:
+                await self._refresh_rollups(job_id)
+                self._count_cache.invalidate()
                 logger.info("Job created successfully",
                            job_id=job_id,
                            job_name=db_job_data['job_name'],
@@ -481,11 +544,14 @@ class JobService:
         update_dict.pop('notes', None)
 
         # Update job
+        bucket = await self._get_rollup_bucket(job_id)
         success = await self.job_repo.update(job_id, update_dict)
 
         if not success:
             raise HTTPException(status_code=500, detail="Failed to update job")
 
+        await self._refresh_rollups(job_id, bucket)
+
         # Get updated job
         updated_job = await self.get_job(job_id)
 
@@ -639,9 +705,11 @@ class JobService:
                     updates['notes'] = status_note
 
             # Update job in database
+            bucket = await self._get_rollup_bucket(job_id)
             success = await self.job_repo.update(str(job_id), updates)
 
             if success:
+                await self._refresh_rollups(job_id, bucket)
                 logger.info("Job status updated",
                            job_id=job_id,
                            status=status,
@@ -796,6 +864,7 @@ class JobService:
                 'material_cost': costs['material_cost'],
                 'power_cost': costs['power_cost']
             })
+            await self._refresh_rollups(job_id)
             
             logger.info("Calculated costs for job", job_id=job_id, costs=costs)
             return costs
@@ -823,6 +892,8 @@ class JobService:
             
             if success:
                 logger.info("Job progress updated", job_id=job_id, progress=progress, material_used=material_used)
+                if material_used is not None:
+                    await self._refresh_rollups(job_id)
                 
                 # Emit event for progress update
                 await self.event_service.emit_event('job_progress_updated', {
@@ -3,7 +3,6 @@ Library Service for unified file management.
 Handles checksum-based file identification, deduplication, and organization.
 """
 
-import hashlib
 import asyncio
 import shutil
 import os
@@ -15,10 +14,16 @@ import json
 
 import structlog
 
-from src.database.repositories import LibraryRepository
+from src.database.repositories import LibraryRepository, ChecksumIndexRepository, ExtractionJobRepository
 from src.services.bambu_parser import BambuParser
-from src.services.stl_analyzer import STLAnalyzer
 from src.services.preview_render_service import PreviewRenderService
+from src.services.metadata_extraction_queue import (
+    ExtractionWorkerError,
+    MetadataExtractionQueue,
+    run_model_parser,
+)
+from src.constants import LibraryConstants, PaginationConstants, ThumbnailConstants
+from src.database.pagination import CountCache
 from src.services.filament_colors import (
     extract_colors_from_filament_ids,
     extract_color_from_name,
@@ -26,6 +31,7 @@ from src.services.filament_colors import (
     format_color_list
 )
 from src.services.file_role_classifier import classify_role, threemf_has_gcode
+from src.utils.file_hashing import hash_file
 import base64
 
 logger = structlog.get_logger()
@@ -44,7 +50,8 @@ class LibraryService:
             event_service: Event service for notifications
         """
         self.database = database
-        self.library_repo = LibraryRepository(database._connection)
+        self.library_repo = LibraryRepository.from_database(database)
+        self.checksum_index = ChecksumIndexRepository.from_database(database)
         self.config_service = config_service
         self.event_service = event_service
 
@@ -56,17 +63,26 @@ class LibraryService:
         self.checksum_algorithm = getattr(config_service.settings, 'library_checksum_algorithm', 'sha256')
         self.preserve_originals = getattr(config_service.settings, 'library_preserve_originals', True)
 
-        # Processing state
-        self._processing_files = set()  # Track files currently being processed
+        # Totals reused by cursor pages of list_files
+        self._count_cache = CountCache(PaginationConstants.COUNT_CACHE_TTL_SECONDS)
 
-        # Initialize metadata extraction parsers
+        # Initialize metadata extraction parser (3MF and STL parsing runs in
+        # the extraction queue's parser processes)
         self.bambu_parser = BambuParser()
-        self.stl_analyzer = STLAnalyzer()
 
         # Initialize preview rendering service for thumbnail generation
         cache_dir = self.library_path / '.metadata' / 'preview-cache'
         self.preview_service = PreviewRenderService(cache_dir=str(cache_dir))
 
+        # Persistent metadata extraction queue (workers start in initialize)
+        self.extraction_queue = MetadataExtractionQueue(
+            ExtractionJobRepository.from_database(database),
+            self._extract_metadata,
+            self._on_extraction_failed,
+            max_workers=getattr(config_service.settings, 'library_processing_workers', 2),
+            use_processes=getattr(config_service.settings, 'library_extraction_processes', True),
+        )
+
         logger.info("Library service initialized",
                    library_path=str(self.library_path),
                    enabled=self.enabled)
@@ -110,26 +126,39 @@ class LibraryService:
             except Exception as e:  # noqa: BLE001
                 logger.warning("Library role backfill failed", error=str(e))
 
+            # Start extraction workers (resumes jobs a restart interrupted)
+            await self.extraction_queue.start()
+
         except Exception as e:
             logger.error("Failed to initialize library", error=str(e))
             raise
 
+    async def shutdown(self) -> None:
+        """Stop the metadata extraction workers and persist the preview cache index."""
+        await self.extraction_queue.shutdown()
+        self.preview_service.close()
+
     async def classify_unroled_files(self) -> int:
-        """One-time backfill: classify library_files rows with role IS NULL."""
-        from src.services.file_role_classifier import classify_role, threemf_has_gcode
+        """
+        One-time backfill: classify library_files rows with role IS NULL.
+
+        Roles that follow from the file type are set here. 3MF files must be
+        opened to see whether they bundle G-code, so they are queued for
+        metadata extraction (at backfill priority), which sets the role.
+        """
         updated = 0
         async with self.database.connection() as conn:
             cursor = await conn.execute(
-                "SELECT checksum, file_type, library_path FROM library_files WHERE role IS NULL")
+                "SELECT id, checksum, file_type, library_path FROM library_files WHERE role IS NULL")
             rows = await cursor.fetchall()
+        to_extract = []
         for row in rows:
-            checksum, file_type, library_path = row[0], row[1], row[2]
+            file_id, checksum, file_type, library_path = row[0], row[1], row[2], row[3]
             ext = (file_type or "").lstrip(".").lower()
-            has_gcode = None
-            if ext == "3mf":
-                full = self.library_path / library_path if library_path else None
-                has_gcode = threemf_has_gcode(full) if full and full.exists() else None
-            role = classify_role(file_type or "", has_gcode)
+            if ext == "3mf" and library_path and (self.library_path / library_path).exists():
+                to_extract.append((checksum, file_id))
+                continue
+            role = classify_role(file_type or "", None)
             if role is None:
                 continue
             async with self.database.connection() as conn:
@@ -140,6 +169,10 @@ class LibraryService:
             updated += 1
         if updated:
             logger.info("Backfilled library file roles", count=updated)
+        if to_extract:
+            queued = await self.extraction_queue.enqueue_many(
+                to_extract, LibraryConstants.EXTRACTION_PRIORITY_BACKFILL)
+            logger.info("Queued 3MF files for role classification", count=queued)
         return updated
 
     async def calculate_checksum(self, file_path: Path, algorithm: str = None) -> str:
@@ -159,33 +192,40 @@ class LibraryService:
         # Run checksum calculation in thread pool to avoid blocking
         return await asyncio.to_thread(self._calculate_checksum_sync, file_path, algorithm)
 
-    def _calculate_checksum_sync(self, file_path: Path, algorithm: str) -> str:
-        """Synchronous checksum calculation."""
-        if algorithm == 'sha256':
-            hasher = hashlib.sha256()
-        elif algorithm == 'md5':
-            hasher = hashlib.md5()
-        else:
-            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    async def get_file_checksum(self, file_path: Path) -> str:
+        """
+        Get a file's checksum, reusing the persistent checksum index.
 
-        file_size = file_path.stat().st_size
-        chunk_size = 8192
+        The file is only hashed when its path, size, mtime or inode changed
+        since the stored checksum was computed.
 
-        with open(file_path, 'rb') as f:
-            bytes_read = 0
-            while chunk := f.read(chunk_size):
-                hasher.update(chunk)
-                bytes_read += len(chunk)
+        Args:
+            file_path: Path to file
 
-                # Log progress for large files
-                if file_size > 10 * 1024 * 1024:  # >10MB
-                    if bytes_read % (1024 * 1024) == 0:  # Every 1MB
-                        progress = (bytes_read / file_size) * 100
-                        logger.debug("Checksum progress",
-                                   file=str(file_path),
-                                   progress=f"{progress:.1f}%")
+        Returns:
+            Hexadecimal checksum string
+        """
+        path = os.path.abspath(file_path)
+        # Stat before hashing: a write during hashing changes mtime, so the
+        # next lookup misses instead of returning a checksum of mixed content
+        stat = await asyncio.to_thread(os.stat, path)
 
-        return hasher.hexdigest()
+        checksum = await self.checksum_index.lookup(path, stat, self.checksum_algorithm)
+        if checksum:
+            logger.debug("Checksum index hit", file=path, checksum=checksum[:16])
+            return checksum
+
+        checksum = await self.calculate_checksum(Path(path))
+        await self.checksum_index.store(path, stat, self.checksum_algorithm, checksum)
+        return checksum
+
+    async def forget_file_checksum(self, file_path: Path) -> None:
+        """Drop a file from the checksum index (e.g. after it was deleted)."""
+        await self.checksum_index.delete(os.path.abspath(file_path))
+
+    def _calculate_checksum_sync(self, file_path: Path, algorithm: str) -> str:
+        """Synchronous checksum calculation."""
+        return hash_file(file_path, algorithm)
 
     def get_library_path_for_file(self, checksum: str, source_type: str,
                                    original_filename: str = None, printer_name: str = None) -> Path:
@@ -275,7 +315,8 @@ class LibraryService:
     async def add_file_to_library(self, source_path: Path, source_info: Dict[str, Any],
                                   copy_file: bool = True, calculate_hash: bool = True,
                                   role: Optional[str] = None,
-                                  parent_checksum: Optional[str] = None) -> Dict[str, Any]:
+                                  parent_checksum: Optional[str] = None,
+                                  checksum: Optional[str] = None) -> Dict[str, Any]:
         """
         Add a file to the library.
 
@@ -291,6 +332,8 @@ class LibraryService:
             calculate_hash: Whether to calculate checksum (False if already known)
             role: Optional file role ('model' or 'printfile'). If not provided, will be classified.
             parent_checksum: Optional checksum of parent model (for printfiles).
+            checksum: Checksum of source_path if the caller already computed it
+                (skips hashing the source again).
 
         Returns:
             Dictionary with file information
@@ -305,7 +348,9 @@ class LibraryService:
                 raise ValueError(f"Invalid source type: {source_type}")
 
             # Calculate checksum
-            if calculate_hash:
+            if checksum:
+                logger.debug("Using known checksum", file=str(source_path), checksum=checksum[:16])
+            elif calculate_hash:
                 logger.info("Calculating checksum", file=str(source_path))
                 checksum = await self.calculate_checksum(source_path)
                 logger.info("Checksum calculated", file=str(source_path), checksum=checksum[:16])
@@ -431,6 +476,8 @@ class LibraryService:
             # Save to database (handle race condition with UNIQUE constraint)
             try:
                 success = await self.library_repo.create_file(file_record)
+                if success:
+                    self._count_cache.invalidate()
 
                 if not success:
                     # Database insert failed - likely race condition
@@ -475,15 +522,21 @@ class LibraryService:
 
             # Emit event
             await self.event_service.emit_event('library_file_added', {
+                'file_id': file_id,
                 'checksum': checksum,
                 'filename': source_path.name,
                 'file_size': file_size,
                 'source_type': source_type
             })
 
-            # Schedule metadata extraction if enabled
+            # Queue metadata extraction if enabled
             if self.auto_extract_metadata:
-                asyncio.create_task(self._extract_metadata_async(file_id, checksum))
+                priority = (LibraryConstants.EXTRACTION_PRIORITY_UPLOAD if source_type == 'upload'
+                            else LibraryConstants.EXTRACTION_PRIORITY_BACKFILL)
+                try:
+                    await self.extraction_queue.enqueue(checksum, file_id, priority)
+                except Exception as e:
+                    logger.error("Failed to queue metadata extraction", checksum=checksum[:16], error=str(e))
 
             return file_record
 
@@ -534,7 +587,8 @@ class LibraryService:
         return [dict(row) for row in rows]
 
     async def list_files(self, filters: Dict[str, Any] = None,
-                        page: int = 1, limit: int = 50) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+                        page: int = 1, limit: int = 50,
+                        cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
         List files in library with filters and pagination.
 
@@ -548,11 +602,17 @@ class LibraryService:
                 - has_metadata: Filter by metadata presence
             page: Page number (1-indexed)
             limit: Items per page
+            cursor: pagination['next_cursor'] of the previous page (keyset
+                pagination; the total may be up to a few seconds old)
 
         Returns:
             Tuple of (files list, pagination info)
+
+        Raises:
+            InvalidCursorError: If the cursor does not match the filters
         """
-        return await self.library_repo.list_files(filters, page, limit)
+        return await self.library_repo.list_files(filters, page, limit, cursor=cursor,
+                                                  count_cache=self._count_cache)
 
     async def add_file_source(self, checksum: str, source_info: Dict[str, Any]) -> None:
         """
@@ -629,11 +689,14 @@ class LibraryService:
             # Delete from database
             await self.library_repo.delete_file(checksum)
             await self.library_repo.delete_file_sources(checksum)
+            await asyncio.to_thread(self.preview_service.invalidate_previews, checksum)
+            self.preview_service.invalidate_previews(checksum)
 
             logger.info("File deleted from library", checksum=checksum[:16])
 
             # Emit event
             await self.event_service.emit_event('library_file_deleted', {
+                'file_id': file_record.get('id'),
                 'checksum': checksum,
                 'filename': file_record.get('filename')
             })
@@ -651,7 +714,33 @@ class LibraryService:
         Returns:
             Statistics dictionary
         """
-        return await self.library_repo.get_stats()
+        stats = await self.library_repo.get_stats()
+        try:
+            stats['extraction_queue'] = await self.extraction_queue.get_stats()
+        except Exception as e:
+            logger.warning("Failed to get extraction queue stats", error=str(e))
+        return stats
+
+    async def prioritize_extraction(self, checksum: str) -> bool:
+        """
+        Extract a file's metadata next if it is still waiting in the queue
+        (e.g. a user opened it).
+
+        Returns:
+            True if the file's job was moved up
+        """
+        try:
+            return await self.extraction_queue.prioritize(checksum)
+        except Exception as e:
+            logger.warning("Failed to prioritize metadata extraction", checksum=checksum[:16], error=str(e))
+            return False
+
+    async def _on_extraction_failed(self, job: Dict[str, Any], error: Exception, final: bool) -> None:
+        """Record a failed extraction attempt on the file (error once no retry is left)."""
+        await self.library_repo.update_file(job['checksum'], {
+            'status': 'error' if final else 'pending',
+            'error_message': str(error)
+        })
 
     def _map_parser_metadata_to_db(self, parser_metadata: Dict[str, Any], parser_thumbnails: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -933,196 +1022,212 @@ class LibraryService:
 
         return db_fields
 
-    async def _extract_metadata_async(self, file_id: str, checksum: str):
+    async def _extract_metadata(self, file_id: Optional[str], checksum: str):
         """
-        Asynchronously extract metadata from file.
-        Internal method called after file is added to library.
+        Extract metadata from a library file.
+        Run by a metadata extraction queue worker.
+
+        Parser failures are recorded on the file; infrastructure failures
+        (parser process died or timed out, database errors) are raised so
+        the queue retries the job.
 
         Args:
             file_id: File database ID
             checksum: File checksum
         """
-        try:
-            # Prevent duplicate processing
-            if checksum in self._processing_files:
-                logger.debug("File already being processed", checksum=checksum[:16])
-                return
-
-            self._processing_files.add(checksum)
-
-            # Update status to processing
-            await self.library_repo.update_file(checksum, {
-                'status': 'processing'
-            })
+        # Get file record (gone if the file was deleted while queued)
+        file_record = await self.get_file_by_checksum(checksum)
+        if not file_record:
+            logger.debug("Queued file no longer in library", checksum=checksum[:16])
+            return
+        file_id = file_id or file_record.get('id')
 
-            # Get file record
-            file_record = await self.get_file_by_checksum(checksum)
-            if not file_record:
-                return
+        # Update status to processing
+        await self.library_repo.update_file(checksum, {
+            'status': 'processing'
+        })
 
-            library_path = self.library_path / file_record['library_path']
-            file_type = file_record.get('file_type', '').lower()
+        library_path = self.library_path / file_record['library_path']
+        file_type = file_record.get('file_type', '').lower()
 
-            logger.info("Metadata extraction started",
-                       checksum=checksum[:16],
-                       file_type=file_type,
-                       path=str(library_path))
+        logger.info("Metadata extraction started",
+                   checksum=checksum[:16],
+                   file_type=file_type,
+                   path=str(library_path))
 
-            # Extract metadata using appropriate parser for file type
-            metadata_fields = {}
+        # Extract metadata using appropriate parser for file type
+        metadata_fields = {}
 
-            if file_type in ['3mf', 'gcode', 'bgcode', 'stl']:
-                try:
-                    # Parse file for metadata and thumbnails
-                    parse_result = await self.bambu_parser.parse_file(str(library_path))
-
-                    if parse_result['success']:
-                        # Map parser output to database fields
-                        metadata_fields = self._map_parser_metadata_to_db(
-                            parse_result.get('metadata', {}),
-                            parse_result.get('thumbnails', [])
-                        )
+        # Classify role if the file was added before roles existed
+        if file_record.get('role') is None and library_path.exists():
+            has_gcode = await asyncio.to_thread(threemf_has_gcode, library_path) if file_type == '3mf' else None
+            role = classify_role(file_type, has_gcode)
+            if role is not None:
+                metadata_fields['role'] = role
 
-                        logger.info("Metadata extracted from file parser",
-                                   checksum=checksum[:16],
-                                   fields_extracted=len(metadata_fields),
-                                   has_thumbnail=metadata_fields.get('has_thumbnail', 0) == 1)
-
-                        # Generate animated preview in background for 3D files with embedded thumbnails
-                        if file_type in ['3mf'] and metadata_fields.get('has_thumbnail', 0) == 1:
-                            try:
-                                asyncio.create_task(
-                                    self.preview_service.get_or_generate_animated_preview(
-                                        str(library_path),
-                                        file_type,
-                                        size=(200, 200)
-                                    )
-                                )
-                                logger.debug("Started animated preview generation for 3MF in background",
-                                           checksum=checksum[:16])
-                            except Exception as e:
-                                logger.warning("Failed to start animated preview generation for 3MF",
-                                             checksum=checksum[:16],
-                                             error=str(e))
-                    else:
-                        logger.warning("File parser extraction failed",
-                                     checksum=checksum[:16],
-                                     error=parse_result.get('error'))
+        if file_type in ['3mf', 'gcode', 'bgcode', 'stl']:
+            try:
+                # Parse file for metadata and thumbnails (3MF packages in a parser process)
+                if file_type == '3mf':
+                    parse_result = await self.extraction_queue.run_cpu_bound(
+                        run_model_parser, 'bambu', str(library_path), checksum)
+                else:
+                    parse_result = await self.bambu_parser.parse_file(str(library_path), checksum=checksum)
+
+                if parse_result['success']:
+                    # Map parser output to database fields
+                    metadata_fields.update(self._map_parser_metadata_to_db(
+                        parse_result.get('metadata', {}),
+                        parse_result.get('thumbnails', [])
+                    ))
+
+                    logger.info("Metadata extracted from file parser",
+                               checksum=checksum[:16],
+                               fields_extracted=len(metadata_fields),
+                               has_thumbnail=metadata_fields.get('has_thumbnail', 0) == 1)
 
-                    # For STL files, also extract geometric metadata using STL analyzer
-                    if file_type == 'stl':
+                    # Generate animated preview in background for 3D files with embedded thumbnails
+                    if file_type in ['3mf'] and metadata_fields.get('has_thumbnail', 0) == 1:
                         try:
-                            stl_result = await self.stl_analyzer.analyze_file(library_path)
-
-                            if stl_result['success']:
-                                # Extract and merge STL-specific metadata
-                                stl_fields = self._map_stl_metadata_to_db(stl_result)
-                                metadata_fields.update(stl_fields)
-                                metadata_fields['analysis_error'] = None  # clear any prior error
-
-                                logger.info("STL geometric metadata extracted",
-                                           checksum=checksum[:16],
-                                           stl_fields_added=len(stl_fields))
-                            else:
-                                err = stl_result.get('error') or 'STL analysis returned no data'
-                                metadata_fields['analysis_error'] = f"STL analysis failed: {err}"
-                                logger.warning("STL analysis failed",
-                                             checksum=checksum[:16],
-                                             error=stl_result.get('error'))
+                            asyncio.create_task(
+                                self.preview_service.get_or_generate_animated_preview(
+                                    str(library_path),
+                                    file_type,
+                                    size=(200, 200),
+                                    priority=ThumbnailConstants.RENDER_PRIORITY_BACKGROUND,
+                                    checksum=checksum
+                                )
+                            )
+                            logger.debug("Started animated preview generation for 3MF in background",
+                                       checksum=checksum[:16])
                         except Exception as e:
-                            # Persist the error onto the record so it is visible via the API
-                            # (it otherwise only reaches stdout via structlog).
-                            metadata_fields['analysis_error'] = f"STL analysis exception: {str(e)}"
-                            logger.error("Error during STL analysis",
+                            logger.warning("Failed to start animated preview generation for 3MF",
+                                         checksum=checksum[:16],
+                                         error=str(e))
+                else:
+                    logger.warning("File parser extraction failed",
+                                 checksum=checksum[:16],
+                                 error=parse_result.get('error'))
+
+                # For STL files, also extract geometric metadata using STL analyzer
+                if file_type == 'stl':
+                    try:
+                        stl_result = await self.extraction_queue.run_cpu_bound(
+                            run_model_parser, 'stl', str(library_path), checksum)
+
+                        if stl_result['success']:
+                            # Extract and merge STL-specific metadata
+                            stl_fields = self._map_stl_metadata_to_db(stl_result)
+                            metadata_fields.update(stl_fields)
+                            metadata_fields['analysis_error'] = None  # clear any prior error
+
+                            logger.info("STL geometric metadata extracted",
                                        checksum=checksum[:16],
-                                       error=str(e), exc_info=True)
-
-                    # Generate thumbnail if file needs it (STL, gcode without embedded thumbnails)
-                    if parse_result.get('needs_generation', False) and not metadata_fields.get('has_thumbnail'):
-                        try:
-                            logger.info("Generating preview thumbnail",
-                                      checksum=checksum[:16],
-                                      file_type=file_type)
-
-                            # Remove leading dot from file_type for preview service
-                            file_type_clean = file_type.lstrip('.')
+                                       stl_fields_added=len(stl_fields))
+                        else:
+                            err = stl_result.get('error') or 'STL analysis returned no data'
+                            metadata_fields['analysis_error'] = f"STL analysis failed: {err}"
+                            logger.warning("STL analysis failed",
+                                         checksum=checksum[:16],
+                                         error=stl_result.get('error'))
+                    except ExtractionWorkerError:
+                        raise
+                    except Exception as e:
+                        # Persist the error onto the record so it is visible via the API
+                        # (it otherwise only reaches stdout via structlog).
+                        metadata_fields['analysis_error'] = f"STL analysis exception: {str(e)}"
+                        logger.error("Error during STL analysis",
+                                   checksum=checksum[:16],
+                                   error=str(e), exc_info=True)
+
+                # Generate thumbnail if file needs it (STL, gcode without embedded thumbnails)
+                if parse_result.get('needs_generation', False) and not metadata_fields.get('has_thumbnail'):
+                    try:
+                        logger.info("Generating preview thumbnail",
+                                  checksum=checksum[:16],
+                                  file_type=file_type)
+
+                        # Remove leading dot from file_type for preview service
+                        file_type_clean = file_type.lstrip('.')
+
+                        # Generate thumbnail (512x512 for library preview)
+                        thumbnail_bytes = await self.preview_service.get_or_generate_preview(
+                            str(library_path),
+                            file_type_clean,
+                            size=(512, 512),
+                            priority=ThumbnailConstants.RENDER_PRIORITY_BACKGROUND,
+                            checksum=checksum
+                        )
 
-                            # Generate thumbnail (512x512 for library preview)
-                            thumbnail_bytes = await self.preview_service.get_or_generate_preview(
-                                str(library_path),
-                                file_type_clean,
-                                size=(512, 512)
-                            )
+                        if thumbnail_bytes:
+                            # Convert to base64 for database storage
+                            thumbnail_b64 = base64.b64encode(thumbnail_bytes).decode('utf-8')
+                            metadata_fields['has_thumbnail'] = 1
+                            metadata_fields['thumbnail_data'] = thumbnail_b64
+                            metadata_fields['thumbnail_width'] = 512
+                            metadata_fields['thumbnail_height'] = 512
+                            metadata_fields['thumbnail_format'] = 'png'
 
-                            if thumbnail_bytes:
-                                # Convert to base64 for database storage
-                                thumbnail_b64 = base64.b64encode(thumbnail_bytes).decode('utf-8')
-                                metadata_fields['has_thumbnail'] = 1
-                                metadata_fields['thumbnail_data'] = thumbnail_b64
-                                metadata_fields['thumbnail_width'] = 512
-                                metadata_fields['thumbnail_height'] = 512
-                                metadata_fields['thumbnail_format'] = 'png'
-
-                                logger.info("Preview thumbnail generated successfully",
-                                          checksum=checksum[:16],
-                                          size_bytes=len(thumbnail_bytes))
-
-                                # Also generate animated preview in the background for 3D files
-                                if file_type_clean.lower() in ['stl', '3mf']:
-                                    try:
-                                        asyncio.create_task(
-                                            self.preview_service.get_or_generate_animated_preview(
-                                                str(library_path),
-                                                file_type_clean,
-                                                size=(200, 200)
-                                            )
+                            logger.info("Preview thumbnail generated successfully",
+                                      checksum=checksum[:16],
+                                      size_bytes=len(thumbnail_bytes))
+
+                            # Also generate animated preview in the background for 3D files
+                            if file_type_clean.lower() in ['stl', '3mf']:
+                                try:
+                                    asyncio.create_task(
+                                        self.preview_service.get_or_generate_animated_preview(
+                                            str(library_path),
+                                            file_type_clean,
+                                            size=(200, 200),
+                                            priority=ThumbnailConstants.RENDER_PRIORITY_BACKGROUND,
+                                            checksum=checksum
                                         )
-                                        logger.debug("Started animated preview generation in background",
-                                                   checksum=checksum[:16])
-                                    except Exception as e:
-                                        logger.warning("Failed to start animated preview generation",
-                                                     checksum=checksum[:16],
-                                                     error=str(e))
-                            else:
-                                logger.warning("Preview thumbnail generation returned no data",
-                                             checksum=checksum[:16])
-
-                        except Exception as e:
-                            logger.error("Error generating preview thumbnail",
-                                       checksum=checksum[:16],
-                                       error=str(e))
+                                    )
+                                    logger.debug("Started animated preview generation in background",
+                                               checksum=checksum[:16])
+                                except Exception as e:
+                                    logger.warning("Failed to start animated preview generation",
+                                                 checksum=checksum[:16],
+                                                 error=str(e))
+                        else:
+                            logger.warning("Preview thumbnail generation returned no data",
+                                         checksum=checksum[:16])
+
+                    except Exception as e:
+                        logger.error("Error generating preview thumbnail",
+                                   checksum=checksum[:16],
+                                   error=str(e))
 
-                except Exception as e:
-                    logger.error("Error during metadata extraction",
-                               checksum=checksum[:16],
-                               error=str(e))
-            else:
-                logger.info("File type does not support metadata extraction",
+            except ExtractionWorkerError:
+                raise
+            except Exception as e:
+                logger.error("Error during metadata extraction",
                            checksum=checksum[:16],
-                           file_type=file_type)
+                           error=str(e))
+        else:
+            logger.info("File type does not support metadata extraction",
+                       checksum=checksum[:16],
+                       file_type=file_type)
 
-            # Update database with extracted metadata and mark as ready
-            update_fields = {
-                **metadata_fields,
-                'status': 'ready',
-                'last_analyzed': datetime.now().isoformat()
-            }
+        # Update database with extracted metadata and mark as ready
+        update_fields = {
+            **metadata_fields,
+            'status': 'ready',
+            'last_analyzed': datetime.now().isoformat()
+        }
 
-            await self.library_repo.update_file(checksum, update_fields)
+        if not await self.library_repo.update_file(checksum, update_fields):
+            raise RuntimeError("Failed to store extracted metadata")
 
-            logger.info("Metadata extraction completed",
-                       checksum=checksum[:16],
-                       metadata_count=len(metadata_fields))
+        logger.info("Metadata extraction completed",
+                   checksum=checksum[:16],
+                   metadata_count=len(metadata_fields))
 
-        except Exception as e:
-            logger.error("Metadata extraction failed", checksum=checksum[:16], error=str(e))
-            await self.library_repo.update_file(checksum, {
-                'status': 'error',
-                'error_message': str(e)
-            })
-
-        finally:
-            self._processing_files.discard(checksum)
+        await self.event_service.emit_event('library_file_updated', {
+            'file_id': file_id,
+            'checksum': checksum
+        })
 
     async def add_file_from_upload(self, file_id: str, file_path: str) -> Dict[str, Any]:
         """
@@ -1197,15 +1302,17 @@ class LibraryService:
                         error=str(e))
             raise
 
-    async def reprocess_file(self, checksum: str) -> bool:
+    async def reprocess_file(self, checksum: str,
+                             priority: int = LibraryConstants.EXTRACTION_PRIORITY_USER) -> bool:
         """
         Reprocess file metadata.
 
         Args:
             checksum: File checksum
+            priority: Extraction queue priority (a user request by default)
 
         Returns:
-            True if reprocessing started successfully
+            True if reprocessing was queued successfully
         """
         try:
             file_record = await self.get_file_by_checksum(checksum)
@@ -1213,8 +1320,8 @@ class LibraryService:
                 logger.warning("File not found for reprocessing", checksum=checksum[:16])
                 return False
 
-            # Schedule metadata extraction
-            asyncio.create_task(self._extract_metadata_async(file_record['id'], checksum))
+            # Queue metadata extraction
+            await self.extraction_queue.enqueue(checksum, file_record['id'], priority)
 
             logger.info("File reprocessing scheduled", checksum=checksum[:16])
             return True
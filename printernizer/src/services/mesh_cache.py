@@ -0,0 +1,436 @@
+"""
+Shared cache of parsed STL/3MF meshes.
+
+Parsing a large mesh with trimesh takes seconds and hundreds of MB, and the
+same library file is parsed by the STL analyzer and by every preview render
+(static and animated). The cache parses each file once and keeps its vertex
+and face arrays:
+
+    memory  per-process LRU under ``mesh_cache_memory_mb``
+    disk    ``<key>.npz`` (uncompressed arrays, loads in milliseconds) under
+            ``mesh_cache_disk_mb``, shared with the preview render worker
+            processes
+
+Keys are content addressed: library files use their checksum, other files a
+hash of path, size and mtime. Meshes above ``mesh_preview_max_faces`` also
+get a decimated copy (vertex clustering) which preview renders use instead
+of the full mesh; analysis always gets full resolution.
+
+Usage:
+    ```python
+    cache = get_mesh_cache()
+    mesh = cache.get_trimesh(path, checksum=checksum)                # analysis
+    preview = cache.get_trimesh(path, checksum=checksum, preview=True)  # rendering
+    ```
+"""
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import structlog
+
+from ..utils.config import get_settings
+from .threemf_reader import read_3mf
+
+logger = structlog.get_logger(__name__)
+
+# Optional import with graceful degradation
+try:
+    import numpy as np
+    import trimesh
+    MESH_CACHE_AVAILABLE = True
+except ImportError:
+    MESH_CACHE_AVAILABLE = False
+
+_CHECKSUM_PATTERN = re.compile(r'^[0-9a-f]{16,128}$')
+
+# Vertex clustering passes before settling for the closest result
+_DECIMATION_PASSES = 6
+
+
+class MeshData(NamedTuple):
+    """Vertex and face arrays of a parsed mesh."""
+    vertices: 'np.ndarray'
+    """float32, shape (n, 3)"""
+    faces: 'np.ndarray'
+    """int32, shape (m, 3)"""
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the arrays."""
+        return self.vertices.nbytes + self.faces.nbytes
+
+    def to_trimesh(self) -> 'trimesh.Trimesh':
+        """New Trimesh over these arrays (safe to modify; no re-processing)."""
+        return trimesh.Trimesh(vertices=self.vertices, faces=self.faces, process=False)
+
+
+def decimate_mesh(vertices: 'np.ndarray', faces: 'np.ndarray', max_faces: int) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Reduce a mesh to at most ``max_faces`` triangles by vertex clustering.
+
+    Vertices are snapped to a uniform grid over the bounding box and merged
+    per cell (at the cell's mean position); triangles that collapse are
+    dropped. The grid is refined until the face count fits. Coarse, but
+    fast and dependency-free, which is what thumbnails need.
+    """
+    if len(faces) <= max_faces:
+        return vertices, faces
+
+    lower = vertices.min(axis=0)
+    span = float((vertices.max(axis=0) - lower).max()) or 1.0
+    # Surface meshes keep roughly one face per few grid cells squared
+    grid = max(2, int((max_faces / 2) ** 0.5))
+    best: Optional[Tuple['np.ndarray', 'np.ndarray']] = None
+
+    for _ in range(_DECIMATION_PASSES):
+        cells = np.minimum(((vertices - lower) / span * grid).astype(np.int64), grid - 1)
+        cell_ids = (cells[:, 0] * grid + cells[:, 1]) * grid + cells[:, 2]
+        _, remap = np.unique(cell_ids, return_inverse=True)
+        counts = np.bincount(remap).astype(np.float64)
+        merged = np.column_stack([
+            np.bincount(remap, weights=vertices[:, axis]) / counts for axis in range(3)
+        ]).astype(np.float32)
+
+        new_faces = remap[faces]
+        keep = ((new_faces[:, 0] != new_faces[:, 1])
+                & (new_faces[:, 1] != new_faces[:, 2])
+                & (new_faces[:, 0] != new_faces[:, 2]))
+        new_faces = new_faces[keep]
+        # Drop triangles that collapsed onto the same three cells
+        _, first = np.unique(np.sort(new_faces, axis=1), axis=0, return_index=True)
+        new_faces = new_faces[np.sort(first)]
+
+        if len(new_faces) <= max_faces:
+            best = (merged, new_faces)
+            if len(new_faces) > max_faces * 0.5:
+                break
+            grid = int(grid * 1.3)
+        elif best is not None:
+            break
+        else:
+            grid = max(2, int(grid * (max_faces / len(new_faces)) ** 0.5 * 0.95))
+
+    if best is None:
+        best = (merged, new_faces)
+
+    # Drop vertices no face references any more
+    used, compact_faces = np.unique(best[1], return_inverse=True)
+    return best[0][used], compact_faces.reshape(-1, 3).astype(np.int32)
+
+
+def load_mesh_arrays(file_path: Union[str, Path]) -> MeshData:
+    """
+    Parse an STL or 3MF file into one mesh.
+
+    3MF packages are stream-parsed by the one-pass reader; all their objects
+    are combined (untransformed).
+    """
+    if str(file_path).lower().endswith('.3mf'):
+        package = read_3mf(file_path, thumbnails=False)
+        return MeshData(package.vertices, package.triangles)
+
+    mesh = trimesh.load_mesh(str(file_path))
+    return MeshData(
+        np.ascontiguousarray(mesh.vertices, dtype=np.float32).reshape(-1, 3),
+        np.ascontiguousarray(mesh.faces, dtype=np.int32).reshape(-1, 3),
+    )
+
+
+class MeshCache:
+    """
+    Two-level cache of parsed meshes (process memory, then ``.npz`` files).
+
+    Thread safe; concurrent requests for the same mesh in one process parse
+    it once.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], memory_budget_bytes: int,
+                 disk_budget_bytes: int, preview_max_faces: int):
+        """
+        Initialize the mesh cache.
+
+        Args:
+            cache_dir: Directory of the ``.npz`` files
+            memory_budget_bytes: In-memory budget (0 disables the memory level)
+            disk_budget_bytes: On-disk budget (0 disables the disk level)
+            preview_max_faces: Face count above which previews are decimated
+        """
+        self.cache_dir = Path(cache_dir)
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes
+        self.preview_max_faces = preview_max_faces
+
+        self._memory: 'OrderedDict[Tuple[str, bool], MeshData]' = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        # key -> [lock, number of threads holding or waiting for it]
+        self._key_locks: Dict[str, List[Any]] = {}
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'parses': 0,
+            'decimated': 0,
+            'evictions': 0,
+            'disk_evictions': 0,
+        }
+
+    @staticmethod
+    def cache_key(file_path: Union[str, Path], checksum: Optional[str] = None) -> str:
+        """
+        Content address of a mesh file.
+
+        Uses the library checksum when known; otherwise path, size and mtime,
+        so a modified file gets a new key.
+        """
+        if checksum:
+            checksum = checksum.lower()
+            if _CHECKSUM_PATTERN.match(checksum):
+                return checksum
+            return hashlib.sha256(checksum.encode()).hexdigest()
+        stat = os.stat(file_path)
+        identity = f"{Path(file_path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+        return 'stat-' + hashlib.sha256(identity.encode()).hexdigest()[:40]
+
+    def get(self, file_path: Union[str, Path], checksum: Optional[str] = None,
+            preview: bool = False) -> MeshData:
+        """
+        Get the arrays of a mesh file, parsing it only on a cache miss.
+
+        Args:
+            file_path: STL or 3MF file
+            checksum: Library checksum of the file, if known
+            preview: Return the decimated mesh (if the mesh is large)
+
+        Returns:
+            Mesh arrays (empty arrays for an empty mesh)
+
+        Raises:
+            Whatever trimesh raises for unreadable files
+        """
+        key = self.cache_key(file_path, checksum)
+
+        data = self._memory_get(key, preview)
+        if data is not None:
+            return data
+
+        with self._key_lock(key):
+            # Another thread may have loaded it meanwhile
+            data = self._memory_get(key, preview)
+            if data is not None:
+                return data
+
+            full, reduced = self._disk_get(key, preview)
+            if full is None and reduced is None:
+                full = load_mesh_arrays(file_path)
+                self.stats['parses'] += 1
+                reduced = self._decimate(full, file_path)
+                self._disk_put(key, full, reduced)
+
+            if full is not None:
+                self._memory_put((key, False), full)
+            if reduced is not None:
+                self._memory_put((key, True), reduced)
+            if preview and reduced is not None:
+                return reduced
+            return full
+
+    def get_trimesh(self, file_path: Union[str, Path], checksum: Optional[str] = None,
+                    preview: bool = False) -> 'trimesh.Trimesh':
+        """Like ``get``, as a new Trimesh the caller may modify."""
+        return self.get(file_path, checksum, preview).to_trimesh()
+
+    @contextmanager
+    def _key_lock(self, key: str) -> Iterator[None]:
+        """
+        Serialize the loading of one key.
+
+        The lock only exists while threads hold or wait for it, so the table
+        does not grow with every key ever loaded.
+        """
+        with self._lock:
+            entry = self._key_locks.get(key)
+            if entry is None:
+                entry = self._key_locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+
+    def put(self, file_path: Union[str, Path], vertices: 'np.ndarray', faces: 'np.ndarray',
+            checksum: Optional[str] = None) -> None:
+        """
+        Store a mesh another reader already parsed (e.g. the 3MF reader of
+        BambuParser), so later requests do not parse the file again.
+
+        Args:
+            file_path: Source file of the mesh
+            vertices: Vertex array (n, 3)
+            faces: Triangle array (m, 3)
+            checksum: Library checksum of the file, if known
+        """
+        key = self.cache_key(file_path, checksum)
+        full = MeshData(np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3),
+                        np.ascontiguousarray(faces, dtype=np.int32).reshape(-1, 3))
+        with self._key_lock(key):
+            reduced = self._decimate(full, file_path)
+            self._disk_put(key, full, reduced)
+            self._memory_put((key, False), full)
+            if reduced is not None:
+                self._memory_put((key, True), reduced)
+
+    def _decimate(self, full: MeshData, file_path: Union[str, Path]) -> Optional[MeshData]:
+        """Decimated copy of a mesh for previews, or None if it is small enough."""
+        if len(full.faces) <= self.preview_max_faces:
+            return None
+
+        vertices, faces = decimate_mesh(full.vertices, full.faces, self.preview_max_faces)
+        self.stats['decimated'] += 1
+        logger.debug("Decimated mesh for previews", file_path=str(file_path),
+                     faces=len(full.faces), preview_faces=len(faces))
+        return MeshData(vertices, faces)
+
+    def _memory_get(self, key: str, preview: bool) -> Optional[MeshData]:
+        """
+        Look up a mesh in memory, marking it recently used.
+
+        A full mesh small enough to need no decimation also serves previews.
+        """
+        with self._lock:
+            entry_keys = ((key, True), (key, False)) if preview else ((key, False),)
+            for entry_key in entry_keys:
+                data = self._memory.get(entry_key)
+                if data is None:
+                    continue
+                if entry_key[1] == preview or len(data.faces) <= self.preview_max_faces:
+                    self._memory.move_to_end(entry_key)
+                    self.stats['memory_hits'] += 1
+                    return data
+            return None
+
+    def _memory_put(self, key: Tuple[str, bool], data: MeshData) -> None:
+        """Keep a mesh in memory, evicting least recently used meshes over budget."""
+        if data.nbytes > self.memory_budget_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous.nbytes
+            self._memory[key] = data
+            self._memory_bytes += data.nbytes
+            while self._memory_bytes > self.memory_budget_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted.nbytes
+                self.stats['evictions'] += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    def _disk_get(self, key: str, preview: bool) -> Tuple[Optional[MeshData], Optional[MeshData]]:
+        """
+        Read the arrays needed for a request from the ``.npz`` file.
+
+        Returns (full, decimated); only the decimated copy is read for a
+        preview request when one exists, otherwise only the full mesh.
+        """
+        if not self.disk_budget_bytes:
+            return None, None
+        path = self._disk_path(key)
+        try:
+            with np.load(path) as npz:
+                if preview and 'preview_faces' in npz.files:
+                    full, reduced = None, MeshData(npz['preview_vertices'], npz['preview_faces'])
+                else:
+                    full, reduced = MeshData(npz['vertices'], npz['faces']), None
+            os.utime(path)  # recently used, for disk eviction
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            logger.warning("Discarding unreadable mesh cache file", path=str(path), error=str(e))
+            path.unlink(missing_ok=True)
+            return None, None
+
+        self.stats['disk_hits'] += 1
+        return full, reduced
+
+    def _disk_put(self, key: str, full: MeshData, reduced: Optional[MeshData]) -> None:
+        """Write the arrays to ``<key>.npz`` (atomically) and enforce the disk budget."""
+        if not self.disk_budget_bytes:
+            return
+        arrays: Dict[str, Any] = {'vertices': full.vertices, 'faces': full.faces}
+        if reduced is not None:
+            arrays['preview_vertices'] = reduced.vertices
+            arrays['preview_faces'] = reduced.faces
+        path = self._disk_path(key)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write mesh cache file", path=str(path), error=str(e))
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used ``.npz`` files while over the disk budget."""
+        try:
+            entries = []
+            total = 0
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.npz'):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+        except OSError:
+            return
+        if total <= self.disk_budget_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            self.stats['disk_evictions'] += 1
+            if total <= self.disk_budget_bytes:
+                break
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/parse counters and memory use."""
+        with self._lock:
+            return {
+                **self.stats,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+            }
+
+
+_mesh_cache: Optional[MeshCache] = None
+
+
+def get_mesh_cache() -> MeshCache:
+    """Get the process-wide mesh cache (created from settings on first use)."""
+    global _mesh_cache
+    if _mesh_cache is None:
+        settings = get_settings()
+        _mesh_cache = MeshCache(
+            cache_dir=settings.mesh_cache_dir,
+            memory_budget_bytes=settings.mesh_cache_memory_mb * 1024 * 1024,
+            disk_budget_bytes=settings.mesh_cache_disk_mb * 1024 * 1024,
+            preview_max_faces=settings.mesh_preview_max_faces,
+        )
+    return _mesh_cache
@@ -0,0 +1,366 @@
+"""
+Persistent, prioritized queue for library metadata extraction.
+
+Metadata extraction used to start as one background task per added file, so
+a bulk import of hundreds of files ran hundreds of parses at once, and files
+left 'processing' by a restart stayed that way. Jobs now live in the
+metadata_extraction_jobs table (migration 043). A fixed number of workers
+claim them by priority (a file a user opened, then uploads, then backfills),
+failed attempts are retried with exponential backoff, and jobs a restart
+interrupted are picked up again on start.
+
+CPU-heavy parsers (3MF packages, STL analysis) run through
+``run_cpu_bound`` in a process pool, so they neither block the event loop
+nor contend for the GIL; G-code is streamed and stays in process.
+
+Usage:
+    ```python
+    queue = MetadataExtractionQueue(ExtractionJobRepository.from_database(db),
+                                    service._extract_metadata, service._on_extraction_failed,
+                                    max_workers=2)
+    await queue.start()
+    await queue.enqueue(checksum, file_id, LibraryConstants.EXTRACTION_PRIORITY_UPLOAD)
+    result = await queue.run_cpu_bound(run_model_parser, 'bambu', path, checksum)
+    await queue.shutdown()
+    ```
+"""
+import asyncio
+import multiprocessing
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from src.constants import LibraryConstants
+from src.database.repositories import ExtractionJobRepository
+
+logger = structlog.get_logger()
+
+# Library file statuses whose extraction a restart may have cut off
+RESUMABLE_FILE_STATUSES = ('processing', 'pending')
+
+
+class ExtractionWorkerError(Exception):
+    """An extraction worker process died or timed out; the job is retried."""
+
+
+class ExtractionInterruptedError(ExtractionWorkerError):
+    """
+    The parser process pool was recycled because another job timed out.
+
+    Not the job's fault: it goes back to the queue without using an attempt.
+    """
+
+
+def run_model_parser(parser: str, file_path: str, checksum: Optional[str]) -> Dict[str, Any]:
+    """
+    Run a model parser synchronously (in a worker process or thread).
+
+    Args:
+        parser: 'bambu' for BambuParser.parse_file, 'stl' for STLAnalyzer.analyze_file
+        file_path: Path of the library file
+        checksum: Library checksum (mesh cache key)
+
+    Returns:
+        The parser's result dict
+    """
+    if parser == 'bambu':
+        from src.services.bambu_parser import BambuParser
+        return asyncio.run(BambuParser().parse_file(file_path, checksum=checksum))
+    from src.services.stl_analyzer import STLAnalyzer
+    return asyncio.run(STLAnalyzer().analyze_file(Path(file_path), checksum=checksum))
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before the next attempt after ``attempts`` failed ones."""
+    delay = LibraryConstants.EXTRACTION_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1)
+    return min(delay, LibraryConstants.EXTRACTION_RETRY_MAX_SECONDS)
+
+
+class MetadataExtractionQueue:
+    """
+    SQLite-backed job queue plus a fixed number of extraction workers.
+
+    ``extract`` is called as ``await extract(file_id, checksum)`` on a worker
+    and performs the whole extraction; an exception fails the attempt. After
+    each failed attempt ``on_failure(job, error, final)`` is awaited, with
+    ``final`` True once no retry is left.
+
+    Metrics:
+        - pending / running / failed: jobs per status
+        - completed / retried / gave_up: outcomes since start
+        - interrupted: jobs requeued after a timed-out job recycled the pool
+        - seconds_per_file: average extraction time
+    """
+
+    def __init__(self, repository: ExtractionJobRepository,
+                 extract: Callable[[Optional[str], str], Awaitable[None]],
+                 on_failure: Callable[[Dict[str, Any], Exception, bool], Awaitable[None]],
+                 max_workers: int = 2, use_processes: bool = True):
+        """
+        Initialize the queue (workers are started by ``start``).
+
+        Args:
+            repository: Job table repository
+            extract: Coroutine function that extracts one file's metadata
+            on_failure: Coroutine function called after a failed attempt
+            max_workers: Extractions allowed to run at once (also the number
+                of parser processes)
+            use_processes: Run ``run_cpu_bound`` work in processes, not threads
+        """
+        self.repository = repository
+        self._extract = extract
+        self._on_failure = on_failure
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Pools killed after a timeout; their other calls fail through no fault of their own
+        self._terminated: 'weakref.WeakSet[ProcessPoolExecutor]' = weakref.WeakSet()
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._running: Dict[str, float] = {}
+        self.stats = {
+            'completed': 0,
+            'retried': 0,
+            'gave_up': 0,
+            'interrupted': 0,
+            'extract_seconds': 0.0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """True once workers are started."""
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """Resume interrupted jobs and start the workers."""
+        if self.is_running:
+            return
+        reset = await self.repository.reset_running()
+        orphaned = await self.repository.enqueue_orphaned(
+            RESUMABLE_FILE_STATUSES, LibraryConstants.EXTRACTION_PRIORITY_BACKFILL
+        )
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"metadata-extraction-{i}")
+            for i in range(self.max_workers)
+        ]
+        logger.info("Metadata extraction queue started", workers=self.max_workers,
+                    processes=self.use_processes, resumed=reset, orphaned=orphaned)
+
+    async def enqueue(self, checksum: str, file_id: Optional[str], priority: int) -> None:
+        """
+        Queue extraction of a file. A file already queued keeps one job,
+        moved up if ``priority`` is more urgent.
+        """
+        await self.repository.enqueue(checksum, file_id, priority)
+        self._wakeup.set()
+
+    async def enqueue_many(self, entries: Iterable[Tuple[str, Optional[str]]], priority: int) -> int:
+        """Queue extraction of many (checksum, file_id) files; returns how many."""
+        count = await self.repository.enqueue_many(entries, priority)
+        if count:
+            self._wakeup.set()
+        return count
+
+    async def prioritize(self, checksum: str) -> bool:
+        """
+        Move a file's pending job to user priority (e.g. the user opened it).
+
+        Returns:
+            True if the job was moved up
+        """
+        moved = await self.repository.escalate(checksum, LibraryConstants.EXTRACTION_PRIORITY_USER)
+        if moved:
+            self._wakeup.set()
+        return moved
+
+    async def run_cpu_bound(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a picklable function in the parser process pool (or a thread
+        when processes are disabled).
+
+        Raises:
+            ExtractionWorkerError: If the worker process died or the call
+                exceeded EXTRACTION_TIMEOUT_SECONDS
+        """
+        if not self.use_processes:
+            return await asyncio.to_thread(fn, *args)
+
+        if self._executor is None:
+            # spawn: workers must not inherit the event loop's threads and locks
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        executor = self._executor
+        try:
+            return await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(executor, fn, *args),
+                timeout=LibraryConstants.EXTRACTION_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError as e:
+            # Cancelling the future does not stop the parse: kill the pool so
+            # a stuck file cannot keep holding a worker process
+            self._recycle_executor(executor, terminate=True)
+            raise ExtractionWorkerError(
+                f"Parser timed out after {LibraryConstants.EXTRACTION_TIMEOUT_SECONDS:.0f}s"
+            ) from e
+        except BrokenProcessPool as e:
+            if executor in self._terminated:
+                raise ExtractionInterruptedError("Parser pool recycled after another file timed out") from e
+            # A crashed worker breaks the whole pool; start a fresh one next time
+            self._recycle_executor(executor)
+            raise ExtractionWorkerError(f"Parser process died: {e}") from e
+
+    def _recycle_executor(self, executor: ProcessPoolExecutor, terminate: bool = False) -> None:
+        """
+        Retire a parser pool; the next ``run_cpu_bound`` starts a fresh one.
+
+        Args:
+            executor: Pool to retire (ignored if already replaced)
+            terminate: Kill its processes, which are still busy
+        """
+        if self._executor is executor:
+            self._executor = None
+        if terminate:
+            self._terminated.add(executor)
+            # ProcessPoolExecutor cannot cancel running calls; its processes
+            # are only reachable through the private _processes map
+            for process in list((getattr(executor, '_processes', None) or {}).values()):
+                try:
+                    process.terminate()
+                except Exception:
+                    pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _worker(self, index: int) -> None:
+        """Claim and run due jobs; sleep until the next one is due or work arrives."""
+        while True:
+            # Cleared before claiming, so an enqueue after an empty claim still wakes us
+            self._wakeup.clear()
+            try:
+                job = await self.repository.claim_next(time.time())
+            except Exception as e:
+                logger.error("Could not claim metadata extraction job", worker=index, error=str(e))
+                await asyncio.sleep(LibraryConstants.EXTRACTION_RETRY_BASE_SECONDS)
+                continue
+
+            if job is None:
+                await self._wait_for_work()
+                continue
+
+            checksum = job['checksum']
+            started = time.monotonic()
+            self._running[checksum] = started
+            try:
+                await self._extract(job['file_id'], checksum)
+            except ExtractionInterruptedError as e:
+                await self._release(job, e)
+            except Exception as e:
+                await self._handle_failure(job, e)
+            else:
+                self.stats['completed'] += 1
+                try:
+                    if await self.repository.complete(checksum):
+                        # Enqueued again (e.g. reprocess) while this attempt ran
+                        self._wakeup.set()
+                except Exception as e:
+                    logger.error("Could not remove finished extraction job", checksum=checksum[:16],
+                                 error=str(e))
+            finally:
+                self._running.pop(checksum, None)
+                self.stats['extract_seconds'] += time.monotonic() - started
+
+    async def _wait_for_work(self) -> None:
+        """Wait for an enqueue, or until the earliest retry is due."""
+        timeout = LibraryConstants.EXTRACTION_IDLE_POLL_SECONDS
+        try:
+            due = await self.repository.next_due_at()
+        except Exception:
+            due = None
+        if due is not None:
+            timeout = max(0.0, min(timeout, due - time.time()))
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _release(self, job: Dict[str, Any], error: Exception) -> None:
+        """Put a job interrupted through no fault of its own back in the queue, uncounted."""
+        checksum = job['checksum']
+        try:
+            await self.repository.release(checksum)
+            self.stats['interrupted'] += 1
+            self._wakeup.set()
+            logger.info("Metadata extraction interrupted, requeued", checksum=checksum[:16], error=str(error))
+        except Exception as e:
+            logger.error("Could not requeue interrupted extraction job", checksum=checksum[:16],
+                         error=str(e))
+
+    async def _handle_failure(self, job: Dict[str, Any], error: Exception) -> None:
+        """Reschedule a failed attempt with backoff, or give up after the last one."""
+        checksum, attempts = job['checksum'], job['attempts']
+        final = attempts >= LibraryConstants.EXTRACTION_MAX_ATTEMPTS
+        try:
+            if final and not await self.repository.fail(checksum, str(error)):
+                # Enqueued again while this attempt ran: starts over
+                final = False
+                self._wakeup.set()
+                logger.warning("Metadata extraction failed, requested again", checksum=checksum[:16],
+                               attempts=attempts, error=str(error))
+            elif final:
+                self.stats['gave_up'] += 1
+                logger.error("Metadata extraction failed", checksum=checksum[:16],
+                             attempts=attempts, error=str(error))
+            else:
+                delay = retry_delay(attempts)
+                await self.repository.retry(checksum, time.time() + delay, str(error))
+                self.stats['retried'] += 1
+                logger.warning("Metadata extraction attempt failed, retrying", checksum=checksum[:16],
+                               attempts=attempts, retry_in_seconds=delay, error=str(error))
+            await self._on_failure(job, error, final)
+        except Exception as e:
+            logger.error("Could not record metadata extraction failure", checksum=checksum[:16],
+                         error=str(e))
+
+    async def shutdown(self) -> None:
+        """Stop the workers and parser processes; interrupted jobs resume on the next start."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._running.clear()
+
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: executor.shutdown(wait=True, cancel_futures=True)
+            )
+
+        if workers:
+            try:
+                await self.repository.reset_running()
+            except Exception as e:
+                logger.warning("Could not requeue interrupted extraction jobs", error=str(e))
+            logger.info("Metadata extraction queue stopped")
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, outcomes and throughput."""
+        counts = await self.repository.get_counts()
+        attempts = self.stats['completed'] + self.stats['retried'] + self.stats['gave_up']
+        return {
+            'max_workers': self.max_workers,
+            'processes': self.use_processes,
+            'pending': counts.get('pending', 0),
+            'running': len(self._running),
+            'failed': counts.get('failed', 0),
+            'completed': self.stats['completed'],
+            'retried': self.stats['retried'],
+            'gave_up': self.stats['gave_up'],
+            'interrupted': self.stats['interrupted'],
+            'seconds_per_file': round(self.stats['extract_seconds'] / attempts, 2) if attempts else 0.0,
+        }
@@ -82,8 +82,8 @@ class NotificationService(BaseService):
         await super().initialize()
 
         # Initialize repository
-        if self.db.connection:
-            self.repository = NotificationRepository(self.db.connection)
+        if self.db._connection:
+            self.repository = NotificationRepository.from_database(self.db)
 
         # Subscribe to events
         if self.event_service:
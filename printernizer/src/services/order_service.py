@@ -6,6 +6,7 @@ import structlog
 from src.database.database import Database
 from src.database.repositories.order_repository import OrderRepository
 from src.database.repositories.customer_repository import CustomerRepository
+from src.database.repositories.job_rollup_repository import JobRollupRepository
 from src.services.base_service import BaseService
 
 logger = structlog.get_logger()
@@ -25,8 +26,10 @@ class OrderService(BaseService):
 
     def __init__(self, database: Database):
         super().__init__(database)  # Sets self.db, self._initialized
-        self.order_repo = OrderRepository(database._connection)
-        self.customer_repo = CustomerRepository(database._connection)
+        self.order_repo = OrderRepository.from_database(database)
+        self.customer_repo = CustomerRepository.from_database(database)
+        # Draft jobs count towards the dashboard rollups like any other job
+        self.rollup_repo = JobRollupRepository.from_database(database)
 
     # ===================== Customer methods =====================
 
@@ -232,7 +235,13 @@ class OrderService(BaseService):
             'created_at': now,
             'updated_at': now,
         }
-        await self.order_repo.create_draft_job(job_data)
+        if await self.order_repo.create_draft_job(job_data):
+            try:
+                await self.rollup_repo.refresh_job(job_id)
+            except Exception as e:
+                # Rollups can be repaired with AnalyticsService.rebuild_rollups();
+                # never fail the order write
+                logger.warning("Failed to refresh job rollups", job_id=job_id, error=str(e))
         logger.info("Draft job created for order", job_id=job_id, order_id=order_id)
         return job_id
 
@@ -0,0 +1,414 @@
+"""
+Content-addressed, size-bounded cache of rendered previews.
+
+Previews used to be cached as files named after a hash of the file path,
+size and mtime. Every request stat'ed the cache file to check its age, the
+directory only shrank when ``clear_cache`` was called, and moving a library
+file orphaned its previews. Entries are now keyed by the file's content
+address (library checksum, see ``MeshCache.cache_key``) plus the render
+parameters, so identical content shares one preview and a changed renderer
+configuration gets a new one.
+
+    files   ``<key>.png`` / ``<key>.gif`` in the cache directory
+    index   one row per entry (size, created, last access, hits, render
+            cost) kept in memory in LRU order and persisted to
+            ``index.sqlite`` in the same directory; access updates are
+            written in batches
+
+Entries are evicted least recently used first once the total size exceeds
+``preview_cache_max_mb``. Files the index does not know (e.g. previews of
+the old path-keyed layout) are removed when the cache is opened.
+
+Usage:
+    ```python
+    cache = PreviewCache(cache_dir, max_bytes=512 * 1024 * 1024)
+    key = PreviewCache.make_key(content_key, 'static', (512, 512), render_params)
+    data = cache.get(key)
+    if data is None:
+        cache.put(key, rendered, content_key, 'static', render_seconds=1.2)
+    ```
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+INDEX_FILE = 'index.sqlite'
+
+# File extension and media type per preview kind
+PREVIEW_FORMATS = {
+    'static': ('png', 'image/png'),
+    'animated': ('gif', 'image/gif'),
+}
+
+# Access updates buffered before the index is written
+_ACCESS_FLUSH_THRESHOLD = 64
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS preview_entries (
+        key TEXT PRIMARY KEY,
+        content_key TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        last_access REAL NOT NULL,
+        hits INTEGER NOT NULL DEFAULT 0,
+        render_seconds REAL NOT NULL DEFAULT 0
+    )
+"""
+
+
+class PreviewCacheEntry:
+    """Index entry of one cached preview."""
+
+    __slots__ = ('key', 'content_key', 'kind', 'size_bytes', 'created_at',
+                 'last_access', 'hits', 'render_seconds')
+
+    def __init__(self, key: str, content_key: str, kind: str, size_bytes: int, created_at: float,
+                 last_access: float, hits: int = 0, render_seconds: float = 0.0):
+        self.key = key
+        self.content_key = content_key
+        self.kind = kind
+        self.size_bytes = size_bytes
+        self.created_at = created_at
+        self.last_access = last_access
+        self.hits = hits
+        self.render_seconds = render_seconds
+
+    @property
+    def file_name(self) -> str:
+        """Name of the preview file in the cache directory."""
+        return f"{self.key}.{PREVIEW_FORMATS[self.kind][0]}"
+
+    @property
+    def media_type(self) -> str:
+        """MIME type of the preview."""
+        return PREVIEW_FORMATS[self.kind][1]
+
+    @property
+    def etag(self) -> str:
+        """Strong HTTP entity tag; the key already addresses the content."""
+        return f'"{self.key}"'
+
+
+class PreviewCache:
+    """
+    LRU preview cache under a byte budget with a persisted index.
+
+    Thread safe. The index is the source of truth: lookups never stat the
+    preview files, a missing file is only noticed (and dropped) on read.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int):
+        """
+        Open the cache, loading and reconciling its index.
+
+        Args:
+            cache_dir: Directory of the preview files and index
+            max_bytes: Total size of preview files kept
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, PreviewCacheEntry]' = OrderedDict()
+        self._total_bytes = 0
+        self._dirty: set = set()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'render_seconds_saved': 0.0,
+        }
+
+        self._db = sqlite3.connect(str(self.cache_dir / INDEX_FILE), check_same_thread=False)
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+        self._load()
+
+    @staticmethod
+    def make_key(content_key: str, kind: str, size: Tuple[int, int], params: str) -> str:
+        """
+        Cache key of a preview.
+
+        Args:
+            content_key: Content address of the source file
+            kind: 'static' or 'animated'
+            size: Preview size (width, height)
+            params: Serialized render parameters that affect the output
+        """
+        identity = f"{content_key}|{kind}|{size[0]}x{size[1]}|{params}"
+        return hashlib.sha256(identity.encode()).hexdigest()[:40]
+
+    def _load(self) -> None:
+        """Load the index in LRU order and drop rows and files that do not match."""
+        try:
+            on_disk = {entry.name: entry.stat().st_size for entry in os.scandir(self.cache_dir)
+                       if entry.is_file() and not entry.name.startswith(INDEX_FILE)}
+        except OSError:
+            on_disk = {}
+
+        stale = []
+        rows = self._db.execute(
+            """SELECT key, content_key, kind, size_bytes, created_at, last_access, hits, render_seconds
+               FROM preview_entries ORDER BY last_access"""
+        ).fetchall()
+        for row in rows:
+            entry = PreviewCacheEntry(*row)
+            if entry.kind not in PREVIEW_FORMATS or entry.file_name not in on_disk:
+                stale.append(entry.key)
+                continue
+            entry.size_bytes = on_disk.pop(entry.file_name)
+            self._entries[entry.key] = entry
+            self._total_bytes += entry.size_bytes
+
+        if stale:
+            self._db.executemany("DELETE FROM preview_entries WHERE key = ?", [(key,) for key in stale])
+            self._db.commit()
+
+        # Whatever is left is not indexed: old path-keyed previews or interrupted writes
+        for name in on_disk:
+            try:
+                os.unlink(self.cache_dir / name)
+            except OSError:
+                pass
+
+        if stale or on_disk:
+            logger.info("Preview cache index reconciled", entries=len(self._entries),
+                        dropped_rows=len(stale), removed_files=len(on_disk))
+        with self._lock:
+            self._evict()
+
+    def peek(self, key: str, max_age: Optional[float] = None) -> Optional[PreviewCacheEntry]:
+        """
+        Entry for ``key`` without reading its file or marking it as used.
+
+        For HTTP validators (ETag, Last-Modified): neither the LRU order nor
+        the hit counters change, and an expired entry is reported missing
+        but left for the next ``get`` to drop.
+
+        Args:
+            key: Cache key
+            max_age: Seconds after which an entry counts as missing
+
+        Returns:
+            The entry, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if max_age is not None and time.time() - entry.created_at > max_age:
+                return None
+            return entry
+
+    def lookup(self, key: str, max_age: Optional[float] = None) -> Optional[PreviewCacheEntry]:
+        """
+        Entry for ``key`` without reading its file, marked as used.
+
+        Args:
+            key: Cache key
+            max_age: Seconds after which an entry counts as missing
+
+        Returns:
+            The entry, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if max_age is not None and time.time() - entry.created_at > max_age:
+                self._remove(entry)
+                return None
+            entry.last_access = time.time()
+            entry.hits += 1
+            self._entries.move_to_end(key)
+            self._dirty.add(key)
+            if len(self._dirty) >= _ACCESS_FLUSH_THRESHOLD:
+                self._flush_access()
+            return entry
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[bytes]:
+        """
+        Cached preview bytes, or None on a miss.
+
+        Args:
+            key: Cache key
+            max_age: Seconds after which an entry counts as missing
+        """
+        entry = self.lookup(key, max_age)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+        try:
+            with open(self.cache_dir / entry.file_name, 'rb') as f:
+                data = f.read()
+        except OSError:
+            # Deleted behind our back; render again
+            with self._lock:
+                self._remove(entry)
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        self.stats['render_seconds_saved'] += entry.render_seconds
+        return data
+
+    def put(self, key: str, data: bytes, content_key: str, kind: str,
+            render_seconds: float = 0.0) -> PreviewCacheEntry:
+        """
+        Store a rendered preview and evict old entries over the budget.
+
+        Args:
+            key: Cache key (from ``make_key``)
+            data: Preview bytes
+            content_key: Content address of the source file
+            kind: 'static' or 'animated'
+            render_seconds: Time the render took
+
+        Returns:
+            The new entry
+        """
+        now = time.time()
+        entry = PreviewCacheEntry(key, content_key, kind, len(data), now, now, 0, render_seconds)
+        path = self.cache_dir / entry.file_name
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size_bytes
+            self._entries[key] = entry
+            self._total_bytes += entry.size_bytes
+            self._dirty.discard(key)
+            self._db.execute(
+                """INSERT OR REPLACE INTO preview_entries
+                   (key, content_key, kind, size_bytes, created_at, last_access, hits, render_seconds)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (key, content_key, kind, entry.size_bytes, now, now, 0, render_seconds)
+            )
+            self._flush_access()
+            self.stats['stores'] += 1
+            self._evict(keep=key)
+        return entry
+
+    def invalidate(self, content_key: str) -> int:
+        """
+        Drop all previews of a source file (e.g. it was deleted).
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            entries = [entry for entry in self._entries.values() if entry.content_key == content_key]
+            self._remove_many(entries)
+        return len(entries)
+
+    def clear(self, older_than: Optional[float] = None) -> int:
+        """
+        Drop entries.
+
+        Args:
+            older_than: Only entries created more than this many seconds
+                ago; None drops everything
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = None if older_than is None else time.time() - older_than
+        with self._lock:
+            entries = [entry for entry in self._entries.values()
+                       if cutoff is None or entry.created_at < cutoff]
+            self._remove_many(entries)
+        return len(entries)
+
+    def flush(self) -> None:
+        """Write buffered access updates to the index."""
+        with self._lock:
+            self._flush_access()
+
+    def _flush_access(self) -> None:
+        """Write buffered access updates (lock held)."""
+        if not self._dirty:
+            self._db.commit()
+            return
+        rows = [(self._entries[key].last_access, self._entries[key].hits, key)
+                for key in self._dirty if key in self._entries]
+        self._dirty.clear()
+        self._db.executemany("UPDATE preview_entries SET last_access = ?, hits = ? WHERE key = ?", rows)
+        self._db.commit()
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Remove least recently used entries while over budget (lock held)."""
+        victims = []
+        total = self._total_bytes
+        for key, entry in self._entries.items():
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            victims.append(entry)
+            total -= entry.size_bytes
+        if victims:
+            self._remove_many(victims)
+            self.stats['evictions'] += len(victims)
+
+    def _remove(self, entry: PreviewCacheEntry) -> None:
+        """Remove one entry and its file (lock held)."""
+        self._remove_many([entry])
+
+    def _remove_many(self, entries: Iterable[PreviewCacheEntry]) -> None:
+        """Remove entries and their files (lock held)."""
+        keys = []
+        for entry in entries:
+            if self._entries.pop(entry.key, None) is None:
+                continue
+            self._total_bytes -= entry.size_bytes
+            self._dirty.discard(entry.key)
+            keys.append((entry.key,))
+            try:
+                os.unlink(self.cache_dir / entry.file_name)
+            except OSError:
+                pass
+        if keys:
+            self._db.executemany("DELETE FROM preview_entries WHERE key = ?", keys)
+            self._db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size, budget, hit rate and render time saved."""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for entry in self._entries.values():
+                counts[entry.kind] = counts.get(entry.kind, 0) + 1
+            entry_count = len(self._entries)
+            total_bytes = self._total_bytes
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'render_seconds_saved': round(self.stats['render_seconds_saved'], 1),
+            'hit_rate': round(self.stats['hits'] / lookups, 3) if lookups else 0.0,
+            'entries': entry_count,
+            'static_entries': counts.get('static', 0),
+            'animated_entries': counts.get('animated', 0),
+            'size_mb': round(total_bytes / (1024 * 1024), 2),
+            'max_mb': round(self.max_bytes / (1024 * 1024), 2),
+        }
+
+    def close(self) -> None:
+        """Write buffered access updates and close the index."""
+        with self._lock:
+            try:
+                self._flush_access()
+            finally:
+                self._db.close()
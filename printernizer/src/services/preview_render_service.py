@@ -3,38 +3,288 @@ Preview rendering service for 3D files.
 Generates thumbnail images from STL, GCODE, and other 3D file formats.
 """
 import asyncio
-import hashlib
-import os
-from datetime import datetime, timedelta
+import itertools
+import json
+import multiprocessing
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
 from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Callable, List, NamedTuple
 
 import structlog
 
 from ..utils.gcode_analyzer import GcodeAnalyzer
+from .mesh_cache import MeshCache, get_mesh_cache
+from .preview_cache import PreviewCache, PreviewCacheEntry
+from .turntable_renderer import TURNTABLE_AVAILABLE, TurntableRenderer
 from ..utils.config import get_settings
+from ..constants import GCodeConstants, ThumbnailConstants
 
 logger = structlog.get_logger(__name__)
 
+# Part of every preview cache key; bump when renderer output changes
+PREVIEW_RENDER_VERSION = 2
+
 # Optional imports with graceful degradation
 try:
     import trimesh
-    import numpy as np
     # Set matplotlib to non-GUI backend before importing pyplot
     import matplotlib
     matplotlib.use('Agg')
     from matplotlib import pyplot as plt
     from matplotlib.backends.backend_agg import FigureCanvasAgg
     from mpl_toolkits.mplot3d import Axes3D
-    from PIL import Image
     RENDERING_AVAILABLE = True
 except ImportError as e:
     RENDERING_AVAILABLE = False
     logger.warning(f"Preview rendering libraries not available: {e}")
 
 
+class RenderOutput(NamedTuple):
+    """Render result carrying metrics back from the worker process."""
+    data: bytes
+    """Rendered image bytes"""
+    metrics: Dict[str, Any]
+    """Per-file render time and memory"""
+
+
+class _RenderJob:
+    """A queued render: the callable, its arguments and the caller-facing future."""
+
+    __slots__ = ('fn', 'args', 'timeout', 'priority', 'future', 'started', 'run_seconds')
+
+    def __init__(self, fn: Callable[..., Any], args: Tuple[Any, ...], timeout: float,
+                 priority: int, future: 'asyncio.Future'):
+        self.fn = fn
+        self.args = args
+        self.timeout = timeout
+        self.priority = priority
+        self.future = future
+        self.started = False
+        self.run_seconds = 0.0
+
+
+class RenderPool:
+    """
+    Bounded, prioritized process pool for preview renders.
+
+    Shared by all PreviewRenderService instances so the total number of
+    concurrent renders never exceeds ``max_workers``, no matter how many
+    tiles or services ask at once. Jobs wait in a priority queue (lower
+    value first, FIFO within a priority), so thumbnails a user is waiting
+    on overtake background pre-generation. Rendering runs in worker
+    processes, keeping matplotlib's CPU and memory use out of the event
+    loop process.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize the render pool.
+
+        Args:
+            max_workers: Maximum number of concurrent renders
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Pools killed after a render timed out; their other renders are requeued
+        self._terminated: 'weakref.WeakSet[ProcessPoolExecutor]' = weakref.WeakSet()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: List[asyncio.Task] = []
+        self._sequence = itertools.count()
+        self._running = 0
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'escalated': 0,
+            'requeued': 0,
+            'pools_recycled': 0,
+        }
+
+    def _ensure_started(self) -> None:
+        """Create the queue, executor and dispatcher tasks on first use in this loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [
+            loop.create_task(self._dispatch(), name=f"preview-render-{i}")
+            for i in range(self.max_workers)
+        ]
+        logger.info("Preview render pool started", workers=self.max_workers)
+
+    def submit(self, fn: Callable[..., Any], args: Tuple[Any, ...],
+               timeout: float, priority: int) -> _RenderJob:
+        """
+        Queue a render.
+
+        Args:
+            fn: Picklable callable run in a worker process
+            args: Positional arguments for ``fn``
+            timeout: Seconds the render may run once started
+            priority: Queue priority (lower runs first)
+
+        Returns:
+            Job whose ``future`` resolves to the render result; raises
+            ``asyncio.TimeoutError`` if the render exceeds ``timeout``
+        """
+        self._ensure_started()
+        job = _RenderJob(fn, args, timeout, priority, self._loop.create_future())
+        self._queue.put_nowait((priority, next(self._sequence), job))
+        self.stats['submitted'] += 1
+        return job
+
+    def escalate(self, job: _RenderJob, priority: int) -> None:
+        """
+        Move a queued job ahead to ``priority`` if that is more urgent.
+
+        The job is queued again under the new priority; whichever entry a
+        dispatcher reaches first runs it and the other is skipped.
+        """
+        if job.started or job.future.done() or priority >= job.priority:
+            return
+        job.priority = priority
+        self._queue.put_nowait((priority, next(self._sequence), job))
+        self.stats['escalated'] += 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """The current process pool, started on first use or after a recycle."""
+        if self._executor is None:
+            # spawn: workers must not inherit the event loop's threads and locks
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._executor
+
+    def _recycle_executor(self, executor: ProcessPoolExecutor, terminate: bool = False) -> None:
+        """
+        Retire a process pool; the next render starts a fresh one.
+
+        Args:
+            executor: Pool to retire (ignored if already replaced)
+            terminate: Kill its processes, which are still busy
+        """
+        if self._executor is executor:
+            self._executor = None
+        if terminate:
+            self._terminated.add(executor)
+            # ProcessPoolExecutor cannot cancel running calls; its processes
+            # are only reachable through the private _processes map
+            for process in list((getattr(executor, '_processes', None) or {}).values()):
+                try:
+                    process.terminate()
+                except Exception:
+                    pass
+        executor.shutdown(wait=False, cancel_futures=True)
+        self.stats['pools_recycled'] += 1
+
+    async def _dispatch(self) -> None:
+        """Take jobs from the queue and run them on the process pool."""
+        while True:
+            _, _, job = await self._queue.get()
+            if job.started or job.future.done():
+                continue
+
+            job.started = True
+            self._running += 1
+            started = time.perf_counter()
+            executor = self._get_executor()
+            try:
+                result = await asyncio.wait_for(
+                    self._loop.run_in_executor(executor, job.fn, *job.args),
+                    timeout=job.timeout
+                )
+            except asyncio.TimeoutError as e:
+                # Cancelling the future does not stop the render: kill the pool
+                # so the hung worker cannot hold up the renders queued behind it
+                self._recycle_executor(executor, terminate=True)
+                self.stats['timed_out'] += 1
+                if not job.future.done():
+                    job.future.set_exception(e)
+            except BrokenProcessPool as e:
+                if executor in self._terminated:
+                    # Killed because another render on this pool timed out:
+                    # run it again on the fresh pool
+                    job.started = False
+                    self._queue.put_nowait((job.priority, next(self._sequence), job))
+                    self.stats['requeued'] += 1
+                else:
+                    # A crashed worker breaks the whole pool; start a fresh one next time
+                    self._recycle_executor(executor)
+                    self.stats['failed'] += 1
+                    if not job.future.done():
+                        job.future.set_exception(e)
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.cancel()
+                raise
+            except Exception as e:
+                self.stats['failed'] += 1
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                self.stats['completed'] += 1
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self._running -= 1
+                job.run_seconds = time.perf_counter() - started
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool counters and current load."""
+        return {
+            **self.stats,
+            'max_workers': self.max_workers,
+            'running': self._running,
+            'queued': self._queue.qsize() if self._queue else 0,
+        }
+
+    async def shutdown(self) -> None:
+        """Stop dispatching and terminate the worker processes."""
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._loop = None
+        self._queue = None
+
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: executor.shutdown(wait=True, cancel_futures=True)
+            )
+            logger.info("Preview render pool stopped")
+
+
+_render_pool: Optional[RenderPool] = None
+
+
+def get_render_pool() -> RenderPool:
+    """Get the process-wide preview render pool."""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = RenderPool(max_workers=get_settings().preview_render_workers)
+    return _render_pool
+
+
+async def shutdown_render_pool() -> None:
+    """Shut down the preview render pool if it was started."""
+    if _render_pool is not None:
+        await _render_pool.shutdown()
+
+
 class PreviewRenderService:
     """Service for generating preview thumbnails from 3D files."""
 
@@ -89,28 +339,52 @@ class PreviewRenderService:
         self.cache_duration = timedelta(days=30)
         self._render_timeout = settings.preview_render_timeout  # seconds (configurable via PREVIEW_RENDER_TIMEOUT)
 
+        # Content-addressed preview cache, LRU within PREVIEW_CACHE_MAX_MB
+        self.cache = PreviewCache(self.cache_dir, settings.preview_cache_max_mb * 1024 * 1024)
+
         # Statistics
         self.stats = {
             'renders_generated': 0,
             'renders_cached': 0,
             'render_failures': 0,
             'animated_renders_generated': 0,
-            'animated_renders_cached': 0
+            'animated_renders_cached': 0,
+            'renders_deduplicated': 0
         }
 
+        # Time and memory of the most recent animated renders
+        self.animated_render_metrics: deque = deque(maxlen=ThumbnailConstants.RENDER_METRICS_KEPT)
+
+        # In-flight renders by cache file name, joined by concurrent callers
+        self._inflight: Dict[str, Tuple[asyncio.Task, _RenderJob]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the rendering configuration for the worker processes."""
+        state = self.__dict__.copy()
+        state.pop('_inflight', None)
+        state.pop('cache', None)
+        state.pop('animated_render_metrics', None)
+        return state
+
     async def get_or_generate_preview(
         self,
         file_path: str,
         file_type: str,
-        size: Tuple[int, int] = (512, 512)
+        size: Tuple[int, int] = (512, 512),
+        priority: int = ThumbnailConstants.RENDER_PRIORITY_INTERACTIVE,
+        checksum: Optional[str] = None
     ) -> Optional[bytes]:
         """
         Get cached preview or generate new one.
 
+        Concurrent requests for the same preview share a single render.
+
         Args:
             file_path: Path to the 3D file
             file_type: Type of file (stl, gcode, bgcode, 3mf)
             size: Desired thumbnail size (width, height)
+            priority: Render queue priority (ThumbnailConstants.RENDER_PRIORITY_*)
+            checksum: Library checksum, used as the shared mesh cache key
 
         Returns:
             PNG image as bytes, or None if generation failed
@@ -121,35 +395,35 @@ class PreviewRenderService:
 
         try:
             # Check cache first
-            cache_key = self._get_cache_key(file_path, size)
-            cache_path = self.cache_dir / f"{cache_key}.png"
-
-            if cache_path.exists():
-                # Check if cache is still valid
-                file_age = datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)
-                if file_age < self.cache_duration:
-                    logger.debug(f"Using cached preview: {cache_path}")
-                    with open(cache_path, 'rb') as f:
-                        self.stats['renders_cached'] += 1
-                        return f.read()
+            cache_ref = self._cache_ref(file_path, file_type, size, checksum, animated=False)
+            if cache_ref is None:
+                self.stats['render_failures'] += 1
+                return None
+            cache_key, content_key = cache_ref
+
+            cached = await asyncio.to_thread(self.cache.get, cache_key,
+                                             max_age=self.cache_duration.total_seconds())
+            if cached is not None:
+                logger.debug(f"Using cached preview: {cache_key}")
+                self.stats['renders_cached'] += 1
+                return cached
 
             # Generate new preview
             logger.info(f"Generating preview for {file_path}", file_type=file_type, size=size)
 
-            # Run rendering in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            preview_bytes = await asyncio.wait_for(
-                loop.run_in_executor(None, self._render_file, file_path, file_type, size),
-                timeout=self._render_timeout
+            preview_bytes = await self._render_single_flight(
+                cache_key,
+                content_key,
+                'static',
+                self._render_file,
+                (file_path, file_type, size, checksum),
+                timeout=self._render_timeout,
+                priority=priority,
+                stat_key='renders_generated'
             )
 
             if preview_bytes:
-                # Cache the result
-                with open(cache_path, 'wb') as f:
-                    f.write(preview_bytes)
-
-                self.stats['renders_generated'] += 1
-                logger.info(f"Successfully generated and cached preview: {cache_path}")
+                logger.info(f"Successfully generated and cached preview: {cache_key}")
                 return preview_bytes
             else:
                 self.stats['render_failures'] += 1
@@ -168,15 +442,21 @@ class PreviewRenderService:
         self,
         file_path: str,
         file_type: str,
-        size: Tuple[int, int] = (512, 512)
+        size: Tuple[int, int] = (512, 512),
+        priority: int = ThumbnailConstants.RENDER_PRIORITY_INTERACTIVE,
+        checksum: Optional[str] = None
     ) -> Optional[bytes]:
         """
         Get cached animated GIF preview or generate new one.
 
+        Concurrent requests for the same preview share a single render.
+
         Args:
             file_path: Path to the 3D file
             file_type: Type of file (stl, 3mf)
             size: Desired thumbnail size (width, height)
+            priority: Render queue priority (ThumbnailConstants.RENDER_PRIORITY_*)
+            checksum: Library checksum, used as the shared mesh cache key
 
         Returns:
             GIF image as bytes, or None if generation failed
@@ -187,7 +467,7 @@ class PreviewRenderService:
                    cache_enabled=self.animation_config['enabled'],
                    size=size)
 
-        if not RENDERING_AVAILABLE:
+        if not (RENDERING_AVAILABLE and TURNTABLE_AVAILABLE):
             logger.warning("Preview rendering not available - libraries not installed")
             return None
 
@@ -203,41 +483,39 @@ class PreviewRenderService:
 
         try:
             # Check cache first
-            cache_key = self._get_cache_key(file_path, size)
-            cache_path = self.cache_dir / f"{cache_key}-animated.gif"
-
-            if cache_path.exists():
-                # Check if cache is still valid
-                file_age = datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)
-                if file_age < self.cache_duration:
-                    logger.info("Serving cached animated GIF",
-                               cache_path=str(cache_path),
-                               age_minutes=file_age.total_seconds() / 60)
-                    with open(cache_path, 'rb') as f:
-                        self.stats['animated_renders_cached'] += 1
-                        return f.read()
+            cache_ref = self._cache_ref(file_path, file_type, size, checksum, animated=True)
+            if cache_ref is None:
+                self.stats['render_failures'] += 1
+                return None
+            cache_key, content_key = cache_ref
+
+            cached = await asyncio.to_thread(self.cache.get, cache_key,
+                                             max_age=self.cache_duration.total_seconds())
+            if cached is not None:
+                logger.debug("Serving cached animated GIF", cache_key=cache_key)
+                self.stats['animated_renders_cached'] += 1
+                return cached
 
             # Generate new animated preview
             logger.info("Generating new animated GIF",
                        angles=self.animation_config['angles'],
                        frame_count=len(self.animation_config['angles']))
 
-            # Run rendering in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            gif_bytes = await asyncio.wait_for(
-                loop.run_in_executor(None, self._render_animated_file, file_path, file_type, size),
-                timeout=self._render_timeout * len(self.animation_config['angles'])  # More time for multiple frames
+            gif_bytes = await self._render_single_flight(
+                cache_key,
+                content_key,
+                'animated',
+                self._render_animated_file,
+                (file_path, file_type, size, checksum),
+                timeout=self._render_timeout * len(self.animation_config['angles']),  # More time for multiple frames
+                priority=priority,
+                stat_key='animated_renders_generated'
             )
 
             if gif_bytes:
-                # Cache the result
-                with open(cache_path, 'wb') as f:
-                    f.write(gif_bytes)
-
-                self.stats['animated_renders_generated'] += 1
                 logger.info("Animated GIF generated successfully",
                            size_bytes=len(gif_bytes),
-                           cache_path=str(cache_path))
+                           cache_key=cache_key)
                 return gif_bytes
             else:
                 self.stats['render_failures'] += 1
@@ -259,175 +537,228 @@ class PreviewRenderService:
             self.stats['render_failures'] += 1
             return None
 
-    def _render_animated_file(
+    async def _render_single_flight(
         self,
-        file_path: str,
-        file_type: str,
-        size: Tuple[int, int]
+        cache_key: str,
+        content_key: str,
+        kind: str,
+        render_fn: Callable[..., Optional[bytes]],
+        args: Tuple[Any, ...],
+        timeout: float,
+        priority: int,
+        stat_key: str
     ) -> Optional[bytes]:
         """
-        Render file to animated GIF with multiple camera angles (synchronous, run in executor).
+        Render via the shared render pool, or join an in-flight render.
+
+        The first caller for a cache key queues the render; concurrent
+        callers await the same task and can raise its priority. The result
+        is stored in the cache once.
 
         Args:
-            file_path: Path to the file
-            file_type: File type (stl, 3mf)
-            size: Desired size
+            cache_key: Preview cache key the render is stored under
+            content_key: Content address of the source file
+            kind: 'static' or 'animated'
+            render_fn: Render method run in a worker process
+            args: Arguments for ``render_fn``
+            timeout: Seconds the render may run once started
+            priority: Render queue priority
+            stat_key: Stats counter incremented on a successful render
 
         Returns:
-            GIF bytes or None
+            Rendered bytes or None
         """
-        try:
-            # Load mesh
-            file_type_lower = file_type.lower()
-            if file_type_lower == 'stl':
-                mesh = trimesh.load_mesh(file_path)
-            elif file_type_lower == '3mf':
-                mesh = trimesh.load(file_path)
-                if isinstance(mesh, trimesh.Scene):
-                    mesh = trimesh.util.concatenate(
-                        [geom for geom in mesh.geometry.values() if isinstance(geom, trimesh.Trimesh)]
-                    )
-            else:
-                logger.warning(f"Unsupported file type for animation: {file_type}")
-                return None
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            task, job = inflight
+            self.stats['renders_deduplicated'] += 1
+            get_render_pool().escalate(job, priority)
+            logger.debug(f"Joining in-flight render: {cache_key}")
+            # Shielded so one caller giving up does not cancel the shared render
+            return await asyncio.shield(task)
+
+        job = get_render_pool().submit(render_fn, args, timeout, priority)
+        task = asyncio.ensure_future(self._store_render(job, cache_key, content_key, kind, stat_key))
+        self._inflight[cache_key] = (task, job)
+        task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    async def _store_render(self, job: _RenderJob, cache_key: str, content_key: str,
+                            kind: str, stat_key: str) -> Optional[bytes]:
+        """Wait for a render job and store its result in the cache."""
+        rendered = await job.future
+        render_seconds = job.run_seconds
+        if isinstance(rendered, RenderOutput):
+            self.animated_render_metrics.append(rendered.metrics)
+            render_seconds = rendered.metrics.get('seconds', render_seconds)
+            rendered = rendered.data
+        if rendered:
+            # File write, index commit and eviction unlinks stay off the event loop
+            await asyncio.to_thread(self.cache.put, cache_key, rendered, content_key, kind,
+                                    render_seconds=render_seconds)
+            self.stats[stat_key] += 1
+        return rendered
+
+    def _render_params(self, file_type: str, animated: bool) -> str:
+        """Serialized configuration a preview depends on (part of its cache key)."""
+        file_type_lower = file_type.lower()
+        if animated:
+            params = {'animation': self.animation_config, 'mesh': self.stl_config}
+        elif file_type_lower in ('gcode', 'bgcode'):
+            params = {'gcode': self.gcode_config}
+        else:
+            params = {'mesh': self.stl_config}
+        return json.dumps({'version': PREVIEW_RENDER_VERSION, 'type': file_type_lower, **params},
+                          sort_keys=True, default=str)
 
-            if mesh.is_empty:
-                logger.warning(f"Empty mesh in file: {file_path}")
-                return None
+    def _cache_ref(
+        self,
+        file_path: str,
+        file_type: str,
+        size: Tuple[int, int],
+        checksum: Optional[str],
+        animated: bool
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Preview cache key and content address of a file's preview.
 
-            # Generate frames for each angle
-            frames = []
-            angles = self.animation_config['angles']
-            elevation = self.animation_config['elevation']
-
-            for azimuth in angles:
-                frame_bytes = self._render_mesh_at_angle(mesh, size, azimuth, elevation)
-                if frame_bytes:
-                    # Convert PNG bytes to PIL Image
-                    frame_image = Image.open(BytesIO(frame_bytes))
-                    frames.append(frame_image)
-                else:
-                    logger.warning(f"Failed to render frame at angle {azimuth}")
+        Returns:
+            (cache key, content key), or None if the file cannot be read
+        """
+        try:
+            content_key = MeshCache.cache_key(file_path, checksum)
+        except OSError as e:
+            logger.warning(f"Cannot preview missing file {file_path}: {e}")
+            return None
+        kind = 'animated' if animated else 'static'
+        cache_key = PreviewCache.make_key(content_key, kind, size, self._render_params(file_type, animated))
+        return cache_key, content_key
 
-            if not frames:
-                logger.error("No frames generated for animated preview")
-                return None
+    def get_cached_preview(
+        self,
+        file_path: str,
+        file_type: str,
+        size: Tuple[int, int] = (512, 512),
+        checksum: Optional[str] = None,
+        animated: bool = False
+    ) -> Optional[PreviewCacheEntry]:
+        """
+        Cache entry of a preview without reading or rendering it.
 
-            # Create GIF
-            gif_buffer = BytesIO()
-            frames[0].save(
-                gif_buffer,
-                format='GIF',
-                save_all=True,
-                append_images=frames[1:],
-                duration=self.animation_config['frame_duration'],
-                loop=self.animation_config['loop'],
-                optimize=False  # Disable optimization for speed
-            )
+        Used by the HTTP endpoints to answer conditional requests (ETag,
+        Last-Modified) before touching the preview bytes. Does not count as
+        an access. May stat the file when no checksum is given, so call it
+        off the event loop.
 
-            gif_buffer.seek(0)
-            logger.info(f"Generated animated GIF with {len(frames)} frames")
-            return gif_buffer.read()
+        Args:
+            file_path: Path to the 3D file
+            file_type: Type of file (stl, gcode, bgcode, 3mf)
+            size: Preview size (width, height)
+            checksum: Library checksum, the content address
+            animated: The animated GIF instead of the PNG
 
-        except Exception as e:
-            logger.error(f"Failed to render animated file {file_path}: {e}")
+        Returns:
+            The entry, or None if the preview is not cached
+        """
+        cache_ref = self._cache_ref(file_path, file_type, size, checksum, animated)
+        if cache_ref is None:
             return None
+        return self.cache.peek(cache_ref[0], max_age=self.cache_duration.total_seconds())
 
-    def _render_mesh_at_angle(
+    def invalidate_previews(self, checksum: str) -> int:
+        """
+        Drop all cached previews of a library file.
+
+        Returns:
+            Number of previews removed
+        """
+        return self.cache.invalidate(MeshCache.cache_key('', checksum))
+
+    def _render_animated_file(
         self,
-        mesh: 'trimesh.Trimesh',
+        file_path: str,
+        file_type: str,
         size: Tuple[int, int],
-        azimuth: float,
-        elevation: float
-    ) -> Optional[bytes]:
+        checksum: Optional[str] = None
+    ) -> Optional[RenderOutput]:
         """
-        Render mesh at a specific camera angle.
+        Render file to animated GIF with multiple camera angles (synchronous, run in a render pool process).
+
+        The mesh is prepared once by the turntable renderer and only rotated
+        per frame; all frames are encoded in one pass.
 
         Args:
-            mesh: Trimesh object (already centered and normalized)
+            file_path: Path to the file
+            file_type: File type (stl, 3mf)
             size: Desired size
-            azimuth: Azimuth angle in degrees
-            elevation: Elevation angle in degrees
+            checksum: Library checksum (mesh cache key)
 
         Returns:
-            PNG bytes
+            GIF bytes with the render's time and memory, or None
         """
         try:
-            # Clone mesh to avoid modifying original
-            mesh_copy = mesh.copy()
-
-            # Center and normalize
-            mesh_copy.vertices -= mesh_copy.centroid
-            scale = 1.0 / max(mesh_copy.extents)
-            mesh_copy.vertices *= scale
-
-            # Create figure
-            dpi = self.stl_config['dpi']
-            fig_width = size[0] / dpi
-            fig_height = size[1] / dpi
+            started = time.perf_counter()
 
-            fig = plt.figure(figsize=(fig_width, fig_height), dpi=dpi)
-            ax = fig.add_subplot(111, projection='3d')
+            # Load mesh (decimated preview copy from the shared mesh cache)
+            file_type_lower = file_type.lower()
+            if file_type_lower in ('stl', '3mf'):
+                mesh = get_mesh_cache().get(file_path, checksum=checksum, preview=True)
+            else:
+                logger.warning(f"Unsupported file type for animation: {file_type}")
+                return None
 
-            # Set colors
-            fig.patch.set_facecolor(self.stl_config['background_color'])
-            ax.set_facecolor(self.stl_config['background_color'])
+            if not len(mesh.faces):
+                logger.warning(f"Empty mesh in file: {file_path}")
+                return None
 
-            # Plot mesh
-            ax.plot_trisurf(
-                mesh_copy.vertices[:, 0],
-                mesh_copy.vertices[:, 1],
-                mesh_copy.vertices[:, 2],
-                triangles=mesh_copy.faces,
-                color=self.stl_config['face_color'],
-                edgecolor=self.stl_config['edge_color'],
-                linewidth=self.stl_config['edge_width'],
-                alpha=0.9,
-                shade=True
+            renderer = TurntableRenderer(
+                mesh.vertices,
+                mesh.faces,
+                size,
+                elevation=self.animation_config['elevation'],
+                face_color=self.stl_config['face_color'],
+                background_color=self.stl_config['background_color']
             )
+            if not renderer.face_count:
+                logger.warning(f"Only degenerate faces in file: {file_path}")
+                return None
 
-            # Set camera angle
-            ax.view_init(elev=elevation, azim=azimuth)
-            ax.set_axis_off()
-
-            # Set equal aspect ratio
-            max_range = 0.5
-            ax.set_xlim([-max_range, max_range])
-            ax.set_ylim([-max_range, max_range])
-            ax.set_zlim([-max_range, max_range])
-
-            # Save to bytes
-            buf = BytesIO()
-            plt.savefig(
-                buf,
-                format='png',
-                dpi=dpi,
-                bbox_inches='tight',
-                pad_inches=0.1,
-                facecolor=self.stl_config['background_color']
+            angles = self.animation_config['angles']
+            gif_bytes = renderer.render_gif(
+                angles,
+                frame_duration=self.animation_config['frame_duration'],
+                loop=self.animation_config['loop']
             )
-            plt.close(fig)
 
-            buf.seek(0)
-            return buf.read()
+            metrics = {
+                'file': Path(file_path).name,
+                'frames': len(angles),
+                'faces': renderer.face_count,
+                'seconds': round(time.perf_counter() - started, 3),
+                'peak_rss_mb': round(renderer.peak_rss_bytes / (1024 * 1024), 1),
+            }
+            logger.info("Generated animated GIF", **metrics)
+            return RenderOutput(gif_bytes, metrics)
 
         except Exception as e:
-            logger.error(f"Failed to render mesh at angle {azimuth}: {e}")
+            logger.error(f"Failed to render animated file {file_path}: {e}")
             return None
 
     def _render_file(
         self,
         file_path: str,
         file_type: str,
-        size: Tuple[int, int]
+        size: Tuple[int, int],
+        checksum: Optional[str] = None
     ) -> Optional[bytes]:
         """
-        Render file to PNG bytes (synchronous, run in executor).
+        Render file to PNG bytes (synchronous, run in a render pool process).
 
         Args:
             file_path: Path to the file
             file_type: File type (stl, gcode, bgcode)
             size: Desired size
+            checksum: Library checksum (mesh cache key)
 
         Returns:
             PNG bytes or None
@@ -435,29 +766,31 @@ class PreviewRenderService:
         file_type_lower = file_type.lower()
 
         if file_type_lower == 'stl':
-            return self._render_stl(file_path, size)
+            return self._render_stl(file_path, size, checksum)
         elif file_type_lower == '3mf':
-            return self._render_3mf(file_path, size)
+            return self._render_3mf(file_path, size, checksum)
         elif file_type_lower in ['gcode', 'bgcode'] and self.gcode_config['enabled']:
             return self._render_gcode_toolpath(file_path, size)
         else:
             logger.warning(f"No renderer available for file type: {file_type}")
             return None
 
-    def _render_stl(self, file_path: str, size: Tuple[int, int]) -> Optional[bytes]:
+    def _render_stl(self, file_path: str, size: Tuple[int, int],
+                    checksum: Optional[str] = None) -> Optional[bytes]:
         """
         Render STL file to PNG thumbnail.
 
         Args:
             file_path: Path to STL file
             size: Desired thumbnail size
+            checksum: Library checksum (mesh cache key)
 
         Returns:
             PNG image as bytes
         """
         try:
-            # Load STL file
-            mesh = trimesh.load_mesh(file_path)
+            # Load STL file (decimated preview copy from the shared mesh cache)
+            mesh = get_mesh_cache().get_trimesh(file_path, checksum=checksum, preview=True)
 
             if not mesh.is_empty:
                 # Center the mesh
@@ -527,27 +860,22 @@ class PreviewRenderService:
             logger.error(f"Failed to render STL file {file_path}: {e}")
             return None
 
-    def _render_3mf(self, file_path: str, size: Tuple[int, int]) -> Optional[bytes]:
+    def _render_3mf(self, file_path: str, size: Tuple[int, int],
+                    checksum: Optional[str] = None) -> Optional[bytes]:
         """
         Render 3MF file by extracting and rendering its meshes.
 
         Args:
             file_path: Path to 3MF file
             size: Desired thumbnail size
+            checksum: Library checksum (mesh cache key)
 
         Returns:
             PNG image as bytes
         """
         try:
-            # Load 3MF file (trimesh can handle this)
-            mesh = trimesh.load(file_path)
-
-            # 3MF might contain a scene with multiple meshes
-            if isinstance(mesh, trimesh.Scene):
-                # Combine all meshes in the scene
-                mesh = trimesh.util.concatenate(
-                    [geom for geom in mesh.geometry.values() if isinstance(geom, trimesh.Trimesh)]
-                )
+            # Load 3MF file; scenes with multiple meshes come back combined
+            mesh = get_mesh_cache().get_trimesh(file_path, checksum=checksum, preview=True)
 
             if not mesh.is_empty:
                 # Use the same rendering as STL
@@ -650,61 +978,29 @@ class PreviewRenderService:
             logger.info(f"Rendering G-code toolpath: {file_path}", 
                        optimize_enabled=self.gcode_config['optimize_print_only'])
             
-            # Read and potentially optimize G-code
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = []
-                for i, line in enumerate(f):
-                    # Limit lines for performance, but analyze more for optimization
-                    max_lines = (self.gcode_config['optimization_max_lines'] 
-                               if self.gcode_config['optimize_print_only'] 
-                               else self.gcode_config['max_lines'])
-                    if i >= max_lines:
-                        break
-                    lines.append(line.rstrip())
-            
-            # Apply G-code optimization if enabled
-            if self.gcode_config['optimize_print_only']:
-                original_count = len(lines)
-                lines = self.gcode_analyzer.get_optimized_gcode_lines(lines)
-                
-                # Extend to max_lines from optimized start if needed
-                if len(lines) < self.gcode_config['max_lines']:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        all_lines = f.readlines()
-                        start_idx = original_count - len(lines)
-                        end_idx = min(start_idx + self.gcode_config['max_lines'], len(all_lines))
-                        lines = [line.rstrip() for line in all_lines[start_idx:end_idx]]
-                        
-                logger.info(f"G-code optimization applied: {original_count} -> {len(lines)} lines")
-            
-            # Parse movement commands
-            points = []
-            current_pos = [0.0, 0.0, 0.0]
-            
-            for line in lines:
-                # Parse G0/G1 movement commands
-                if line.startswith('G0 ') or line.startswith('G1 '):
-                    parts = line.strip().split()
-                    for part in parts[1:]:
-                        try:
-                            if part.startswith('X'):
-                                current_pos[0] = float(part[1:])
-                            elif part.startswith('Y'):
-                                current_pos[1] = float(part[1:])
-                            elif part.startswith('Z'):
-                                current_pos[2] = float(part[1:])
-                        except ValueError:
-                            continue  # Skip invalid coordinates
-                    
-                    points.append(current_pos.copy())
-
-            if not points:
+            # Read (skipping warmup if enabled) and extract moves in one pass
+            toolpath = self.gcode_analyzer.get_toolpath(
+                file_path,
+                max_lines=self.gcode_config['max_lines'],
+                analyze_lines=self.gcode_config['optimization_max_lines']
+            )
+
+            if not len(toolpath):
                 logger.warning(f"No toolpath points found in {file_path}")
                 return None
 
-            # Convert to numpy array
-            points = np.array(points)
-            logger.debug(f"Extracted {len(points)} toolpath points")
+            # Decimate per layer to what the image can show
+            max_points = (size[0] * size[1]) // GCodeConstants.TOOLPATH_PIXELS_PER_POINT
+            toolpath = toolpath.decimate(max_points)
+
+            # Draw extrusion only; files without E words fall back to all moves
+            points = toolpath.extrusion_polyline()
+            if not len(points):
+                points = toolpath.positions
+            bounds_min, bounds_max = toolpath.bounds()
+            logger.debug(f"Extracted {len(toolpath)} toolpath points",
+                        layers=toolpath.layer_count,
+                        extrusion_moves=toolpath.extrusion_count)
 
             # Create figure
             dpi = self.stl_config['dpi']
@@ -724,10 +1020,9 @@ class PreviewRenderService:
             ax.set_axis_off()
             
             # Auto-fit the view
-            if len(points) > 0:
-                ax.set_xlim(points[:, 0].min(), points[:, 0].max())
-                ax.set_ylim(points[:, 1].min(), points[:, 1].max())
-                ax.set_zlim(points[:, 2].min(), points[:, 2].max())
+            ax.set_xlim(bounds_min[0], bounds_max[0])
+            ax.set_ylim(bounds_min[1], bounds_max[1])
+            ax.set_zlim(bounds_min[2], bounds_max[2])
 
             # Save
             buf = BytesIO()
@@ -742,60 +1037,22 @@ class PreviewRenderService:
             logger.error(f"Failed to render GCODE toolpath {file_path}: {e}")
             return None
 
-    def _get_cache_key(self, file_path: str, size: Tuple[int, int]) -> str:
-        """
-        Generate cache key for a file and size.
-
-        Args:
-            file_path: File path
-            size: Thumbnail size
-
-        Returns:
-            Cache key hash
-        """
-        # Include file path, size, and modification time in cache key
-        try:
-            mtime = os.path.getmtime(file_path)
-        except (OSError, FileNotFoundError):
-            # File not found or inaccessible, use 0 as fallback
-            mtime = 0
-
-        cache_string = f"{file_path}_{size[0]}x{size[1]}_{mtime}"
-        return hashlib.md5(cache_string.encode()).hexdigest()
-
     async def clear_cache(self, older_than_days: Optional[int] = None) -> int:
         """
         Clear preview cache.
 
         Args:
-            older_than_days: Only clear files older than this many days.
-                           If None, clear all.
+            older_than_days: Only clear previews rendered more than this many
+                           days ago. If None, clear all.
 
         Returns:
-            Number of files removed
+            Number of previews removed
         """
         removed_count = 0
 
         try:
-            cutoff_time = None
-            if older_than_days is not None:
-                cutoff_time = datetime.now() - timedelta(days=older_than_days)
-
-            # Clear both PNG and GIF cache files
-            for pattern in ["*.png", "*.gif"]:
-                for cache_file in self.cache_dir.glob(pattern):
-                    if cache_file.is_file():
-                        if cutoff_time is None:
-                            # Remove all
-                            cache_file.unlink()
-                            removed_count += 1
-                        else:
-                            # Check age
-                            file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-                            if file_time < cutoff_time:
-                                cache_file.unlink()
-                                removed_count += 1
-
+            older_than = None if older_than_days is None else timedelta(days=older_than_days).total_seconds()
+            removed_count = await asyncio.to_thread(self.cache.clear, older_than)
             logger.info(f"Cleared {removed_count} preview cache files")
 
         except Exception as e:
@@ -803,22 +1060,42 @@ class PreviewRenderService:
 
         return removed_count
 
+    def close(self) -> None:
+        """Persist the preview cache index."""
+        self.cache.close()
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get rendering statistics."""
-        png_files = list(self.cache_dir.glob("*.png"))
-        gif_files = list(self.cache_dir.glob("*.gif"))
-
-        cache_size = sum(f.stat().st_size for f in png_files + gif_files if f.is_file())
-        cache_count = len(png_files) + len(gif_files)
+        cache_stats = self.cache.get_stats()
 
         return {
             **self.stats,
-            'cache_size_mb': round(cache_size / (1024 * 1024), 2),
-            'cache_file_count': cache_count,
-            'cache_png_count': len(png_files),
-            'cache_gif_count': len(gif_files),
+            'cache_size_mb': cache_stats['size_mb'],
+            'cache_file_count': cache_stats['entries'],
+            'cache_png_count': cache_stats['static_entries'],
+            'cache_gif_count': cache_stats['animated_entries'],
+            'preview_cache': cache_stats,
             'rendering_available': RENDERING_AVAILABLE,
-            'animation_enabled': self.animation_config['enabled']
+            'animation_enabled': self.animation_config['enabled'],
+            'renders_in_flight': len(self._inflight),
+            'render_pool': get_render_pool().get_stats(),
+            'animated_render_timings': self._get_animated_render_timings(),
+            # Counters of this process; renders parse in the pool workers
+            'mesh_cache': get_mesh_cache().get_stats()
+        }
+
+    def _get_animated_render_timings(self) -> Dict[str, Any]:
+        """Summarize time and worker peak RSS of the most recent animated renders."""
+        recent = list(self.animated_render_metrics)
+        if not recent:
+            return {'count': 0, 'recent': []}
+        seconds = [entry['seconds'] for entry in recent]
+        return {
+            'count': len(recent),
+            'avg_seconds': round(sum(seconds) / len(seconds), 3),
+            'max_seconds': max(seconds),
+            'max_peak_rss_mb': max(entry['peak_rss_mb'] for entry in recent),
+            'recent': recent,
         }
 
     def update_config(self, config: Dict[str, Any]) -> None:
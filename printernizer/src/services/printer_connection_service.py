@@ -66,7 +66,7 @@ class PrinterConnectionService:
             usage_stats_service: Optional usage statistics service for telemetry
         """
         self.database = database
-        self.printer_repo = PrinterRepository(database._connection)
+        self.printer_repo = PrinterRepository.from_database(database)
         self.event_service = event_service
         self.config_service = config_service
         self.file_service = file_service
@@ -64,12 +64,17 @@ class PrinterMonitoringService:
             config_service: Optional config service for reading settings
         """
         self.database = database
-        self.printer_repo = PrinterRepository(database._connection)
+        self.printer_repo = PrinterRepository.from_database(database)
         self.event_service = event_service
         self.file_service = file_service
         self.connection_service = connection_service
         self.job_service = job_service
         self.config_service = config_service
+        self.status_history_service = None
+
+        # Status persistence goes through the event service status bus
+        if getattr(event_service, 'database', None) is None:
+            event_service.set_services(database=database)
 
         # Monitoring state
         self.monitoring_active = False
@@ -114,8 +119,8 @@ class PrinterMonitoringService:
         Handle status updates from printers.
 
         Processes incoming status updates by:
-        1. Storing in database
-        2. Emitting events for real-time updates
+        1. Feeding them into the event service status bus (persists on change)
+        2. Emitting events for real-time updates when something changed
         3. Triggering auto-download if applicable
         4. Auto-creating jobs if needed
 
@@ -126,11 +131,7 @@ class PrinterMonitoringService:
             >>> # Called automatically via status callback
             >>> await monitoring_svc._handle_status_update(status)
         """
-        # Store status in database
-        await self._store_status_update(status)
-
-        # Emit event for real-time updates
-        await self.event_service.emit_event("printer_status_update", {
+        payload = {
             "printer_id": status.printer_id,
             "status": status.status.value,
             "message": status.message,
@@ -142,7 +143,14 @@ class PrinterMonitoringService:
             "current_job_has_thumbnail": status.current_job_has_thumbnail,
             "current_job_thumbnail_url": status.current_job_thumbnail_url,
             "timestamp": status.timestamp.isoformat()
-        })
+        }
+
+        # Store status via the status bus (only written when it changed)
+        changes = await self._store_status_update(status, payload)
+
+        # Emit event for real-time updates - unchanged statuses are dropped
+        if changes:
+            await self.event_service.emit_event("printer_status_update", payload)
 
         # Auto-download & process current job file if needed
         await self._check_auto_download(status)
@@ -407,33 +415,61 @@ class PrinterMonitoringService:
                           filename=filename,
                           error=str(e))
 
-    async def _store_status_update(self, status: PrinterStatusUpdate) -> None:
+    async def _store_status_update(self, status: PrinterStatusUpdate,
+                                   payload: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Store status update in database for history.
+        Record a status update in the event service status bus.
+
+        The bus diffs against the last known status and only writes the
+        printers table when the status value changed (or ``last_seen`` is
+        due for a refresh), instead of on every pushed update. Temperatures
+        and progress are also sampled into the status history, if set.
 
         Args:
             status: Status update to store
+            payload: Status snapshot dict built from ``status``
+
+        Returns:
+            Dict of fields that changed since the previous update
 
         Example:
-            >>> await monitoring_svc._store_status_update(status)
+            >>> changes = await monitoring_svc._store_status_update(status, payload)
         """
-        # Log the status update
-        logger.info("Printer status update",
-                   printer_id=status.printer_id,
-                   status=status.status.value,
-                   progress=status.progress)
+        if self.status_history_service:
+            try:
+                await self.status_history_service.record(
+                    status.printer_id, status.timestamp, status.temperature_bed,
+                    status.temperature_nozzle, status.progress
+                )
+            except Exception as e:
+                logger.warning("Failed to record status history sample",
+                              printer_id=status.printer_id,
+                              error=str(e))
+
+        # Connection events carry the printer name, as the polling loop's did
+        name = None
+        if self.connection_service:
+            instance = self.connection_service.printer_instances.get(status.printer_id)
+            name = getattr(instance, 'name', None)
 
-        # Update database with current status (could be expanded to track history)
         try:
-            await self.printer_repo.update_status(
-                status.printer_id,
-                status.status.value.lower(),
-                status.timestamp
-            )
+            changes = await self.event_service.record_printer_status(status.printer_id, payload, name=name)
         except Exception as e:
             logger.error("Failed to store status update",
                         printer_id=status.printer_id,
                         error=str(e))
+            return {}
+
+        if 'status' in changes:
+            logger.info("Printer status update",
+                       printer_id=status.printer_id,
+                       status=status.status.value,
+                       progress=status.progress)
+        elif changes:
+            logger.debug("Printer status update",
+                        printer_id=status.printer_id,
+                        changed=list(changes.keys()))
+        return changes
 
     async def start_monitoring(
         self,
@@ -1023,6 +1059,16 @@ class PrinterMonitoringService:
         self.job_service = job_service
         logger.debug("Job service set in PrinterMonitoringService")
 
+    def set_status_history_service(self, status_history_service):
+        """
+        Set status history service dependency.
+
+        Args:
+            status_history_service: StatusHistoryService instance
+        """
+        self.status_history_service = status_history_service
+        logger.debug("Status history service set in PrinterMonitoringService")
+
     def set_config_service(self, config_service):
         """
         Set config service dependency and load auto-creation setting.
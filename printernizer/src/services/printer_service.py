@@ -269,7 +269,9 @@ class PrinterService:
 
         try:
             status = await instance.get_status()
-            # Update last_seen when we successfully get status
+            # Update last_seen when we successfully get status. This is a
+            # read path: the status bus is only fed by the driver/monitoring
+            # path so pushed deltas are never swallowed as "unchanged".
             await self.database.update_printer_status(
                 printer_id,
                 status.status.value.lower(),
@@ -921,6 +923,7 @@ class PrinterService:
             if instance.is_connected:
                 await instance.disconnect()
             del self.connection.printer_instances[printer_id_str]
+        self.event_service.status_bus.forget(printer_id_str)
 
         # Remove from configuration
         return self.config_service.remove_printer(printer_id_str)
@@ -0,0 +1,151 @@
+"""
+Printer status bus for Printernizer.
+
+Keeps the last-known status snapshot per printer and turns incoming status
+updates (pushed by printer drivers or read by the fallback poll) into diffs.
+Consumers only see real changes, and the database is only written when a
+printer's status value changes or its ``last_seen`` needs refreshing.
+"""
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import structlog
+
+from src.constants import MonitoringConstants
+
+logger = structlog.get_logger()
+
+
+class PrinterStatusBus:
+    """
+    Diffing store for printer status snapshots.
+
+    Snapshots are plain dicts (the same shape as the ``printer_status_update``
+    event payload). Only the fields in ``TRACKED_FIELDS`` take part in change
+    detection; volatile fields such as ``timestamp`` are ignored.
+
+    Example:
+        >>> bus = PrinterStatusBus()
+        >>> bus.publish("bambu_001", {"status": "printing", "progress": 10})
+        {'status': 'printing', 'progress': 10}
+        >>> bus.publish("bambu_001", {"status": "printing", "progress": 10})
+        {}
+    """
+
+    TRACKED_FIELDS: Tuple[str, ...] = (
+        "status",
+        "message",
+        "temperature_bed",
+        "temperature_nozzle",
+        "progress",
+        "current_job",
+        "current_job_file_id",
+        "current_job_has_thumbnail",
+        "current_job_thumbnail_url",
+    )
+
+    def __init__(self, last_seen_refresh: float = MonitoringConstants.LAST_SEEN_REFRESH_SECONDS):
+        """
+        Initialize the status bus.
+
+        Args:
+            last_seen_refresh: Seconds after which an unchanged status is
+                persisted again so ``printers.last_seen`` stays meaningful
+        """
+        self.last_seen_refresh = last_seen_refresh
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._updated_at: Dict[str, float] = {}
+        self._persisted: Dict[str, Tuple[str, float]] = {}
+        self.stats = {
+            "updates": 0,
+            "changes": 0,
+            "unchanged": 0,
+            "db_writes": 0,
+            "db_writes_skipped": 0,
+        }
+
+    def publish(self, printer_id: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record a status snapshot and return the fields that changed.
+
+        Args:
+            printer_id: Printer identifier
+            snapshot: Status snapshot dict
+
+        Returns:
+            Dict of changed tracked fields with their new values (empty if
+            nothing changed). The first snapshot for a printer reports all
+            tracked fields present in it; fields missing from ``snapshot``
+            keep their previous value.
+        """
+        self.stats["updates"] += 1
+        self._updated_at[printer_id] = time.monotonic()
+
+        previous = self._snapshots.get(printer_id)
+        tracked = {k: snapshot.get(k) for k in self.TRACKED_FIELDS if k in snapshot}
+        if previous is None:
+            changes = tracked
+            self._snapshots[printer_id] = tracked
+        else:
+            changes = {k: v for k, v in tracked.items() if previous.get(k) != v}
+            # Partial snapshots (e.g. a bare status from the fallback poll)
+            # only overwrite the fields they carry
+            previous.update(changes)
+        if changes:
+            self.stats["changes"] += 1
+        else:
+            self.stats["unchanged"] += 1
+        return changes
+
+    def get_snapshot(self, printer_id: str) -> Optional[Dict[str, Any]]:
+        """Return the last recorded snapshot for a printer, if any."""
+        snapshot = self._snapshots.get(printer_id)
+        return dict(snapshot) if snapshot is not None else None
+
+    def printer_ids(self) -> List[str]:
+        """List the printers with a recorded snapshot."""
+        return list(self._snapshots)
+
+    def is_fresh(self, printer_id: str, max_age: float) -> bool:
+        """Check whether a printer reported status within ``max_age`` seconds."""
+        updated = self._updated_at.get(printer_id)
+        return updated is not None and (time.monotonic() - updated) < max_age
+
+    def should_persist(self, printer_id: str, status: str) -> bool:
+        """
+        Decide whether a status must be written to the database.
+
+        Returns True when the status value differs from the last persisted
+        one, or when the last write is older than ``last_seen_refresh``.
+        """
+        persisted = self._persisted.get(printer_id)
+        if persisted is None:
+            return True
+        last_status, written_at = persisted
+        if last_status != status:
+            return True
+        if time.monotonic() - written_at >= self.last_seen_refresh:
+            return True
+        self.stats["db_writes_skipped"] += 1
+        return False
+
+    def mark_persisted(self, printer_id: str, status: str) -> None:
+        """Record that ``status`` was written to the database just now."""
+        self._persisted[printer_id] = (status, time.monotonic())
+        self.stats["db_writes"] += 1
+
+    def forget(self, printer_id: str) -> None:
+        """Drop all state for a printer (e.g. after it was removed)."""
+        self._snapshots.pop(printer_id, None)
+        self._updated_at.pop(printer_id, None)
+        self._persisted.pop(printer_id, None)
+
+    def clear(self) -> None:
+        """Drop all tracked printers."""
+        self._snapshots.clear()
+        self._updated_at.clear()
+        self._persisted.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bus counters for debugging."""
+        return {**self.stats, "printers_tracked": len(self._snapshots)}
@@ -7,11 +7,14 @@ import time
 import math
 import json
 import hashlib
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Set, Tuple
 from datetime import datetime
 import structlog
+from prometheus_client import Counter, Gauge
 
 from src.config.constants import file_url
+from src.constants import SearchConstants
 from src.database.database import Database
 from src.database.repositories import FileRepository, LibraryRepository, IdeaRepository
 from src.models.search import (
@@ -22,20 +25,62 @@ from src.models.search import (
 logger = structlog.get_logger()
 
 
+# Search cache metrics - initialized once
+try:
+    SEARCH_CACHE_REQUESTS = Counter(
+        'printernizer_search_cache_requests_total',
+        'Search result cache lookups', ['result']
+    )
+    SEARCH_CACHE_EVICTIONS = Counter(
+        'printernizer_search_cache_evictions_total',
+        'Search result cache entries removed (lru, expired or invalidated)', ['reason']
+    )
+    SEARCH_CACHE_ENTRIES = Gauge(
+        'printernizer_search_cache_entries',
+        'Search result pages currently cached'
+    )
+    SEARCH_CACHE_BYTES = Gauge(
+        'printernizer_search_cache_memory_bytes',
+        'Estimated size of the cached search result pages (serialized JSON)'
+    )
+except ValueError:
+    # Metrics already registered (happens during reload)
+    from prometheus_client import REGISTRY
+    SEARCH_CACHE_REQUESTS = REGISTRY._names_to_collectors['printernizer_search_cache_requests_total']
+    SEARCH_CACHE_EVICTIONS = REGISTRY._names_to_collectors['printernizer_search_cache_evictions_total']
+    SEARCH_CACHE_ENTRIES = REGISTRY._names_to_collectors['printernizer_search_cache_entries']
+    SEARCH_CACHE_BYTES = REGISTRY._names_to_collectors['printernizer_search_cache_memory_bytes']
+
+
 class SearchCache:
-    """Three-layer caching system for search results."""
+    """
+    Three-layer caching system for search results.
 
-    def __init__(self, results_ttl: int = 300, external_ttl: int = 3600):
+    The results layer is a size-bounded LRU with per-entry TTL. Each cached
+    page is indexed by the IDs of the results it contains and by the sources
+    it searched, so invalidation only touches the affected entries.
+    """
+
+    def __init__(self, results_ttl: int = SearchConstants.RESULTS_CACHE_TTL_SECONDS,
+                 external_ttl: int = 3600,
+                 max_entries: int = SearchConstants.RESULTS_CACHE_MAX_ENTRIES):
         """
         Initialize search cache.
 
         Args:
             results_ttl: TTL for search results in seconds (default: 5 minutes)
             external_ttl: TTL for external API results in seconds (default: 1 hour)
+            max_entries: Maximum number of cached search result pages
         """
-        # Layer 1: Search results (5 min TTL)
-        self.results_cache: Dict[str, tuple[SearchResults, float]] = {}
+        # Layer 1: Search results (5 min TTL, LRU bounded)
+        # key -> (results, expires_at, estimated size in bytes)
+        self.results_cache: OrderedDict[str, Tuple[SearchResults, float, int]] = OrderedDict()
         self.results_ttl = results_ttl
+        self.max_entries = max_entries
+
+        # Reverse indexes for targeted invalidation
+        self._keys_by_item: Dict[Tuple[str, str], Set[str]] = {}
+        self._keys_by_source: Dict[str, Set[str]] = {}
 
         # Layer 2: External API responses (1 hour TTL)
         self.external_cache: Dict[str, tuple[List[SearchResult], float]] = {}
@@ -44,47 +89,154 @@ class SearchCache:
         # Layer 3: Metadata cache (no TTL, invalidate on update)
         self.metadata_cache: Dict[str, Dict] = {}
 
+        self.memory_bytes = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
     def get_search_results(self, cache_key: str) -> Optional[SearchResults]:
         """Get cached search results."""
-        if cache_key in self.results_cache:
-            results, timestamp = self.results_cache[cache_key]
-            if time.time() - timestamp < self.results_ttl:
+        entry = self.results_cache.get(cache_key)
+        if entry is not None:
+            results, expires_at, _ = entry
+            if time.time() < expires_at:
+                self.results_cache.move_to_end(cache_key)
+                self.stats["hits"] += 1
+                SEARCH_CACHE_REQUESTS.labels(result='hit').inc()
                 # Mark as cached
                 results.cached = True
                 return results
-            else:
-                del self.results_cache[cache_key]
+            self._remove(cache_key, 'expired')
+
+        self.stats["misses"] += 1
+        SEARCH_CACHE_REQUESTS.labels(result='miss').inc()
         return None
 
     def set_search_results(self, cache_key: str, results: SearchResults) -> None:
-        """Cache search results."""
-        self.results_cache[cache_key] = (results, time.time())
+        """Cache search results, evicting least-recently-used pages if full."""
+        if cache_key in self.results_cache:
+            self._remove(cache_key, None)
+
+        size = len(results.model_dump_json())
+        self.results_cache[cache_key] = (results, time.time() + self.results_ttl, size)
+        self.memory_bytes += size
+
+        for group in results.groups:
+            for result in group.results:
+                self._keys_by_item.setdefault((group.source.value, result.id), set()).add(cache_key)
+        for source in results.sources_searched:
+            self._keys_by_source.setdefault(source.value, set()).add(cache_key)
+
+        while len(self.results_cache) > self.max_entries:
+            oldest_key = next(iter(self.results_cache))
+            self._remove(oldest_key, 'lru')
+
+        self._update_gauges()
 
     def invalidate_file(self, file_id: str) -> None:
-        """Invalidate caches when file is updated/deleted."""
-        # Clear results cache (contains this file)
-        self.results_cache.clear()
+        """Invalidate cached pages containing a file that was updated/deleted."""
+        self._invalidate(self._keys_by_item.get((SearchSource.LOCAL_FILES.value, file_id)))
 
         # Clear metadata cache for this file
-        if file_id in self.metadata_cache:
-            del self.metadata_cache[file_id]
+        self.metadata_cache.pop(file_id, None)
 
     def invalidate_idea(self, idea_id: str) -> None:
-        """Invalidate caches when idea is updated/deleted."""
-        # Clear results cache
-        self.results_cache.clear()
+        """Invalidate cached pages containing an idea that was updated/deleted."""
+        self._invalidate(self._keys_by_item.get((SearchSource.IDEAS.value, idea_id)))
+
+    def invalidate_source(self, source: SearchSource) -> None:
+        """
+        Invalidate every cached page that searched ``source``.
+
+        Used when a write may add results to queries that did not contain
+        them before (new items, changed metadata matching other filters).
+        """
+        self._invalidate(self._keys_by_source.get(source.value))
 
     def clear_all(self) -> None:
         """Clear all caches."""
         self.results_cache.clear()
+        self._keys_by_item.clear()
+        self._keys_by_source.clear()
         self.external_cache.clear()
         self.metadata_cache.clear()
+        self.memory_bytes = 0
+        self._update_gauges()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters for debugging."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self.results_cache),
+            "max_entries": self.max_entries,
+            "memory_bytes": self.memory_bytes,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+        }
+
+    def _invalidate(self, keys: Optional[Set[str]]) -> None:
+        """Drop the given cache keys."""
+        if not keys:
+            return
+        for cache_key in list(keys):
+            self._remove(cache_key, 'invalidated')
+        self._update_gauges()
+
+    def _remove(self, cache_key: str, reason: Optional[str]) -> None:
+        """Remove one results entry and its reverse-index references."""
+        entry = self.results_cache.pop(cache_key, None)
+        if entry is None:
+            return
+        results, _, size = entry
+        self.memory_bytes -= size
+
+        for group in results.groups:
+            for result in group.results:
+                self._discard_key(self._keys_by_item, (group.source.value, result.id), cache_key)
+        for source in results.sources_searched:
+            self._discard_key(self._keys_by_source, source.value, cache_key)
+
+        if reason is not None:
+            stat = {'lru': 'evictions', 'expired': 'expirations', 'invalidated': 'invalidations'}[reason]
+            self.stats[stat] += 1
+            SEARCH_CACHE_EVICTIONS.labels(reason=reason).inc()
+
+    @staticmethod
+    def _discard_key(index: Dict[Any, Set[str]], index_key: Any, cache_key: str) -> None:
+        """Remove ``cache_key`` from a reverse index bucket, dropping empty buckets."""
+        keys = index.get(index_key)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del index[index_key]
+
+    def _update_gauges(self) -> None:
+        """Publish entry count and memory estimate."""
+        SEARCH_CACHE_ENTRIES.set(len(self.results_cache))
+        SEARCH_CACHE_BYTES.set(self.memory_bytes)
 
 
 class SearchService:
     """Service for unified cross-site search."""
 
-    def __init__(self, database: Database, file_service=None, idea_service=None):
+    # Write events that only affect cached pages containing the item
+    FILE_REMOVED_EVENTS = ("file_deleted", "library_file_deleted")
+    IDEA_REMOVED_EVENTS = ("idea_deleted",)
+
+    # Write events that may add an item to queries it did not match before
+    FILE_CHANGED_EVENTS = (
+        "library_file_added", "library_file_updated", "file_metadata_extracted",
+        "file_download_complete", "file_upload_complete", "files_discovered",
+        "file_sync_complete", "files_cleaned_up",
+    )
+    IDEA_CHANGED_EVENTS = ("idea_created", "idea_updated", "idea_created_from_trending")
+
+    def __init__(self, database: Database, file_service=None, idea_service=None,
+                 event_service=None):
         """
         Initialize search service.
 
@@ -92,16 +244,52 @@ class SearchService:
             database: Database instance
             file_service: FileService instance (optional)
             idea_service: IdeaService instance (optional)
+            event_service: EventService whose file/library/idea write events
+                invalidate the result cache (optional)
         """
         self.database = database
         # Initialize repositories for domain-specific operations
-        self.file_repo = FileRepository(database._connection)
-        self.library_repo = LibraryRepository(database._connection)
-        self.idea_repo = IdeaRepository(database._connection)
+        self.file_repo = FileRepository.from_database(database)
+        self.library_repo = LibraryRepository.from_database(database)
+        self.idea_repo = IdeaRepository.from_database(database)
         self.file_service = file_service
         self.idea_service = idea_service
         self.cache = SearchCache()
 
+        if event_service:
+            for event_type in self.FILE_REMOVED_EVENTS:
+                event_service.subscribe(event_type, self._on_file_removed)
+            for event_type in self.IDEA_REMOVED_EVENTS:
+                event_service.subscribe(event_type, self._on_idea_removed)
+            for event_type in self.FILE_CHANGED_EVENTS:
+                event_service.subscribe(event_type, self._on_files_changed)
+            for event_type in self.IDEA_CHANGED_EVENTS:
+                event_service.subscribe(event_type, self._on_ideas_changed)
+
+    def _on_file_removed(self, data: Dict[str, Any]) -> None:
+        """Drop cached pages containing a deleted file."""
+        file_id = data.get('file_id')
+        if file_id:
+            self.cache.invalidate_file(file_id)
+        else:
+            self.cache.invalidate_source(SearchSource.LOCAL_FILES)
+
+    def _on_idea_removed(self, data: Dict[str, Any]) -> None:
+        """Drop cached pages containing a deleted idea."""
+        idea_id = data.get('idea_id')
+        if idea_id:
+            self.cache.invalidate_idea(idea_id)
+        else:
+            self.cache.invalidate_source(SearchSource.IDEAS)
+
+    def _on_files_changed(self, data: Dict[str, Any]) -> None:
+        """Drop cached pages that searched local files."""
+        self.cache.invalidate_source(SearchSource.LOCAL_FILES)
+
+    def _on_ideas_changed(self, data: Dict[str, Any]) -> None:
+        """Drop cached pages that searched ideas."""
+        self.cache.invalidate_source(SearchSource.IDEAS)
+
     async def unified_search(
         self,
         query: str,
@@ -141,24 +329,29 @@ class SearchService:
         for source in sources:
             try:
                 if source == SearchSource.LOCAL_FILES:
-                    results = await self._search_local_files(query, filters, limit)
-                    if results:
-                        groups.append(SearchResultGroup(
-                            source=source,
-                            results=results[:limit],
-                            total_count=len(results),
-                            has_more=len(results) > limit
-                        ))
-
+                    results = await self._search_local_files(query, filters, limit, page)
                 elif source == SearchSource.IDEAS:
-                    results = await self._search_ideas(query, filters, limit)
-                    if results:
-                        groups.append(SearchResultGroup(
-                            source=source,
-                            results=results[:limit],
-                            total_count=len(results),
-                            has_more=len(results) > limit
-                        ))
+                    results = await self._search_ideas(query, filters, limit, page)
+                else:
+                    continue
+
+                if results:
+                    # Searchers return up to limit + 1 results; the extra one
+                    # only signals that another page exists
+                    offset = (page - 1) * limit
+                    page_results = results[:limit]
+                    has_more = len(results) > limit
+                    if has_more:
+                        total_count = await self._count_hits(source, query, filters)
+                    else:
+                        # Last page: the total is known without counting
+                        total_count = offset + len(page_results)
+                    groups.append(SearchResultGroup(
+                        source=source,
+                        results=page_results,
+                        total_count=total_count,
+                        has_more=has_more
+                    ))
 
             except Exception as e:
                 logger.error("Search failed for source", source=source, error=str(e))
@@ -198,45 +391,21 @@ class SearchService:
         self,
         query: str,
         filters: SearchFilters,
-        limit: int = 50
+        limit: int = 50,
+        page: int = 1
     ) -> List[SearchResult]:
-        """Search local files using FTS5."""
-        try:
-            # Use FTS5 for full-text search
-            fts_results = await self.database.search_files_fts(query, limit * 2)  # Get more for filtering
-
-            if not fts_results:
-                return []
-
-            # Get full file data
-            file_ids = [r['file_id'] for r in fts_results]
-            files = []
-
-            for file_id in file_ids:
-                # Get file from database
-                file_data = await self.file_repo.get(file_id)
-                if file_data:
-                    files.append(dict(file_data))
-
-                # Also try library
-                if not file_data:
-                    file_data = await self.library_repo.get_file(file_id)
-                    if file_data:
-                        files.append(dict(file_data))
-
-            # Convert to SearchResult objects
-            search_results = []
-            for file_data in files:
-                result = self._file_to_search_result(file_data, query)
-                search_results.append(result)
-
-            # Apply filters
-            filtered_results = self._apply_filters(search_results, filters)
-
-            # Sort by relevance score
-            filtered_results.sort(key=lambda x: x.relevance_score, reverse=True)
+        """
+        Search local files using FTS5.
 
-            return filtered_results
+        Returns up to ``limit + 1`` results for the requested page, so the
+        caller can tell whether another page exists.
+        """
+        try:
+            return await self._fetch_search_page(
+                self.database.search_files_fts_hydrated,
+                self._file_to_search_result,
+                query, filters, limit, page
+            )
 
         except Exception as e:
             logger.error("Local file search failed", error=str(e), query=query)
@@ -246,42 +415,83 @@ class SearchService:
         self,
         query: str,
         filters: SearchFilters,
-        limit: int = 50
+        limit: int = 50,
+        page: int = 1
     ) -> List[SearchResult]:
-        """Search ideas using FTS5."""
-        try:
-            # Use FTS5 for full-text search
-            fts_results = await self.database.search_ideas_fts(query, limit * 2)
-
-            if not fts_results:
-                return []
+        """
+        Search ideas using FTS5.
 
-            # Get full idea data
-            idea_ids = [r['idea_id'] for r in fts_results]
-            ideas = []
+        Returns up to ``limit + 1`` results for the requested page, so the
+        caller can tell whether another page exists.
+        """
+        try:
+            return await self._fetch_search_page(
+                self.database.search_ideas_fts_hydrated,
+                self._idea_to_search_result,
+                query, filters, limit, page
+            )
 
-            for idea_id in idea_ids:
-                idea_data = await self.idea_repo.get(idea_id)
-                if idea_data:
-                    ideas.append(dict(idea_data))
+        except Exception as e:
+            logger.error("Idea search failed", error=str(e), query=query)
+            return []
 
-            # Convert to SearchResult objects
-            search_results = []
-            for idea_data in ideas:
-                result = self._idea_to_search_result(idea_data, query)
-                search_results.append(result)
+    async def _count_hits(self, source: SearchSource, query: str, filters: SearchFilters) -> int:
+        """Total FTS hits of a source, with the same filters as its result pages."""
+        if source == SearchSource.LOCAL_FILES:
+            count = self.database.count_files_fts_hydrated
+        else:
+            count = self.database.count_ideas_fts_hydrated
+        return await count(query, filters.dict(exclude_none=True))
 
-            # Apply filters
-            filtered_results = self._apply_filters(search_results, filters)
+    async def _fetch_search_page(
+        self,
+        fetch: Callable[..., Awaitable[List[Dict[str, Any]]]],
+        convert: Callable[[Dict[str, Any], str], SearchResult],
+        query: str,
+        filters: SearchFilters,
+        limit: int,
+        page: int
+    ) -> List[SearchResult]:
+        """
+        Fetch one page of hydrated FTS hits and convert them to results.
 
-            # Sort by relevance score
-            filtered_results.sort(key=lambda x: x.relevance_score, reverse=True)
+        Filtering and paging both happen in SQL, so only the rows of the
+        requested page (plus one look-ahead row) are loaded.
 
-            return filtered_results
+        Args:
+            fetch: Hydrated FTS query taking ``(query, limit, offset, filters)``
+            convert: Row to SearchResult converter
+            query: Search query string
+            filters: Advanced filters
+            limit: Results per page
+            page: Page number (1-based)
 
-        except Exception as e:
-            logger.error("Idea search failed", error=str(e), query=query)
-            return []
+        Returns:
+            Up to ``limit`` results sorted by relevance score, followed by the
+            look-ahead result if another page exists
+        """
+        offset = (max(page, 1) - 1) * limit
+        rows = await fetch(query, limit + 1, offset, filters.dict(exclude_none=True))
+        results = [convert(self._normalize_row(row), query) for row in rows]
+
+        # Pages are cut in FTS rank order, so the look-ahead row belongs to
+        # the next page and must not take part in this page's sort
+        page_results, look_ahead = results[:limit], results[limit:]
+        # The stable sort keeps rank order among results with equal relevance
+        page_results.sort(key=lambda x: x.relevance_score, reverse=True)
+        return page_results + look_ahead
+
+    @staticmethod
+    def _normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Bring a hydrated FTS row into the shape the repositories return."""
+        file_type = row.get('file_type')
+        if isinstance(file_type, str) and file_type.startswith('.'):
+            row['file_type'] = file_type.lstrip('.')
+        if 'tags' in row and not row['tags']:
+            row['tags'] = []
+        if row.get('metadata') is None:
+            row['metadata'] = {}
+        return row
 
     def _file_to_search_result(self, file_data: Dict[str, Any], query: str) -> SearchResult:
         """Convert file data to SearchResult."""
@@ -450,257 +660,6 @@ class SearchService:
 
         return min(100.0, score)  # Cap at 100
 
-    def _apply_filters(
-        self,
-        results: List[SearchResult],
-        filters: SearchFilters
-    ) -> List[SearchResult]:
-        """
-        Apply advanced filters to search results.
-
-        This function implements a sequential filtering pipeline that progressively
-        narrows down search results. Each filter is applied in order, with each step
-        reducing the result set further.
-
-        Complexity: F-41 (Cyclomatic Complexity)
-        - 10+ different filter types
-        - Multiple conditional branches
-        - Nested helper method calls
-        - Null-safe metadata checking
-
-        Design Rationale:
-            Sequential filtering (not parallel) because:
-            1. Early filters reduce data set for later filters (performance)
-            2. Short-circuit evaluation stops processing eliminated results
-            3. Simpler to debug and test than complex boolean expressions
-            4. Order matters: cheap filters first, expensive filters last
-
-        Performance Characteristics:
-            - Worst case: O(n * m) where n=results, m=filters
-            - Best case: O(n) if early filters eliminate most results
-            - Average: O(n * 3-5) as most searches use 3-5 filters
-            - Memory: O(n) for intermediate filtered lists
-
-        Filter Application Order (optimized for performance):
-            1. File type (fast dict lookup)
-            2. Business flag (fast boolean check)
-            3. Date range (fast datetime comparison)
-            4. Idea status (fast enum check)
-            5. Print time range (numeric comparison)
-            6. Cost range (numeric comparison)
-            7. Material types (list iteration)
-            8. Dimensions (nested property access)
-
-        Args:
-            results: Search results from initial query (pre-filtered by search terms)
-            filters: Filter criteria from user's advanced search options
-
-        Returns:
-            Filtered list of SearchResult objects matching ALL filter criteria
-
-        Example:
-            >>> results = [result1, result2, result3]  # 100 results
-            >>> filters = SearchFilters(file_types=['3mf'], min_cost=5.0)
-            >>> filtered = self._apply_filters(results, filters)
-            >>> len(filtered)  # 23 results after filtering
-            23
-        """
-        # Start with all results, progressively narrow down
-        filtered = results
-
-        # ==================== FILE TYPE FILTER ====================
-        # Filter by file extension (.3mf, .stl, .gcode, etc.)
-        # Fastest filter - simple dict lookup, should be first
-        # Typical reduction: 30-50% (e.g., exclude .gcode files)
-        if filters.file_types:
-            filtered = [
-                r for r in filtered
-                if r.metadata and r.metadata.get('file_type') in filters.file_types
-            ]
-
-        # ==================== DIMENSION FILTERS ====================
-        # Filter by physical model dimensions (width, height, depth)
-        # Used to find models that fit specific printer build volumes
-        # Example: "Models that fit on Bambu A1 (256x256x256mm)"
-
-        # Width filter: X-axis dimension in millimeters
-        # Common use: Exclude models wider than printer bed
-        if filters.min_width or filters.max_width:
-            filtered = [
-                r for r in filtered
-                if self._check_dimension_filter(
-                    r.metadata, 'width', filters.min_width, filters.max_width
-                )
-            ]
-
-        # Height filter: Z-axis dimension in millimeters
-        # Common use: Exclude tall models that exceed printer height
-        # Note: Height is most common limiting factor for consumer printers
-        if filters.min_height or filters.max_height:
-            filtered = [
-                r for r in filtered
-                if self._check_dimension_filter(
-                    r.metadata, 'height', filters.min_height, filters.max_height
-                )
-            ]
-
-        # ==================== MATERIAL TYPE FILTER ====================
-        # Filter by filament material types (PLA, PETG, ABS, TPU, etc.)
-        # Allows users to find models compatible with materials they have in stock
-        # Supports multi-material models: match if ANY material matches filter
-        # Example: Filter for "PLA" matches models using ["PLA"], ["PLA", "PETG"], etc.
-        if filters.material_types:
-            filtered = [
-                r for r in filtered
-                if self._check_material_filter(r.metadata, filters.material_types)
-            ]
-
-        # ==================== PRINT TIME FILTER ====================
-        # Filter by estimated print time in minutes
-        # Helps users find quick prints vs long prints
-        # Common ranges:
-        #   - Quick prints: < 60 minutes
-        #   - Medium prints: 60-240 minutes (1-4 hours)
-        #   - Long prints: > 240 minutes (4+ hours)
-        #   - Overnight: > 480 minutes (8+ hours)
-        if filters.min_print_time or filters.max_print_time:
-            filtered = [
-                r for r in filtered
-                if self._check_range_filter(
-                    r.print_time_minutes,
-                    filters.min_print_time,
-                    filters.max_print_time
-                )
-            ]
-
-        # ==================== COST FILTER ====================
-        # Filter by estimated material cost in EUR
-        # Cost calculated from: filament_weight * material_cost_per_kg
-        # Helps users find budget-friendly models or track expenses
-        # Typical ranges:
-        #   - Budget: < 1 EUR (small prints)
-        #   - Medium: 1-5 EUR (standard models)
-        #   - Expensive: > 5 EUR (large/complex models)
-        if filters.min_cost or filters.max_cost:
-            filtered = [
-                r for r in filtered
-                if self._check_range_filter(
-                    r.cost_eur,
-                    filters.min_cost,
-                    filters.max_cost
-                )
-            ]
-
-        # ==================== BUSINESS FILTER ====================
-        # Filter for business orders vs personal/hobby prints
-        # Critical for users running 3D printing businesses
-        # Enables separate tracking of:
-        #   - Business prints: customer orders, paid jobs
-        #   - Personal prints: prototypes, samples, hobby projects
-        # Used for tax reporting and business analytics
-        if filters.is_business is not None:
-            filtered = [
-                r for r in filtered
-                if r.metadata and r.metadata.get('is_business') == filters.is_business
-            ]
-
-        # ==================== IDEA STATUS FILTER ====================
-        # Filter ideas by workflow status (considering, in_progress, printed, rejected)
-        # Only applies to ResultType.IDEA entries (not files or jobs)
-        # Enables workflow management: "Show me all models I'm considering printing"
-        # Status transitions: considering → in_progress → printed
-        #                    considering → rejected
-        if filters.idea_status:
-            filtered = [
-                r for r in filtered
-                if r.result_type == ResultType.IDEA and
-                r.metadata and r.metadata.get('status') in filters.idea_status
-            ]
-
-        # ==================== DATE RANGE FILTERS ====================
-        # Filter by creation/import date
-        # Common use cases:
-        #   - "Models added this week"
-        #   - "Jobs from last month"
-        #   - "Ideas created in Q1 2025"
-        # Performance: Fast datetime comparison, typically eliminates 60-80% of results
-
-        # Created after: Find recent additions
-        # Example: created_after=datetime(2025, 1, 1) → only 2025 entries
-        if filters.created_after:
-            filtered = [
-                r for r in filtered
-                if r.created_at and r.created_at >= filters.created_after
-            ]
-
-        # Created before: Find historical entries
-        # Example: created_before=datetime(2024, 12, 31) → only 2024 and earlier
-        if filters.created_before:
-            filtered = [
-                r for r in filtered
-                if r.created_at and r.created_at <= filters.created_before
-            ]
-
-        return filtered
-
-    def _check_dimension_filter(
-        self,
-        metadata: Optional[Dict[str, Any]],
-        dimension: str,
-        min_val: Optional[float],
-        max_val: Optional[float]
-    ) -> bool:
-        """Check if dimension is within filter range."""
-        if not metadata:
-            return False
-
-        physical_props = metadata.get('physical_properties', {})
-        value = physical_props.get(dimension)
-
-        if value is None:
-            return False
-
-        if min_val is not None and value < min_val:
-            return False
-        if max_val is not None and value > max_val:
-            return False
-
-        return True
-
-    def _check_material_filter(
-        self,
-        metadata: Optional[Dict[str, Any]],
-        material_types: List[str]
-    ) -> bool:
-        """Check if material matches filter."""
-        if not metadata:
-            return False
-
-        material_reqs = metadata.get('material_requirements', {})
-        file_materials = material_reqs.get('material_types', [])
-
-        if not file_materials:
-            return False
-
-        return any(mat in file_materials for mat in material_types)
-
-    def _check_range_filter(
-        self,
-        value: Optional[float],
-        min_val: Optional[float],
-        max_val: Optional[float]
-    ) -> bool:
-        """Check if value is within range."""
-        if value is None:
-            return False
-
-        if min_val is not None and value < min_val:
-            return False
-        if max_val is not None and value > max_val:
-            return False
-
-        return True
-
     def _generate_cache_key(
         self,
         query: str,
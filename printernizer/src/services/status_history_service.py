@@ -0,0 +1,347 @@
+"""
+Printer status history service for Printernizer.
+
+Records bed/nozzle temperature and progress samples from printer status
+updates into the columnar status series store (see
+src/database/timeseries.py) and answers range queries for charts.
+
+Lifecycle of a printer's samples:
+    1. Samples are appended to an in-memory raw chunk for the current hour,
+       which is written (write-behind, one upsert per chunk) every
+       FLUSH_INTERVAL_SECONDS.
+    2. When the hour is over the chunk is sealed: written a last time and
+       averaged into the 1-minute and 15-minute tiers.
+    3. Maintenance prunes raw chunks after 24 hours and 1-minute chunks
+       after 30 days, and seals raw chunks left unsealed by a restart.
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import structlog
+
+from src.constants import StatusHistoryConstants
+from src.database.database import Database
+from src.database.repositories import StatusSeriesRepository
+from src.database.timeseries import (
+    DOWNSAMPLED_TIERS, MINUTE_TIER, QUARTER_HOUR_TIER, RAW_TIER, SERIES_FIELDS, TIERS,
+    SeriesChunk, SeriesTier,
+)
+
+logger = structlog.get_logger()
+
+RESOLUTIONS = ('auto', *TIERS)
+
+
+class StatusHistoryService:
+    """
+    Time-series history of printer temperatures and progress.
+
+    Example:
+        >>> history = StatusHistoryService(database)
+        >>> await history.start()
+        >>> await history.record("bambu_001", datetime.now(), 60.1, 219.5, 42)
+        >>> series = await history.get_series("bambu_001", start, end)
+        >>> series["temperature_nozzle"][-1]
+        219.5
+    """
+
+    def __init__(self, database: Database,
+                 sample_interval: int = StatusHistoryConstants.SAMPLE_MIN_INTERVAL_SECONDS):
+        """
+        Initialize the status history service.
+
+        Args:
+            database: Database instance
+            sample_interval: Minimum spacing between raw samples per printer
+        """
+        self.repository = StatusSeriesRepository.from_database(database)
+        self.sample_interval = sample_interval
+
+        # printer_id -> raw chunk of the current hour
+        self._open: Dict[str, SeriesChunk] = {}
+        self._chunk_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._running = False
+        self._last_maintenance = 0.0
+        self.stats = {
+            "samples": 0,
+            "samples_skipped": 0,
+            "chunks_written": 0,
+            "chunks_sealed": 0,
+            "chunks_pruned": 0,
+        }
+
+    async def start(self) -> None:
+        """Recover unsealed chunks, prune expired ones and start the flush loop."""
+        if self._running:
+            logger.warning("Status history service already running")
+            return
+        self._running = True
+        try:
+            await self.run_maintenance()
+        except Exception as e:
+            logger.error("Status history maintenance failed", error=str(e))
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info("Status history service started")
+
+    async def shutdown(self) -> None:
+        """Stop the flush loop and write all open chunks."""
+        self._running = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error("Failed to flush status history", error=str(e))
+        logger.info("Status history service stopped")
+
+    async def record(self, printer_id: str, timestamp: datetime,
+                     temperature_bed: Optional[float], temperature_nozzle: Optional[float],
+                     progress: Optional[float]) -> bool:
+        """
+        Record one status sample.
+
+        Samples closer than ``sample_interval`` to the previous one, older
+        than it, or without any value (offline printers) are skipped.
+
+        Args:
+            printer_id: Printer identifier
+            timestamp: Time of the status update
+            temperature_bed: Bed temperature in Celsius
+            temperature_nozzle: Nozzle temperature in Celsius
+            progress: Print progress in percent
+
+        Returns:
+            True if the sample was stored
+        """
+        values = (temperature_bed, temperature_nozzle, progress)
+        if all(value is None for value in values):
+            return False
+        ts = int(timestamp.timestamp())
+        chunk = self._open.get(printer_id)
+        if chunk is not None and chunk.timestamps and ts - chunk.timestamps[-1] < self.sample_interval:
+            self.stats["samples_skipped"] += 1
+            return False
+
+        chunk_start = RAW_TIER.chunk_start(ts)
+        if chunk is None or chunk.chunk_start != chunk_start:
+            chunk = await self._open_chunk(printer_id, chunk_start)
+            if chunk is None:
+                self.stats["samples_skipped"] += 1
+                return False
+
+        if not chunk.append(ts, values):
+            self.stats["samples_skipped"] += 1
+            return False
+        self.stats["samples"] += 1
+        return True
+
+    async def _open_chunk(self, printer_id: str, chunk_start: int) -> Optional[SeriesChunk]:
+        """Switch a printer to the raw chunk starting at ``chunk_start``."""
+        async with self._chunk_lock:
+            current = self._open.get(printer_id)
+            if current is not None:
+                if current.chunk_start == chunk_start:
+                    return current
+                if current.chunk_start > chunk_start:
+                    # Late sample from an hour that is already closed
+                    return None
+                self._open.pop(printer_id)
+                await self._seal(current)
+
+            # Continue an hour already partially stored (restart mid-hour)
+            chunk = await self.repository.get_chunk(printer_id, RAW_TIER, chunk_start)
+            if chunk is None:
+                chunk = SeriesChunk.empty(printer_id, RAW_TIER, chunk_start)
+            self._open[printer_id] = chunk
+            return chunk
+
+    async def _seal(self, chunk: SeriesChunk) -> None:
+        """Write a finished raw chunk and average it into the downsampled tiers."""
+        if not chunk.timestamps:
+            return
+        chunk.sealed = True
+        await self.repository.save_chunk(chunk)
+        self.stats["chunks_written"] += 1
+
+        for tier in DOWNSAMPLED_TIERS:
+            timestamps, columns = chunk.downsample(tier)
+            # A raw chunk (one hour) always lies within one downsampled chunk
+            target_start = tier.chunk_start(chunk.chunk_start)
+            target = (await self.repository.get_chunk(chunk.printer_id, tier, target_start)
+                      or SeriesChunk.empty(chunk.printer_id, tier, target_start))
+            target.merge(timestamps, columns)
+            await self.repository.save_chunk(target)
+            self.stats["chunks_written"] += 1
+
+        self.stats["chunks_sealed"] += 1
+        logger.debug("Sealed status history chunk", printer_id=chunk.printer_id,
+                     chunk_start=chunk.chunk_start, samples=len(chunk.timestamps))
+
+    async def flush(self, now: Optional[float] = None) -> None:
+        """
+        Write open chunks with new samples and seal chunks whose hour is over.
+
+        Args:
+            now: Current epoch time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        async with self._chunk_lock:
+            for printer_id, chunk in list(self._open.items()):
+                if chunk.chunk_end <= now:
+                    # Printer went quiet; nothing else will close its hour
+                    self._open.pop(printer_id)
+                    await self._seal(chunk)
+                elif chunk.dirty:
+                    await self.repository.save_chunk(chunk)
+                    self.stats["chunks_written"] += 1
+        await self.repository.flush()
+
+    async def run_maintenance(self, now: Optional[float] = None) -> None:
+        """
+        Seal raw chunks left unsealed by a restart and prune expired tiers.
+
+        Args:
+            now: Current epoch time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        self._last_maintenance = now
+        async with self._chunk_lock:
+            open_keys = {(chunk.printer_id, chunk.chunk_start) for chunk in self._open.values()}
+            for chunk in await self.repository.get_unsealed_raw_chunks(before=int(now)):
+                if (chunk.printer_id, chunk.chunk_start) not in open_keys:
+                    await self._seal(chunk)
+
+        for tier in (RAW_TIER, MINUTE_TIER):
+            self.stats["chunks_pruned"] += await self.repository.prune(
+                tier, before=int(now) - tier.retention_seconds
+            )
+
+    async def _flush_loop(self) -> None:
+        """Background task: periodic flush and hourly maintenance."""
+        while self._running:
+            try:
+                await asyncio.sleep(StatusHistoryConstants.FLUSH_INTERVAL_SECONDS)
+                await self.flush()
+                if time.time() - self._last_maintenance >= StatusHistoryConstants.MAINTENANCE_INTERVAL_SECONDS:
+                    await self.run_maintenance()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Error in status history flush loop", error=str(e))
+
+    def pick_tier(self, start: int, end: int, resolution: str = 'auto',
+                  now: Optional[float] = None) -> SeriesTier:
+        """
+        Choose the tier that answers a range query.
+
+        ``auto`` uses raw samples for short recent ranges, 1-minute averages
+        for ranges up to a week within the last 30 days and 15-minute
+        averages otherwise.
+
+        Raises:
+            ValueError: If resolution is unknown
+        """
+        if resolution != 'auto':
+            if resolution not in TIERS:
+                raise ValueError(f"Unknown resolution {resolution!r}; use one of {', '.join(RESOLUTIONS)}")
+            return TIERS[resolution]
+        now = time.time() if now is None else now
+        span = end - start
+        if span <= StatusHistoryConstants.AUTO_RAW_MAX_SPAN_SECONDS and start >= now - RAW_TIER.retention_seconds:
+            return RAW_TIER
+        if span <= StatusHistoryConstants.AUTO_MINUTE_MAX_SPAN_SECONDS and start >= now - MINUTE_TIER.retention_seconds:
+            return MINUTE_TIER
+        return QUARTER_HOUR_TIER
+
+    async def get_series(self, printer_id: str, start: datetime, end: datetime,
+                         resolution: str = 'auto',
+                         fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Get a printer's status history as parallel arrays.
+
+        Samples of the current hour are included from memory; for averaged
+        tiers they are downsampled on the fly.
+
+        Args:
+            printer_id: Printer identifier
+            start: Range start
+            end: Range end
+            resolution: 'auto', 'raw', '1m' or '15m'
+            fields: Subset of SERIES_FIELDS (default: all)
+
+        Returns:
+            Dict with printer_id, resolution, resolution_seconds, start, end,
+            timestamps (epoch seconds) and one value list per field
+
+        Raises:
+            ValueError: If resolution or a field is unknown
+        """
+        fields = list(fields or SERIES_FIELDS)
+        unknown = [field for field in fields if field not in SERIES_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields {', '.join(unknown)}; use {', '.join(SERIES_FIELDS)}")
+        field_index = [SERIES_FIELDS.index(field) for field in fields]
+
+        start_ts, end_ts = int(start.timestamp()), int(end.timestamp())
+        tier = self.pick_tier(start_ts, end_ts, resolution)
+        chunks = await self.repository.get_chunks(printer_id, tier, start_ts, end_ts)
+
+        open_chunk = self._open.get(printer_id)
+        if open_chunk is not None and (open_chunk.chunk_end <= start_ts or open_chunk.chunk_start > end_ts):
+            open_chunk = None
+
+        timestamps: List[int] = []
+        columns: List[List[Optional[float]]] = [[] for _ in fields]
+
+        def extend(ts: List[int], cols: List[List[Optional[float]]]) -> None:
+            timestamps.extend(ts)
+            for own, new in zip(columns, cols):
+                own.extend(new)
+
+        for chunk in chunks:
+            if open_chunk is not None and tier is RAW_TIER and chunk.chunk_start == open_chunk.chunk_start:
+                continue
+            ts, cols = chunk.slice(start_ts, end_ts, field_index)
+            if open_chunk is not None and tier is not RAW_TIER:
+                # The open hour is not downsampled yet; drop stale points of it
+                keep = [i for i, t in enumerate(ts)
+                        if not open_chunk.chunk_start <= t < open_chunk.chunk_end]
+                if len(keep) != len(ts):
+                    ts = [ts[i] for i in keep]
+                    cols = [[col[i] for i in keep] for col in cols]
+            extend(ts, cols)
+
+        if open_chunk is not None:
+            if tier is RAW_TIER:
+                extend(*open_chunk.slice(start_ts, end_ts, field_index))
+            else:
+                ds_ts, ds_cols = open_chunk.downsample(tier)
+                live = SeriesChunk(printer_id, tier, open_chunk.chunk_start, ds_ts, ds_cols)
+                extend(*live.slice(start_ts, end_ts, field_index))
+            if timestamps and any(a > b for a, b in zip(timestamps, timestamps[1:])):
+                order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+                timestamps = [timestamps[i] for i in order]
+                columns = [[col[i] for i in order] for col in columns]
+
+        series: Dict[str, Any] = {
+            "printer_id": printer_id,
+            "resolution": tier.name,
+            "resolution_seconds": tier.resolution_seconds,
+            "start": start_ts,
+            "end": end_ts,
+            "timestamps": timestamps,
+        }
+        series.update(zip(fields, columns))
+        return series
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recording statistics."""
+        return {**self.stats, "open_chunks": len(self._open)}
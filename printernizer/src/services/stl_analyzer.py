@@ -7,15 +7,13 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import structlog
 
+from src.services.mesh_cache import MESH_CACHE_AVAILABLE, get_mesh_cache
+
 logger = structlog.get_logger()
 
-# Optional import with graceful degradation
-try:
-    import trimesh
-    import numpy as np
-    TRIMESH_AVAILABLE = True
-except ImportError:
-    TRIMESH_AVAILABLE = False
+# Meshes are loaded through the mesh cache, which needs trimesh and numpy
+TRIMESH_AVAILABLE = MESH_CACHE_AVAILABLE
+if not TRIMESH_AVAILABLE:
     logger.warning("Trimesh not available - STL analysis will be limited")
 
 
@@ -26,12 +24,13 @@ class STLAnalyzer:
         """Initialize the STL analyzer."""
         self.supported_extensions = ['.stl']
 
-    async def analyze_file(self, file_path: Path) -> Dict[str, Any]:
+    async def analyze_file(self, file_path: Path, checksum: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze STL file and extract comprehensive geometric metadata.
 
         Args:
             file_path: Path to the STL file
+            checksum: Library checksum, used as the shared mesh cache key
 
         Returns:
             Dictionary containing extracted metadata organized by category
@@ -51,7 +50,7 @@ class STLAnalyzer:
         try:
             # Run analysis in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
-            metadata = await loop.run_in_executor(None, self._analyze_stl_sync, file_path)
+            metadata = await loop.run_in_executor(None, self._analyze_stl_sync, file_path, checksum)
 
             logger.info("Successfully analyzed STL file",
                       file_path=str(file_path),
@@ -68,12 +67,13 @@ class STLAnalyzer:
 
         return metadata
 
-    def _analyze_stl_sync(self, file_path: Path) -> Dict[str, Any]:
+    def _analyze_stl_sync(self, file_path: Path, checksum: Optional[str] = None) -> Dict[str, Any]:
         """
         Synchronous STL analysis (runs in executor).
 
         Args:
             file_path: Path to STL file
+            checksum: Library checksum (mesh cache key)
 
         Returns:
             Metadata dictionary
@@ -86,8 +86,8 @@ class STLAnalyzer:
         }
 
         try:
-            # Load STL mesh
-            mesh = trimesh.load_mesh(str(file_path))
+            # Load STL mesh (parsed once, shared with preview rendering)
+            mesh = get_mesh_cache().get_trimesh(file_path, checksum=checksum)
 
             if mesh.is_empty:
                 logger.warning("Empty mesh in STL file", file_path=str(file_path))
@@ -2,13 +2,14 @@
 3MF File Analyzer for extracting comprehensive metadata from 3MF packages.
 Supports Bambu Lab and PrusaSlicer 3MF files with detailed analysis.
 """
-import json
+import asyncio
 import zipfile
-import xml.etree.ElementTree as ET
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import structlog
 
+from src.services.threemf_reader import ThreeMFPackage, read_3mf
+
 logger = structlog.get_logger()
 
 
@@ -40,22 +41,24 @@ class ThreeMFAnalyzer:
         }
         
         try:
-            with zipfile.ZipFile(file_path, 'r') as zip_file:
-                # Analyze different components of the 3MF package
-                metadata['physical_properties'] = await self._analyze_model_geometry(zip_file)
-                metadata['print_settings'] = await self._analyze_print_settings(zip_file)
-                metadata['material_info'] = await self._analyze_material_usage(zip_file)
-                metadata['compatibility'] = await self._analyze_compatibility(zip_file)
-                
-                # Calculate derived metrics
-                metadata['cost_analysis'] = await self._calculate_costs(metadata)
-                metadata['quality_metrics'] = await self._assess_quality(metadata)
-                
-                metadata['success'] = True
-                logger.info("Successfully analyzed 3MF file", 
-                          file_path=str(file_path),
-                          objects=metadata['physical_properties'].get('object_count', 0))
-                
+            # Read the package once (settings parts only; no geometry or thumbnails)
+            package = await asyncio.to_thread(read_3mf, file_path, geometry=False, thumbnails=False)
+
+            # Analyze different components of the 3MF package
+            metadata['physical_properties'] = await self._analyze_model_geometry(package)
+            metadata['print_settings'] = await self._analyze_print_settings(package)
+            metadata['material_info'] = await self._analyze_material_usage(package)
+            metadata['compatibility'] = await self._analyze_compatibility(package)
+
+            # Calculate derived metrics
+            metadata['cost_analysis'] = await self._calculate_costs(metadata)
+            metadata['quality_metrics'] = await self._assess_quality(metadata)
+
+            metadata['success'] = True
+            logger.info("Successfully analyzed 3MF file",
+                      file_path=str(file_path),
+                      objects=metadata['physical_properties'].get('object_count', 0))
+
         except FileNotFoundError:
             logger.error("3MF file not found", file_path=str(file_path))
             metadata['error'] = f"File not found: {file_path}"
@@ -70,16 +73,14 @@ class ThreeMFAnalyzer:
             
         return metadata
     
-    async def _analyze_model_geometry(self, zip_file: zipfile.ZipFile) -> Dict[str, Any]:
+    async def _analyze_model_geometry(self, package: ThreeMFPackage) -> Dict[str, Any]:
         """Extract physical properties from 3MF model files."""
         geometry = {}
         
         try:
             # Try to parse Bambu Lab plate JSON for object layout
-            if 'Metadata/plate_1.json' in zip_file.namelist():
-                with zip_file.open('Metadata/plate_1.json') as f:
-                    plate_data = json.loads(f.read().decode('utf-8'))
-                    
+            plate_data = package.plates.get(1)
+            if plate_data is not None:
                 # Extract bounding box information
                 if 'bbox_all' in plate_data:
                     bbox = plate_data['bbox_all']
@@ -119,16 +120,14 @@ class ThreeMFAnalyzer:
             
         return geometry
     
-    async def _analyze_print_settings(self, zip_file: zipfile.ZipFile) -> Dict[str, Any]:
+    async def _analyze_print_settings(self, package: ThreeMFPackage) -> Dict[str, Any]:
         """Extract print settings from configuration files."""
         settings = {}
         
         try:
             # Try Bambu Lab process settings
-            if 'Metadata/process_settings_1.config' in zip_file.namelist():
-                with zip_file.open('Metadata/process_settings_1.config') as f:
-                    config_data = json.loads(f.read().decode('utf-8'))
-                    
+            config_data = package.process_settings.get(1)
+            if config_data is not None:
                 # Extract key print parameters with safe defaults
                 settings['layer_height'] = self._safe_extract(config_data, 'layer_height', 0.2)
                 settings['first_layer_height'] = self._safe_extract(config_data, 'first_layer_height', 0.2)
@@ -174,19 +173,14 @@ class ThreeMFAnalyzer:
             
         return settings
     
-    async def _analyze_material_usage(self, zip_file: zipfile.ZipFile) -> Dict[str, Any]:
+    async def _analyze_material_usage(self, package: ThreeMFPackage) -> Dict[str, Any]:
         """Extract material and filament information."""
         material_info = {}
         
         try:
-            # Parse Bambu Lab slice info for material data
-            if 'Metadata/slice_info.config' in zip_file.namelist():
-                with zip_file.open('Metadata/slice_info.config') as f:
-                    slice_content = f.read().decode('utf-8')
-                    
-                # Parse XML content
-                root = ET.fromstring(slice_content)
-                plate = root.find('plate')
+            # Bambu Lab slice info for material data
+            if package.slice_info is not None:
+                plate = package.slice_info.find('plate')
                 
                 if plate is not None:
                     # Extract weight and time predictions
@@ -210,11 +204,9 @@ class ThreeMFAnalyzer:
                             int(slot) for slot in maps if slot.isdigit()
                         ]
             
-            # Parse plate JSON for color information
-            if 'Metadata/plate_1.json' in zip_file.namelist():
-                with zip_file.open('Metadata/plate_1.json') as f:
-                    plate_data = json.loads(f.read().decode('utf-8'))
-                    
+            # Plate JSON for color information
+            plate_data = package.plates.get(1)
+            if plate_data is not None:
                 material_info['filament_colors'] = plate_data.get('filament_colors', [])
                 material_info['filament_ids'] = plate_data.get('filament_ids', [])
                 
@@ -227,16 +219,14 @@ class ThreeMFAnalyzer:
             
         return material_info
     
-    async def _analyze_compatibility(self, zip_file: zipfile.ZipFile) -> Dict[str, Any]:
+    async def _analyze_compatibility(self, package: ThreeMFPackage) -> Dict[str, Any]:
         """Extract compatibility information."""
         compatibility = {}
         
         try:
             # Try to extract printer compatibility from config
-            if 'Metadata/process_settings_1.config' in zip_file.namelist():
-                with zip_file.open('Metadata/process_settings_1.config') as f:
-                    config_data = json.loads(f.read().decode('utf-8'))
-                    
+            config_data = package.process_settings.get(1)
+            if config_data is not None:
                 # Extract compatible printers
                 printers = config_data.get('compatible_printers', [])
                 if isinstance(printers, list):
@@ -0,0 +1,217 @@
+"""
+One-pass 3MF package reader.
+
+A 3MF file is a ZIP archive. Thumbnails, plate layouts, slicer settings and
+the model geometry used to be read by three services, each reopening the
+archive and parsing the parts it needed (the model XML into a full element
+tree). ``read_3mf`` walks the archive's central directory once and returns a
+``ThreeMFPackage`` with everything the ThreeMFAnalyzer, BambuParser and the
+mesh cache use:
+
+    Metadata/*.png                      thumbnails
+    Metadata/plate_N.json               plate layouts (Bambu)
+    Metadata/process_settings_N.config  slicer process settings (Bambu, JSON)
+    Metadata/slice_info.config          slice results (Bambu, XML)
+    Metadata/*.xml                      extra metadata parts
+    3D/*.model, 3D/Objects/*.model      model metadata and mesh geometry
+
+Model parts are stream-parsed with expat callbacks: vertices and triangles go
+straight into flat arrays and no element tree is built, so memory stays
+proportional to the mesh, not to its XML.
+
+Usage:
+    ```python
+    package = read_3mf(path)                       # everything
+    package = read_3mf(path, geometry=False)       # settings only
+    vertices, triangles = package.vertices, package.triangles
+    ```
+"""
+import json
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import structlog
+
+logger = structlog.get_logger()
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+MODEL_PART = '3D/3dmodel.model'
+
+_PLATE_JSON = re.compile(r'^Metadata/plate_(\d+)\.json$')
+_PROCESS_SETTINGS = re.compile(r'^Metadata/process_settings_(\d+)\.config$')
+
+
+def _local_name(tag: str) -> str:
+    """Tag without its XML namespace."""
+    return tag.rpartition('}')[2]
+
+
+class ThreeMFPackage:
+    """Contents of a 3MF archive, read in one pass by ``read_3mf``."""
+
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        self.names: List[str] = []
+        """All member names, in archive order"""
+        self.thumbnails: List[Tuple[str, bytes]] = []
+        """(member name, PNG bytes) of Metadata/*.png"""
+        self.plates: Dict[int, Dict[str, Any]] = {}
+        """Parsed Metadata/plate_N.json by plate number"""
+        self.process_settings: Dict[int, Dict[str, Any]] = {}
+        """Parsed Metadata/process_settings_N.config by plate number"""
+        self.slice_info: Optional[ET.Element] = None
+        """Root of Metadata/slice_info.config"""
+        self.metadata_xml: Dict[str, str] = {}
+        """Text of Metadata/*.xml parts"""
+        self.model_metadata: List[Tuple[str, str]] = []
+        """(name, value) of the <metadata> entries of 3D/3dmodel.model"""
+        self.model_parsed = False
+        """3D/3dmodel.model was present and parsed"""
+        self._vertices = array('d')
+        self._triangles = array('q')
+
+    @property
+    def vertex_count(self) -> int:
+        """Number of vertices over all meshes."""
+        return len(self._vertices) // 3
+
+    @property
+    def vertices(self) -> 'np.ndarray':
+        """Vertices of all meshes as float32 (n, 3), untransformed."""
+        return np.frombuffer(self._vertices, dtype=np.float64).astype(np.float32).reshape(-1, 3)
+
+    @property
+    def triangles(self) -> 'np.ndarray':
+        """Triangles of all meshes as int32 (m, 3), indexing ``vertices``."""
+        return np.frombuffer(self._triangles, dtype=np.int64).astype(np.int32).reshape(-1, 3)
+
+    def bounds(self) -> Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]]:
+        """((min_x, min_y, min_z), (max_x, max_y, max_z)) of all vertices, or None."""
+        if not self._vertices:
+            return None
+        xs, ys, zs = self._vertices[0::3], self._vertices[1::3], self._vertices[2::3]
+        return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+
+    def _parse_model(self, stream, collect_metadata: bool) -> None:
+        """Stream-parse a model part, appending its meshes to the flat arrays."""
+        vertices, triangles = self._vertices, self._triangles
+        model_metadata = self.model_metadata
+        state = {'offset': 0, 'metadata': None}
+        local_names: Dict[str, str] = {}
+
+        # expat callbacks only: no element objects are built for the mesh
+        def start(tag, attrs):
+            name = local_names.get(tag)
+            if name is None:
+                name = local_names[tag] = _local_name(tag)
+            if name == 'vertex':
+                try:
+                    vertices.extend((float(attrs.get('x', 0)), float(attrs.get('y', 0)), float(attrs.get('z', 0))))
+                except (ValueError, TypeError):
+                    pass
+            elif name == 'triangle':
+                offset = state['offset']
+                try:
+                    triangles.extend((int(attrs['v1']) + offset, int(attrs['v2']) + offset,
+                                      int(attrs['v3']) + offset))
+                except (KeyError, ValueError, TypeError):
+                    pass
+            elif name == 'mesh':
+                state['offset'] = len(vertices) // 3
+            elif collect_metadata and 'metadata' in name.lower():
+                state['metadata'] = (attrs.get('name', ''), attrs.get('value', ''), [])
+
+        def end(tag):
+            entry = state['metadata']
+            if entry is not None and 'metadata' in _local_name(tag).lower():
+                entry_name, value, text = entry
+                value = ''.join(text) or value
+                if entry_name and value:
+                    model_metadata.append((entry_name, value))
+                state['metadata'] = None
+
+        def characters(data):
+            if state['metadata'] is not None:
+                state['metadata'][2].append(data)
+
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        if collect_metadata:
+            parser.EndElementHandler = end
+            parser.CharacterDataHandler = characters
+        parser.ParseFile(stream)
+
+
+def read_3mf(file_path: Union[str, Path], geometry: bool = True, thumbnails: bool = True) -> ThreeMFPackage:
+    """
+    Read a 3MF archive in one pass over its members.
+
+    Unreadable parts are logged and skipped; the rest of the package is
+    still returned.
+
+    Args:
+        file_path: Path to the 3MF file
+        geometry: Parse the model parts (metadata and meshes)
+        thumbnails: Read the embedded PNG thumbnails
+
+    Returns:
+        The package contents
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        zipfile.BadZipFile: If it is not a ZIP archive
+    """
+    package = ThreeMFPackage(Path(file_path))
+    with zipfile.ZipFile(file_path, 'r') as zip_file:
+        for info in zip_file.infolist():
+            name = info.filename
+            package.names.append(name)
+            if info.is_dir():
+                continue
+            try:
+                if name.startswith('Metadata/'):
+                    _read_metadata_part(zip_file, info, package, thumbnails)
+                elif geometry and name.startswith('3D/') and name.endswith('.model'):
+                    with zip_file.open(info) as stream:
+                        package._parse_model(stream, collect_metadata=(name == MODEL_PART))
+                    if name == MODEL_PART:
+                        package.model_parsed = True
+            except Exception as e:
+                logger.warning("Could not read 3MF part", file_path=str(file_path), part=name, error=str(e))
+    return package
+
+
+def _read_metadata_part(zip_file: zipfile.ZipFile, info: zipfile.ZipInfo,
+                        package: ThreeMFPackage, thumbnails: bool) -> None:
+    """Read one Metadata/ member into the package."""
+    name = info.filename
+    if name.endswith('.png'):
+        if thumbnails:
+            package.thumbnails.append((name, zip_file.read(info)))
+        return
+
+    match = _PLATE_JSON.match(name)
+    if match:
+        package.plates[int(match.group(1))] = json.loads(zip_file.read(info).decode('utf-8'))
+        return
+
+    match = _PROCESS_SETTINGS.match(name)
+    if match:
+        package.process_settings[int(match.group(1))] = json.loads(zip_file.read(info).decode('utf-8'))
+        return
+
+    if name == 'Metadata/slice_info.config':
+        package.slice_info = ET.fromstring(zip_file.read(info).decode('utf-8'))
+    elif name.endswith('.xml'):
+        package.metadata_xml[name] = zip_file.read(info).decode('utf-8')
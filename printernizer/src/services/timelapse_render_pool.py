@@ -0,0 +1,380 @@
+"""
+Render worker pool for timelapse videos.
+
+Timelapse encodes are long (minutes to half an hour) CPU-heavy subprocesses.
+The pool runs up to ``max_workers`` of them at once, picks the next one by
+priority (manual requests, then pinned, then the most recent timelapse),
+supports cancelling queued and running renders, and tracks queue depth and
+encode throughput.
+
+The subprocess side lives in ``run_render_process``: it starts the command
+at reduced CPU/IO priority, streams stdout/stderr instead of buffering a
+whole encode's output, reports ffmpeg ``frame=`` progress as it arrives and
+keeps only a bounded tail of the output for error messages.
+
+Usage:
+    ```python
+    pool = TimelapseRenderPool(service._process_timelapse, max_workers=2)
+    pool.start()
+    pool.submit(timelapse_id, render_priority(pinned=True, recency=ts))
+    pool.cancel(timelapse_id)
+    await pool.shutdown()
+    ```
+"""
+import asyncio
+import itertools
+import re
+import shutil
+import sys
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from src.constants import TimelapseConstants
+
+logger = structlog.get_logger()
+
+# (class, -recency): lower sorts first
+RenderPriority = Tuple[int, float]
+
+PRIORITY_MANUAL = 0
+PRIORITY_PINNED = 1
+PRIORITY_DEFAULT = 2
+
+_FRAME_PATTERN = re.compile(rb'frame=\s*(\d+)')
+_LINE_SPLIT = re.compile(rb'[\r\n]')
+
+
+def render_priority(manual: bool = False, pinned: bool = False, recency: float = 0.0) -> RenderPriority:
+    """
+    Queue priority of a render.
+
+    Args:
+        manual: Requested by a user (runs before everything else)
+        pinned: Timelapse is pinned
+        recency: Epoch seconds of the timelapse's last image; newer first
+    """
+    cls = PRIORITY_MANUAL if manual else PRIORITY_PINNED if pinned else PRIORITY_DEFAULT
+    return (cls, -recency)
+
+
+class RenderResult:
+    """Outcome of one render subprocess."""
+
+    __slots__ = ('returncode', 'stdout_tail', 'stderr_tail', 'duration_line', 'frames')
+
+    def __init__(self, returncode: int, stdout_tail: str, stderr_tail: str,
+                 duration_line: Optional[str], frames: int):
+        self.returncode = returncode
+        self.stdout_tail = stdout_tail
+        self.stderr_tail = stderr_tail
+        self.duration_line = duration_line
+        self.frames = frames
+
+
+class RenderJob:
+    """A queued or running render and its progress."""
+
+    __slots__ = ('timelapse_id', 'priority', 'total_frames', 'frames', 'queued_at',
+                 'started_at', 'cancel_requested', 'task')
+
+    def __init__(self, timelapse_id: str, priority: RenderPriority, total_frames: Optional[int]):
+        self.timelapse_id = timelapse_id
+        self.priority = priority
+        self.total_frames = total_frames
+        self.frames = 0
+        self.queued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.cancel_requested = False
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def progress(self) -> Optional[float]:
+        """Percent done from ffmpeg frame counts, if the total is known."""
+        if not self.total_frames:
+            return None
+        return round(min(100.0, self.frames * 100.0 / self.total_frames), 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Progress snapshot for stats and events."""
+        return {
+            'timelapse_id': self.timelapse_id,
+            'running': self.started_at is not None,
+            'frames': self.frames,
+            'total_frames': self.total_frames,
+            'progress': self.progress,
+            'elapsed_seconds': round(time.monotonic() - self.started_at, 1) if self.started_at else None,
+        }
+
+
+class TimelapseRenderPool:
+    """
+    Priority queue plus a fixed number of render workers.
+
+    ``render`` is called as ``await render(job)`` on a worker and owns the
+    whole render (status updates, subprocess, result handling). Cancelling a
+    running job cancels that call; ``job.cancel_requested`` tells it whether
+    a user asked for it or the pool is shutting down.
+
+    Metrics:
+        - queue_depth / running: jobs waiting and encoding
+        - completed / failed / cancelled: finished renders
+        - frames_per_second: encoded frames per second of encode time
+    """
+
+    def __init__(self, render: Callable[[RenderJob], Awaitable[None]], max_workers: int = 1):
+        """
+        Initialize the pool (workers are started by ``start``).
+
+        Args:
+            render: Coroutine function that performs one render
+            max_workers: Renders allowed to run at once
+        """
+        self._render = render
+        self.max_workers = max(1, max_workers)
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._sequence = itertools.count()
+        self._jobs: Dict[str, RenderJob] = {}
+        self._workers: List[asyncio.Task] = []
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'cancelled': 0,
+            'frames_encoded': 0,
+            'encode_seconds': 0.0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """True once workers are started."""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start the render workers."""
+        if self.is_running:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [asyncio.create_task(self._worker(i)) for i in range(self.max_workers)]
+        logger.info("Timelapse render pool started", workers=self.max_workers)
+
+    def submit(self, timelapse_id: str, priority: RenderPriority,
+               total_frames: Optional[int] = None) -> bool:
+        """
+        Queue a render unless it is already queued or running.
+
+        A queued render submitted again with a more urgent priority moves up.
+
+        Returns:
+            True if the render was queued (or moved up)
+        """
+        if not self.is_running:
+            raise RuntimeError("Render pool not started")
+        job = self._jobs.get(timelapse_id)
+        if job is not None:
+            if job.started_at is not None or priority >= job.priority:
+                return False
+            # Re-queue under the new priority; the stale entry is skipped
+            job.priority = priority
+        else:
+            job = RenderJob(timelapse_id, priority, total_frames)
+            self._jobs[timelapse_id] = job
+            self.stats['submitted'] += 1
+        self._queue.put_nowait((priority, next(self._sequence), job))
+        return True
+
+    def cancel(self, timelapse_id: str) -> bool:
+        """
+        Cancel a queued or running render.
+
+        Returns:
+            True if the render was queued or running
+        """
+        job = self._jobs.get(timelapse_id)
+        if job is None:
+            return False
+        job.cancel_requested = True
+        if job.task is not None:
+            job.task.cancel()
+        else:
+            # Still queued: the worker drops it when it comes up
+            self._jobs.pop(timelapse_id, None)
+            self.stats['cancelled'] += 1
+        logger.info("Timelapse render cancelled", timelapse_id=timelapse_id,
+                    running=job.task is not None)
+        return True
+
+    def get_job(self, timelapse_id: str) -> Optional[RenderJob]:
+        """Queued or running render of a timelapse."""
+        return self._jobs.get(timelapse_id)
+
+    def record_frames(self, job: RenderJob, frames: int) -> None:
+        """Update a running job's encoded frame count."""
+        if frames > job.frames:
+            self.stats['frames_encoded'] += frames - job.frames
+            job.frames = frames
+
+    async def _worker(self, index: int) -> None:
+        """Run queued renders one after another."""
+        while True:
+            _, _, job = await self._queue.get()
+            if self._jobs.get(job.timelapse_id) is not job or job.started_at is not None:
+                continue  # cancelled while queued, or a superseded entry
+            job.started_at = time.monotonic()
+            job.task = asyncio.create_task(self._render(job))
+            try:
+                await asyncio.shield(job.task)
+                self.stats['completed'] += 1
+            except asyncio.CancelledError:
+                if not job.task.done():
+                    # The worker itself is being cancelled (shutdown)
+                    job.task.cancel()
+                    await asyncio.gather(job.task, return_exceptions=True)
+                    raise
+                self.stats['cancelled'] += 1
+            except Exception as e:
+                self.stats['failed'] += 1
+                logger.error("Timelapse render failed", timelapse_id=job.timelapse_id,
+                             error=str(e), worker=index)
+            finally:
+                self.stats['encode_seconds'] += time.monotonic() - job.started_at
+                self._jobs.pop(job.timelapse_id, None)
+
+    async def shutdown(self) -> None:
+        """Cancel running renders and stop the workers."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._jobs.clear()
+        if workers:
+            logger.info("Timelapse render pool stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue, progress and throughput metrics."""
+        running = [job for job in self._jobs.values() if job.started_at is not None]
+        encode_seconds = self.stats['encode_seconds'] + sum(
+            time.monotonic() - job.started_at for job in running
+        )
+        return {
+            'max_workers': self.max_workers,
+            'queue_depth': len(self._jobs) - len(running),
+            'running': len(running),
+            'jobs': [job.to_dict() for job in running],
+            'submitted': self.stats['submitted'],
+            'completed': self.stats['completed'],
+            'failed': self.stats['failed'],
+            'cancelled': self.stats['cancelled'],
+            'frames_encoded': self.stats['frames_encoded'],
+            'frames_per_second': round(self.stats['frames_encoded'] / encode_seconds, 2) if encode_seconds else 0.0,
+        }
+
+
+def limited_command(cmd: Sequence[str], nice: int) -> List[str]:
+    """
+    Wrap a command so it runs at reduced CPU and I/O priority.
+
+    Uses ``nice`` and ``ionice -c 3`` (idle I/O class) where available;
+    returns the command unchanged on Windows or without those tools.
+    """
+    wrapped = list(cmd)
+    if sys.platform == 'win32':
+        return wrapped
+    ionice = shutil.which('ionice')
+    if ionice:
+        wrapped = [ionice, '-c', '3', *wrapped]
+    nice_path = shutil.which('nice')
+    if nice_path and nice > 0:
+        wrapped = [nice_path, '-n', str(nice), *wrapped]
+    return wrapped
+
+
+async def _pump(stream: asyncio.StreamReader, tail: Deque[str],
+                on_line: Callable[[bytes], bool],
+                on_progress: Callable[[], Awaitable[None]]) -> None:
+    """
+    Read a stream to EOF, splitting on CR and LF (ffmpeg uses CR for progress).
+
+    ``on_line`` returns True when a line advanced the progress; ``on_progress``
+    is then awaited once per chunk read.
+    """
+    pending = b''
+    while True:
+        chunk = await stream.read(TimelapseConstants.RENDER_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        pending += chunk
+        *lines, pending = _LINE_SPLIT.split(pending)
+        advanced = False
+        for line in lines:
+            if line:
+                advanced = on_line(line) or advanced
+                tail.append(line.decode('utf-8', errors='replace'))
+        if advanced:
+            await on_progress()
+    if pending:
+        on_line(pending)
+        tail.append(pending.decode('utf-8', errors='replace'))
+
+
+async def run_render_process(cmd: Sequence[str], timeout: float,
+                             on_frames: Callable[[int], Awaitable[None]]) -> RenderResult:
+    """
+    Run a render command, streaming its output.
+
+    Args:
+        cmd: Command (already wrapped by ``limited_command``)
+        timeout: Seconds before the process is killed
+        on_frames: Awaited with ffmpeg's ``frame=`` count as it advances
+
+    Returns:
+        RenderResult with the return code and the last lines of output
+
+    Raises:
+        asyncio.TimeoutError: If the render exceeded ``timeout``
+        asyncio.CancelledError: If cancelled (the process is killed)
+        FileNotFoundError: If the command does not exist
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout_tail: Deque[str] = deque(maxlen=TimelapseConstants.RENDER_OUTPUT_TAIL_LINES)
+    stderr_tail: Deque[str] = deque(maxlen=TimelapseConstants.RENDER_OUTPUT_TAIL_LINES)
+    state = {'duration': None, 'frames': 0}
+
+    def on_line(line: bytes) -> bool:
+        if state['duration'] is None and b'Duration:' in line:
+            state['duration'] = line.decode('utf-8', errors='replace')
+        match = _FRAME_PATTERN.search(line)
+        if match:
+            frames = int(match.group(1))
+            if frames > state['frames']:
+                state['frames'] = frames
+                return True
+        return False
+
+    async def on_progress() -> None:
+        await on_frames(state['frames'])
+
+    readers = asyncio.gather(
+        _pump(process.stdout, stdout_tail, on_line, on_progress),
+        _pump(process.stderr, stderr_tail, on_line, on_progress),
+        process.wait()
+    )
+    try:
+        await asyncio.wait_for(readers, timeout=timeout)
+    except BaseException:
+        # Timeout or cancellation: do not leave an encoder running
+        readers.cancel()
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        await asyncio.wait([readers])
+        if not readers.cancelled():
+            readers.exception()  # retrieved so it is not reported as unhandled
+        raise
+
+    return RenderResult(process.returncode, '\n'.join(stdout_tail), '\n'.join(stderr_tail),
+                        state['duration'], state['frames'])
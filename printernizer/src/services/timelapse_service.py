@@ -1,19 +1,44 @@
 """
 Timelapse service for managing timelapse video creation.
 Handles folder monitoring, auto-detection, and video processing.
+
+Folder detection is event-driven: a watchdog observer marks subfolders of
+the source folder as changed, and only those are recounted. A periodic
+survey remains as a safety net (missed events, network shares, Windows); it
+stats each subfolder and reuses the cached image count while the folder's
+mtime is unchanged, so past prints with thousands of images are not listed
+again.
+
+Rendering goes through a TimelapseRenderPool: up to
+``timelapse_max_concurrent_renders`` FlickerFree processes run at reduced
+CPU/IO priority, ordered manual request > pinned > most recent, with
+streamed progress and cancellation.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
+import os
+import sys
 import uuid
 import asyncio
 import subprocess
 import re
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 import structlog
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler, FileSystemEvent, FileModifiedEvent
 
 from src.config.constants import PollingIntervals
+from src.constants import TimelapseConstants
 from src.database.database import Database
 from src.services.event_service import EventService
+from src.services.timelapse_render_pool import (
+    RenderJob,
+    TimelapseRenderPool,
+    limited_command,
+    render_priority,
+    run_render_process,
+)
 from src.models.timelapse import (
     Timelapse,
     TimelapseStatus,
@@ -26,6 +51,44 @@ from src.utils.config import get_settings
 
 logger = structlog.get_logger()
 
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
+
+class TimelapseFolderHandler(FileSystemEventHandler):
+    """
+    Marks timelapse subfolders as changed on file system events.
+
+    Runs on the watchdog thread; the changed subfolder is handed to the
+    event loop with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, service: 'TimelapseService', source_folder: Path,
+                 loop: asyncio.AbstractEventLoop):
+        """Initialize handler for one source folder."""
+        super().__init__()
+        self.service = service
+        self.source_folder = source_folder
+        self.loop = loop
+
+    def _subfolder_of(self, path: str) -> Optional[str]:
+        """Top-level subfolder of the source folder containing ``path``."""
+        try:
+            parts = Path(path).relative_to(self.source_folder).parts
+        except ValueError:
+            return None
+        if not parts or parts[0].startswith('.'):
+            return None
+        return str(self.source_folder / parts[0])
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        """Mark the affected subfolder(s); file content changes are ignored."""
+        if isinstance(event, FileModifiedEvent):
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', None)):
+            subfolder = self._subfolder_of(path) if path else None
+            if subfolder:
+                self.loop.call_soon_threadsafe(self.service._mark_folder_changed, subfolder)
+
 
 class TimelapseService:
     """Service for managing timelapse videos."""
@@ -39,6 +102,17 @@ class TimelapseService:
         self._queue_task: Optional[asyncio.Task] = None
         self._shutdown = False
 
+        # Event-driven folder detection
+        self._observer = None
+        self._changed_folders: Set[str] = set()
+        self._folders_changed = asyncio.Event()
+        # folder path -> (mtime_ns, image count)
+        self._image_counts: Dict[str, Tuple[int, int]] = {}
+
+        self._render_pool = TimelapseRenderPool(
+            self._process_timelapse, max_workers=self.settings.timelapse_max_concurrent_renders
+        )
+
     async def start(self) -> None:
         """Start timelapse service background tasks."""
         if not self.settings.timelapse_enabled:
@@ -56,8 +130,16 @@ class TimelapseService:
 
         logger.info("Starting timelapse service")
 
+        # Renders interrupted by a previous shutdown or crash start over
+        await self.database.execute(
+            "UPDATE timelapses SET status = ?, updated_at = ? WHERE status = ?",
+            (TimelapseStatus.PENDING.value, datetime.now().isoformat(), TimelapseStatus.PROCESSING.value)
+        )
+
         # Start background tasks
         self._shutdown = False
+        self._render_pool.start()
+        self._start_observer()
         self._monitoring_task = asyncio.create_task(self._folder_monitor_loop())
         self._queue_task = asyncio.create_task(self._process_queue_loop())
 
@@ -84,23 +166,100 @@ class TimelapseService:
             except asyncio.CancelledError:
                 pass
 
+        # Running renders go back to pending
+        await self._render_pool.shutdown()
+        await self._stop_observer()
+
         logger.info("Timelapse service shutdown complete")
 
+    def _start_observer(self) -> None:
+        """
+        Watch the source folder for new images.
+
+        Not used on Windows, where watchdog would fall back to polling every
+        file; the periodic survey covers that case.
+        """
+        source_folder = Path(self.settings.timelapse_source_folder)
+        if sys.platform == 'win32' or not source_folder.is_dir():
+            logger.info("Timelapse folder events unavailable, using periodic scan only",
+                        path=str(source_folder))
+            return
+        try:
+            observer = Observer()
+            observer.schedule(
+                TimelapseFolderHandler(self, source_folder, asyncio.get_running_loop()),
+                str(source_folder), recursive=True
+            )
+            observer.start()
+            self._observer = observer
+            logger.info("Watching timelapse source folder", path=str(source_folder))
+        except Exception as e:
+            # e.g. inotify watch limit reached
+            logger.warning("Failed to watch timelapse source folder, using periodic scan only",
+                           path=str(source_folder), error=str(e))
+            self._observer = None
+
+    async def _stop_observer(self) -> None:
+        """Stop the folder observer."""
+        observer, self._observer = self._observer, None
+        if observer is None:
+            return
+        try:
+            observer.stop()
+            await asyncio.to_thread(observer.join, 5.0)
+        except Exception as e:
+            logger.warning("Failed to stop timelapse folder observer", error=str(e))
+
+    def _mark_folder_changed(self, folder: str) -> None:
+        """Queue a subfolder for rescanning (called on the event loop)."""
+        self._changed_folders.add(folder)
+        self._folders_changed.set()
+
     async def _folder_monitor_loop(self):
-        """Background task to monitor source folder for new timelapse folders."""
+        """
+        Background task to detect new and growing timelapse folders.
+
+        Rescans changed folders shortly after file system events; every
+        TIMELAPSE_CHECK_INTERVAL all folders are surveyed (cheap while their
+        mtime is unchanged) so missed events and auto-processing timeouts
+        are still handled.
+        """
         logger.info("Starting folder monitoring loop")
+        next_survey = 0.0
 
         while not self._shutdown:
             try:
-                await self._scan_source_folders()
+                now = time.monotonic()
+                if now >= next_survey:
+                    next_survey = now + PollingIntervals.TIMELAPSE_CHECK_INTERVAL
+                    await self._scan_source_folders()
+                elif self._changed_folders:
+                    # Let a burst of images settle, then rescan those folders only
+                    await asyncio.sleep(TimelapseConstants.TIMELAPSE_EVENT_DEBOUNCE_SECONDS)
+                    changed, self._changed_folders = self._changed_folders, set()
+                    self._folders_changed.clear()
+                    await self._scan_source_folders(only=changed)
             except Exception as e:
                 logger.error("Folder monitoring error", error=str(e), error_type=type(e).__name__)
 
-            # Wait 30 seconds before next scan
-            await asyncio.sleep(PollingIntervals.TIMELAPSE_CHECK_INTERVAL)
+            if self._changed_folders:
+                continue
+            try:
+                await asyncio.wait_for(self._folders_changed.wait(),
+                                       timeout=max(0.0, next_survey - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _scan_source_folders(self, only: Optional[Set[str]] = None):
+        """
+        Scan source folder for timelapse image subfolders.
 
-    async def _scan_source_folders(self):
-        """Scan source folder for timelapse image subfolders."""
+        Args:
+            only: Subfolder paths known to have changed; they are recounted
+                unconditionally and no other folder is looked at. None
+                surveys every subfolder, recounting only those whose mtime
+                changed since the last count.
+        """
         source_folder = Path(self.settings.timelapse_source_folder)
 
         # Check if source folder exists
@@ -108,46 +267,127 @@ class TimelapseService:
             logger.warning("Timelapse source folder does not exist", path=str(source_folder))
             return
 
-        logger.debug("Scanning source folder for timelapses", path=str(source_folder))
+        logger.debug("Scanning source folder for timelapses", path=str(source_folder),
+                     changed_only=only is not None)
 
-        # List subfolders
         try:
-            subfolders = [f for f in source_folder.iterdir() if f.is_dir() and not f.name.startswith('.')]
+            counts, recounted = await asyncio.to_thread(self._survey_subfolders, source_folder, only)
         except Exception as e:
             logger.error("Failed to list source folder contents", path=str(source_folder), error=str(e))
             return
 
-        for subfolder in subfolders:
+        if not counts:
+            return
+
+        # One query for every tracked folder instead of one per subfolder
+        tracked = await self._load_tracked_timelapses()
+
+        for folder_path, image_count in counts.items():
             try:
-                await self._process_subfolder(subfolder)
+                await self._process_subfolder(Path(folder_path), image_count, tracked)
             except Exception as e:
-                logger.error("Failed to process subfolder", folder=subfolder.name, error=str(e))
-
-        logger.debug("Folder scan complete", folders_found=len(subfolders))
+                logger.error("Failed to process subfolder", folder=Path(folder_path).name, error=str(e))
+
+        logger.debug("Folder scan complete", folders_found=len(counts), recounted=recounted)
+
+    def _survey_subfolders(self, source_folder: Path,
+                           only: Optional[Set[str]] = None) -> Tuple[Dict[str, int], int]:
+        """
+        Get the image count of each subfolder (runs in a worker thread).
+
+        A folder's count is reused while its mtime is unchanged: adding,
+        removing or renaming an image changes the mtime of its folder.
+
+        Returns:
+            Tuple of (folder path -> image count, number of folders recounted)
+        """
+        if only is None:
+            with os.scandir(source_folder) as entries:
+                folders = [entry.path for entry in entries
+                           if not entry.name.startswith('.') and entry.is_dir()]
+            # Forget folders that were removed
+            for stale in set(self._image_counts) - set(folders):
+                self._image_counts.pop(stale, None)
+        else:
+            folders = sorted(folder for folder in only if os.path.isdir(folder))
+            for gone in only.difference(folders):
+                self._image_counts.pop(gone, None)
+
+        settle_ns = int(TimelapseConstants.TIMELAPSE_MTIME_SETTLE_SECONDS * 1e9)
+        counts: Dict[str, int] = {}
+        recounted = 0
+        for folder in folders:
+            try:
+                mtime_ns = os.stat(folder).st_mtime_ns
+            except OSError:
+                self._image_counts.pop(folder, None)
+                continue
+            cached = self._image_counts.get(folder)
+            if only is None and cached is not None and cached[0] == mtime_ns:
+                counts[folder] = cached[1]
+                continue
+            try:
+                counts[folder] = self._count_images(folder)
+            except OSError as e:
+                logger.error("Failed to count images in folder", folder=Path(folder).name, error=str(e))
+                continue
+            recounted += 1
+            if time.time_ns() - mtime_ns > settle_ns:
+                self._image_counts[folder] = (mtime_ns, counts[folder])
+            else:
+                # Changes within the same timestamp tick would go unnoticed
+                self._image_counts.pop(folder, None)
+        return counts, recounted
+
+    @staticmethod
+    def _count_images(folder: str) -> int:
+        """Count image files directly inside a folder."""
+        with os.scandir(folder) as entries:
+            return sum(
+                1 for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file()
+            )
 
-    async def _process_subfolder(self, subfolder: Path):
-        """Process a single subfolder - count images and track status."""
+    async def _load_tracked_timelapses(self) -> Dict[str, Dict[str, Any]]:
+        """Get the detection-relevant fields of all timelapses, by source folder."""
+        rows = await self.database._fetch_all(
+            """SELECT id, source_folder, folder_name, status, image_count, auto_process_eligible_at,
+                      last_image_detected_at, pinned
+               FROM timelapses"""
+        )
+        return {row['source_folder']: dict(row) for row in rows}
+
+    async def _process_subfolder(self, subfolder: Path, image_count: Optional[int] = None,
+                                 tracked: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Process a single subfolder - track its image count and status.
+
+        Args:
+            subfolder: Timelapse image folder
+            image_count: Image count if already known (counted otherwise)
+            tracked: Timelapses by source folder if already loaded (queried
+                otherwise)
+        """
         folder_name = subfolder.name
         source_folder_path = str(subfolder)
 
         # Count image files
-        image_extensions = {'.jpg', '.jpeg', '.png'}
-        try:
-            image_files = [
-                f for f in subfolder.iterdir()
-                if f.is_file() and f.suffix.lower() in image_extensions
-            ]
-            image_count = len(image_files)
-        except Exception as e:
-            logger.error("Failed to count images in folder", folder=folder_name, error=str(e))
-            return
+        if image_count is None:
+            try:
+                image_count = await asyncio.to_thread(self._count_images, source_folder_path)
+            except Exception as e:
+                logger.error("Failed to count images in folder", folder=folder_name, error=str(e))
+                return
 
         # Skip folders with no images
         if image_count == 0:
             return
 
         # Check if timelapse already tracked
-        existing = await self.get_timelapse_by_source_folder(source_folder_path)
+        if tracked is not None:
+            existing = tracked.get(source_folder_path)
+        else:
+            existing = await self.get_timelapse_by_source_folder(source_folder_path)
 
         if not existing:
             # Create new timelapse record
@@ -244,6 +484,21 @@ class TimelapseService:
                     'status': TimelapseStatus.PENDING.value
                 })
 
+                self._submit_render(existing)
+
+    def _submit_render(self, timelapse: Dict[str, Any], manual: bool = False) -> bool:
+        """Queue a pending timelapse on the render pool (no-op if already queued)."""
+        if not self._render_pool.is_running:
+            return False
+        recency = 0.0
+        if timelapse.get('last_image_detected_at'):
+            try:
+                recency = datetime.fromisoformat(timelapse['last_image_detected_at']).timestamp()
+            except (TypeError, ValueError):
+                pass
+        priority = render_priority(manual=manual, pinned=bool(timelapse.get('pinned')), recency=recency)
+        return self._render_pool.submit(timelapse['id'], priority, total_frames=timelapse.get('image_count'))
+
     async def _process_queue_loop(self):
         """Background task to process pending timelapses."""
         logger.info("Starting queue processing loop")
@@ -258,42 +513,32 @@ class TimelapseService:
             await asyncio.sleep(PollingIntervals.TIMELAPSE_FRAME_INTERVAL)
 
     async def _process_queue(self):
-        """Check for pending timelapses and process next one if none currently processing."""
-        # Check if any timelapse is currently processing
-        result = await self.database._fetch_one(
-            "SELECT COUNT(*) as count FROM timelapses WHERE status = ?",
-            (TimelapseStatus.PROCESSING.value,)
-        )
-
-        if result and result['count'] > 0:
-            # Already processing one, wait
-            return
-
-        # Get next pending timelapse (FIFO)
-        result = await self.database._fetch_one(
+        """Queue pending timelapses on the render pool (it orders and limits them)."""
+        rows = await self.database._fetch_all(
             """
-            SELECT * FROM timelapses
+            SELECT id, pinned, image_count, last_image_detected_at FROM timelapses
             WHERE status = ?
-            ORDER BY auto_process_eligible_at ASC
-            LIMIT 1
             """,
             (TimelapseStatus.PENDING.value,)
         )
 
-        if result:
-            logger.info("Found pending timelapse, starting processing", timelapse_id=result['id'])
-            # Process in background to avoid blocking queue loop
-            asyncio.create_task(self._process_timelapse(result['id']))
+        for row in rows:
+            if self._submit_render(dict(row)):
+                logger.info("Queued pending timelapse for rendering", timelapse_id=row['id'])
 
-
-    async def _process_timelapse(self, timelapse_id: str):
-        """Process a timelapse by calling FlickerFree script."""
+    async def _process_timelapse(self, job: RenderJob):
+        """Process a timelapse by calling FlickerFree script (runs on a render pool worker)."""
+        timelapse_id = job.timelapse_id
+        output_path: Optional[Path] = None
         try:
             # Load timelapse record
             timelapse = await self.get_timelapse(timelapse_id)
             if not timelapse:
                 logger.error("Timelapse not found for processing", timelapse_id=timelapse_id)
                 return
+            if timelapse['status'] != TimelapseStatus.PENDING.value:
+                # Cancelled, deleted or re-triggered since it was queued
+                return
 
             # Update status to processing
             now = datetime.now()
@@ -321,11 +566,10 @@ class TimelapseService:
             flickerfree_script = Path(self.settings.timelapse_flickerfree_path)
             source_folder = Path(timelapse['source_folder'])
 
-            cmd = [
-                str(flickerfree_script),
-                str(source_folder),
-                str(output_path)
-            ]
+            cmd = limited_command(
+                [str(flickerfree_script), str(source_folder), str(output_path)],
+                nice=self.settings.timelapse_render_nice
+            )
 
             logger.info(
                 "Executing FlickerFree command",
@@ -333,35 +577,44 @@ class TimelapseService:
                 command=" ".join(cmd)
             )
 
-            # Execute subprocess with timeout (30 minutes)
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
+            last_event = 0.0
 
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=1800  # 30 minutes
-                )
+            async def on_frames(frames: int) -> None:
+                nonlocal last_event
+                self._render_pool.record_frames(job, frames)
+                now_ts = time.monotonic()
+                if now_ts - last_event < TimelapseConstants.RENDER_PROGRESS_EVENT_INTERVAL_SECONDS:
+                    return
+                last_event = now_ts
+                await self.event_service.emit('timelapse.progress', {
+                    'id': timelapse_id,
+                    'folder_name': timelapse['folder_name'],
+                    'frames': frames,
+                    'total_frames': job.total_frames,
+                    'progress': job.progress
+                })
 
-                stdout_str = stdout.decode('utf-8', errors='replace') if stdout else ""
-                stderr_str = stderr.decode('utf-8', errors='replace') if stderr else ""
+            timeout = self.settings.timelapse_render_timeout
+            try:
+                result = await run_render_process(cmd, timeout, on_frames)
 
-                if process.returncode == 0:
+                if result.returncode == 0:
                     # Success!
-                    await self._handle_processing_success(timelapse_id, output_path, stdout_str)
+                    await self._handle_processing_success(
+                        timelapse_id, output_path, result.duration_line or result.stdout_tail
+                    )
                 else:
                     # Failed
-                    error_msg = self._parse_error_message(stderr_str, stdout_str, process.returncode)
+                    error_msg = self._parse_error_message(
+                        result.stderr_tail, result.stdout_tail, result.returncode
+                    )
                     await self._handle_processing_failure(timelapse_id, error_msg)
 
             except asyncio.TimeoutError:
                 logger.error("Timelapse processing timeout", timelapse_id=timelapse_id)
                 await self._handle_processing_failure(
                     timelapse_id,
-                    "Processing exceeded 30-minute timeout. Try with fewer images or increase timeout."
+                    f"Processing exceeded {timeout // 60}-minute timeout. Try with fewer images or increase timeout."
                 )
 
             except FileNotFoundError:
@@ -371,10 +624,47 @@ class TimelapseService:
                     f"FlickerFree script not found at {flickerfree_script}. Please configure correct path."
                 )
 
+        except asyncio.CancelledError:
+            await self._handle_processing_cancelled(job, output_path)
+            raise
+
         except Exception as e:
             logger.error("Unexpected error during processing", timelapse_id=timelapse_id, error=str(e), error_type=type(e).__name__)
             await self._handle_processing_failure(timelapse_id, f"Unexpected error: {str(e)}")
 
+    async def _handle_processing_cancelled(self, job: RenderJob, output_path: Optional[Path]):
+        """Record a cancelled render: failed if a user cancelled it, pending again on shutdown."""
+        timelapse_id = job.timelapse_id
+        if not job.cancel_requested:
+            await self.database.execute(
+                "UPDATE timelapses SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (TimelapseStatus.PENDING.value, datetime.now().isoformat(), timelapse_id,
+                 TimelapseStatus.PROCESSING.value)
+            )
+            logger.info("Timelapse render interrupted, will resume", timelapse_id=timelapse_id)
+            return
+
+        # Drop the partial video
+        if output_path is not None:
+            try:
+                output_path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("Failed to remove partial video", path=str(output_path), error=str(e))
+        await self._mark_cancelled(timelapse_id)
+
+    async def _mark_cancelled(self, timelapse_id: str):
+        """Set a timelapse to failed with a cancellation message and notify clients."""
+        await self.database.execute(
+            "UPDATE timelapses SET status = ?, error_message = ?, updated_at = ? WHERE id = ?",
+            (TimelapseStatus.FAILED.value, "Processing cancelled", datetime.now().isoformat(), timelapse_id)
+        )
+        logger.info("Timelapse processing cancelled", timelapse_id=timelapse_id)
+        await self.event_service.emit('timelapse.failed', {
+            'id': timelapse_id,
+            'status': TimelapseStatus.FAILED.value,
+            'error_message': "Processing cancelled"
+        })
+
     def _determine_output_path(self, timelapse: Dict[str, Any]) -> Path:
         """Determine output video path based on configuration strategy."""
         folder_name = timelapse['folder_name']
@@ -768,6 +1058,11 @@ class TimelapseService:
                 logger.error("Timelapse not found", timelapse_id=timelapse_id)
                 return None
 
+            # Already pending: just move it to the front of the render queue
+            if timelapse['status'] == TimelapseStatus.PENDING.value:
+                self._submit_render(timelapse, manual=True)
+                return timelapse
+
             # Only allow triggering from discovered or failed status
             if timelapse['status'] not in [TimelapseStatus.DISCOVERED.value, TimelapseStatus.FAILED.value]:
                 logger.warning(
@@ -791,12 +1086,50 @@ class TimelapseService:
                 'status': TimelapseStatus.PENDING.value
             })
 
+            self._submit_render(timelapse, manual=True)
+
             return await self.get_timelapse(timelapse_id)
 
         except Exception as e:
             logger.error("Failed to trigger processing", timelapse_id=timelapse_id, error=str(e))
             return None
 
+    async def cancel_processing(self, timelapse_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a pending or running render (the timelapse becomes failed).
+
+        A running render process is killed and its partial video removed.
+        Timelapses in any other status are returned unchanged.
+        """
+        try:
+            timelapse = await self.get_timelapse(timelapse_id)
+            if not timelapse:
+                logger.error("Timelapse not found", timelapse_id=timelapse_id)
+                return None
+
+            if timelapse['status'] not in [TimelapseStatus.PENDING.value, TimelapseStatus.PROCESSING.value]:
+                logger.warning(
+                    "Cannot cancel processing from current status",
+                    timelapse_id=timelapse_id,
+                    status=timelapse['status']
+                )
+                return timelapse
+
+            job = self._render_pool.get_job(timelapse_id)
+            running = job is not None and job.task is not None
+            self._render_pool.cancel(timelapse_id)
+            if running:
+                # The render records the cancellation once its process is gone
+                await asyncio.gather(job.task, return_exceptions=True)
+            else:
+                await self._mark_cancelled(timelapse_id)
+
+            return await self.get_timelapse(timelapse_id)
+
+        except Exception as e:
+            logger.error("Failed to cancel processing", timelapse_id=timelapse_id, error=str(e))
+            return None
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get timelapse statistics."""
         try:
@@ -838,7 +1171,8 @@ class TimelapseService:
                 'processing_count': status_counts.get('processing_count', 0),
                 'completed_count': status_counts.get('completed_count', 0),
                 'failed_count': status_counts.get('failed_count', 0),
-                'cleanup_candidates_count': cleanup_count
+                'cleanup_candidates_count': cleanup_count,
+                'render_pool': self._render_pool.get_stats()
             }
 
             return stats
@@ -864,6 +1198,11 @@ class TimelapseService:
                 logger.error("Timelapse not found for deletion", timelapse_id=timelapse_id)
                 return False
 
+            # Stop a queued or running render first
+            job = self._render_pool.get_job(timelapse_id)
+            if self._render_pool.cancel(timelapse_id) and job.task is not None:
+                await asyncio.gather(job.task, return_exceptions=True)
+
             # Delete video file if it exists
             if timelapse.get('output_video_path'):
                 video_path = Path(timelapse['output_video_path'])
@@ -0,0 +1,247 @@
+"""
+Turntable renderer for animated mesh previews.
+
+Animated previews used to render every frame as a separate matplotlib
+figure: each angle copied and re-normalized the mesh, rebuilt a
+``plot_trisurf`` collection, shaded and projected every face again and went
+through a PNG round trip before the GIF was assembled. The turntable
+renderer prepares the mesh once and only re-projects it per frame:
+
+    once       center and scale the vertices, drop degenerate faces, compute
+               face normals and their shading (fixed world light, like
+               matplotlib's), decide whether back faces can be culled
+    per frame  rotate the vertices with one 3x3 matrix product, cull, sort
+               faces back to front and fill them (painter's algorithm)
+    encode     all frames are palette images over one shared buffer and
+               palette, so the GIF is written in a single save without
+               per-frame quantization
+
+Usage:
+    ```python
+    mesh = get_mesh_cache().get(path, checksum=checksum, preview=True)
+    renderer = TurntableRenderer(mesh.vertices, mesh.faces, (512, 512), elevation=45)
+    gif_bytes = renderer.render_gif([0, 90, 180, 270], frame_duration=500)
+    ```
+"""
+from io import BytesIO
+from typing import List, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Optional imports with graceful degradation
+try:
+    import numpy as np
+    from PIL import Image, ImageColor, ImageDraw
+    TURNTABLE_AVAILABLE = True
+except ImportError:
+    TURNTABLE_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Light direction of matplotlib's default LightSource (azimuth 225, altitude 19.47)
+_LIGHT_AZIMUTH = 225.0
+_LIGHT_ALTITUDE = 19.4712
+
+# Brightness range of shaded faces (matplotlib maps light to 0.3 .. 1.0)
+_MIN_BRIGHTNESS = 0.3
+
+# Share of the frame the mesh's bounding sphere fills
+_FILL = 0.92
+
+
+def _light_direction() -> 'np.ndarray':
+    """Unit vector towards the light, in world coordinates."""
+    azimuth = np.radians(90.0 - _LIGHT_AZIMUTH)
+    altitude = np.radians(_LIGHT_ALTITUDE)
+    return np.array([np.cos(altitude) * np.cos(azimuth),
+                     np.cos(altitude) * np.sin(azimuth),
+                     np.sin(altitude)], dtype=np.float32)
+
+
+class TurntableRenderer:
+    """
+    Renders a mesh from several azimuths around the vertical axis.
+
+    The camera is orthographic and looks at the center of the mesh's
+    bounding box from ``elevation`` degrees; angles follow matplotlib's
+    ``view_init`` convention so frames match the static previews.
+    """
+
+    def __init__(self, vertices: 'np.ndarray', faces: 'np.ndarray', size: Tuple[int, int],
+                 elevation: float = 45.0, face_color: str = '#6c757d',
+                 background_color: str = '#ffffff', shade_levels: int = 32):
+        """
+        Prepare a mesh for rendering.
+
+        Args:
+            vertices: float (n, 3) vertex positions
+            faces: int (m, 3) triangles indexing ``vertices``
+            size: Frame size (width, height)
+            elevation: Camera elevation in degrees
+            face_color: Base color of the mesh
+            background_color: Frame background color
+            shade_levels: Brightness steps in the palette (at most 255)
+        """
+        self.size = size
+        self.elevation = elevation
+        self.peak_rss_bytes = 0
+        """Highest process RSS sampled while preparing, drawing and encoding"""
+        self.shade_levels = max(2, min(255, shade_levels))
+
+        vertices = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+        faces = np.asarray(faces, dtype=np.int32).reshape(-1, 3)
+
+        center = (vertices.min(axis=0) + vertices.max(axis=0)) / 2 if len(vertices) else 0.0
+        self.vertices = vertices - center
+        radius = float(np.sqrt((self.vertices ** 2).sum(axis=1)).max()) if len(vertices) else 0.0
+        self.scale = _FILL * min(size) / 2 / (radius or 1.0)
+
+        corners = self.vertices[faces]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        del corners
+        lengths = np.linalg.norm(normals, axis=1)
+        keep = lengths > 0
+        self.faces = faces[keep]
+        self.normals = normals[keep] / lengths[keep, None]
+
+        # Back faces can only be skipped on closed, consistently wound meshes;
+        # anything else may show its inside and is drawn whole
+        self.cull = self._is_closed_and_consistent()
+        if self.cull and self._signed_volume() < 0:
+            self.normals = -self.normals
+
+        brightness = _MIN_BRIGHTNESS + (1.0 - _MIN_BRIGHTNESS) * (self.normals @ _light_direction() + 1) / 2
+        self.shade = np.round(brightness * (self.shade_levels - 1)).astype(np.uint8)
+        self.background_index = self.shade_levels
+        self.palette = self._build_palette(face_color, background_color)
+        self._sample_memory()
+
+    @property
+    def face_count(self) -> int:
+        """Faces that are drawn (degenerate ones are dropped)."""
+        return len(self.faces)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the prepared mesh arrays."""
+        return self.vertices.nbytes + self.faces.nbytes + self.normals.nbytes + self.shade.nbytes
+
+    def _sample_memory(self) -> None:
+        """Record the process RSS if it is a new high (at the points memory use peaks)."""
+        if PSUTIL_AVAILABLE:
+            self.peak_rss_bytes = max(self.peak_rss_bytes, psutil.Process().memory_info().rss)
+
+    def _is_closed_and_consistent(self) -> bool:
+        """True if every edge is used exactly once in each direction."""
+        if not len(self.faces):
+            return False
+        edges = self.faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64)
+        count = len(self.vertices)
+        directed = np.sort(edges[:, 0] * count + edges[:, 1])
+        if np.any(directed[1:] == directed[:-1]):
+            return False
+        reverse = edges[:, 1] * count + edges[:, 0]
+        return bool(np.isin(reverse, directed, assume_unique=True).all())
+
+    def _signed_volume(self) -> float:
+        """Volume enclosed by the faces; negative if they point inwards."""
+        v0, v1, v2 = (self.vertices[self.faces[:, i]].astype(np.float64) for i in range(3))
+        return float(np.einsum('ij,ij->i', v0, np.cross(v1, v2)).sum() / 6.0)
+
+    def _build_palette(self, face_color: str, background_color: str) -> List[int]:
+        """Palette of face color shades, then the background color."""
+        base = np.array(ImageColor.getrgb(face_color)[:3], dtype=np.float32)
+        steps = np.arange(self.shade_levels, dtype=np.float32)[:, None] / (self.shade_levels - 1)
+        shades = np.clip(np.round(base * steps), 0, 255).astype(np.uint8)
+        palette = shades.flatten().tolist() + list(ImageColor.getrgb(background_color)[:3])
+        return palette + [0] * (768 - len(palette))
+
+    def _view_basis(self, azimuth: float) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Screen right/up/towards-viewer axes as a (3, 3) matrix, and the view direction."""
+        azimuth, elevation = np.radians(azimuth), np.radians(self.elevation)
+        eye = np.array([np.cos(elevation) * np.cos(azimuth),
+                        np.cos(elevation) * np.sin(azimuth),
+                        np.sin(elevation)], dtype=np.float32)
+        right = np.array([-np.sin(azimuth), np.cos(azimuth), 0.0], dtype=np.float32)
+        up = np.cross(eye, right).astype(np.float32)
+        return np.stack([right, up, eye], axis=1), eye
+
+    def draw_frame(self, draw: 'ImageDraw.ImageDraw', azimuth: float, y_offset: int = 0) -> int:
+        """
+        Draw the mesh seen from ``azimuth`` into a palette image.
+
+        Args:
+            draw: Drawer of the target image
+            azimuth: Camera azimuth in degrees
+            y_offset: Row the frame starts at in the target image
+
+        Returns:
+            Number of faces drawn
+        """
+        basis, eye = self._view_basis(azimuth)
+        projected = self.vertices @ basis
+
+        faces, shade = self.faces, self.shade
+        if self.cull:
+            visible = self.normals @ eye > 0
+            faces, shade = faces[visible], shade[visible]
+
+        # Painter's algorithm: farthest faces (smallest depth) first
+        order = np.argsort(projected[faces, 2].sum(axis=1), kind='stable')
+        width, height = self.size
+        screen = projected[:, :2] * np.array([self.scale, -self.scale], dtype=np.float32)
+        screen += np.array([width / 2, height / 2 + y_offset], dtype=np.float32)
+        polygons = screen[faces[order]].reshape(-1, 6).tolist()
+        self._sample_memory()
+
+        polygon = draw.polygon
+        for points, fill in zip(polygons, shade[order].tolist()):
+            polygon(points, fill=fill)
+        return len(polygons)
+
+    def render_frames(self, angles: Sequence[float]) -> List['Image.Image']:
+        """
+        Render one frame per azimuth.
+
+        All frames are drawn into one palette image stacked vertically and
+        returned as views of it.
+        """
+        width, height = self.size
+        canvas = Image.new('P', (width, height * len(angles)), self.background_index)
+        canvas.putpalette(self.palette)
+        draw = ImageDraw.Draw(canvas)
+        for index, azimuth in enumerate(angles):
+            self.draw_frame(draw, azimuth, y_offset=index * height)
+        return [canvas.crop((0, index * height, width, (index + 1) * height)) for index in range(len(angles))]
+
+    def render_gif(self, angles: Sequence[float], frame_duration: int = 500, loop: int = 0) -> bytes:
+        """
+        Render a looping turntable GIF.
+
+        Args:
+            angles: Camera azimuths in degrees, one frame each
+            frame_duration: Milliseconds per frame
+            loop: GIF loop count (0 = infinite)
+
+        Returns:
+            GIF bytes
+        """
+        frames = self.render_frames(angles)
+        buffer = BytesIO()
+        frames[0].save(
+            buffer,
+            format='GIF',
+            save_all=True,
+            append_images=frames[1:],
+            duration=frame_duration,
+            loop=loop,
+            optimize=False
+        )
+        self._sample_memory()
+        return buffer.getvalue()
@@ -103,7 +103,7 @@ class UsageStatisticsService(BaseService):
             repository: Optional repository override for testing
         """
         super().__init__(database)
-        self.repository = repository or UsageStatisticsRepository(database._connection)
+        self.repository = repository or UsageStatisticsRepository.from_database(database)
         self.settings = get_settings()
 
         # Track initialization timestamp for uptime calculation
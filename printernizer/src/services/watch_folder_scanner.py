@@ -0,0 +1,352 @@
+"""
+Watch-folder scan pipeline for Printernizer.
+
+A folder scan runs as four stages connected by bounded queues:
+
+    walk      os.scandir recursion in a worker thread, filtered by file name
+    stat      os.stat per path, one thread call per batch of walked paths
+    hash      checksum index lookup, hashing only files that changed
+    upsert    batched checksum index writes, then per-file registration
+
+Every stage has its own concurrency limit, so a slow disk or network mount
+no longer serializes the whole scan, and the bounded queues keep memory flat
+on very large folders. Progress and throughput are emitted as
+``watch_folder_scan_progress`` / ``watch_folder_scan_completed`` events.
+"""
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import structlog
+
+from src.constants import FileConstants
+
+logger = structlog.get_logger()
+
+# Registration callback: (file_path, stat, checksum or None)
+RegisterCallback = Callable[[str, os.stat_result, Optional[str]], Awaitable[None]]
+
+
+class ScannedFile(NamedTuple):
+    """A file travelling through the scan pipeline."""
+    path: str
+    stat: os.stat_result
+    checksum: Optional[str] = None
+    fresh: bool = False  # checksum computed by this scan, not read from the index
+
+
+@dataclass
+class ScanStats:
+    """Counters for one folder scan."""
+    folder: str
+    started_at: float = field(default_factory=time.monotonic)
+    files_found: int = 0
+    files_processed: int = 0
+    files_hashed: int = 0
+    index_hits: int = 0
+    bytes_processed: int = 0
+    bytes_hashed: int = 0
+    errors: int = 0
+    walk_errors: int = 0
+    walk_complete: bool = False
+    completed: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Event payload for this scan.
+
+        ``files_per_second`` counts processed files; ``mb_per_second`` counts
+        bytes actually read for hashing, so index hits do not inflate it.
+        """
+        elapsed = max(time.monotonic() - self.started_at, 1e-6)
+        return {
+            'folder': self.folder,
+            'files_found': self.files_found,
+            'files_processed': self.files_processed,
+            'files_hashed': self.files_hashed,
+            'index_hits': self.index_hits,
+            'bytes_processed': self.bytes_processed,
+            'bytes_hashed': self.bytes_hashed,
+            'errors': self.errors + self.walk_errors,
+            'walk_complete': self.walk_complete,
+            'completed': self.completed,
+            'elapsed_seconds': round(elapsed, 3),
+            'files_per_second': round(self.files_processed / elapsed, 1),
+            'mb_per_second': round(self.bytes_hashed / elapsed / 1_048_576, 2),
+        }
+
+
+def _stat_paths(paths: List[str]) -> List[Tuple[str, Optional[os.stat_result]]]:
+    """Stat a batch of paths; files that vanished since the walk get None."""
+    results = []
+    for path in paths:
+        try:
+            results.append((path, os.stat(path)))
+        except OSError:
+            results.append((path, None))
+    return results
+
+
+class WatchFolderScanner:
+    """
+    Pipelined scanner for one watch folder.
+
+    The scanner only discovers, stats and hashes files; what happens to a
+    file afterwards is up to the ``register`` callback (FileWatcherService
+    tracks it and adds it to the library). Files with the same checksum are
+    registered one after another so the library never races on duplicates.
+
+    Example:
+        >>> scanner = WatchFolderScanner(handler.should_process_file, register,
+        ...                              event_service, library_service)
+        >>> stats = await scanner.scan("/prints", recursive=True)
+        >>> stats.to_dict()['files_per_second']
+        412.5
+    """
+
+    def __init__(self, should_process: Callable[[str], bool], register: RegisterCallback,
+                 event_service=None, library_service=None,
+                 stat_workers: int = FileConstants.SCAN_STAT_WORKERS,
+                 hash_workers: int = FileConstants.SCAN_HASH_WORKERS,
+                 register_workers: int = FileConstants.SCAN_REGISTER_WORKERS,
+                 walk_batch_size: int = FileConstants.SCAN_WALK_BATCH_SIZE,
+                 queue_size: int = FileConstants.SCAN_QUEUE_SIZE,
+                 index_batch_size: int = FileConstants.SCAN_INDEX_BATCH_SIZE,
+                 progress_interval: float = FileConstants.SCAN_PROGRESS_INTERVAL_SECONDS):
+        """
+        Initialize the scanner.
+
+        Args:
+            should_process: Name filter for walked files
+            register: Coroutine called once per discovered file
+            event_service: EventService for progress events (optional)
+            library_service: LibraryService; when given, files are hashed via
+                its checksum index and the index is pruned after the scan
+            stat_workers: Concurrent stat stage workers
+            hash_workers: Concurrent hash stage workers
+            register_workers: Concurrent registrations per upsert batch
+            walk_batch_size: Paths per hand-off from the walk thread
+            queue_size: Bound of the stat/hash/upsert queues
+            index_batch_size: Checksum index rows per transaction
+            progress_interval: Seconds between progress events
+        """
+        self.should_process = should_process
+        self.register = register
+        self.event_service = event_service
+        self.library_service = library_service
+        self.stat_workers = max(1, stat_workers)
+        self.hash_workers = max(1, hash_workers)
+        self.register_workers = max(1, register_workers)
+        self.walk_batch_size = max(1, walk_batch_size)
+        self.queue_size = max(1, queue_size)
+        self.index_batch_size = max(1, index_batch_size)
+        self.progress_interval = progress_interval
+
+    async def scan(self, folder: str, recursive: bool = True) -> ScanStats:
+        """
+        Scan a folder and register every matching file.
+
+        Args:
+            folder: Folder to scan
+            recursive: Descend into subdirectories
+
+        Returns:
+            Final scan counters
+        """
+        stats = ScanStats(folder=str(folder))
+        loop = asyncio.get_running_loop()
+        stop = threading.Event()
+        found_paths: List[str] = []
+
+        walked: asyncio.Queue = asyncio.Queue(max(1, self.queue_size // self.walk_batch_size))
+        statted: asyncio.Queue = asyncio.Queue(self.queue_size)
+        hashed: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        tasks = [asyncio.create_task(self._stat_worker(walked, statted if self.library_service else hashed))
+                 for _ in range(self.stat_workers)]
+        if self.library_service:
+            tasks += [asyncio.create_task(self._hash_worker(statted, hashed, stats))
+                      for _ in range(self.hash_workers)]
+        tasks.append(asyncio.create_task(self._upsert_stage(hashed, stats)))
+        tasks.append(asyncio.create_task(self._report_progress(stats)))
+
+        try:
+            await asyncio.to_thread(self._walk, str(folder), recursive, walked,
+                                    loop, stop, stats, found_paths)
+            stats.walk_complete = True
+            # Drain the stages in order; every worker marks items done even on error
+            await walked.join()
+            await statted.join()
+            await hashed.join()
+            stats.completed = True
+        finally:
+            stop.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Only prune after a complete walk, otherwise entries of unreadable
+        # directories would be dropped and rehashed next time
+        if self.library_service and stats.walk_errors == 0:
+            try:
+                await self.library_service.checksum_index.prune(
+                    os.path.abspath(folder), [os.path.abspath(p) for p in found_paths],
+                    recursive=recursive
+                )
+            except Exception as e:
+                logger.warning("Failed to prune checksum index", folder=str(folder), error=str(e))
+
+        result = stats.to_dict()
+        await self._emit('watch_folder_scan_completed', result)
+        logger.info("Watch folder scanned", **result)
+        return stats
+
+    def _walk(self, root: str, recursive: bool, outbox: asyncio.Queue,
+              loop: asyncio.AbstractEventLoop, stop: threading.Event,
+              stats: ScanStats, found_paths: List[str]) -> None:
+        """Walk stage (runs in a thread): hand matching paths over in batches."""
+        batch: List[str] = []
+        directories = [root]
+        while directories and not stop.is_set():
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if recursive:
+                                    directories.append(entry.path)
+                            elif entry.is_file() and self.should_process(entry.path):
+                                batch.append(entry.path)
+                        except OSError:
+                            continue
+                        if len(batch) >= self.walk_batch_size:
+                            if not self._hand_off(outbox, batch, loop, stop, stats, found_paths):
+                                return
+                            batch = []
+            except OSError as e:
+                stats.walk_errors += 1
+                logger.warning("Cannot scan directory", directory=directory, error=str(e))
+        if batch:
+            self._hand_off(outbox, batch, loop, stop, stats, found_paths)
+
+    @staticmethod
+    def _hand_off(outbox: asyncio.Queue, batch: List[str], loop: asyncio.AbstractEventLoop,
+                  stop: threading.Event, stats: ScanStats, found_paths: List[str]) -> bool:
+        """Put a batch on the loop's queue, blocking for back-pressure until stopped."""
+        future = asyncio.run_coroutine_threadsafe(outbox.put(batch), loop)
+        while True:
+            try:
+                future.result(timeout=0.5)
+                break
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    future.cancel()
+                    return False
+        stats.files_found += len(batch)
+        found_paths.extend(batch)
+        return True
+
+    async def _stat_worker(self, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        """Stat stage: one thread call per walked batch."""
+        while True:
+            batch = await inbox.get()
+            try:
+                for path, stat in await asyncio.to_thread(_stat_paths, batch):
+                    if stat is None:
+                        logger.debug("File vanished during scan", file_path=path)
+                        continue
+                    await outbox.put(ScannedFile(path, stat))
+            except Exception as e:
+                logger.error("Scan stat stage failed", error=str(e))
+            finally:
+                inbox.task_done()
+
+    async def _hash_worker(self, inbox: asyncio.Queue, outbox: asyncio.Queue,
+                           stats: ScanStats) -> None:
+        """Hash stage: reuse the checksum index, hash only on a miss."""
+        index = self.library_service.checksum_index
+        algorithm = self.library_service.checksum_algorithm
+        while True:
+            item: ScannedFile = await inbox.get()
+            try:
+                path = os.path.abspath(item.path)
+                checksum = await index.lookup(path, item.stat, algorithm)
+                fresh = checksum is None
+                if fresh:
+                    checksum = await self.library_service.calculate_checksum(Path(path))
+                    stats.files_hashed += 1
+                    stats.bytes_hashed += item.stat.st_size
+                else:
+                    stats.index_hits += 1
+                await outbox.put(item._replace(checksum=checksum, fresh=fresh))
+            except Exception as e:
+                stats.errors += 1
+                logger.error("Failed to hash file during scan", file_path=item.path, error=str(e))
+            finally:
+                inbox.task_done()
+
+    async def _upsert_stage(self, inbox: asyncio.Queue, stats: ScanStats) -> None:
+        """Upsert stage: batched checksum index writes, then registration."""
+        while True:
+            batch: List[ScannedFile] = [await inbox.get()]
+            while len(batch) < self.index_batch_size:
+                try:
+                    batch.append(inbox.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                fresh = [(os.path.abspath(item.path), item.stat, item.checksum)
+                         for item in batch if item.fresh]
+                if fresh:
+                    try:
+                        await self.library_service.checksum_index.store_many(
+                            fresh, self.library_service.checksum_algorithm
+                        )
+                    except Exception as e:
+                        logger.warning("Failed to store scanned checksums", count=len(fresh), error=str(e))
+                await self._register_batch(batch, stats)
+            finally:
+                for _ in batch:
+                    inbox.task_done()
+
+    async def _register_batch(self, batch: List[ScannedFile], stats: ScanStats) -> None:
+        """Register a batch; files sharing a checksum run sequentially."""
+        groups: Dict[str, List[ScannedFile]] = {}
+        for item in batch:
+            groups.setdefault(item.checksum or item.path, []).append(item)
+
+        semaphore = asyncio.Semaphore(self.register_workers)
+
+        async def register_group(items: List[ScannedFile]) -> None:
+            async with semaphore:
+                for item in items:
+                    try:
+                        await self.register(item.path, item.stat, item.checksum)
+                    except Exception as e:
+                        stats.errors += 1
+                        logger.error("Failed to register scanned file", file_path=item.path, error=str(e))
+                    stats.files_processed += 1
+                    stats.bytes_processed += item.stat.st_size
+
+        await asyncio.gather(*(register_group(items) for items in groups.values()))
+
+    async def _report_progress(self, stats: ScanStats) -> None:
+        """Emit progress events until cancelled."""
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            await self._emit('watch_folder_scan_progress', stats.to_dict())
+
+    async def _emit(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Emit a scan event; failures never abort the scan."""
+        if not self.event_service:
+            return
+        try:
+            await self.event_service.emit_event(event_type, data)
+        except Exception as e:
+            logger.warning("Failed to emit scan event", event_type=event_type, error=str(e))
@@ -159,6 +159,27 @@ class PrinternizerSettings(BaseSettings):
         env="WATCH_RECURSIVE",
         description="Enable recursive monitoring of subdirectories in watch folders."
     )
+    watch_scan_stat_workers: int = Field(
+        default=4,
+        env="WATCH_SCAN_STAT_WORKERS",
+        description="Concurrent stat workers per watch folder scan. Must be between 1 and 32.",
+        ge=1,
+        le=32
+    )
+    watch_scan_hash_workers: int = Field(
+        default=4,
+        env="WATCH_SCAN_HASH_WORKERS",
+        description="Concurrent hash workers per watch folder scan. Must be between 1 and 16.",
+        ge=1,
+        le=16
+    )
+    watch_scan_register_workers: int = Field(
+        default=2,
+        env="WATCH_SCAN_REGISTER_WORKERS",
+        description="Concurrent library registrations per watch folder scan. Must be between 1 and 8.",
+        ge=1,
+        le=8
+    )
 
     # WebSocket Configuration
     enable_websockets: bool = Field(
@@ -261,6 +282,46 @@ class PrinternizerSettings(BaseSettings):
         ge=10,
         le=300
     )
+    preview_render_workers: int = Field(
+        default=2,
+        env="PREVIEW_RENDER_WORKERS",
+        description="Number of worker processes rendering 3D file previews. Must be between 1 and 16.",
+        ge=1,
+        le=16
+    )
+    preview_cache_max_mb: int = Field(
+        default=512,
+        env="PREVIEW_CACHE_MAX_MB",
+        description="Rendered preview cache budget in MB; least recently used previews are evicted beyond it. Must be between 16 and 65536.",
+        ge=16,
+        le=65536
+    )
+    mesh_cache_dir: str = Field(
+        default="data/mesh-cache",
+        env="MESH_CACHE_DIR",
+        description="Directory for parsed STL/3MF meshes shared by analysis and preview rendering. Will be created if doesn't exist."
+    )
+    mesh_cache_memory_mb: int = Field(
+        default=256,
+        env="MESH_CACHE_MEMORY_MB",
+        description="In-memory parsed mesh cache budget per process in MB (0 disables). Must be between 0 and 8192.",
+        ge=0,
+        le=8192
+    )
+    mesh_cache_disk_mb: int = Field(
+        default=1024,
+        env="MESH_CACHE_DISK_MB",
+        description="On-disk parsed mesh cache budget in MB (0 disables). Must be between 0 and 65536.",
+        ge=0,
+        le=65536
+    )
+    mesh_preview_max_faces: int = Field(
+        default=50000,
+        env="MESH_PREVIEW_MAX_FACES",
+        description="Meshes with more triangles are decimated before preview rendering. Must be between 1000 and 2000000.",
+        ge=1000,
+        le=2000000
+    )
 
     # Model Generator Configuration
     # Geometry is generated client-side (JSCAD); this dir only stages uploaded
@@ -310,10 +371,15 @@ class PrinternizerSettings(BaseSettings):
     library_processing_workers: int = Field(
         default=2,
         env="LIBRARY_PROCESSING_WORKERS",
-        description="Number of worker threads for library processing. Must be between 1 and 10.",
+        description="Number of concurrent library metadata extraction workers. Must be between 1 and 10.",
         ge=1,
         le=10
     )
+    library_extraction_processes: bool = Field(
+        default=True,
+        env="LIBRARY_EXTRACTION_PROCESSES",
+        description="Parse 3MF and STL files for library metadata in worker processes instead of threads."
+    )
 
     # Library Search Configuration
     library_search_enabled: bool = Field(
@@ -369,6 +435,27 @@ class PrinternizerSettings(BaseSettings):
         env="TIMELAPSE_FLICKERFREE_PATH",
         description="Path to FlickerFree do_timelapse.sh script for video processing."
     )
+    timelapse_max_concurrent_renders: int = Field(
+        default=1,
+        env="TIMELAPSE_MAX_CONCURRENT_RENDERS",
+        description="Number of timelapse videos rendered at the same time. Must be between 1 and 8.",
+        ge=1,
+        le=8
+    )
+    timelapse_render_nice: int = Field(
+        default=10,
+        env="TIMELAPSE_RENDER_NICE",
+        description="CPU niceness of render processes (0 = normal priority, 19 = lowest). Must be between 0 and 19.",
+        ge=0,
+        le=19
+    )
+    timelapse_render_timeout: int = Field(
+        default=1800,
+        env="TIMELAPSE_RENDER_TIMEOUT",
+        description="Seconds before a timelapse render is aborted. Must be between 60 and 21600 seconds.",
+        ge=60,
+        le=21600
+    )
 
     # Slicing Configuration
     slicing_output_dir: str = Field(
@@ -26,6 +26,7 @@ from src.services.material_service import MaterialService
 from src.services.timelapse_service import TimelapseService
 from src.services.search_service import SearchService
 from src.services.camera_snapshot_service import CameraSnapshotService
+from src.services.status_history_service import StatusHistoryService
 from src.services.slicer_service import SlicerService
 from src.services.slicing_queue import SlicingQueue
 
@@ -39,42 +40,42 @@ async def get_snapshot_repository(
     database: Database = Depends(get_database)
 ) -> SnapshotRepository:
     """Get snapshot repository instance."""
-    return SnapshotRepository(database._connection)
+    return SnapshotRepository.from_database(database)
 
 
 async def get_trending_repository(
     database: Database = Depends(get_database)
 ) -> TrendingRepository:
     """Get trending repository instance."""
-    return TrendingRepository(database._connection)
+    return TrendingRepository.from_database(database)
 
 
 async def get_idea_repository(
     database: Database = Depends(get_database)
 ) -> IdeaRepository:
     """Get idea repository instance."""
-    return IdeaRepository(database._connection)
+    return IdeaRepository.from_database(database)
 
 
 async def get_printer_repository(
     database: Database = Depends(get_database)
 ) -> PrinterRepository:
     """Get printer repository instance."""
-    return PrinterRepository(database._connection)
+    return PrinterRepository.from_database(database)
 
 
 async def get_job_repository(
     database: Database = Depends(get_database)
 ) -> JobRepository:
     """Get job repository instance."""
-    return JobRepository(database._connection)
+    return JobRepository.from_database(database)
 
 
 async def get_file_repository(
     database: Database = Depends(get_database)
 ) -> FileRepository:
     """Get file repository instance."""
-    return FileRepository(database._connection)
+    return FileRepository.from_database(database)
 
 
 async def get_config_service(request: Request) -> ConfigService:
@@ -110,10 +111,11 @@ async def get_analytics_service(
 
 
 async def get_idea_service(
+    request: Request,
     database: Database = Depends(get_database)
 ) -> IdeaService:
     """Get idea service instance."""
-    return IdeaService(database)
+    return IdeaService(database, event_service=request.app.state.event_service)
 
 
 # DISABLED - Trending service disabled
@@ -140,14 +142,9 @@ async def get_timelapse_service(request: Request) -> TimelapseService:
     return request.app.state.timelapse_service
 
 
-async def get_search_service(
-    database: Database = Depends(get_database),
-    request: Request = None
-) -> SearchService:
-    """Get search service instance."""
-    file_service = request.app.state.file_service if request else None
-    idea_service = IdeaService(database)
-    return SearchService(database, file_service, idea_service)
+async def get_search_service(request: Request) -> SearchService:
+    """Get search service instance from app state."""
+    return request.app.state.search_service
 
 
 async def get_camera_snapshot_service(request: Request) -> CameraSnapshotService:
@@ -155,6 +152,11 @@ async def get_camera_snapshot_service(request: Request) -> CameraSnapshotService
     return request.app.state.camera_snapshot_service
 
 
+async def get_status_history_service(request: Request) -> StatusHistoryService:
+    """Get status history service instance from app state."""
+    return request.app.state.status_history_service
+
+
 async def get_slicer_service(request: Request) -> SlicerService:
     """Get slicer service instance from app state."""
     return request.app.state.slicer_service
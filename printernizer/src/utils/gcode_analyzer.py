@@ -3,9 +3,13 @@ G-code analyzer for identifying print start and warmup phases.
 Used to optimize G-code preview rendering by showing only the actual print.
 """
 import re
-from typing import List, Optional, Tuple
+from itertools import islice
+from typing import List, Optional, Tuple, TYPE_CHECKING
 import structlog
 
+if TYPE_CHECKING:
+    from .gcode_toolpath import Toolpath
+
 logger = structlog.get_logger(__name__)
 
 
@@ -175,6 +179,60 @@ class GcodeAnalyzer:
         
         return optimized_lines
         
+    def read_print_lines(self, file_path: str, max_lines: int,
+                         analyze_lines: int = 1000) -> Tuple[List[str], int]:
+        """
+        Read the G-code lines needed to show the print, in a single pass.
+
+        The first ``analyze_lines`` lines are searched for the print start
+        (when optimization is enabled); reading then continues from the same
+        file handle until ``max_lines`` lines after the print start.
+
+        Args:
+            file_path: Path to G-code file
+            max_lines: Maximum lines to return after the print start
+            analyze_lines: Lines searched for the print start
+
+        Returns:
+            Tuple of (lines, print start index). The lines include the
+            warmup prefix so callers can replay modal state.
+        """
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            if not self.optimize_enabled:
+                return [line.rstrip() for line in islice(f, max_lines)], 0
+
+            lines = [line.rstrip() for line in islice(f, analyze_lines)]
+            start_line = self.find_print_start_line(lines) or 0
+
+            end_line = start_line + max_lines
+            if end_line > len(lines):
+                lines.extend(line.rstrip() for line in islice(f, end_line - len(lines)))
+            else:
+                del lines[end_line:]
+
+        if start_line:
+            logger.info(f"G-code optimized: skipping {start_line} warmup lines, "
+                       f"kept {len(lines) - start_line} print lines")
+        return lines, start_line
+
+    def get_toolpath(self, file_path: str, max_lines: int, analyze_lines: int = 1000) -> 'Toolpath':
+        """
+        Extract the toolpath of the print (warmup removed when optimizing).
+
+        Args:
+            file_path: Path to G-code file
+            max_lines: Maximum lines to parse after the print start
+            analyze_lines: Lines searched for the print start
+
+        Returns:
+            Toolpath of the moves from the print start on
+        """
+        # Imported lazily: NumPy is only needed for toolpath extraction
+        from .gcode_toolpath import extract_toolpath
+
+        lines, start_line = self.read_print_lines(file_path, max_lines, analyze_lines)
+        return extract_toolpath(lines, start_line)
+
     def analyze_gcode_file(self, file_path: str, max_lines: int = 1000) -> dict:
         """
         Analyze a G-code file and return optimization info.
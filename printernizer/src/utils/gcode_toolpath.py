@@ -0,0 +1,324 @@
+"""
+Vectorized G-code toolpath extraction.
+
+Parses G0/G1 moves into NumPy coordinate arrays instead of splitting tokens
+per line in Python: the G-code is scanned as one byte array, axis words are
+located and converted to floats with array operations. Modal state (position, E axis, absolute/relative
+extrusion) is carried forward with array operations, moves are classified
+as extrusion or travel, and layers are derived from the Z height of
+extrusion moves so toolpaths can be decimated per layer for rendering.
+"""
+import re
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+import numpy as np
+
+# Command codes per line (-1 for lines the extractor ignores)
+_CMD_NONE, _CMD_G0, _CMD_G1, _CMD_G92, _CMD_M82, _CMD_M83 = range(-1, 5)
+
+_COMMENT_PATTERN = re.compile(rb';[^\n]*')
+
+# Byte values
+_SPACE, _TAB, _LF, _CR = 32, 9, 10, 13
+_MINUS, _DOT, _ZERO = 45, 46, 48
+
+# Axis letters and their column in the X/Y/Z/E coordinate matrix
+_AXIS_COLUMNS = {ord('X'): 0, ord('Y'): 1, ord('Z'): 2, ord('E'): 3}
+
+# Longest numeric word parsed; longer words are treated as invalid
+MAX_NUMBER_WIDTH = 16
+
+_POW10 = 10.0 ** np.arange(MAX_NUMBER_WIDTH + 1)
+
+# Minimum Z increase between extrusion moves that starts a new layer (mm)
+LAYER_Z_EPSILON = 1e-4
+
+
+@dataclass
+class Toolpath:
+    """
+    Extracted toolpath moves.
+
+    Attributes:
+        positions: (n, 3) float array with the end position of each move
+        extruding: (n,) bool array, True for extrusion moves, False for travel
+        layers: (n,) int array with the layer index of each move
+        line_numbers: (n,) int array with the source line index of each move
+    """
+
+    positions: np.ndarray
+    extruding: np.ndarray
+    layers: np.ndarray
+    line_numbers: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def layer_count(self) -> int:
+        """Number of layers containing moves."""
+        return int(self.layers[-1]) + 1 if len(self.layers) else 0
+
+    @property
+    def extrusion_count(self) -> int:
+        """Number of extrusion moves."""
+        return int(np.count_nonzero(self.extruding))
+
+    def decimate(self, max_points: int) -> 'Toolpath':
+        """
+        Thin out moves so at most about ``max_points`` remain.
+
+        Each layer gets a share of the budget proportional to its move count
+        and keeps every n-th move. The first and last move of each layer and
+        every extrusion/travel transition are always kept, so printed runs
+        are never joined across a travel move.
+
+        When there are too many layers for that to reduce anything (spiral
+        vase G-code raises Z on every move, so nearly every move is its own
+        layer), every n-th move of the whole toolpath is kept instead.
+
+        Args:
+            max_points: Target number of moves
+
+        Returns:
+            Decimated toolpath (``self`` if already within budget)
+        """
+        n = len(self)
+        if n <= max_points or max_points <= 0:
+            return self
+
+        # Per-layer decimation keeps at least the two ends of every layer
+        if self.layer_count * 2 <= max_points:
+            counts = np.bincount(self.layers)
+            allotment = np.maximum(1, np.floor(counts * (max_points / n)))
+            strides = np.ceil(counts / allotment).astype(np.int64)
+            layer_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+            index_in_layer = np.arange(n) - layer_starts[self.layers]
+            keep = (index_in_layer % strides[self.layers]) == 0
+            keep[:-1] |= self.layers[:-1] != self.layers[1:]
+        else:
+            keep = (np.arange(n) % int(np.ceil(n / max_points))) == 0
+
+        # Last move and extrusion/travel transitions
+        keep[-1] = True
+        keep[:-1] |= self.extruding[:-1] != self.extruding[1:]
+        keep[1:] |= self.extruding[1:] != self.extruding[:-1]
+
+        return Toolpath(
+            positions=self.positions[keep],
+            extruding=self.extruding[keep],
+            layers=self.layers[keep],
+            line_numbers=self.line_numbers[keep],
+        )
+
+    def extrusion_polyline(self) -> np.ndarray:
+        """
+        Build a polyline of the extrusion moves for plotting.
+
+        Each extrusion run starts at the position of the move before it.
+        Runs are separated by NaN rows, which matplotlib treats as line
+        breaks, so travel moves are not drawn.
+
+        Returns:
+            (m, 3) float array, empty if there are no extrusion moves
+        """
+        if not self.extrusion_count:
+            return np.empty((0, 3))
+
+        # A move is drawn if it extrudes or if it is the start point of the
+        # next extrusion run
+        next_extruding = np.zeros_like(self.extruding)
+        next_extruding[:-1] = self.extruding[1:]
+        drawn = np.flatnonzero(self.extruding | next_extruding)
+
+        points = self.positions[drawn]
+        run_starts = np.flatnonzero(~self.extruding[drawn])
+        run_starts = run_starts[run_starts > 0]
+        return np.insert(points, run_starts, np.nan, axis=0)
+
+    def bounds(self, extrusion_only: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the (min, max) corners of the toolpath.
+
+        Args:
+            extrusion_only: Ignore travel moves when the toolpath has
+                extrusion moves (travel often parks at the bed origin)
+
+        Returns:
+            Tuple of two (3,) arrays
+        """
+        positions = self.positions
+        if extrusion_only and self.extrusion_count:
+            positions = positions[self.extruding]
+        return positions.min(axis=0), positions.max(axis=0)
+
+
+def _forward_fill(values: np.ndarray, initial: float) -> np.ndarray:
+    """Replace NaNs with the last preceding non-NaN value (or ``initial``)."""
+    filled = np.concatenate(([initial], values))
+    index = np.where(np.isnan(filled), 0, np.arange(len(filled)))
+    np.maximum.accumulate(index, out=index)
+    return filled[index][1:]
+
+
+def _is_word_end(chars: np.ndarray) -> np.ndarray:
+    """Check which bytes end a G-code word (whitespace or end of line)."""
+    return (chars == _SPACE) | (chars == _TAB) | (chars == _LF) | (chars == _CR)
+
+
+def _parse_commands(padded: np.ndarray, line_starts: np.ndarray) -> np.ndarray:
+    """Classify each line by its leading command (G0, G1, G92, M82, M83)."""
+    c0, c1, c2, c3 = (padded[line_starts + k] for k in range(4))
+    g = c0 == ord('G')
+    m8 = (c0 == ord('M')) & (c1 == ord('8'))
+
+    commands = np.full(len(line_starts), _CMD_NONE, dtype=np.int8)
+    commands[g & (c1 == ord('0')) & _is_word_end(c2)] = _CMD_G0
+    commands[g & (c1 == ord('1')) & _is_word_end(c2)] = _CMD_G1
+    commands[g & (c1 == ord('9')) & (c2 == ord('2')) & _is_word_end(c3)] = _CMD_G92
+    commands[m8 & (c2 == ord('2')) & _is_word_end(c3)] = _CMD_M82
+    commands[m8 & (c2 == ord('3')) & _is_word_end(c3)] = _CMD_M83
+    return commands
+
+
+def _parse_numbers(padded: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Parse decimal numbers from byte ranges without creating Python objects.
+
+    Works column by column over all numbers at once: digits are accumulated
+    into an integer mantissa, which is divided by the power of ten given by
+    the digits after the decimal point. Ranges that are not a plain decimal
+    number ("-", "1.2.3", "1e5") yield NaN.
+    """
+    lengths = ends - starts
+    width = min(int(lengths.max()) if len(lengths) else 0, MAX_NUMBER_WIDTH)
+
+    mantissa = np.zeros(len(starts), dtype=np.int64)
+    digit_count = np.zeros(len(starts), dtype=np.int64)
+    integer_digits = np.zeros(len(starts), dtype=np.int64)
+    dot_count = np.zeros(len(starts), dtype=np.int64)
+    negative = padded[starts] == _MINUS
+
+    for column in range(width):
+        chars = padded[starts + column]
+        inside = column < lengths
+        digits = chars - np.uint8(_ZERO)
+        is_digit = (digits <= 9) & inside
+        mantissa = np.where(is_digit, mantissa * 10 + digits, mantissa)
+        digit_count += is_digit
+        integer_digits += is_digit & (dot_count == 0)
+        dot_count += (chars == _DOT) & inside
+
+    values = mantissa / _POW10[digit_count - integer_digits]
+    values[negative] *= -1
+
+    valid = (digit_count > 0) & (dot_count <= 1) & (digit_count + dot_count + negative == lengths)
+    return np.where(valid, values, np.nan)
+
+
+def _parse_lines(lines: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse G-code lines into per-line commands and X/Y/Z/E words.
+
+    Returns:
+        Tuple of (commands, coords): an (n,) int8 array of command codes and
+        a preallocated (n, 4) float array of X/Y/Z/E values, NaN where a
+        line has no such word
+    """
+    text = _COMMENT_PATTERN.sub(b'', '\n'.join(lines).encode('utf-8', errors='ignore'))
+    buf = np.frombuffer(text, dtype=np.uint8)
+    padded = np.concatenate((buf, np.full(MAX_NUMBER_WIDTH + 4, _LF, dtype=np.uint8)))
+
+    newlines = np.flatnonzero(buf == _LF)
+    line_starts = np.concatenate(([0], newlines + 1))
+    commands = _parse_commands(padded, line_starts)
+
+    whitespace = (buf == _SPACE) | (buf == _TAB)
+    word_ends = np.concatenate((np.flatnonzero(_is_word_end(buf)), [len(buf)]))
+
+    # Axis words: an axis letter right after whitespace
+    after_whitespace = np.zeros(len(buf), dtype=bool)
+    after_whitespace[1:] = whitespace[:-1]
+    is_axis = np.zeros(len(buf), dtype=bool)
+    for letter in _AXIS_COLUMNS:
+        is_axis |= buf == letter
+    word_positions = np.flatnonzero(is_axis & after_whitespace)
+
+    column_lookup = np.full(256, -1, dtype=np.int8)
+    for letter, column in _AXIS_COLUMNS.items():
+        column_lookup[letter] = column
+
+    starts = word_positions + 1
+    ends = word_ends[np.searchsorted(word_ends, starts)]
+
+    coords = np.full((len(line_starts), 4), np.nan)
+    coords[np.searchsorted(newlines, word_positions), column_lookup[buf[word_positions]]] = (
+        _parse_numbers(padded, starts, ends)
+    )
+    return commands, coords
+
+
+def extract_toolpath(lines: Iterable[str], start_line: int = 0) -> Toolpath:
+    """
+    Extract the toolpath from G-code lines.
+
+    Lines before ``start_line`` are parsed for modal state (position,
+    extrusion mode, E axis) but their moves are not part of the result, so a
+    toolpath trimmed to the print start still begins at the right height.
+
+    Args:
+        lines: G-code lines without line terminators
+        start_line: Index of the first line whose moves are returned
+
+    Returns:
+        Toolpath with one entry per G0/G1 move at or after ``start_line``
+    """
+    commands, coords = _parse_lines(lines)
+
+    # Only the tracked commands take part in modal state
+    tracked = commands != _CMD_NONE
+    commands = commands[tracked]
+    coords = coords[tracked]
+    line_numbers = np.flatnonzero(tracked)
+
+    is_move = (commands == _CMD_G0) | (commands == _CMD_G1)
+    is_g92 = commands == _CMD_G92
+
+    # G92 only resets axes; keep its X/Y/Z out of the position carry-forward
+    coords[is_g92, :3] = np.nan
+
+    mode = np.full(len(commands), np.nan)
+    mode[commands == _CMD_M82] = 0.0
+    mode[commands == _CMD_M83] = 1.0
+    relative = _forward_fill(mode, 0.0) == 1.0
+
+    raw_e = coords[:, 3]
+    e = _forward_fill(raw_e, 0.0)
+    previous_e = np.concatenate(([0.0], e[:-1]))
+    has_e = ~np.isnan(raw_e)
+    e_advance = np.where(relative, np.nan_to_num(raw_e), e - previous_e)
+    extruding = (commands == _CMD_G1) & has_e & (e_advance > 0)
+
+    positions = np.column_stack([_forward_fill(coords[:, axis], 0.0) for axis in range(3)])
+
+    keep = is_move & (line_numbers >= start_line)
+    positions = positions[keep]
+    extruding = extruding[keep]
+    line_numbers = line_numbers[keep]
+
+    # A new layer starts when an extrusion move is higher than the previous one
+    z = positions[:, 2]
+    extrusion_z = _forward_fill(np.where(extruding, z, np.nan), -np.inf)
+    previous_extrusion_z = np.concatenate(([-np.inf], extrusion_z[:-1]))
+    new_layer = extruding & (z > previous_extrusion_z + LAYER_Z_EPSILON)
+    # Moves before the first extrusion belong to the first layer
+    layers = np.maximum(np.cumsum(new_layer, dtype=np.int64) - 1, 0)
+
+    return Toolpath(
+        positions=positions,
+        extruding=extruding,
+        layers=layers,
+        line_numbers=line_numbers,
+    )
@@ -0,0 +1,66 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified) for image endpoints.
+
+Preview and thumbnail endpoints attach validators to their responses so
+browsers revalidate with ``If-None-Match`` / ``If-Modified-Since`` and get an
+empty 304 instead of downloading the image again.
+
+Usage:
+    ```python
+    headers = cache_validator_headers(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type="image/png", headers=headers)
+    ```
+"""
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Optional, Union
+
+from fastapi import Request
+
+
+def content_etag(data: Union[bytes, str]) -> str:
+    """Strong entity tag derived from the response content."""
+    if isinstance(data, str):
+        data = data.encode()
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def cache_validator_headers(etag: str, last_modified: Optional[float] = None) -> Dict[str, str]:
+    """
+    ETag and Last-Modified response headers.
+
+    Args:
+        etag: Quoted entity tag
+        last_modified: Epoch seconds the content was produced
+    """
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[float] = None) -> bool:
+    """
+    True if the client's cached copy is current (answer with 304).
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since`` (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: a W/ prefix added by a proxy still matches
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one second resolution
+        return int(last_modified) <= since
+    return False
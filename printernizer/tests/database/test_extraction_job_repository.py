@@ -0,0 +1,165 @@
+"""Tests for the metadata extraction job queue transitions."""
+import time
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.database.repositories.extraction_job_repository import ExtractionJobRepository
+
+MIGRATIONS = Path(__file__).resolve().parents[2] / 'migrations'
+
+HIGH, LOW = 10, 30
+
+
+async def _open(tmp_path) -> ExtractionJobRepository:
+    connection = await aiosqlite.connect(str(tmp_path / 'jobs.db'))
+    await connection.execute("CREATE TABLE library_files (id TEXT, checksum TEXT PRIMARY KEY, status TEXT)")
+    for name in ('043_metadata_extraction_jobs.sql', '044_extraction_job_requeue.sql'):
+        await connection.executescript((MIGRATIONS / name).read_text())
+    return ExtractionJobRepository(connection)
+
+
+async def _job(repo, checksum):
+    return await repo._fetch_one("SELECT * FROM metadata_extraction_jobs WHERE checksum = ?", [checksum])
+
+
+@pytest.mark.asyncio
+async def test_claim_takes_most_urgent_due_job_once(tmp_path):
+    repo = await _open(tmp_path)
+    try:
+        await repo.enqueue('low', 'f1', LOW)
+        await repo.enqueue('high', 'f2', HIGH)
+        await repo.enqueue_many([('later', 'f3')], HIGH)
+        await repo.retry('later', time.time() + 3600, 'not due yet')
+
+        first = await repo.claim_next(time.time())
+        second = await repo.claim_next(time.time())
+
+        assert first == {'checksum': 'high', 'file_id': 'f2', 'priority': HIGH, 'attempts': 1}
+        assert second['checksum'] == 'low'
+        assert await repo.claim_next(time.time()) is None
+        assert await repo.get_counts() == {'running': 2, 'pending': 1}
+    finally:
+        await repo.connection.close()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_again_only_raises_priority(tmp_path):
+    repo = await _open(tmp_path)
+    try:
+        await repo.enqueue('c', 'f1', HIGH)
+        await repo.enqueue('c', None, LOW)
+        job = await _job(repo, 'c')
+        assert (job['priority'], job['file_id']) == (HIGH, 'f1')
+
+        await repo.enqueue('d', 'f2', LOW)
+        assert await repo.escalate('d', HIGH)
+        assert not await repo.escalate('d', HIGH)
+        assert (await _job(repo, 'd'))['priority'] == HIGH
+    finally:
+        await repo.connection.close()
+
+
+@pytest.mark.asyncio
+async def test_complete_deletes_job(tmp_path):
+    repo = await _open(tmp_path)
+    try:
+        await repo.enqueue('c', 'f1', HIGH)
+        await repo.claim_next(time.time())
+
+        assert not await repo.complete('c')
+        assert await _job(repo, 'c') is None
+    finally:
+        await repo.connection.close()
+
+
+@pytest.mark.asyncio
+async def test_retry_reschedules_and_counts_attempts(tmp_path):
+    repo = await _open(tmp_path)
+    try:
+        await repo.enqueue('c', 'f1', HIGH)
+        await repo.claim_next(time.time())
+        due = time.time() + 60
+        await repo.retry('c', due, 'parse error')
+
+        job = await _job(repo, 'c')
+        assert (job['status'], job['attempts'], job['last_error']) == ('pending', 1, 'parse error')
+        assert job['next_attempt_at'] == due
+        assert await repo.next_due_at() == due
+        assert await repo.claim_next(time.time()) is None
+
+        claimed = await repo.claim_next(due)
+        assert claimed['attempts'] == 2
+        assert await repo.fail('c', 'gave up')
+        assert (await repo.get_failed())[0]['last_error'] == 'gave up'
+
+        # A failed job starts over when submitted again
+        await repo.enqueue('c', 'f1', LOW)
+        job = await _job(repo, 'c')
+        assert (job['status'], job['attempts']) == ('pending', 0)
+    finally:
+        await repo.connection.close()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_while_running_requeues_after_attempt(tmp_path):
+    repo = await _open(tmp_path)
+    try:
+        await repo.enqueue('c', 'f1', LOW)
+        await repo.claim_next(time.time())
+        await repo.enqueue('c', 'f1', HIGH)
+        assert (await _job(repo, 'c'))['status'] == 'running'
+
+        assert await repo.complete('c')
+        job = await _job(repo, 'c')
+        assert (job['status'], job['requeue'], job['attempts'], job['priority']) == ('pending', 0, 0, HIGH)
+
+        # The same applies to failed and retried attempts
+        await repo.claim_next(time.time())
+        await repo.enqueue('c', 'f1', HIGH)
+        assert not await repo.fail('c', 'boom')
+        assert (await _job(repo, 'c'))['status'] == 'pending'
+
+        await repo.claim_next(time.time())
+        await repo.enqueue('c', 'f1', HIGH)
+        await repo.retry('c', time.time() + 3600, 'boom')
+        assert await repo.next_due_at() <= time.time()
+    finally:
+        await repo.connection.close()
+
+
+@pytest.mark.asyncio
+async def test_release_and_reset_running_do_not_count_the_attempt(tmp_path):
+    repo = await _open(tmp_path)
+    try:
+        await repo.enqueue_many([('a', 'f1'), ('b', 'f2')], HIGH)
+        await repo.claim_next(time.time())
+        await repo.claim_next(time.time())
+
+        await repo.release('a')
+        assert await repo.reset_running() == 1
+
+        for checksum in ('a', 'b'):
+            job = await _job(repo, checksum)
+            assert (job['status'], job['attempts']) == ('pending', 0)
+    finally:
+        await repo.connection.close()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_orphaned_skips_files_with_a_job(tmp_path):
+    repo = await _open(tmp_path)
+    try:
+        await repo.connection.executemany(
+            "INSERT INTO library_files (id, checksum, status) VALUES (?, ?, ?)",
+            [('f1', 'a', 'processing'), ('f2', 'b', 'processing'), ('f3', 'c', 'ready')]
+        )
+        await repo.enqueue('b', 'f2', HIGH)
+
+        assert await repo.enqueue_orphaned(['processing'], LOW) == 1
+        assert (await _job(repo, 'a'))['priority'] == LOW
+        assert (await _job(repo, 'b'))['priority'] == HIGH
+        assert await _job(repo, 'c') is None
+    finally:
+        await repo.connection.close()
@@ -0,0 +1,129 @@
+"""Tests for keyset pagination helpers and the count cache."""
+import sqlite3
+
+import pytest
+
+from src.database.pagination import (
+    CountCache, InvalidCursorError, decode_cursor, encode_cursor, keyset_segments,
+    query_signature, sort_key,
+)
+
+ROWS = [
+    ('a', 3.0), ('b', None), ('c', 1.0), ('d', 3.0), ('e', None),
+    ('f', 2.0), ('g', None), ('h', 1.0), ('i', 5.0),
+]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE items (id TEXT PRIMARY KEY, value REAL)")
+    conn.executemany("INSERT INTO items VALUES (?, ?)", ROWS)
+    yield conn
+    conn.close()
+
+
+def _paginate(conn, descending, page_size):
+    """Walk all pages the way the repositories do, one segment after the other."""
+    direction = 'DESC' if descending else 'ASC'
+    seen, after = [], None
+    while True:
+        page = []
+        for condition, params in keyset_segments('value', 'id', descending, nullable=True, after=after):
+            page += conn.execute(
+                f"SELECT id, value FROM items WHERE {condition} "
+                f"ORDER BY value {direction}, id {direction} LIMIT ?",
+                [*params, page_size - len(page)]
+            ).fetchall()
+            if len(page) == page_size:
+                break
+        seen += page
+        if len(page) < page_size:
+            return seen
+        after = (page[-1][1], page[-1][0])
+
+
+@pytest.mark.parametrize('descending', [False, True])
+@pytest.mark.parametrize('page_size', [1, 2, 4, 20])
+def test_nullable_segments_match_sqlite_order(conn, descending, page_size):
+    direction = 'DESC' if descending else 'ASC'
+    expected = conn.execute(f"SELECT id, value FROM items ORDER BY value {direction}, id {direction}").fetchall()
+
+    assert _paginate(conn, descending, page_size) == expected
+
+
+def test_first_page_segment_order_puts_nulls_where_sqlite_does():
+    ascending = keyset_segments('value', 'id', descending=False, nullable=True)
+    descending = keyset_segments('value', 'id', descending=True, nullable=True)
+
+    assert [sql for sql, _ in ascending] == ['value IS NULL', 'value IS NOT NULL']
+    assert [sql for sql, _ in descending] == ['value IS NOT NULL', 'value IS NULL']
+
+
+def test_descending_after_null_has_no_value_segment():
+    segments = keyset_segments('value', 'id', descending=True, nullable=True, after=(None, 'e'))
+
+    assert segments == [('value IS NULL AND id < ?', ['e'])]
+
+
+def test_non_nullable_segment():
+    assert keyset_segments('value', 'id', descending=False, nullable=False) == [('1=1', [])]
+    assert keyset_segments('value', 'id', descending=True, nullable=False, after=(2, 'x')) == \
+        [('(value, id) < (?, ?)', [2, 'x'])]
+
+
+def test_sort_key_matches_sqlite_nulls_first():
+    rows = sorted(ROWS, key=lambda row: sort_key(row[1], row[0]))
+
+    assert [row[0] for row in rows[:3]] == ['b', 'e', 'g']
+    assert [row[0] for row in rows[3:]] == ['c', 'h', 'f', 'a', 'd', 'i']
+
+
+def test_cursor_round_trip():
+    signature = query_signature('jobs', 'created_at', 'desc', None)
+    cursor = encode_cursor(signature, '2026-01-01T00:00:00', 'job_1')
+
+    assert decode_cursor(cursor, signature) == ('2026-01-01T00:00:00', 'job_1')
+
+
+def test_cursor_from_other_query_is_rejected():
+    cursor = encode_cursor(query_signature('jobs', 'created_at', 'desc'), 1, 'a')
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, query_signature('jobs', 'created_at', 'asc'))
+    with pytest.raises(InvalidCursorError):
+        decode_cursor('not-a-cursor!', 'x')
+
+
+@pytest.mark.asyncio
+async def test_count_cache_reuses_total_until_invalidated():
+    calls = []
+
+    async def count():
+        calls.append(1)
+        return 42
+
+    cache = CountCache(ttl=60)
+    assert await cache.get(('jobs', None), count) == 42
+    assert await cache.get(('jobs', None), count) == 42
+    assert len(calls) == 1
+
+    await cache.get(('jobs', 'printer_1'), count)
+    assert len(calls) == 2
+
+    cache.invalidate()
+    await cache.get(('jobs', None), count)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_count_cache_expires_after_ttl():
+    calls = []
+
+    async def count():
+        calls.append(1)
+        return len(calls)
+
+    cache = CountCache(ttl=0)
+    assert await cache.get('key', count) == 1
+    assert await cache.get('key', count) == 2
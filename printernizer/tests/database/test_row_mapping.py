@@ -0,0 +1,112 @@
+"""Tests for the LazyRow listing fast path."""
+import json
+from datetime import datetime
+
+import pytest
+
+from src.database.row_mapping import LazyRow, decode_datetime, map_rows, select_statement
+
+DESCRIPTION = [('id', None), ('metadata', None), ('created_at', None)]
+
+
+def _rows():
+    return map_rows(DESCRIPTION, [
+        ('f1', '{"layers": 10}', '2026-01-02T03:04:05'),
+        ('f2', None, ''),
+    ], {'metadata': json.loads, 'created_at': decode_datetime})
+
+
+def test_map_rows_shares_one_index():
+    first, second = _rows()
+
+    assert first._index is second._index
+    assert map_rows(DESCRIPTION, []) == []
+
+
+def test_columns_decode_once_on_access():
+    calls = []
+
+    def decoder(value):
+        calls.append(value)
+        return json.loads(value)
+
+    row = map_rows(DESCRIPTION, [('f1', '{"layers": 10}', None)], {'metadata': decoder})[0]
+    assert row['id'] == 'f1'
+    assert calls == []
+
+    assert row['metadata'] == {'layers': 10}
+    assert row['metadata'] is row['metadata']
+    assert len(calls) == 1
+    assert row.raw('metadata') == '{"layers": 10}'
+
+
+def test_none_and_empty_values_are_not_decoded():
+    row = _rows()[1]
+
+    assert row['metadata'] is None
+    assert row['created_at'] == ''
+    assert _rows()[0]['created_at'] == datetime(2026, 1, 2, 3, 4, 5)
+
+
+def test_reads_like_a_dict():
+    row = _rows()[0]
+
+    assert list(row) == ['id', 'metadata', 'created_at']
+    assert len(row) == 3
+    assert 'id' in row and 'missing' not in row
+    assert row.get('missing', 'default') == 'default'
+    assert {**row}['metadata'] == {'layers': 10}
+    with pytest.raises(KeyError):
+        row['missing']
+
+
+def test_assignment_and_deletion_use_the_overlay():
+    row = _rows()[0]
+    raw = row._values
+
+    row['id'] = 'renamed'
+    row['extra'] = 1
+    del row['created_at']
+
+    assert row['id'] == 'renamed'
+    assert row.raw('id') == 'f1'
+    assert row._values is raw
+    assert list(row) == ['id', 'metadata', 'extra']
+    assert 'created_at' not in row
+    with pytest.raises(KeyError):
+        del row['created_at']
+
+    del row['extra']
+    assert 'extra' not in row
+
+
+def test_copy_is_independent():
+    row = _rows()[0]
+    row['metadata']
+    clone = row.copy()
+    clone['id'] = 'other'
+
+    assert row['id'] == 'f1'
+    assert clone['metadata'] is row['metadata']
+
+
+def test_to_dict_decodes_everything():
+    assert _rows()[0].to_dict() == {
+        'id': 'f1',
+        'metadata': {'layers': 10},
+        'created_at': datetime(2026, 1, 2, 3, 4, 5),
+    }
+
+
+def test_lazy_row_without_decoders():
+    row = LazyRow(('a', 'b'), {'x': 0, 'y': 1})
+
+    assert row.to_dict() == {'x': 'a', 'y': 'b'}
+
+
+def test_select_statement():
+    assert select_statement('files', ('id', 'status'), ('status', 'printer_id'), 'created_at DESC', True) == (
+        "SELECT id, status FROM files WHERE status = ? AND printer_id = ? "
+        "ORDER BY created_at DESC LIMIT ? OFFSET ?"
+    )
+    assert select_statement('jobs') == "SELECT * FROM jobs"
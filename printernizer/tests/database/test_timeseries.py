@@ -0,0 +1,99 @@
+"""Tests for delta-encoded status history chunks."""
+import pytest
+
+from src.constants import StatusHistoryConstants
+from src.database.timeseries import (
+    MINUTE_TIER, MISSING, QUARTER_HOUR_TIER, RAW_TIER, SeriesChunk,
+    decode_ints, decode_values, encode_ints, encode_values,
+)
+
+
+@pytest.mark.parametrize('values', [
+    [],
+    [0],
+    [1_700_000_000, 1_700_000_005, 1_700_000_010, 1_700_000_020],
+    [5, -3, 2 ** 40, -(2 ** 40), 0],
+    [MISSING, 12, MISSING, MISSING, -7],
+])
+def test_int_round_trip(values):
+    assert decode_ints(encode_ints(values)) == values
+
+
+def test_value_round_trip_keeps_missing_and_fixed_point_precision():
+    scale = StatusHistoryConstants.VALUE_SCALE
+    values = [None, 21.5, 219.8, None, 0.0, -1.25, 100.0]
+
+    decoded = decode_values(encode_values(values))
+
+    assert [v is None for v in decoded] == [v is None for v in values]
+    for original, restored in zip(values, decoded):
+        if original is not None:
+            assert restored == pytest.approx(original, abs=1 / scale)
+
+
+def test_slow_changing_series_compresses():
+    timestamps = list(range(1_700_000_000, 1_700_003_600, 5))
+
+    assert len(encode_ints(timestamps)) < len(timestamps)
+
+
+def test_append_ignores_out_of_order_samples():
+    chunk = SeriesChunk.empty('p1', RAW_TIER, 0)
+
+    assert chunk.append(10, (60.0, 200.0, 1))
+    assert not chunk.append(10, (61.0, 201.0, 2))
+    assert not chunk.append(5, (61.0, 201.0, 2))
+    assert chunk.timestamps == [10]
+    assert chunk.dirty
+
+
+def test_merge_replaces_points_with_the_same_timestamp():
+    chunk = SeriesChunk.empty('p1', MINUTE_TIER, 0)
+    chunk.merge([60, 120], [[1.0, 2.0], [10.0, 20.0], [0, 0]])
+    chunk.merge([0, 120], [[0.5, 2.5], [5.0, 25.0], [None, 1]])
+
+    assert chunk.timestamps == [0, 60, 120]
+    assert chunk.columns == [[0.5, 1.0, 2.5], [5.0, 10.0, 25.0], [None, 0, 1]]
+
+
+def test_downsample_averages_per_bucket_and_skips_missing():
+    chunk = SeriesChunk.empty('p1', RAW_TIER, 0)
+    chunk.append(0, (60.0, 200.0, None))
+    chunk.append(30, (62.0, None, None))
+    chunk.append(60, (70.0, 210.0, 50))
+    chunk.append(65, (None, 220.0, 52))
+    chunk.append(185, (80.0, 230.0, 99))
+
+    timestamps, (bed, nozzle, progress) = chunk.downsample(MINUTE_TIER)
+
+    assert timestamps == [0, 60, 180]
+    assert bed == [61.0, 70.0, 80.0]
+    assert nozzle == [200.0, 215.0, 230.0]
+    assert progress == [None, 51.0, 99.0]
+
+
+def test_downsample_round_trips_through_storage():
+    chunk = SeriesChunk.empty('p1', RAW_TIER, 0)
+    for ts in range(0, 1800, 5):
+        chunk.append(ts, (60 + ts / 1000, 220.0, ts // 18))
+
+    timestamps, columns = chunk.downsample(QUARTER_HOUR_TIER)
+    restored = [decode_values(encode_values(column)) for column in columns]
+
+    assert decode_ints(encode_ints(timestamps)) == [0, 900]
+    assert restored == columns
+
+
+def test_slice_is_inclusive():
+    chunk = SeriesChunk.empty('p1', RAW_TIER, 0)
+    for ts in (0, 5, 10, 15):
+        chunk.append(ts, (ts, None, None))
+
+    timestamps, (bed,) = chunk.slice(5, 10, [0])
+
+    assert timestamps == [5, 10]
+    assert bed == [5, 10]
+
+
+def test_chunk_start():
+    assert RAW_TIER.chunk_start(RAW_TIER.chunk_seconds + 7) == RAW_TIER.chunk_seconds
@@ -0,0 +1,156 @@
+"""Tests for the content-addressed preview cache."""
+import sqlite3
+import time
+
+import pytest
+
+from src.services.preview_cache import INDEX_FILE, PreviewCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / 'previews'
+
+
+def _put(cache, key, size, content_key='content', kind='static'):
+    return cache.put(key, b'x' * size, content_key, kind, render_seconds=1.0)
+
+
+def test_put_and_get(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=1000)
+    entry = _put(cache, 'a', 10)
+
+    assert (cache_dir / 'a.png').read_bytes() == b'x' * 10
+    assert entry.etag == '"a"'
+    assert cache.get('a') == b'x' * 10
+    assert cache.get('missing') is None
+    assert cache.stats['hits'] == 1
+    assert cache.stats['misses'] == 1
+
+
+def test_evicts_least_recently_used_over_budget(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=100)
+    _put(cache, 'a', 40)
+    _put(cache, 'b', 40)
+    cache.get('a')
+    _put(cache, 'c', 40)
+
+    assert cache.peek('b') is None
+    assert not (cache_dir / 'b.png').exists()
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+    assert cache.get_stats()['evictions'] == 1
+    assert cache._total_bytes == 80
+
+
+def test_entry_larger_than_budget_is_kept_alone(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=100)
+    _put(cache, 'a', 40)
+    _put(cache, 'big', 150)
+
+    assert cache.peek('a') is None
+    assert cache.peek('big') is not None
+
+
+def test_peek_does_not_count_an_access(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=100)
+    _put(cache, 'a', 40)
+    _put(cache, 'b', 40)
+
+    entry = cache.peek('a')
+    _put(cache, 'c', 40)
+
+    assert entry.hits == 0
+    assert not cache._dirty
+    # Peeking did not make 'a' recently used
+    assert cache.peek('a') is None
+    assert cache.peek('b') is not None
+
+
+def test_expired_entries_count_as_missing(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=1000)
+    _put(cache, 'a', 10)
+    cache._entries['a'].created_at = time.time() - 100
+
+    assert cache.peek('a', max_age=50) is None
+    assert cache.peek('a') is not None
+    assert cache.get('a', max_age=50) is None
+    assert cache.peek('a') is None
+
+
+def test_file_deleted_behind_the_cache_is_a_miss(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=1000)
+    _put(cache, 'a', 10)
+    (cache_dir / 'a.png').unlink()
+
+    assert cache.get('a') is None
+    assert cache.peek('a') is None
+
+
+def test_invalidate_and_clear(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=1000)
+    _put(cache, 'a', 10, content_key='one')
+    _put(cache, 'b', 10, content_key='one', kind='animated')
+    _put(cache, 'c', 10, content_key='two')
+
+    assert cache.invalidate('one') == 2
+    assert not (cache_dir / 'b.gif').exists()
+    assert cache.clear() == 1
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_index_survives_reopen_in_lru_order(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=1000)
+    _put(cache, 'a', 10)
+    time.sleep(0.01)
+    _put(cache, 'b', 10)
+    time.sleep(0.01)
+    cache.get('a')
+    cache.close()
+
+    reopened = PreviewCache(cache_dir, max_bytes=1000)
+
+    assert list(reopened._entries) == ['b', 'a']
+    assert reopened._entries['a'].hits == 1
+    reopened.close()
+
+
+def test_load_removes_orphans_and_stale_rows(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=1000)
+    _put(cache, 'kept', 10)
+    _put(cache, 'lost', 10)
+    cache.close()
+    (cache_dir / 'lost.png').unlink()
+    (cache_dir / 'old_path_keyed.png').write_bytes(b'old')
+    (cache_dir / 'kept.png.123.tmp').write_bytes(b'partial')
+
+    reopened = PreviewCache(cache_dir, max_bytes=1000)
+
+    assert list(reopened._entries) == ['kept']
+    assert sorted(p.name for p in cache_dir.iterdir() if not p.name.startswith(INDEX_FILE)) == ['kept.png']
+    reopened.close()
+    rows = sqlite3.connect(str(cache_dir / INDEX_FILE)).execute("SELECT key FROM preview_entries").fetchall()
+    assert rows == [('kept',)]
+
+
+def test_load_evicts_when_budget_shrank(cache_dir):
+    cache = PreviewCache(cache_dir, max_bytes=1000)
+    _put(cache, 'a', 40)
+    time.sleep(0.01)
+    _put(cache, 'b', 40)
+    cache.close()
+
+    reopened = PreviewCache(cache_dir, max_bytes=50)
+
+    assert list(reopened._entries) == ['b']
+    assert not (cache_dir / 'a.png').exists()
+    reopened.close()
+
+
+def test_make_key_depends_on_every_part():
+    key = PreviewCache.make_key('content', 'static', (200, 200), 'params')
+
+    assert key == PreviewCache.make_key('content', 'static', (200, 200), 'params')
+    assert key != PreviewCache.make_key('content', 'animated', (200, 200), 'params')
+    assert key != PreviewCache.make_key('content', 'static', (512, 512), 'params')
+    assert key != PreviewCache.make_key('content', 'static', (200, 200), 'other')
@@ -0,0 +1,109 @@
+"""Tests for the one-pass 3MF reader."""
+import json
+import zipfile
+
+import pytest
+
+from src.services.threemf_reader import read_3mf
+
+MODEL_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<model unit="millimeter" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">
+  <metadata name="Title">Calibration cube</metadata>
+  <metadata name="Application">BambuStudio-01.09</metadata>
+  <resources>
+    <object id="1" type="model">
+      <mesh>
+        <vertices>
+          <vertex x="0" y="0" z="0"/>
+          <vertex x="10" y="0" z="0"/>
+          <vertex x="0" y="20" z="5"/>
+        </vertices>
+        <triangles>
+          <triangle v1="0" v2="1" v3="2"/>
+        </triangles>
+      </mesh>
+    </object>
+    <object id="2" type="model">
+      <mesh>
+        <vertices>
+          <vertex x="-1" y="2" z="3"/>
+          <vertex x="4" y="5" z="6"/>
+          <vertex x="7" y="8" z="9"/>
+        </vertices>
+        <triangles>
+          <triangle v1="0" v2="1" v3="2"/>
+          <triangle v1="2" v2="bad" v3="0"/>
+        </triangles>
+      </mesh>
+    </object>
+  </resources>
+</model>
+"""
+
+SLICE_INFO = """<?xml version="1.0" encoding="UTF-8"?>
+<config><plate><metadata key="index" value="1"/></plate></config>
+"""
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 16
+
+
+@pytest.fixture
+def package_path(tmp_path):
+    path = tmp_path / 'cube.3mf'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('3D/3dmodel.model', MODEL_XML)
+        archive.writestr('Metadata/plate_1.png', PNG)
+        archive.writestr('Metadata/plate_1.json', json.dumps({'bbox_objects': [{'name': 'cube'}]}))
+        archive.writestr('Metadata/process_settings_1.config', json.dumps({'layer_height': '0.2'}))
+        archive.writestr('Metadata/slice_info.config', SLICE_INFO)
+        archive.writestr('Metadata/extra.xml', '<extra/>')
+        archive.writestr('Metadata/plate_2.json', '{not json')
+    return path
+
+
+def test_reads_all_parts_in_one_pass(package_path):
+    package = read_3mf(package_path)
+
+    assert package.model_parsed
+    assert package.thumbnails == [('Metadata/plate_1.png', PNG)]
+    assert package.plates == {1: {'bbox_objects': [{'name': 'cube'}]}}
+    assert package.process_settings == {1: {'layer_height': '0.2'}}
+    assert package.slice_info.find('plate/metadata').get('value') == '1'
+    assert package.metadata_xml == {'Metadata/extra.xml': '<extra/>'}
+    assert package.model_metadata == [('Title', 'Calibration cube'), ('Application', 'BambuStudio-01.09')]
+    assert '3D/3dmodel.model' in package.names
+
+
+def test_meshes_are_flattened_with_offsets(package_path):
+    package = read_3mf(package_path)
+
+    assert package.vertex_count == 6
+    assert list(package._triangles) == [0, 1, 2, 3, 4, 5]
+    assert package.bounds() == ((-1.0, 0.0, 0.0), (10.0, 20.0, 9.0))
+
+
+def test_numpy_views(package_path):
+    np = pytest.importorskip('numpy')
+    package = read_3mf(package_path)
+
+    assert package.vertices.shape == (6, 3)
+    assert package.vertices.dtype == np.float32
+    assert package.triangles.tolist() == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_geometry_and_thumbnails_can_be_skipped(package_path):
+    package = read_3mf(package_path, geometry=False, thumbnails=False)
+
+    assert not package.model_parsed
+    assert package.vertex_count == 0
+    assert package.bounds() is None
+    assert package.thumbnails == []
+    assert package.process_settings == {1: {'layer_height': '0.2'}}
+
+
+def test_not_a_zip(tmp_path):
+    path = tmp_path / 'broken.3mf'
+    path.write_bytes(b'not a zip')
+
+    with pytest.raises(zipfile.BadZipFile):
+        read_3mf(path)
@@ -0,0 +1,71 @@
+"""Tests for the library hashing engine."""
+import hashlib
+
+import pytest
+
+from src.utils.file_hashing import find_duplicates, hash_file, sample_fingerprint
+
+
+def _write(path, data):
+    path.write_bytes(data)
+    return path
+
+
+@pytest.mark.parametrize('algorithm', ['sha256', 'md5'])
+@pytest.mark.parametrize('size', [0, 1, 4095, 4096, 10_000])
+def test_hash_file_matches_hashlib(tmp_path, algorithm, size):
+    data = bytes(i % 251 for i in range(size))
+    path = _write(tmp_path / 'model.stl', data)
+
+    assert hash_file(path, algorithm, chunk_size=4096) == hashlib.new(algorithm, data).hexdigest()
+
+
+def test_hash_file_rejects_unknown_algorithm(tmp_path):
+    path = _write(tmp_path / 'model.stl', b'x')
+
+    with pytest.raises(ValueError):
+        hash_file(path, 'sha1')
+
+
+def test_sample_fingerprint_covers_size_head_and_tail(tmp_path):
+    base = b'a' * 100 + b'b' * 100 + b'c' * 100
+    same = _write(tmp_path / 'same1', base)
+    same_copy = _write(tmp_path / 'same2', base)
+    other_tail = _write(tmp_path / 'tail', base[:-1] + b'x')
+    other_middle = _write(tmp_path / 'middle', base[:150] + b'x' + base[151:])
+
+    fingerprint = sample_fingerprint(same, sample_size=64)
+
+    assert fingerprint.startswith(f"{len(base):x}-")
+    assert sample_fingerprint(same_copy, sample_size=64) == fingerprint
+    assert sample_fingerprint(other_tail, sample_size=64) != fingerprint
+    # The middle is not sampled: equal fingerprints only mean "maybe equal"
+    assert sample_fingerprint(other_middle, sample_size=64) == fingerprint
+
+
+def test_sample_fingerprint_small_file(tmp_path):
+    path = _write(tmp_path / 'small', b'abc')
+
+    assert sample_fingerprint(path, sample_size=64).startswith('3-')
+
+
+@pytest.mark.parametrize('prehash', [True, False])
+def test_find_duplicates(tmp_path, prehash):
+    content = b'solid cube\n' * 1000
+    a = _write(tmp_path / 'a.stl', content)
+    b = _write(tmp_path / 'b.stl', content)
+    # Same size, different content
+    near = _write(tmp_path / 'near.stl', content[:5000] + b'X' + content[5001:])
+    _write(tmp_path / 'unique.stl', b'other')
+
+    duplicates = find_duplicates(
+        [a, b, near, tmp_path / 'unique.stl', tmp_path / 'missing.stl'], prehash=prehash
+    )
+
+    assert duplicates == {hashlib.sha256(content).hexdigest(): [str(a), str(b)]}
+
+
+def test_find_duplicates_without_collisions(tmp_path):
+    paths = [_write(tmp_path / f'{i}.stl', b'x' * i) for i in range(1, 4)]
+
+    assert find_duplicates(paths) == {}